@@ -0,0 +1,49 @@
+"""Benchmark of Endpoint.invoke against a stubbed sagemaker-runtime client.
+
+Measures the client side overhead of invoke (argument validation, serialization and
+response transformation) without any network calls.
+
+Usage:
+    python benchmarks/benchmark_endpoint_invoke.py [--number 10000]
+"""
+
+import argparse
+import io
+import time
+from unittest.mock import MagicMock, patch
+
+from sagemaker_core.main.resources import Base, Endpoint
+
+
+def build_stub_runtime_client() -> MagicMock:
+    """Build a runtime client returning a fixed InvokeEndpoint response."""
+    client = MagicMock()
+    client.invoke_endpoint.side_effect = lambda **kwargs: {
+        "Body": io.BytesIO(b'{"predictions": [0.42]}'),
+        "ContentType": "application/json",
+        "InvokedProductionVariant": "AllTraffic",
+    }
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10000, help="Number of invoke calls")
+    args = parser.parse_args()
+
+    endpoint = Endpoint(endpoint_name="benchmark-endpoint")
+    client = build_stub_runtime_client()
+    with patch.object(Base, "get_sagemaker_client", return_value=client):
+        start = time.perf_counter()
+        for _ in range(args.number):
+            endpoint.invoke(
+                body='{"instances": [[1.0, 2.0, 3.0]]}', content_type="application/json"
+            )
+        elapsed = time.perf_counter() - start
+
+    print(f"{args.number} Endpoint.invoke calls: {elapsed:.3f}s total")
+    print(f"{elapsed / args.number * 1e6:.1f} us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Import time benchmark for the sagemaker_core package.
+
+Runs each import statement in fresh interpreters and reports the median of:
+- the cumulative ``python -X importtime`` time of the modules it loads,
+- the wall time of the statement,
+- the growth of the peak resident set size (RSS) caused by the statement.
+
+Usage:
+    python benchmarks/benchmark_import_time.py [--repeat 5] [--output import_time.json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+IMPORT_STATEMENTS = [
+    "import sagemaker_core",
+    "import sagemaker_core.resources",
+    "import sagemaker_core.shapes",
+    "from sagemaker_core.resources import TrainingJob",
+    "from sagemaker_core.resources import Endpoint",
+]
+
+
+def measure_import_time(statement: str) -> float:
+    """Run the statement in a new interpreter and return the importtime total in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, module = line[len("import time:") :].split("|")
+        # Skip the header, and nested imports which are indented below their importer
+        if cumulative.strip().isdigit() and not module.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+MEASURE_FOOTPRINT_SCRIPT = """
+import resource, time
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{statement}
+wall_time = time.perf_counter() - start
+print(wall_time, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before)
+"""
+
+# ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+RSS_UNITS_PER_MB = 1024 * 1024 if sys.platform == "darwin" else 1024
+
+
+def measure_import_footprint(statement: str) -> tuple:
+    """Run the statement in a new interpreter and return its wall time in ms and RSS growth in MB."""
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_FOOTPRINT_SCRIPT.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_time, rss_growth = result.stdout.split()
+    return float(wall_time) * 1000, int(rss_growth) / RSS_UNITS_PER_MB
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreter runs per statement")
+    parser.add_argument("--output", help="Optional path of a JSON file to write the results to")
+    args = parser.parse_args()
+
+    # Modules imported by the interpreter at startup are reported for every statement
+    startup_time = statistics.median(measure_import_time("pass") for _ in range(args.repeat))
+
+    results = {}
+    for statement in IMPORT_STATEMENTS:
+        import_times = [measure_import_time(statement) - startup_time for _ in range(args.repeat)]
+        wall_times, rss_growths = zip(
+            *(measure_import_footprint(statement) for _ in range(args.repeat))
+        )
+        results[statement] = {
+            "importtime_ms": statistics.median(import_times),
+            "wall_time_ms": statistics.median(wall_times),
+            "rss_mb": statistics.median(rss_growths),
+        }
+        print(
+            f"{statement:<52} importtime {results[statement]['importtime_ms']:8.1f} ms"
+            f"  wall {results[statement]['wall_time_ms']:8.1f} ms"
+            f"  rss {results[statement]['rss_mb']:6.1f} MB"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
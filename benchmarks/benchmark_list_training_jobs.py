@@ -0,0 +1,142 @@
+"""Benchmark of listing training jobs against a stubbed sagemaker client.
+
+Measures the client side cost of TrainingJob.get_all, which describes every listed job,
+with validated and with trusted responses, without any network calls.
+
+Usage:
+    python benchmarks/benchmark_list_training_jobs.py [--number 1000] [--repeat 5]
+"""
+
+import argparse
+import datetime
+import time
+from unittest.mock import MagicMock, patch
+
+from sagemaker_core.main.code_injection.codec import trusted_responses
+from sagemaker_core.main.resources import Base, TrainingJob
+
+
+def build_describe_training_job_response(training_job_name: str) -> dict:
+    """Build a DescribeTrainingJob response with the nested shapes of a typical job."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return {
+        "TrainingJobName": training_job_name,
+        "TrainingJobArn": f"arn:aws:sagemaker:us-west-2:111111111111:training-job/{training_job_name}",
+        "ModelArtifacts": {"S3ModelArtifacts": f"s3://bucket/{training_job_name}/model.tar.gz"},
+        "TrainingJobStatus": "Completed",
+        "SecondaryStatus": "Completed",
+        "HyperParameters": {"max_depth": "5", "eta": "0.2", "num_round": "100"},
+        "AlgorithmSpecification": {
+            "TrainingImage": "111111111111.dkr.ecr.us-west-2.amazonaws.com/xgboost:latest",
+            "TrainingInputMode": "File",
+            "MetricDefinitions": [
+                {"Name": "validation:rmse", "Regex": "validation-rmse:([0-9\\.]+)"}
+            ],
+        },
+        "RoleArn": "arn:aws:iam::111111111111:role/SageMakerRole",
+        "InputDataConfig": [
+            {
+                "ChannelName": "train",
+                "DataSource": {
+                    "S3DataSource": {
+                        "S3DataType": "S3Prefix",
+                        "S3Uri": "s3://bucket/train",
+                        "S3DataDistributionType": "FullyReplicated",
+                    }
+                },
+                "ContentType": "text/csv",
+            }
+        ],
+        "OutputDataConfig": {"S3OutputPath": "s3://bucket/output"},
+        "ResourceConfig": {
+            "InstanceType": "ml.m5.xlarge",
+            "InstanceCount": 1,
+            "VolumeSizeInGB": 30,
+        },
+        "StoppingCondition": {"MaxRuntimeInSeconds": 86400},
+        "CreationTime": now,
+        "TrainingStartTime": now,
+        "TrainingEndTime": now,
+        "LastModifiedTime": now,
+        "SecondaryStatusTransitions": [
+            {"Status": "Starting", "StartTime": now, "EndTime": now, "StatusMessage": "Starting"},
+            {"Status": "Training", "StartTime": now, "EndTime": now, "StatusMessage": "Training"},
+            {"Status": "Completed", "StartTime": now, "StatusMessage": "Completed"},
+        ],
+        "FinalMetricDataList": [{"MetricName": "validation:rmse", "Value": 0.5, "Timestamp": now}],
+        "EnableNetworkIsolation": False,
+        "EnableInterContainerTrafficEncryption": False,
+        "EnableManagedSpotTraining": False,
+        "TrainingTimeInSeconds": 120,
+        "BillableTimeInSeconds": 120,
+    }
+
+
+def build_stub_client(number: int) -> MagicMock:
+    """Build a sagemaker client listing the given number of training jobs in pages of 100."""
+    responses = {
+        f"training-job-{i}": build_describe_training_job_response(f"training-job-{i}")
+        for i in range(number)
+    }
+    names = list(responses)
+
+    def list_training_jobs(NextToken=None, **kwargs):
+        start = int(NextToken or 0)
+        page = names[start : start + 100]
+        response = {
+            "TrainingJobSummaries": [
+                {
+                    key: responses[name][key]
+                    for key in (
+                        "TrainingJobName",
+                        "TrainingJobArn",
+                        "CreationTime",
+                        "LastModifiedTime",
+                        "TrainingJobStatus",
+                    )
+                }
+                for name in page
+            ]
+        }
+        if start + 100 < len(names):
+            response["NextToken"] = str(start + 100)
+        return response
+
+    client = MagicMock()
+    client.list_training_jobs.side_effect = list_training_jobs
+    client.describe_training_job.side_effect = lambda TrainingJobName: responses[TrainingJobName]
+    return client
+
+
+def measure_get_all(client: MagicMock, number: int) -> float:
+    """List and describe all training jobs and return the elapsed time in seconds."""
+    with patch.object(Base, "get_sagemaker_client", return_value=client):
+        start = time.perf_counter()
+        training_jobs = list(TrainingJob.get_all())
+        elapsed = time.perf_counter() - start
+    assert len(training_jobs) == number
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000, help="Number of training jobs")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode, the best is reported")
+    args = parser.parse_args()
+
+    client = build_stub_client(args.number)
+    validated, trusted = [], []
+    for _ in range(args.repeat):
+        validated.append(measure_get_all(client, args.number))
+        with trusted_responses():
+            trusted.append(measure_get_all(client, args.number))
+
+    for mode, elapsed in (("validated", min(validated)), ("trusted", min(trusted))):
+        print(
+            f"{mode:<10} {args.number} training jobs: {elapsed:.3f}s total, "
+            f"{elapsed / args.number * 1e6:.1f} us per job"
+        )
+
+
+if __name__ == "__main__":
+    main()
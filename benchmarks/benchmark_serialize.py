@@ -0,0 +1,109 @@
+"""Micro-benchmark for serialize() of a full TrainingJob.create request.
+
+Compares key conversion through the generated name tables with the regex based
+conversion used when a name is missing from the tables.
+
+Usage:
+    python benchmarks/benchmark_serialize.py [--number 2000]
+"""
+
+import argparse
+import timeit
+from unittest.mock import patch
+
+import sagemaker_core.main.code_injection.codec as codec
+import sagemaker_core.main.utils as utils
+from sagemaker_core.main.shapes import (
+    AlgorithmSpecification,
+    Channel,
+    CheckpointConfig,
+    DataSource,
+    MetricDefinition,
+    OutputDataConfig,
+    ResourceConfig,
+    S3DataSource,
+    StoppingCondition,
+    Tag,
+    VpcConfig,
+)
+
+
+def build_create_training_job_request() -> dict:
+    """Build the operation input args TrainingJob.create passes to serialize()."""
+    return {
+        "TrainingJobName": "xgboost-benchmark",
+        "HyperParameters": {"max_depth": "5", "eta": "0.2", "objective": "binary:logistic"},
+        "AlgorithmSpecification": AlgorithmSpecification(
+            training_image="123456789012.dkr.ecr.us-west-2.amazonaws.com/xgboost:latest",
+            training_input_mode="File",
+            metric_definitions=[
+                MetricDefinition(name=f"metric-{i}", regex=f"metric-{i}=(.*?);") for i in range(5)
+            ],
+            enable_sage_maker_metrics_time_series=True,
+        ),
+        "RoleArn": "arn:aws:iam::123456789012:role/SageMakerRole",
+        "InputDataConfig": [
+            Channel(
+                channel_name=channel_name,
+                data_source=DataSource(
+                    s3_data_source=S3DataSource(
+                        s3_data_type="S3Prefix",
+                        s3_uri=f"s3://bucket/{channel_name}",
+                        s3_data_distribution_type="FullyReplicated",
+                    )
+                ),
+                content_type="text/csv",
+                compression_type="None",
+                input_mode="File",
+            )
+            for channel_name in ("train", "validation", "test")
+        ],
+        "OutputDataConfig": OutputDataConfig(
+            s3_output_path="s3://bucket/output", kms_key_id="alias/key"
+        ),
+        "ResourceConfig": ResourceConfig(
+            instance_type="ml.m5.xlarge",
+            instance_count=2,
+            volume_size_in_gb=30,
+            keep_alive_period_in_seconds=60,
+        ),
+        "VpcConfig": VpcConfig(security_group_ids=["sg-1"], subnets=["subnet-1", "subnet-2"]),
+        "StoppingCondition": StoppingCondition(
+            max_runtime_in_seconds=86400, max_wait_time_in_seconds=86400
+        ),
+        "Tags": [Tag(key=f"key-{i}", value=f"value-{i}") for i in range(10)],
+        "EnableNetworkIsolation": False,
+        "EnableInterContainerTrafficEncryption": True,
+        "EnableManagedSpotTraining": True,
+        "CheckpointConfig": CheckpointConfig(s3_uri="s3://bucket/checkpoints"),
+        "Environment": {"ENV_VAR": "value"},
+    }
+
+
+def run(number: int) -> None:
+    request = build_create_training_job_request()
+    serialized = utils.serialize(request)
+    assert serialized["ResourceConfig"]["VolumeSizeInGB"] == 30
+
+    table_time = timeit.timeit(lambda: utils.serialize(request), number=number)
+
+    # Route every key through the regex conversion, as before the name tables existed
+    with patch.object(utils, "SNAKE_TO_PASCAL_NAMES", {}), patch.object(
+        codec, "SNAKE_TO_PASCAL_NAMES", {}
+    ), patch.object(
+        utils, "_shape_attribute_to_member_name", utils._shape_attribute_to_member_name.__wrapped__
+    ), patch.object(
+        codec, "_convert_snake_to_pascal", codec._convert_snake_to_pascal.__wrapped__
+    ):
+        regex_time = timeit.timeit(lambda: utils.serialize(request), number=number)
+
+    print(f"serialize() x{number}")
+    print(f"  regex conversion: {regex_time * 1000 / number:.3f} ms/call")
+    print(f"  name tables:      {table_time * 1000 / number:.3f} ms/call")
+    print(f"  speedup:          {regex_time / table_time:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="Number of serialize() calls.")
+    run(parser.parse_args().number)
@@ -10,12 +10,23 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import inspect
 import logging
+import os
+import threading
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import asdict
+from functools import lru_cache
 import re
+from typing import Callable, Optional
 
-from sagemaker_core.main.code_injection.shape_dag import SHAPE_DAG
+from sagemaker_core.main.code_injection.shape_dag import (
+    SHAPE_DAG,
+    PASCAL_TO_SNAKE_NAMES,
+    SNAKE_TO_PASCAL_NAMES,
+)
 from sagemaker_core.main.code_injection.constants import (
     BASIC_TYPES,
     STRUCTURE_TYPE,
@@ -24,19 +35,188 @@ from sagemaker_core.main.code_injection.constants import (
 )
 from io import BytesIO
 
+try:
+    # The post init hook pydantic gives to models with private attributes, wrapped by the post init
+    # hooks of their subclasses
+    from pydantic._internal._model_construction import init_private_attributes
+except ImportError:  # pragma: no cover
+    init_private_attributes = None
+
+# Upper bound of the memo for names missing from the generated name tables
+NAME_CONVERSION_CACHE_SIZE = 4096
+
+# Set to true to build resources and shapes from service responses without validation
+TRUSTED_RESPONSES_ENV_VAR = "SAGEMAKER_CORE_TRUSTED_RESPONSES"
+
+_trusted_responses = ContextVar("trusted_responses", default=None)
+
+
+@contextmanager
+def trusted_responses(enabled: bool = True):
+    """
+    Context manager to build resources and shapes from service responses without validation.
+
+    Responses of the SageMaker APIs are already well-formed, so inside the context resources
+    and their nested shapes are created with `model_construct` instead of being validated.
+    Inputs supplied by the user are still validated. Overrides the
+    `SAGEMAKER_CORE_TRUSTED_RESPONSES` environment variable for the current thread or task.
+
+    Args:
+        enabled (bool): Whether responses are trusted inside the context. Defaults to True.
+
+    Example:
+        with trusted_responses():
+            training_jobs = list(TrainingJob.get_all())
+    """
+    token = _trusted_responses.set(enabled)
+    try:
+        yield
+    finally:
+        _trusted_responses.reset(token)
+
+
+def is_trusted_responses() -> bool:
+    """
+    Whether service responses are currently built without validation.
+
+    Returns:
+        bool: The value set by the innermost `trusted_responses` context, otherwise
+            whether the `SAGEMAKER_CORE_TRUSTED_RESPONSES` environment variable is true.
+    """
+    enabled = _trusted_responses.get()
+    if enabled is None:
+        enabled = os.environ.get(TRUSTED_RESPONSES_ENV_VAR, "").lower() in ("1", "true")
+    return enabled
+
+
+# Defaults that are safe to share between instances instead of being copied per instance
+_SHARED_DEFAULT_TYPES = (type(None), bool, int, float, str, tuple, frozenset)
+
+# Placeholder of required fields in the field values template of a model
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def get_model_constructor(cls) -> Callable[[dict], object]:
+    """
+    Get a function constructing instances of the pydantic model class without validation.
+
+    Equivalent to `cls.model_construct(**data)`, with the field defaults and aliases resolved
+    once per class rather than on every call. Models whose field or private attribute defaults must
+    be copied per instance, or which have post init hooks, fall back to `model_construct`.
+
+    Args:
+        cls (type): The pydantic model class.
+
+    Returns:
+        Callable[[dict], object]: The constructor, taking the field values by name or alias.
+    """
+    # Imported here, utils depends on this module
+    from sagemaker_core.main.utils import Unassigned
+
+    def _model_construct(data):
+        return cls.model_construct(**data)
+
+    if (
+        cls.__pydantic_post_init__ is not None
+        and inspect.unwrap(cls.model_post_init) is not init_private_attributes
+    ):
+        return _model_construct
+
+    private_template = {}
+    for name, private_attr in cls.__private_attributes__.items():
+        if private_attr.default_factory is None and isinstance(
+            private_attr.default, _SHARED_DEFAULT_TYPES
+        ):
+            private_template[name] = private_attr.default
+        else:
+            return _model_construct
+
+    # Field values in declaration order, so instances look the same as validated ones
+    template = {}
+    required = []
+    aliases = {}
+    for name, field in cls.model_fields.items():
+        if field.alias and field.alias != name:
+            aliases[field.alias] = name
+        if field.is_required():
+            template[name] = _MISSING
+            required.append(name)
+        elif field.default_factory is None and isinstance(
+            field.default, (Unassigned, *_SHARED_DEFAULT_TYPES)
+        ):
+            template[name] = field.default
+        else:
+            return _model_construct
+
+    def _construct_model(data):
+        if aliases:
+            data = {aliases.get(key, key): value for key, value in data.items()}
+        values = {**template, **data}
+        if len(values) != len(template):
+            # Like model_construct, ignore values of unknown fields
+            data = {key: value for key, value in data.items() if key in template}
+            values = {**template, **data}
+        for name in required:
+            if values[name] is _MISSING:
+                del values[name]
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(
+            instance, "__pydantic_private__", dict(private_template) if private_template else None
+        )
+        return instance
+
+    return _construct_model
+
+
+def build_from_response(cls, data: dict) -> object:
+    """
+    Build an instance of the class from transformed response data.
+
+    Args:
+        cls (type): The resource or shape class.
+        data (dict): The transformed response data.
+
+    Returns:
+        object: The instance, constructed without validation if responses are trusted.
+    """
+    if is_trusted_responses():
+        return get_model_constructor(cls)(data)
+    return cls(**data)
+
+
+@lru_cache(maxsize=NAME_CONVERSION_CACHE_SIZE)
+def _convert_pascal_to_snake(pascal_str):
+    snake_case = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", pascal_str)
+    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", snake_case).lower()
+
+
+@lru_cache(maxsize=NAME_CONVERSION_CACHE_SIZE)
+def _convert_snake_to_pascal(snake_str):
+    components = snake_str.split("_")
+    return "".join(x.title() for x in components[0:])
+
 
 def pascal_to_snake(pascal_str):
     """
     Converts a PascalCase string to snake_case.
 
+    Member names of the service shapes are looked up in the generated name table,
+    any other name is converted once and memoized.
+
     Args:
         pascal_str (str): The PascalCase string to be converted.
 
     Returns:
         str: The converted snake_case string.
     """
-    snake_case = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", pascal_str)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", snake_case).lower()
+    snake_str = PASCAL_TO_SNAKE_NAMES.get(pascal_str)
+    if snake_str is None:
+        snake_str = _convert_pascal_to_snake(pascal_str)
+    return snake_str
 
 
 def deserialize(data, cls) -> object:
@@ -69,6 +249,10 @@ def snake_to_pascal(snake_str):
     """
     Convert a snake_case string to PascalCase.
 
+    Member names of the service shapes are looked up in the generated name table,
+    so acronyms like AutoMLJobName and VolumeSizeInGB round trip. Any other name is
+    converted once and memoized.
+
     Args:
         snake_str (str): The snake_case string to be converted.
 
@@ -76,8 +260,10 @@ def snake_to_pascal(snake_str):
         str: The PascalCase string.
 
     """
-    components = snake_str.split("_")
-    return "".join(x.title() for x in components[0:])
+    pascal_str = SNAKE_TO_PASCAL_NAMES.get(snake_str)
+    if pascal_str is None:
+        pascal_str = _convert_snake_to_pascal(snake_str)
+    return pascal_str
 
 
 def serialize(data) -> object:
@@ -99,114 +285,264 @@ def serialize(data) -> object:
     return data_dict
 
 
-def _evaluate_list_type(raw_list, shape) -> list:
+def _raise_on_evaluation(message):
+    """
+    Builds a converter that raises a ValueError once a value actually needs it.
+
+    Unsupported member types are only an error if the member is present in the data,
+    so the error is deferred from compile time to evaluation time.
+
+    Args:
+        message (str): The error message.
+
+    Returns:
+        Callable: The converter.
+    """
+
+    def _converter(value):
+        raise ValueError(message)
+
+    return _converter
+
+
+def _assign_as_is(value):
+    return value
+
+
+def _convert_blob(blob_data):
     """
-    Evaluates a list type based on the given shape.
+    Converts blob data into a file-like object.
 
     Args:
-        raw_list (list): The raw list to be evaluated.
-        shape (dict): The shape of the list.
+        blob_data (bytes or file-like object): The blob data.
 
     Returns:
-        list: The evaluated list based on the shape.
+        file-like object: The blob data as a file-like object.
 
     Raises:
-        ValueError: If an unhandled list member type is encountered.
+        ValueError: If the blob data is neither bytes nor file-like.
+    """
+    if isinstance(blob_data, bytes):
+        return BytesIO(blob_data)
+    if hasattr(blob_data, "read"):
+        # If it's already a file-like object, use it as is
+        return blob_data
+    raise ValueError(f"Unexpected blob data type: {type(blob_data)}")
+
 
+def _compile_list_type(shape_name, pending, construct) -> Optional[Callable]:
     """
-    _shape_member_type = shape["member_type"]
-    _shape_member_shape = shape["member_shape"]
-    _evaluated_list = []
-    if _shape_member_type in BASIC_TYPES:
+    Compiles a converter for a list shape.
+
+    Args:
+        shape_name (str): The name of the list shape.
+        pending (dict): Transformers compiled in the current pass, not yet published.
+        construct (bool): Whether nested structures are constructed as shape instances.
+
+    Returns:
+        Callable: The converter, or None if the list can be assigned as is.
+    """
+    shape = SHAPE_DAG[shape_name]
+    member_type = shape["member_type"]
+    member_shape = shape["member_shape"]
+    if member_type in BASIC_TYPES:
         # if basic types directly assign list value.
-        _evaluated_list = raw_list
-    elif _shape_member_type == STRUCTURE_TYPE:
-        # if structure type, transform each list item and assign value.
-        # traverse through response list and evaluate item
-        for item in raw_list:
-            _evaluated_item = transform(item, _shape_member_shape)
-            _evaluated_list.append(_evaluated_item)
-    elif _shape_member_type == LIST_TYPE:
-        # if list type, transform each list item and assign value.
-        # traverse through response list and evaluate item
-        for item in raw_list:
-            _list_type_shape = SHAPE_DAG[_shape_member_shape]
-            _evaluated_item = _evaluate_list_type(item, _list_type_shape)
-            _evaluated_list.append(_evaluated_item)
-    elif _shape_member_type == MAP_TYPE:
-        # if structure type, transform each list item and assign value.
-        # traverse through response list and evaluate item
-        for item in raw_list:
-            _map_type_shape = SHAPE_DAG[_shape_member_shape]
-            _evaluated_item = _evaluate_map_type(item, _map_type_shape)
-            _evaluated_list.append(_evaluated_item)
+        return None
+    if member_type == STRUCTURE_TYPE:
+        convert_item = _compile_nested_structure(member_shape, pending, construct)
+    elif member_type == LIST_TYPE:
+        convert_item = _compile_list_type(member_shape, pending, construct) or _assign_as_is
+    elif member_type == MAP_TYPE:
+        convert_item = _compile_map_type(member_shape, pending, construct) or _assign_as_is
     else:
-        raise ValueError(
+        return _raise_on_evaluation(
             f"Unhandled List member type "
-            f"[{_shape_member_type}] encountered. "
+            f"[{member_type}] encountered. "
             "Needs additional logic for support"
         )
-    return _evaluated_list
 
+    def _convert_list(raw_list):
+        return [convert_item(item) for item in raw_list]
+
+    return _convert_list
 
-def _evaluate_map_type(raw_map, shape) -> dict:
+
+def _compile_map_type(shape_name, pending, construct) -> Optional[Callable]:
     """
-    Evaluates a map type based on the given shape.
+    Compiles a converter for a map shape.
 
     Args:
-        raw_map (dict): The raw map to be evaluated.
-        shape (dict): The shape of the map.
+        shape_name (str): The name of the map shape.
+        pending (dict): Transformers compiled in the current pass, not yet published.
+        construct (bool): Whether nested structures are constructed as shape instances.
 
     Returns:
-        dict: The evaluated map.
-
-    Raises:
-        ValueError: If an unhandled map key type or list member type is encountered.
+        Callable: The converter, or None if the map can be assigned as is.
     """
-    _shape_key_type = shape["key_type"]
-    _shape_value_type = shape["value_type"]
-    _shape_value_shape = shape["value_shape"]
-    if _shape_key_type != "string":
-        raise ValueError(
+    shape = SHAPE_DAG[shape_name]
+    key_type = shape["key_type"]
+    value_type = shape["value_type"]
+    value_shape = shape["value_shape"]
+    if key_type != "string":
+        return _raise_on_evaluation(
             f"Unhandled Map key type "
-            f"[{_shape_key_type}] encountered. "
+            f"[{key_type}] encountered. "
             "Needs additional logic for support"
         )
-
-    _evaluated_map = {}
-    if _shape_value_type in BASIC_TYPES:
+    if value_type in BASIC_TYPES:
         # if basic types directly assign value.
         # Ex. response["map_member"] = {"key":"value"}
-        _evaluated_map = raw_map
-    elif _shape_value_type == STRUCTURE_TYPE:
-        # if structure type loop through and evaluate values
-        for k, v in raw_map.items():
-            _evaluated_value = transform(v, _shape_value_shape)
-            _evaluated_map[k] = _evaluated_value
-    elif _shape_value_type == LIST_TYPE:
-        for k, v in raw_map.items():
-            _list_type_shape = SHAPE_DAG[_shape_value_shape]
-            evaluated_values = _evaluate_list_type(v, _list_type_shape)
-            _evaluated_map[k] = evaluated_values
-    elif _shape_value_type == MAP_TYPE:
-        for k, v in raw_map.items():
-            _map_type_shape = SHAPE_DAG[_shape_value_shape]
-            evaluated_values = _evaluate_map_type(v, _map_type_shape)
-            _evaluated_map[k] = evaluated_values
+        return None
+    if value_type == STRUCTURE_TYPE:
+        convert_value = _compile_nested_structure(value_shape, pending, construct)
+    elif value_type == LIST_TYPE:
+        convert_value = _compile_list_type(value_shape, pending, construct) or _assign_as_is
+    elif value_type == MAP_TYPE:
+        convert_value = _compile_map_type(value_shape, pending, construct) or _assign_as_is
     else:
-        raise ValueError(
+        return _raise_on_evaluation(
             f"Unhandled List member type "
-            f"[{_shape_value_type}] encountered. "
+            f"[{value_type}] encountered. "
             "Needs additional logic for support"
         )
 
-    return _evaluated_map
+    def _convert_map(raw_map):
+        return {k: convert_value(v) for k, v in raw_map.items()}
+
+    return _convert_map
+
+
+def _compile_nested_structure(shape_name, pending, construct) -> Callable:
+    """
+    Compiles the converter for a structure nested in another shape.
+
+    Args:
+        shape_name (str): The name of the structure shape.
+        pending (dict): Transformers compiled in the current pass, not yet published.
+        construct (bool): Whether the structure is constructed as a shape instance.
+
+    Returns:
+        Callable: The converter, returning a dict or an unvalidated shape instance.
+    """
+    transform_structure = _compile_structure_type(shape_name, pending, construct)
+    if not construct:
+        return transform_structure
+
+    # Imported here, shapes depend on this module through utils
+    from sagemaker_core.main import shapes
+
+    shape_cls = getattr(shapes, shape_name, None)
+    if shape_cls is None:
+        return transform_structure
+    construct_shape = get_model_constructor(shape_cls)
+
+    def _construct_structure(data):
+        return construct_shape(transform_structure(data))
+
+    return _construct_structure
+
+
+def _compile_structure_type(shape_name, pending, construct=False) -> Callable[[dict], dict]:
+    """
+    Compiles the transformer for a structure shape.
+
+    The snake_case attribute names and the converter of every member are resolved once here,
+    so the returned function only has to walk the members present in the data.
+    Nested structures are compiled recursively. The transformer is registered in `pending`
+    before its members are compiled, so self-referencing shapes resolve to it.
+
+    Args:
+        shape_name (str): The name of the structure shape.
+        pending (dict): Transformers compiled in the current pass, not yet published.
+        construct (bool): Whether nested structures are constructed as shape instances.
+
+    Returns:
+        Callable[[dict], dict]: The transformer for the shape.
+
+    Raises:
+        ValueError: If the shape is a basic type.
+    """
+    compiled = _COMPILED_CONSTRUCTORS if construct else _COMPILED_TRANSFORMERS
+    if transformer := compiled.get(shape_name) or pending.get(shape_name):
+        return transformer
+
+    shape = SHAPE_DAG[shape_name]
+    if shape["type"] in BASIC_TYPES:
+        raise ValueError("Unexpected low-level operation model shape")
+
+    members = []
+
+    def _transform_structure(data):
+        result = {}
+        for member_name, attribute_name, convert in members:
+            value = data.get(member_name)
+            if value is None:
+                # skip members that are not in the response
+                continue
+            result[attribute_name] = value if convert is None else convert(value)
+        return result
+
+    pending[shape_name] = _transform_structure
+    for member in shape["members"]:
+        member_type = member["type"]
+        member_shape = member["shape"]
+        if member_type in BASIC_TYPES:
+            convert = None
+        elif member_type == STRUCTURE_TYPE:
+            convert = _compile_nested_structure(member_shape, pending, construct)
+        elif member_type == LIST_TYPE:
+            convert = _compile_list_type(member_shape, pending, construct)
+        elif member_type == MAP_TYPE:
+            convert = _compile_map_type(member_shape, pending, construct)
+        elif member_type == "blob":
+            convert = _convert_blob
+        else:
+            convert = _raise_on_evaluation(f"Unexpected member type encountered: {member_type}")
+        members.append((member["name"], pascal_to_snake(member["name"]), convert))
+
+    return _transform_structure
+
+
+_COMPILED_TRANSFORMERS = {}
+# Transformers constructing nested structures as unvalidated shape instances
+_COMPILED_CONSTRUCTORS = {}
+_COMPILE_LOCK = threading.RLock()
+
+
+def get_transformer(shape, construct=False) -> Callable[[dict], dict]:
+    """
+    Get the compiled transformer for the given shape, compiling it on first use.
+
+    Transformers are cached per shape name. A shape and all of its nested shapes are compiled
+    together and only published to the cache once complete, so concurrent callers never
+    observe a partially compiled transformer.
+
+    Args:
+        shape (str): The name of the structure shape.
+        construct (bool): Whether nested structures are constructed as shape instances
+            with `model_construct` instead of being left as dicts. Defaults to False.
+
+    Returns:
+        Callable[[dict], dict]: A function that transforms data of the shape into snake_case.
+    """
+    compiled = _COMPILED_CONSTRUCTORS if construct else _COMPILED_TRANSFORMERS
+    if transformer := compiled.get(shape):
+        return transformer
+    with _COMPILE_LOCK:
+        if shape not in compiled:
+            pending = {}
+            _compile_structure_type(shape, pending, construct)
+            compiled.update(pending)
+        return compiled[shape]
 
 
 def transform(data, shape, object_instance=None) -> dict:
     """
     Transforms the given data based on the given shape.
 
+    If responses are trusted, see `trusted_responses`, nested structures are constructed as
+    shape instances and the object instance is updated without validation.
+
     Args:
         data (dict): The data to be transformed.
         shape (str): The shape of the data.
@@ -218,48 +554,17 @@ def transform(data, shape, object_instance=None) -> dict:
     Raises:
         ValueError: If an unhandled shape type is encountered.
     """
-    result = {}
-    _shape = SHAPE_DAG[shape]
-
-    if _shape["type"] in BASIC_TYPES:
-        raise ValueError("Unexpected low-level operation model shape")
-
-    for member in _shape["members"]:
-        _member_name = member["name"]
-        _member_shape = member["shape"]
-        _member_type = member["type"]
-        if data.get(_member_name) is None:
-            # skip members that are not in the response
-            continue
-        # 1. set snake case attribute name
-        attribute_name = pascal_to_snake(_member_name)
-        # 2. assign response value
-        if _member_type in BASIC_TYPES:
-            evaluated_value = data[_member_name]
-        elif _member_type == STRUCTURE_TYPE:
-            evaluated_value = transform(data[_member_name], _member_shape)
-        elif _member_type == LIST_TYPE:
-            _list_type_shape = SHAPE_DAG[_member_shape]
-            # 2. assign response value
-            evaluated_value = _evaluate_list_type(data[_member_name], _list_type_shape)
-        elif _member_type == MAP_TYPE:
-            _map_type_shape = SHAPE_DAG[_member_shape]
-            evaluated_value = _evaluate_map_type(data[_member_name], _map_type_shape)
-        elif _member_type == "blob":
-            blob_data = data[_member_name]
-            if isinstance(blob_data, bytes):
-                evaluated_value = BytesIO(blob_data)
-            elif hasattr(blob_data, "read"):
-                # If it's already a file-like object, use it as is
-                evaluated_value = blob_data
-            else:
-                raise ValueError(f"Unexpected blob data type: {type(blob_data)}")
-        else:
-            raise ValueError(f"Unexpected member type encountered: {_member_type}")
-
-        result[attribute_name] = evaluated_value
-        if object_instance:
-            # 3. set attribute value
+    trusted = is_trusted_responses()
+    result = get_transformer(shape, construct=trusted)(data)
+    if object_instance and trusted:
+        constructed = get_model_constructor(type(object_instance))(result)
+        for attribute_name in constructed.model_fields_set:
+            object.__setattr__(
+                object_instance, attribute_name, getattr(constructed, attribute_name)
+            )
+        object_instance.__pydantic_fields_set__.update(constructed.model_fields_set)
+    elif object_instance:
+        for attribute_name, evaluated_value in result.items():
             setattr(object_instance, attribute_name, evaluated_value)
 
     return result
@@ -1,11 +1,53 @@
+import asyncio
 import boto3
 import botocore
+import datetime
+import heapq
+import itertools
+import time
 
 from boto3.session import Session
 import botocore.client
 from botocore.config import Config
-from typing import Generator, Tuple, List
-from sagemaker_core.main.utils import SingletonMeta
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Generator, Iterator, Optional, Tuple, List, Union
+from sagemaker_core.main.exceptions import TimeoutExceededError
+from sagemaker_core.main.utils import (
+    ExponentialPollStrategy,
+    Poller,
+    PollStrategy,
+    SingletonMeta,
+    run_async,
+)
+from sagemaker_core.main.waiters import _refresh_status
+
+# Default maximum number of log streams fetched concurrently, bounded to stay within the
+# GetLogEvents quota of CloudWatch Logs
+DEFAULT_LOG_STREAM_WORKERS = 10
+
+# Default number of milliseconds merged log events are held back to be ordered with late events
+# of other streams
+DEFAULT_LOG_REORDER_WINDOW = 0
+
+# Expected number of log streams above which the log events of all the streams are followed with
+# FilterLogEvents, instead of polling GetLogEvents for every stream
+FILTER_LOG_EVENTS_STREAM_THRESHOLD = DEFAULT_LOG_STREAM_WORKERS
+
+# Default number of milliseconds FilterLogEvents queries look back before the latest event, to
+# catch the events of other streams ingested after it
+DEFAULT_FILTER_LOG_EVENTS_LOOKBACK = 10000
+
+# Initial and maximum number of seconds between the DescribeLogStreams calls discovering the log
+# streams of a job, the delay growing while no new stream appears
+LOG_STREAM_DISCOVERY_INITIAL_DELAY = 5
+LOG_STREAM_DISCOVERY_MAX_DELAY = 60
+
+
+def _get_event_sort_key(stream_event: Tuple[str, dict]) -> Tuple[int, int]:
+    _, event = stream_event
+    return event["timestamp"], event["ingestionTime"]
 
 
 class CloudWatchLogsClient(metaclass=SingletonMeta):
@@ -21,7 +63,10 @@ class CloudWatchLogsClient(metaclass=SingletonMeta):
             self.client = session.client(
                 "logs",
                 session.region_name,
-                config=Config(retries={"max_attempts": 10, "mode": "standard"}),
+                config=Config(
+                    retries={"max_attempts": 10, "mode": "standard"},
+                    max_pool_connections=DEFAULT_LOG_STREAM_WORKERS,
+                ),
             )
 
 
@@ -29,14 +74,22 @@ class LogStreamHandler:
     log_group_name: str = None
     log_stream_name: str = None
     stream_id: int = None
+    start_time: Optional[int] = None
     next_token: str = None
     cw_client = None
 
-    def __init__(self, log_group_name: str, log_stream_name: str, stream_id: int):
+    def __init__(
+        self,
+        log_group_name: str,
+        log_stream_name: str,
+        stream_id: int,
+        start_time: Optional[int] = None,
+    ):
         self.log_group_name = log_group_name
         self.log_stream_name = log_stream_name
         self.cw_client = CloudWatchLogsClient().client
         self.stream_id = stream_id
+        self.start_time = start_time
 
     def get_latest_log_events(self) -> Generator[Tuple[str, dict], None, None]:
         """
@@ -60,6 +113,8 @@ class LogStreamHandler:
         while True:
             if not self.next_token:
                 token_args = {}
+                if self.start_time is not None:
+                    token_args["startTime"] = self.start_time
             else:
                 token_args = {"nextToken": self.next_token}
 
@@ -78,25 +133,173 @@ class LogStreamHandler:
                 yield self.log_stream_name, event
 
 
+class FilterLogEventsHandler:
+    log_group_name: str = None
+    log_stream_name_prefix: str = None
+    filter_pattern: Optional[str] = None
+    lookback: int = DEFAULT_FILTER_LOG_EVENTS_LOOKBACK
+    start_time: Optional[int] = None
+    cw_client = None
+
+    def __init__(
+        self,
+        log_group_name: str,
+        log_stream_name_prefix: str,
+        filter_pattern: Optional[str] = None,
+        lookback: int = DEFAULT_FILTER_LOG_EVENTS_LOOKBACK,
+        start_time: Optional[int] = None,
+    ):
+        self.log_group_name = log_group_name
+        self.log_stream_name_prefix = log_stream_name_prefix
+        self.filter_pattern = filter_pattern
+        self.lookback = lookback
+        self.start_time = start_time
+        self.seen_event_timestamps = {}
+        self.cw_client = CloudWatchLogsClient().client
+
+    def get_latest_log_events(self) -> Generator[Tuple[str, dict], None, None]:
+        """
+        This method gets all the latest log events of the streams with the prefix that exist at this moment.
+
+        A single FilterLogEvents query covers all the streams, starting lookback milliseconds before
+        the latest event of the previous query so that the events ingested late are still caught.
+        The events returned by several queries are de-duplicated by eventId.
+
+        API Reference: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/logs/client/filter_log_events.html
+
+        Returns:
+            Generator[tuple[str, dict], None, None]: Generator that yields a tuple that consists for two values
+                str: stream_name,
+                dict: event dict in format
+                    {
+                        "logStreamName": "string",
+                        "timestamp": number,
+                        "message": "string",
+                        "ingestionTime": number,
+                        "eventId": "string"
+                    }
+        """
+        filter_args = {}
+        if self.filter_pattern:
+            filter_args["filterPattern"] = self.filter_pattern
+        if self.start_time is not None:
+            filter_args["startTime"] = self.start_time
+
+        next_token = None
+        while True:
+            if not next_token:
+                token_args = {}
+            else:
+                token_args = {"nextToken": next_token}
+
+            try:
+                response = self.cw_client.filter_log_events(
+                    logGroupName=self.log_group_name,
+                    logStreamNamePrefix=self.log_stream_name_prefix + "/",
+                    **filter_args,
+                    **token_args,
+                )
+            except botocore.exceptions.ClientError as e:
+                # The log group does not exist until the first container starts logging
+                if e.response["Error"]["Code"] == "ResourceNotFoundException":
+                    return
+                raise
+
+            events = [
+                event
+                for event in response["events"]
+                if event["eventId"] not in self.seen_event_timestamps
+            ]
+            for event in sorted(
+                events, key=lambda event: (event["timestamp"], event["ingestionTime"])
+            ):
+                self.seen_event_timestamps[event["eventId"]] = event["timestamp"]
+                yield event["logStreamName"], event
+
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+
+        if self.seen_event_timestamps:
+            # Only the events within the lookback window can be returned again by the next query
+            self.start_time = max(self.seen_event_timestamps.values()) - self.lookback
+            self.seen_event_timestamps = {
+                event_id: timestamp
+                for event_id, timestamp in self.seen_event_timestamps.items()
+                if timestamp >= self.start_time
+            }
+
+
 class MultiLogStreamHandler:
     log_group_name: str = None
     log_stream_name_prefix: str = None
     expected_stream_count: int = None
-    streams: List[LogStreamHandler] = []
+    max_workers: int = DEFAULT_LOG_STREAM_WORKERS
+    reorder_window: int = DEFAULT_LOG_REORDER_WINDOW
+    start_time: Optional[int] = None
+    streams: List[LogStreamHandler] = None
+    filter_log_events_handler: Optional[FilterLogEventsHandler] = None
     cw_client = None
 
     def __init__(
-        self, log_group_name: str, log_stream_name_prefix: str, expected_stream_count: int
+        self,
+        log_group_name: str,
+        log_stream_name_prefix: str,
+        expected_stream_count: int,
+        max_workers: int = DEFAULT_LOG_STREAM_WORKERS,
+        reorder_window: Optional[int] = None,
+        filter_pattern: Optional[str] = None,
+        use_filter_log_events: Optional[bool] = None,
+        start_time: Optional[int] = None,
     ):
         self.log_group_name = log_group_name
         self.log_stream_name_prefix = log_stream_name_prefix
         self.expected_stream_count = expected_stream_count
+        self.max_workers = max_workers
+        self.start_time = start_time
+        if reorder_window is not None:
+            self.reorder_window = reorder_window
+        self.held_back_events = []
+        self.streams = []
+        self.known_stream_names = set()
+        self.discovery_strategy = ExponentialPollStrategy(
+            initial_delay=LOG_STREAM_DISCOVERY_INITIAL_DELAY,
+            max_delay=LOG_STREAM_DISCOVERY_MAX_DELAY,
+        )
+        self.next_discovery_time = 0
         self.cw_client = CloudWatchLogsClient().client
 
-    def get_latest_log_events(self) -> Generator[Tuple[str, dict], None, None]:
+        if use_filter_log_events is None:
+            # GetLogEvents cannot filter events, and polling it for every stream does not scale
+            use_filter_log_events = (
+                filter_pattern is not None
+                or expected_stream_count > FILTER_LOG_EVENTS_STREAM_THRESHOLD
+            )
+        if use_filter_log_events:
+            self.filter_log_events_handler = FilterLogEventsHandler(
+                log_group_name, log_stream_name_prefix, filter_pattern, start_time=start_time
+            )
+
+    def get_latest_log_events(self, flush: bool = False) -> Generator[Tuple[str, dict], None, None]:
         """
         This method gets all the latest log events from each stream that exist at this moment.
 
+        The first page of events of every stream is fetched concurrently by up to max_workers
+        threads, each stream following its own nextForwardToken. The events of the streams are then
+        merged in order of timestamp and ingestionTime, fetching the next page of a stream only once
+        its current page is merged, so that a single page of events is buffered per stream.
+
+        Events within reorder_window milliseconds of the latest merged event are held back until the
+        next call, so that the late events of slower streams can still be merged before them.
+
+        When following the streams with FilterLogEvents, the events are returned by the
+        FilterLogEventsHandler instead.
+
+        Args:
+            flush: Whether to also yield the held back events, once no more events are expected.
+                The log streams are then discovered regardless of the back-off, so that the
+                streams that appeared since the last discovery are not missed.
+
         Returns:
              Generator[tuple[str, dict], None, None]: Generator that yields a tuple that consists for two values
                 str: stream_name,
@@ -107,26 +310,67 @@ class MultiLogStreamHandler:
                         "timestamp": number
                     }
         """
-        if not self.ready():
+        if self.filter_log_events_handler:
+            yield from self.filter_log_events_handler.get_latest_log_events()
+            return
+
+        if not self.ready(force=flush):
             return []
 
-        for stream in self.streams:
-            yield from stream.get_latest_log_events()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.streams))) as executor:
+            stream_events = list(executor.map(self._prefetch_log_events, self.streams))
+
+        held_back_events = deque()
+        for stream_event in heapq.merge(
+            self.held_back_events, *stream_events, key=_get_event_sort_key
+        ):
+            held_back_events.append(stream_event)
+            timestamp, _ = _get_event_sort_key(stream_event)
+            while (
+                held_back_events
+                and _get_event_sort_key(held_back_events[0])[0] <= timestamp - self.reorder_window
+            ):
+                yield held_back_events.popleft()
+
+        if flush:
+            yield from held_back_events
+            held_back_events.clear()
+        self.held_back_events = list(held_back_events)
+
+    @staticmethod
+    def _prefetch_log_events(stream: LogStreamHandler) -> Iterator[Tuple[str, dict]]:
+        """Fetch the first page of events of the stream, the next pages are fetched lazily."""
+        events = stream.get_latest_log_events()
+        first_event = next(events, None)
+        if first_event is None:
+            return iter([])
+        return itertools.chain([first_event], events)
 
-    def ready(self) -> bool:
+    def ready(self, force: bool = False) -> bool:
         """
         Checks whether or not MultiLogStreamHandler is ready to serve new log events at this moment.
 
-        If self.streams is already set, return True.
-        Otherwise, check if the current number of log streams in the log group match the exptected stream count.
+        If all the expected streams are known, or the streams are followed by FilterLogEvents,
+        return True. Otherwise, discover the log streams of the log group that are not known yet,
+        and return True as soon as any stream exists, so that the streams of the first hosts are
+        tailed while the others start. The discovery is backed off while no new stream appears.
+
+        Args:
+            force: Whether to discover the log streams regardless of the back-off.
 
         Returns:
             bool: Whether or not MultiLogStreamHandler is ready to serve new log events.
         """
 
+        if self.filter_log_events_handler:
+            return True
+
         if len(self.streams) >= self.expected_stream_count:
             return True
 
+        if not force and time.time() < self.next_discovery_time:
+            return len(self.streams) > 0
+
         try:
             response = self.cw_client.describe_log_streams(
                 logGroupName=self.log_group_name,
@@ -146,22 +390,159 @@ class MultiLogStreamHandler:
                 stream_names.extend([stream["logStreamName"] for stream in response["logStreams"]])
                 next_token = response.get("nextToken", None)
 
-            if len(stream_names) >= self.expected_stream_count:
-                self.streams = [
-                    LogStreamHandler(self.log_group_name, log_stream_name, index)
-                    for index, log_stream_name in enumerate(stream_names)
-                ]
-
-                return True
-            else:
-                # Log streams are created whenever a container starts writing to stdout/err,
-                # so if the stream count is less than the expected number, return False
-                return False
-
         except botocore.exceptions.ClientError as e:
             # On the very first training job run on an account, there's no log group until
             # the container starts logging, so ignore any errors thrown about that
             if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                return False
+                stream_names = []
             else:
                 raise
+
+        # Log streams are created whenever a container starts writing to stdout/err,
+        # so the streams of the hosts appear one after the other
+        new_stream_names = [name for name in stream_names if name not in self.known_stream_names]
+        for log_stream_name in new_stream_names:
+            self.streams.append(
+                LogStreamHandler(
+                    self.log_group_name, log_stream_name, len(self.streams), self.start_time
+                )
+            )
+            self.known_stream_names.add(log_stream_name)
+
+        if new_stream_names:
+            self.discovery_strategy.reset()
+        self.next_discovery_time = time.time() + self.discovery_strategy.next_delay()
+
+        return len(self.streams) > 0
+
+
+@dataclass
+class LogEvent:
+    """
+    A log event of a job.
+
+    Attributes:
+        stream_id: The name of the log stream of the event.
+        timestamp: The time of the event, in milliseconds since the epoch.
+        message: The message of the event.
+        ingestion_time: The time the event was ingested, in milliseconds since the epoch.
+    """
+
+    stream_id: str
+    timestamp: int
+    message: str
+    ingestion_time: Optional[int] = None
+
+
+class JobLogStreamer:
+    """
+    Streams the log events of a job, iterated over with for or async for.
+
+    The log events are fetched while they are consumed, a page of events per stream at a time, so
+    a slow consumer slows down the polling of the logs instead of buffering them in memory. When
+    iterated over with async for, the job and its logs are polled on the thread pool of the async
+    bridge.
+
+    Example:
+        for event in training_job.stream_logs():
+            print(event.stream_id, event.timestamp, event.message)
+
+        async for event in training_job.stream_logs(start_time=start_time):
+            await sink.send(event)
+    """
+
+    def __init__(
+        self,
+        resource: Any,
+        log_group_name: str,
+        instance_count: int,
+        follow: bool = True,
+        start_time: Optional[datetime.datetime] = None,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        filter_pattern: Optional[str] = None,
+    ):
+        """
+        Initializes a JobLogStreamer.
+
+        Args:
+            resource (Any): The job, e.g. a TrainingJob.
+            log_group_name (str): The name of the log group of the job.
+            instance_count (int): The number of instances of the job, each writing a log stream.
+            follow (bool, optional): Whether to keep polling for new log events until the job
+                reaches a terminal state, rather than only getting the log events that exist at
+                this moment. Defaults to True.
+            start_time (datetime.datetime, optional): The time of the first log events to get.
+                Defaults to None, getting the log events from the start of the job.
+            poll (Union[int, PollStrategy], optional): The number of seconds to wait between each
+                poll, or the strategy choosing the delays between polls. Defaults to 5.
+            timeout (int, optional): The maximum number of seconds to follow the logs.
+                Defaults to None, following them until the job reaches a terminal state.
+            filter_pattern (str, optional): The CloudWatch Logs filter pattern the log events must
+                match. Defaults to None.
+        """
+        self.resource = resource
+        self.follow = follow
+        self.poller = Poller(poll, timeout)
+        self.timeout = timeout
+        self.current_status = None
+        self.finished = False
+        self.log_handler = MultiLogStreamHandler(
+            log_group_name=log_group_name,
+            log_stream_name_prefix=resource.get_name(),
+            expected_stream_count=instance_count,
+            filter_pattern=filter_pattern,
+            start_time=int(start_time.timestamp() * 1000) if start_time else None,
+        )
+
+    def get_latest_log_events(self) -> Generator[LogEvent, None, None]:
+        """
+        Refresh the job when following its logs, and get the log events that exist at this moment.
+
+        Returns:
+            Generator[LogEvent, None, None]: Generator that yields the log events of the job.
+        """
+        if self.follow:
+            self.current_status = _refresh_status(self.resource, self.poller)
+            self.finished = self.current_status in self.resource._terminal_states
+        else:
+            self.finished = True
+
+        for stream_id, event in self.log_handler.get_latest_log_events(flush=self.finished):
+            yield LogEvent(
+                stream_id=stream_id,
+                timestamp=event["timestamp"],
+                message=event["message"],
+                ingestion_time=event.get("ingestionTime"),
+            )
+
+    def _check_timeout(self):
+        if self.timeout is not None and time.time() - self.poller.start_time >= self.timeout:
+            raise TimeoutExceededError(
+                resource_type=type(self.resource).__name__, status=self.current_status
+            )
+
+    def __iter__(self) -> Generator[LogEvent, None, None]:
+        while True:
+            yield from self.get_latest_log_events()
+            if self.finished:
+                return
+
+            self._check_timeout()
+            self.poller.sleep(self.current_status)
+
+    async def __aiter__(self) -> AsyncGenerator[LogEvent, None]:
+        while True:
+            events = self.get_latest_log_events()
+            while True:
+                # StopIteration cannot be raised through a future, the generator marks the end
+                event = await run_async(next, events, events)
+                if event is events:
+                    break
+                yield event
+
+            if self.finished:
+                return
+
+            self._check_timeout()
+            await asyncio.sleep(self.poller.next_delay(self.current_status))
@@ -0,0 +1,121 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import importlib
+
+RESOURCE_MODULES = {
+    "Action": "action",
+    "Algorithm": "algorithm",
+    "App": "app",
+    "AppImageConfig": "app_image_config",
+    "Artifact": "artifact",
+    "Association": "association",
+    "AutoMLJob": "auto_ml_job",
+    "AutoMLJobV2": "auto_ml_job_v2",
+    "Cluster": "cluster",
+    "ClusterSchedulerConfig": "cluster_scheduler_config",
+    "CodeRepository": "code_repository",
+    "CompilationJob": "compilation_job",
+    "ComputeQuota": "compute_quota",
+    "Context": "context",
+    "DataQualityJobDefinition": "data_quality_job_definition",
+    "Device": "device",
+    "DeviceFleet": "device_fleet",
+    "Domain": "domain",
+    "EdgeDeploymentPlan": "edge_deployment_plan",
+    "EdgePackagingJob": "edge_packaging_job",
+    "Endpoint": "endpoint",
+    "EndpointConfig": "endpoint_config",
+    "Experiment": "experiment",
+    "FeatureGroup": "feature_group",
+    "FeatureMetadata": "feature_metadata",
+    "FeatureStore": "feature_store",
+    "FlowDefinition": "flow_definition",
+    "Hub": "hub",
+    "HubContent": "hub_content",
+    "HubContentPresignedUrls": "hub_content_presigned_urls",
+    "HubContentReference": "hub_content_reference",
+    "HumanTaskUi": "human_task_ui",
+    "HyperParameterTuningJob": "hyper_parameter_tuning_job",
+    "Image": "image",
+    "ImageVersion": "image_version",
+    "InferenceComponent": "inference_component",
+    "InferenceExperiment": "inference_experiment",
+    "InferenceRecommendationsJob": "inference_recommendations_job",
+    "LabelingJob": "labeling_job",
+    "LineageGroup": "lineage_group",
+    "MlflowApp": "mlflow_app",
+    "MlflowTrackingServer": "mlflow_tracking_server",
+    "Model": "model",
+    "ModelBiasJobDefinition": "model_bias_job_definition",
+    "ModelCard": "model_card",
+    "ModelCardExportJob": "model_card_export_job",
+    "ModelExplainabilityJobDefinition": "model_explainability_job_definition",
+    "ModelPackage": "model_package",
+    "ModelPackageGroup": "model_package_group",
+    "ModelQualityJobDefinition": "model_quality_job_definition",
+    "MonitoringAlert": "monitoring_alert",
+    "MonitoringExecution": "monitoring_execution",
+    "MonitoringSchedule": "monitoring_schedule",
+    "NotebookInstance": "notebook_instance",
+    "NotebookInstanceLifecycleConfig": "notebook_instance_lifecycle_config",
+    "OptimizationJob": "optimization_job",
+    "PartnerApp": "partner_app",
+    "PartnerAppPresignedUrl": "partner_app_presigned_url",
+    "Pipeline": "pipeline",
+    "PipelineExecution": "pipeline_execution",
+    "PresignedDomainUrl": "presigned_domain_url",
+    "PresignedMlflowAppUrl": "presigned_mlflow_app_url",
+    "PresignedMlflowTrackingServerUrl": "presigned_mlflow_tracking_server_url",
+    "PresignedNotebookInstanceUrl": "presigned_notebook_instance_url",
+    "ProcessingJob": "processing_job",
+    "Project": "project",
+    "ResourceCatalog": "resource_catalog",
+    "SagemakerServicecatalogPortfolio": "sagemaker_servicecatalog_portfolio",
+    "Space": "space",
+    "StudioLifecycleConfig": "studio_lifecycle_config",
+    "SubscribedWorkteam": "subscribed_workteam",
+    "Tag": "tag",
+    "TrainingJob": "training_job",
+    "TrainingPlan": "training_plan",
+    "TransformJob": "transform_job",
+    "Trial": "trial",
+    "TrialComponent": "trial_component",
+    "UserProfile": "user_profile",
+    "Workforce": "workforce",
+    "Workteam": "workteam",
+}
+
+__all__ = ["Base", *RESOURCE_MODULES]
+
+
+def __getattr__(name: str):
+    """
+    Lazily import resource classes from their modules on first access (PEP 562).
+
+    Other names resolve against the base module, which holds the Base class and the shared imports.
+    """
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = RESOURCE_MODULES.get(name, "_base")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
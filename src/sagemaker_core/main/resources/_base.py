@@ -0,0 +1,210 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+import inspect
+import sagemaker_core.main.resources as resources
+
+
+logger = get_textual_rich_logger(__name__)
+
+
+class Base(BaseModel):
+    model_config = ConfigDict(protected_namespaces=(), validate_assignment=True, extra="forbid")
+    # The session and region the resource was fetched with, used by the methods of the resource
+    _session: Optional[Session] = None
+    _region_name: Optional[str] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        # Resources are generated into per-resource modules but are exposed by the resources package
+        if cls.__module__.startswith(f"{resources.__name__}."):
+            cls.__module__ = resources.__name__
+        super().__pydantic_init_subclass__(**kwargs)
+
+    def __getattr__(self, name):
+        # Resources listed by get_all without hydration only hold the fields of their summary,
+        # the other fields are loaded with refresh on first access
+        fields = type(self).model_fields
+        if name in fields and hasattr(type(self), "refresh"):
+            unloaded_fields = {
+                field_name: field.get_default(call_default_factory=True)
+                for field_name, field in fields.items()
+                if field_name not in self.__dict__
+            }
+            self.__dict__.update(unloaded_fields)
+            try:
+                self.refresh()
+            except BaseException:
+                for field_name, default in unloaded_fields.items():
+                    if self.__dict__.get(field_name) is default:
+                        del self.__dict__[field_name]
+                raise
+            return self.__dict__[name]
+        return super().__getattr__(name)
+
+    @classmethod
+    def get_sagemaker_client(cls, session=None, region_name=None, service_name="sagemaker"):
+        return SageMakerClient(session=session, region_name=region_name).get_client(
+            service_name=service_name
+        )
+
+    def _set_client_context(
+        self, session: Optional[Session] = None, region_name: Optional[str] = None
+    ):
+        self._session = session
+        self._region_name = region_name
+
+    def _get_resource_client(self, service_name: str = "sagemaker"):
+        return Base.get_sagemaker_client(
+            session=self._session, region_name=self._region_name, service_name=service_name
+        )
+
+    @staticmethod
+    def get_updated_kwargs_with_configured_attributes(
+        config_schema_for_resource: dict, resource_name: str, **kwargs
+    ):
+        try:
+            for configurable_attribute in config_schema_for_resource:
+                if kwargs.get(configurable_attribute) is None:
+                    resource_defaults = load_default_configs_for_resource_name(
+                        resource_name=resource_name
+                    )
+                    global_defaults = load_default_configs_for_resource_name(
+                        resource_name="GlobalDefaults"
+                    )
+                    if config_value := get_config_value(
+                        configurable_attribute, resource_defaults, global_defaults
+                    ):
+                        resource_name = snake_to_pascal(configurable_attribute)
+                        class_object = getattr(shapes, resource_name, None) or getattr(
+                            resources, resource_name, None
+                        )
+                        kwargs[configurable_attribute] = class_object(**config_value)
+        except BaseException as e:
+            logger.debug("Could not load Default Configs. Continuing.", exc_info=True)
+            # Continue with existing kwargs if no default configs found
+        return kwargs
+
+    @staticmethod
+    def populate_chained_attributes(resource_name: str, operation_input_args: Union[dict, object]):
+        resource_name_in_snake_case = pascal_to_snake(resource_name)
+        updated_args = (
+            vars(operation_input_args)
+            if type(operation_input_args) == object
+            else operation_input_args
+        )
+        unassigned_args = []
+        keys = operation_input_args.keys()
+        for arg in keys:
+            value = operation_input_args.get(arg)
+            arg_snake = pascal_to_snake(arg)
+
+            if value == Unassigned():
+                unassigned_args.append(arg)
+            elif value == None or not value:
+                continue
+            elif (
+                arg_snake.endswith("name")
+                and arg_snake[: -len("_name")] != resource_name_in_snake_case
+                and arg_snake != "name"
+            ):
+                if value and value != Unassigned() and type(value) != str:
+                    updated_args[arg] = value.get_name()
+            elif isinstance(value, list) and is_primitive_list(value):
+                continue
+            elif isinstance(value, list) and value != []:
+                updated_args[arg] = [Base._get_chained_attribute(list_item) for list_item in value]
+            elif is_not_primitive(value) and is_not_str_dict(value) and type(value) == object:
+                updated_args[arg] = Base._get_chained_attribute(item_value=value)
+
+        for unassigned_arg in unassigned_args:
+            del updated_args[unassigned_arg]
+        return updated_args
+
+    @staticmethod
+    def _get_chained_attribute(item_value: Any):
+        resource_name = type(item_value).__name__
+        class_object = getattr(resources, resource_name, None) or getattr(
+            shapes, resource_name, None
+        )
+        if class_object is None:
+            return item_value
+        return class_object(
+            **Base.populate_chained_attributes(
+                resource_name=resource_name, operation_input_args=vars(item_value)
+            )
+        )
+
+    @staticmethod
+    def add_validate_call(func):
+        validated_func = None
+
+        def get_validated_func():
+            nonlocal validated_func
+            # Build the validator once, on first call, when the annotations of func can be resolved
+            if validated_func is None:
+                config = dict(arbitrary_types_allowed=True)
+                validated_func = validate_call(config=config)(func)
+            return validated_func
+
+        if inspect.iscoroutinefunction(func):
+            # Coroutine functions stay coroutine functions, e.g. for inspect and asyncio
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await get_validated_func()(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return get_validated_func()(*args, **kwargs)
+
+        return wrapper
@@ -0,0 +1,586 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class Algorithm(Base):
+    """
+    Class representing resource Algorithm
+
+    Attributes:
+        algorithm_name: The name of the algorithm being described.
+        algorithm_arn: The Amazon Resource Name (ARN) of the algorithm.
+        creation_time: A timestamp specifying when the algorithm was created.
+        training_specification: Details about training jobs run by this algorithm.
+        algorithm_status: The current status of the algorithm.
+        algorithm_status_details: Details about the current status of the algorithm.
+        algorithm_description: A brief summary about the algorithm.
+        inference_specification: Details about inference jobs that the algorithm runs.
+        validation_specification: Details about configurations for one or more training jobs that SageMaker runs to test the algorithm.
+        product_id: The product identifier of the algorithm.
+        certify_for_marketplace: Whether the algorithm is certified to be listed in Amazon Web Services Marketplace.
+
+    """
+
+    algorithm_name: str
+    algorithm_arn: Optional[str] = Unassigned()
+    algorithm_description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    training_specification: Optional[shapes.TrainingSpecification] = Unassigned()
+    inference_specification: Optional[shapes.InferenceSpecification] = Unassigned()
+    validation_specification: Optional[shapes.AlgorithmValidationSpecification] = Unassigned()
+    algorithm_status: Optional[str] = Unassigned()
+    algorithm_status_details: Optional[shapes.AlgorithmStatusDetails] = Unassigned()
+    product_id: Optional[str] = Unassigned()
+    certify_for_marketplace: Optional[bool] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["algorithm_status"]
+    _terminal_states: ClassVar[List[str]] = []
+    _failure_reason_attribute: ClassVar[Optional[str]] = None
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "algorithm_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object algorithm")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "training_specification": {
+                    "additional_s3_data_source": {
+                        "s3_data_type": {"type": "string"},
+                        "s3_uri": {"type": "string"},
+                    }
+                },
+                "validation_specification": {"validation_role": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Algorithm", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        algorithm_name: str,
+        training_specification: shapes.TrainingSpecification,
+        algorithm_description: Optional[str] = Unassigned(),
+        inference_specification: Optional[shapes.InferenceSpecification] = Unassigned(),
+        validation_specification: Optional[shapes.AlgorithmValidationSpecification] = Unassigned(),
+        certify_for_marketplace: Optional[bool] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Algorithm"]:
+        """
+        Create a Algorithm resource
+
+        Parameters:
+            algorithm_name: The name of the algorithm.
+            training_specification: Specifies details about training jobs run by this algorithm, including the following:   The Amazon ECR path of the container and the version digest of the algorithm.   The hyperparameters that the algorithm supports.   The instance types that the algorithm supports for training.   Whether the algorithm supports distributed training.   The metrics that the algorithm emits to Amazon CloudWatch.   Which metrics that the algorithm emits can be used as the objective metric for hyperparameter tuning jobs.   The input channels that the algorithm supports for training data. For example, an algorithm might support train, validation, and test channels.
+            algorithm_description: A description of the algorithm.
+            inference_specification: Specifies details about inference jobs that the algorithm runs, including the following:   The Amazon ECR paths of containers that contain the inference code and model artifacts.   The instance types that the algorithm supports for transform jobs and real-time endpoints used for inference.   The input and output content formats that the algorithm supports for inference.
+            validation_specification: Specifies configurations for one or more training jobs and that SageMaker runs to test the algorithm's training code and, optionally, one or more batch transform jobs that SageMaker runs to test the algorithm's inference code.
+            certify_for_marketplace: Whether to certify the algorithm so that it can be listed in Amazon Web Services Marketplace.
+            tags: An array of key-value pairs. You can use tags to categorize your Amazon Web Services resources in different ways, for example, by purpose, owner, or environment. For more information, see Tagging Amazon Web Services Resources.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Algorithm resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating algorithm resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "AlgorithmName": algorithm_name,
+            "AlgorithmDescription": algorithm_description,
+            "TrainingSpecification": training_specification,
+            "InferenceSpecification": inference_specification,
+            "ValidationSpecification": validation_specification,
+            "CertifyForMarketplace": certify_for_marketplace,
+            "Tags": tags,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="Algorithm", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_algorithm(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(algorithm_name=algorithm_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        algorithm_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Algorithm"]:
+        """
+        Get a Algorithm resource
+
+        Parameters:
+            algorithm_name: The name of the algorithm to describe.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Algorithm resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        operation_input_args = {
+            "AlgorithmName": algorithm_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_algorithm(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeAlgorithmOutput")
+        algorithm = build_from_response(cls, transformed_response)
+        algorithm._set_client_context(session=session, region_name=region)
+        return algorithm
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["Algorithm"]:
+        """
+        Refresh a Algorithm resource
+
+        Returns:
+            The Algorithm resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        operation_input_args = {
+            "AlgorithmName": self.algorithm_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_algorithm(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeAlgorithmOutput", self)
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a Algorithm resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "AlgorithmName": self.algorithm_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_algorithm(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait_for_status(
+        self,
+        target_status: Literal["Pending", "InProgress", "Completed", "Failed", "Deleting"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a Algorithm resource to reach certain status.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            f"Waiting for Algorithm to reach [bold]{target_status} status...",
+            display,
+            status_callback,
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.algorithm_status
+                waiter_display.update(current_status)
+
+                if target_status == current_status:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+                    return
+
+                if "failed" in current_status.lower():
+                    raise FailedStatusError(
+                        resource_type="Algorithm", status=current_status, reason="(Unknown)"
+                    )
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="Algorithm", status=current_status)
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def wait_for_delete(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a Algorithm resource to be deleted.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for Algorithm to be deleted...", display, status_callback, transient=False
+        ) as waiter_display:
+            while True:
+                try:
+                    poller.call(self.refresh)
+                    current_status = self.algorithm_status
+                    waiter_display.update(current_status)
+
+                    if timeout is not None and time.time() - start_time >= timeout:
+                        raise TimeoutExceededError(resouce_type="Algorithm", status=current_status)
+                except botocore.exceptions.ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+
+                    if "ResourceNotFound" in error_code or "ValidationException" in error_code:
+                        logger.info("Resource was not found. It may have been deleted.")
+                        return
+                    raise e
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Algorithm"]:
+        """
+        Get all Algorithm resources
+
+        Parameters:
+            creation_time_after: A filter that returns only algorithms created after the specified time (timestamp).
+            creation_time_before: A filter that returns only algorithms created before the specified time (timestamp).
+            max_results: The maximum number of algorithms to return in the response.
+            name_contains: A string in the algorithm name. This filter returns only algorithms whose name contains the specified string.
+            next_token: If the response to a previous ListAlgorithms request was truncated, the response includes a NextToken. To retrieve the next set of algorithms, use the token in the next request.
+            sort_by: The parameter by which to sort the results. The default is CreationTime.
+            sort_order: The sort order for the results. The default is Ascending.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed Algorithm resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "MaxResults": max_results,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_algorithms",
+            summaries_key="AlgorithmSummaryList",
+            summary_name="AlgorithmSummary",
+            resource_cls=Algorithm,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["Algorithm"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["Algorithm"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["Algorithm"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_status(
+        self,
+        target_status: Literal["Pending", "InProgress", "Completed", "Failed", "Deleting"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_status, waiting for a Algorithm resource to reach certain status without blocking the event loop.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+    @Base.add_validate_call
+    async def await_deletion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_delete, waiting for a Algorithm resource to be deleted without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+            TimeoutExceededError:  If the resource is not deleted before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_for_delete_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["Algorithm"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,605 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class App(Base):
+    """
+    Class representing resource App
+
+    Attributes:
+        app_arn: The Amazon Resource Name (ARN) of the app.
+        app_type: The type of app.
+        app_name: The name of the app.
+        domain_id: The domain ID.
+        user_profile_name: The user profile name.
+        space_name: The name of the space. If this value is not set, then UserProfileName must be set.
+        status: The status.
+        effective_trusted_identity_propagation_status: The effective status of Trusted Identity Propagation (TIP) for this application. When enabled, user identities from IAM Identity Center are being propagated through the application to TIP enabled Amazon Web Services services. When disabled, standard IAM role-based access is used.
+        recovery_mode:  Indicates whether the application is launched in recovery mode.
+        last_health_check_timestamp: The timestamp of the last health check.
+        last_user_activity_timestamp: The timestamp of the last user's activity. LastUserActivityTimestamp is also updated when SageMaker AI performs health checks without user activity. As a result, this value is set to the same value as LastHealthCheckTimestamp.
+        creation_time: The creation time of the application.  After an application has been shut down for 24 hours, SageMaker AI deletes all metadata for the application. To be considered an update and retain application metadata, applications must be restarted within 24 hours after the previous application has been shut down. After this time window, creation of an application is considered a new application rather than an update of the previous application.
+        failure_reason: The failure reason.
+        resource_spec: The instance type and the Amazon Resource Name (ARN) of the SageMaker AI image created on the instance.
+        built_in_lifecycle_config_arn: The lifecycle configuration that runs before the default lifecycle configuration
+
+    """
+
+    domain_id: str
+    app_type: str
+    app_name: str
+    app_arn: Optional[str] = Unassigned()
+    user_profile_name: Optional[str] = Unassigned()
+    space_name: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    effective_trusted_identity_propagation_status: Optional[str] = Unassigned()
+    recovery_mode: Optional[bool] = Unassigned()
+    last_health_check_timestamp: Optional[datetime.datetime] = Unassigned()
+    last_user_activity_timestamp: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    resource_spec: Optional[shapes.ResourceSpec] = Unassigned()
+    built_in_lifecycle_config_arn: Optional[str] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["status"]
+    _terminal_states: ClassVar[List[str]] = []
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "app_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object app")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def create(
+        cls,
+        domain_id: str,
+        app_type: str,
+        app_name: str,
+        user_profile_name: Optional[Union[str, object]] = Unassigned(),
+        space_name: Optional[Union[str, object]] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        resource_spec: Optional[shapes.ResourceSpec] = Unassigned(),
+        recovery_mode: Optional[bool] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["App"]:
+        """
+        Create a App resource
+
+        Parameters:
+            domain_id: The domain ID.
+            app_type: The type of app.
+            app_name: The name of the app.
+            user_profile_name: The user profile name. If this value is not set, then SpaceName must be set.
+            space_name: The name of the space. If this value is not set, then UserProfileName must be set.
+            tags: Each tag consists of a key and an optional value. Tag keys must be unique per resource.
+            resource_spec: The instance type and the Amazon Resource Name (ARN) of the SageMaker AI image created on the instance.  The value of InstanceType passed as part of the ResourceSpec in the CreateApp call overrides the value passed as part of the ResourceSpec configured for the user profile or the domain. If InstanceType is not specified in any of those three ResourceSpec values for a KernelGateway app, the CreateApp call fails with a request validation error.
+            recovery_mode:  Indicates whether the application is launched in recovery mode.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The App resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating app resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "DomainId": domain_id,
+            "UserProfileName": user_profile_name,
+            "SpaceName": space_name,
+            "AppType": app_type,
+            "AppName": app_name,
+            "Tags": tags,
+            "ResourceSpec": resource_spec,
+            "RecoveryMode": recovery_mode,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="App", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_app(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(
+            domain_id=domain_id,
+            app_type=app_type,
+            app_name=app_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        domain_id: str,
+        app_type: str,
+        app_name: str,
+        user_profile_name: Optional[str] = Unassigned(),
+        space_name: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["App"]:
+        """
+        Get a App resource
+
+        Parameters:
+            domain_id: The domain ID.
+            app_type: The type of app.
+            app_name: The name of the app.
+            user_profile_name: The user profile name. If this value is not set, then SpaceName must be set.
+            space_name: The name of the space.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The App resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "DomainId": domain_id,
+            "UserProfileName": user_profile_name,
+            "SpaceName": space_name,
+            "AppType": app_type,
+            "AppName": app_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_app(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeAppResponse")
+        app = build_from_response(cls, transformed_response)
+        app._set_client_context(session=session, region_name=region)
+        return app
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["App"]:
+        """
+        Refresh a App resource
+
+        Returns:
+            The App resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "SpaceName": self.space_name,
+            "AppType": self.app_type,
+            "AppName": self.app_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_app(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeAppResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a App resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "UserProfileName": self.user_profile_name,
+            "SpaceName": self.space_name,
+            "AppType": self.app_type,
+            "AppName": self.app_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_app(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait_for_status(
+        self,
+        target_status: Literal["Deleted", "Deleting", "Failed", "InService", "Pending"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a App resource to reach certain status.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            f"Waiting for App to reach [bold]{target_status} status...", display, status_callback
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.status
+                waiter_display.update(current_status)
+
+                if target_status == current_status:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+                    return
+
+                if "failed" in current_status.lower():
+                    raise FailedStatusError(
+                        resource_type="App", status=current_status, reason=self.failure_reason
+                    )
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="App", status=current_status)
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def wait_for_delete(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a App resource to be deleted.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for App to be deleted...", display, status_callback, transient=False
+        ) as waiter_display:
+            while True:
+                try:
+                    poller.call(self.refresh)
+                    current_status = self.status
+                    waiter_display.update(current_status)
+
+                    if current_status.lower() == "deleted":
+                        print("Resource was deleted.")
+                        return
+
+                    if timeout is not None and time.time() - start_time >= timeout:
+                        raise TimeoutExceededError(resouce_type="App", status=current_status)
+                except botocore.exceptions.ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+
+                    if "ResourceNotFound" in error_code or "ValidationException" in error_code:
+                        logger.info("Resource was not found. It may have been deleted.")
+                        return
+                    raise e
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        max_results: Optional[int] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        domain_id_equals: Optional[str] = Unassigned(),
+        user_profile_name_equals: Optional[str] = Unassigned(),
+        space_name_equals: Optional[str] = Unassigned(),
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["App"]:
+        """
+        Get all App resources
+
+        Parameters:
+            next_token: If the previous response was truncated, you will receive this token. Use it in your next request to receive the next set of results.
+            max_results: This parameter defines the maximum number of results that can be return in a single response. The MaxResults parameter is an upper bound, not a target. If there are more results available than the value specified, a NextToken is provided in the response. The NextToken indicates that the user should get the next set of results by providing this token as a part of a subsequent call. The default value for MaxResults is 10.
+            sort_order: The sort order for the results. The default is Ascending.
+            sort_by: The parameter by which to sort the results. The default is CreationTime.
+            domain_id_equals: A parameter to search for the domain ID.
+            user_profile_name_equals: A parameter to search by user profile name. If SpaceNameEquals is set, then this value cannot be set.
+            space_name_equals: A parameter to search by space name. If UserProfileNameEquals is set, then this value cannot be set.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed App resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "MaxResults": max_results,
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+            "DomainIdEquals": domain_id_equals,
+            "UserProfileNameEquals": user_profile_name_equals,
+            "SpaceNameEquals": space_name_equals,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_apps",
+            summaries_key="Apps",
+            summary_name="AppDetails",
+            resource_cls=App,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["App"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["App"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["App"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_status(
+        self,
+        target_status: Literal["Deleted", "Deleting", "Failed", "InService", "Pending"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_status, waiting for a App resource to reach certain status without blocking the event loop.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+    @Base.add_validate_call
+    async def await_deletion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_delete, waiting for a App resource to be deleted without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+            TimeoutExceededError:  If the resource is not deleted before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_for_delete_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["App"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
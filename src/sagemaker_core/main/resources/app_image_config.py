@@ -0,0 +1,461 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class AppImageConfig(Base):
+    """
+    Class representing resource AppImageConfig
+
+    Attributes:
+        app_image_config_arn: The ARN of the AppImageConfig.
+        app_image_config_name: The name of the AppImageConfig.
+        creation_time: When the AppImageConfig was created.
+        last_modified_time: When the AppImageConfig was last modified.
+        kernel_gateway_image_config: The configuration of a KernelGateway app.
+        jupyter_lab_app_image_config: The configuration of the JupyterLab app.
+        code_editor_app_image_config: The configuration of the Code Editor app.
+
+    """
+
+    app_image_config_name: str
+    app_image_config_arn: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    kernel_gateway_image_config: Optional[shapes.KernelGatewayImageConfig] = Unassigned()
+    jupyter_lab_app_image_config: Optional[shapes.JupyterLabAppImageConfig] = Unassigned()
+    code_editor_app_image_config: Optional[shapes.CodeEditorAppImageConfig] = Unassigned()
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "app_image_config_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object app_image_config")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def create(
+        cls,
+        app_image_config_name: str,
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        kernel_gateway_image_config: Optional[shapes.KernelGatewayImageConfig] = Unassigned(),
+        jupyter_lab_app_image_config: Optional[shapes.JupyterLabAppImageConfig] = Unassigned(),
+        code_editor_app_image_config: Optional[shapes.CodeEditorAppImageConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["AppImageConfig"]:
+        """
+        Create a AppImageConfig resource
+
+        Parameters:
+            app_image_config_name: The name of the AppImageConfig. Must be unique to your account.
+            tags: A list of tags to apply to the AppImageConfig.
+            kernel_gateway_image_config: The KernelGatewayImageConfig. You can only specify one image kernel in the AppImageConfig API. This kernel will be shown to users before the image starts. Once the image runs, all kernels are visible in JupyterLab.
+            jupyter_lab_app_image_config: The JupyterLabAppImageConfig. You can only specify one image kernel in the AppImageConfig API. This kernel is shown to users before the image starts. After the image runs, all kernels are visible in JupyterLab.
+            code_editor_app_image_config: The CodeEditorAppImageConfig. You can only specify one image kernel in the AppImageConfig API. This kernel is shown to users before the image starts. After the image runs, all kernels are visible in Code Editor.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The AppImageConfig resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating app_image_config resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "AppImageConfigName": app_image_config_name,
+            "Tags": tags,
+            "KernelGatewayImageConfig": kernel_gateway_image_config,
+            "JupyterLabAppImageConfig": jupyter_lab_app_image_config,
+            "CodeEditorAppImageConfig": code_editor_app_image_config,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="AppImageConfig", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_app_image_config(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(app_image_config_name=app_image_config_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        app_image_config_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["AppImageConfig"]:
+        """
+        Get a AppImageConfig resource
+
+        Parameters:
+            app_image_config_name: The name of the AppImageConfig to describe.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The AppImageConfig resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "AppImageConfigName": app_image_config_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_app_image_config(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeAppImageConfigResponse")
+        app_image_config = build_from_response(cls, transformed_response)
+        app_image_config._set_client_context(session=session, region_name=region)
+        return app_image_config
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["AppImageConfig"]:
+        """
+        Refresh a AppImageConfig resource
+
+        Returns:
+            The AppImageConfig resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "AppImageConfigName": self.app_image_config_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_app_image_config(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeAppImageConfigResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def update(
+        self,
+        kernel_gateway_image_config: Optional[shapes.KernelGatewayImageConfig] = Unassigned(),
+        jupyter_lab_app_image_config: Optional[shapes.JupyterLabAppImageConfig] = Unassigned(),
+        code_editor_app_image_config: Optional[shapes.CodeEditorAppImageConfig] = Unassigned(),
+    ) -> Optional["AppImageConfig"]:
+        """
+        Update a AppImageConfig resource
+
+        Returns:
+            The AppImageConfig resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating app_image_config resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "AppImageConfigName": self.app_image_config_name,
+            "KernelGatewayImageConfig": kernel_gateway_image_config,
+            "JupyterLabAppImageConfig": jupyter_lab_app_image_config,
+            "CodeEditorAppImageConfig": code_editor_app_image_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_app_image_config(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a AppImageConfig resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "AppImageConfigName": self.app_image_config_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_app_image_config(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        max_results: Optional[int] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["AppImageConfig"]:
+        """
+        Get all AppImageConfig resources
+
+        Parameters:
+            max_results: The total number of items to return in the response. If the total number of items available is more than the value specified, a NextToken is provided in the response. To resume pagination, provide the NextToken value in the as part of a subsequent call. The default value is 10.
+            next_token: If the previous call to ListImages didn't return the full set of AppImageConfigs, the call returns a token for getting the next set of AppImageConfigs.
+            name_contains: A filter that returns only AppImageConfigs whose name contains the specified string.
+            creation_time_before: A filter that returns only AppImageConfigs created on or before the specified time.
+            creation_time_after: A filter that returns only AppImageConfigs created on or after the specified time.
+            modified_time_before: A filter that returns only AppImageConfigs modified on or before the specified time.
+            modified_time_after: A filter that returns only AppImageConfigs modified on or after the specified time.
+            sort_by: The property used to sort results. The default value is CreationTime.
+            sort_order: The sort order. The default value is Descending.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed AppImageConfig resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "MaxResults": max_results,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "ModifiedTimeBefore": modified_time_before,
+            "ModifiedTimeAfter": modified_time_after,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_app_image_configs",
+            summaries_key="AppImageConfigs",
+            summary_name="AppImageConfigDetails",
+            resource_cls=AppImageConfig,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["AppImageConfig"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["AppImageConfig"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["AppImageConfig"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["AppImageConfig"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["AppImageConfig"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
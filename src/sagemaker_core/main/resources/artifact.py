@@ -0,0 +1,472 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class Artifact(Base):
+    """
+    Class representing resource Artifact
+
+    Attributes:
+        artifact_name: The name of the artifact.
+        artifact_arn: The Amazon Resource Name (ARN) of the artifact.
+        source: The source of the artifact.
+        artifact_type: The type of the artifact.
+        properties: A list of the artifact's properties.
+        creation_time: When the artifact was created.
+        created_by:
+        last_modified_time: When the artifact was last modified.
+        last_modified_by:
+        metadata_properties:
+        lineage_group_arn: The Amazon Resource Name (ARN) of the lineage group.
+
+    """
+
+    artifact_arn: str
+    artifact_name: Optional[str] = Unassigned()
+    source: Optional[shapes.ArtifactSource] = Unassigned()
+    artifact_type: Optional[str] = Unassigned()
+    properties: Optional[Dict[str, str]] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[shapes.UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[shapes.UserContext] = Unassigned()
+    metadata_properties: Optional[shapes.MetadataProperties] = Unassigned()
+    lineage_group_arn: Optional[str] = Unassigned()
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "artifact_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object artifact")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def create(
+        cls,
+        source: shapes.ArtifactSource,
+        artifact_type: str,
+        artifact_name: Optional[str] = Unassigned(),
+        properties: Optional[Dict[str, str]] = Unassigned(),
+        metadata_properties: Optional[shapes.MetadataProperties] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Artifact"]:
+        """
+        Create a Artifact resource
+
+        Parameters:
+            source: The ID, ID type, and URI of the source.
+            artifact_type: The artifact type.
+            artifact_name: The name of the artifact. Must be unique to your account in an Amazon Web Services Region.
+            properties: A list of properties to add to the artifact.
+            metadata_properties:
+            tags: A list of tags to apply to the artifact.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Artifact resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating artifact resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "ArtifactName": artifact_name,
+            "Source": source,
+            "ArtifactType": artifact_type,
+            "Properties": properties,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="Artifact", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_artifact(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(artifact_arn=response["ArtifactArn"], session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        artifact_arn: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Artifact"]:
+        """
+        Get a Artifact resource
+
+        Parameters:
+            artifact_arn: The Amazon Resource Name (ARN) of the artifact to describe.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Artifact resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ArtifactArn": artifact_arn,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_artifact(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeArtifactResponse")
+        artifact = build_from_response(cls, transformed_response)
+        artifact._set_client_context(session=session, region_name=region)
+        return artifact
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["Artifact"]:
+        """
+        Refresh a Artifact resource
+
+        Returns:
+            The Artifact resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_artifact(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeArtifactResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def update(
+        self,
+        artifact_name: Optional[str] = Unassigned(),
+        properties: Optional[Dict[str, str]] = Unassigned(),
+        properties_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional["Artifact"]:
+        """
+        Update a Artifact resource
+
+        Parameters:
+            properties_to_remove: A list of properties to remove.
+
+        Returns:
+            The Artifact resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating artifact resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+            "ArtifactName": artifact_name,
+            "Properties": properties,
+            "PropertiesToRemove": properties_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_artifact(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a Artifact resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ArtifactArn": self.artifact_arn,
+            "Source": self.source,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_artifact(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        source_uri: Optional[str] = Unassigned(),
+        artifact_type: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Artifact"]:
+        """
+        Get all Artifact resources
+
+        Parameters:
+            source_uri: A filter that returns only artifacts with the specified source URI.
+            artifact_type: A filter that returns only artifacts of the specified type.
+            created_after: A filter that returns only artifacts created on or after the specified time.
+            created_before: A filter that returns only artifacts created on or before the specified time.
+            sort_by: The property used to sort results. The default value is CreationTime.
+            sort_order: The sort order. The default value is Descending.
+            next_token: If the previous call to ListArtifacts didn't return the full set of artifacts, the call returns a token for getting the next set of artifacts.
+            max_results: The maximum number of artifacts to return in the response. The default value is 10.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed Artifact resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "SourceUri": source_uri,
+            "ArtifactType": artifact_type,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "MaxResults": max_results,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_artifacts",
+            summaries_key="ArtifactSummaries",
+            summary_name="ArtifactSummary",
+            resource_cls=Artifact,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["Artifact"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["Artifact"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["Artifact"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["Artifact"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["Artifact"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,628 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class AutoMLJob(Base):
+    """
+    Class representing resource AutoMLJob
+
+    Attributes:
+        auto_ml_job_name: Returns the name of the AutoML job.
+        auto_ml_job_arn: Returns the ARN of the AutoML job.
+        input_data_config: Returns the input data configuration for the AutoML job.
+        output_data_config: Returns the job's output data config.
+        role_arn: The ARN of the IAM role that has read permission to the input data location and write permission to the output data location in Amazon S3.
+        creation_time: Returns the creation time of the AutoML job.
+        last_modified_time: Returns the job's last modified time.
+        auto_ml_job_status: Returns the status of the AutoML job.
+        auto_ml_job_secondary_status: Returns the secondary status of the AutoML job.
+        auto_ml_job_objective: Returns the job's objective.
+        problem_type: Returns the job's problem type.
+        auto_ml_job_config: Returns the configuration for the AutoML job.
+        end_time: Returns the end time of the AutoML job.
+        failure_reason: Returns the failure reason for an AutoML job, when applicable.
+        partial_failure_reasons: Returns a list of reasons for partial failures within an AutoML job.
+        best_candidate: The best model candidate selected by SageMaker AI Autopilot using both the best objective metric and lowest InferenceLatency for an experiment.
+        generate_candidate_definitions_only: Indicates whether the output for an AutoML job generates candidate definitions only.
+        auto_ml_job_artifacts: Returns information on the job's artifacts found in AutoMLJobArtifacts.
+        resolved_attributes: Contains ProblemType, AutoMLJobObjective, and CompletionCriteria. If you do not provide these values, they are inferred.
+        model_deploy_config: Indicates whether the model was deployed automatically to an endpoint and the name of that endpoint if deployed automatically.
+        model_deploy_result: Provides information about endpoint for the model deployment.
+
+    """
+
+    auto_ml_job_name: str
+    auto_ml_job_arn: Optional[str] = Unassigned()
+    input_data_config: Optional[List[shapes.AutoMLChannel]] = Unassigned()
+    output_data_config: Optional[shapes.AutoMLOutputDataConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    auto_ml_job_objective: Optional[shapes.AutoMLJobObjective] = Unassigned()
+    problem_type: Optional[str] = Unassigned()
+    auto_ml_job_config: Optional[shapes.AutoMLJobConfig] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    partial_failure_reasons: Optional[List[shapes.AutoMLPartialFailureReason]] = Unassigned()
+    best_candidate: Optional[shapes.AutoMLCandidate] = Unassigned()
+    auto_ml_job_status: Optional[str] = Unassigned()
+    auto_ml_job_secondary_status: Optional[str] = Unassigned()
+    generate_candidate_definitions_only: Optional[bool] = Unassigned()
+    auto_ml_job_artifacts: Optional[shapes.AutoMLJobArtifacts] = Unassigned()
+    resolved_attributes: Optional[shapes.ResolvedAttributes] = Unassigned()
+    model_deploy_config: Optional[shapes.ModelDeployConfig] = Unassigned()
+    model_deploy_result: Optional[shapes.ModelDeployResult] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["auto_ml_job_status"]
+    _terminal_states: ClassVar[List[str]] = ["Completed", "Failed", "Stopped"]
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "auto_ml_job_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object auto_ml_job")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "output_data_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+                "auto_ml_job_config": {
+                    "security_config": {
+                        "volume_kms_key_id": {"type": "string"},
+                        "vpc_config": {
+                            "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                            "subnets": {"type": "array", "items": {"type": "string"}},
+                        },
+                    },
+                    "candidate_generation_config": {
+                        "feature_specification_s3_uri": {"type": "string"}
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "AutoMLJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        auto_ml_job_name: str,
+        input_data_config: List[shapes.AutoMLChannel],
+        output_data_config: shapes.AutoMLOutputDataConfig,
+        role_arn: str,
+        problem_type: Optional[str] = Unassigned(),
+        auto_ml_job_objective: Optional[shapes.AutoMLJobObjective] = Unassigned(),
+        auto_ml_job_config: Optional[shapes.AutoMLJobConfig] = Unassigned(),
+        generate_candidate_definitions_only: Optional[bool] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        model_deploy_config: Optional[shapes.ModelDeployConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["AutoMLJob"]:
+        """
+        Create a AutoMLJob resource
+
+        Parameters:
+            auto_ml_job_name: Identifies an Autopilot job. The name must be unique to your account and is case insensitive.
+            input_data_config: An array of channel objects that describes the input data and its location. Each channel is a named input source. Similar to InputDataConfig supported by HyperParameterTrainingJobDefinition. Format(s) supported: CSV, Parquet. A minimum of 500 rows is required for the training dataset. There is not a minimum number of rows required for the validation dataset.
+            output_data_config: Provides information about encryption and the Amazon S3 output path needed to store artifacts from an AutoML job. Format(s) supported: CSV.
+            role_arn: The ARN of the role that is used to access the data.
+            problem_type: Defines the type of supervised learning problem available for the candidates. For more information, see  SageMaker Autopilot problem types.
+            auto_ml_job_objective: Specifies a metric to minimize or maximize as the objective of a job. If not specified, the default objective metric depends on the problem type. See AutoMLJobObjective for the default values.
+            auto_ml_job_config: A collection of settings used to configure an AutoML job.
+            generate_candidate_definitions_only: Generates possible candidates without training the models. A candidate is a combination of data preprocessors, algorithms, and algorithm parameter settings.
+            tags: An array of key-value pairs. You can use tags to categorize your Amazon Web Services resources in different ways, for example, by purpose, owner, or environment. For more information, see Tagging Amazon Web ServicesResources. Tag keys must be unique per resource.
+            model_deploy_config: Specifies how to generate the endpoint name for an automatic one-click Autopilot model deployment.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The AutoMLJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating auto_ml_job resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "AutoMLJobName": auto_ml_job_name,
+            "InputDataConfig": input_data_config,
+            "OutputDataConfig": output_data_config,
+            "ProblemType": problem_type,
+            "AutoMLJobObjective": auto_ml_job_objective,
+            "AutoMLJobConfig": auto_ml_job_config,
+            "RoleArn": role_arn,
+            "GenerateCandidateDefinitionsOnly": generate_candidate_definitions_only,
+            "Tags": tags,
+            "ModelDeployConfig": model_deploy_config,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="AutoMLJob", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_auto_ml_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(auto_ml_job_name=auto_ml_job_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        auto_ml_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["AutoMLJob"]:
+        """
+        Get a AutoMLJob resource
+
+        Parameters:
+            auto_ml_job_name: Requests information about an AutoML job using its unique name.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The AutoMLJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "AutoMLJobName": auto_ml_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_auto_ml_job(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeAutoMLJobResponse")
+        auto_ml_job = build_from_response(cls, transformed_response)
+        auto_ml_job._set_client_context(session=session, region_name=region)
+        return auto_ml_job
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["AutoMLJob"]:
+        """
+        Refresh a AutoMLJob resource
+
+        Returns:
+            The AutoMLJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "AutoMLJobName": self.auto_ml_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_auto_ml_job(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeAutoMLJobResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def stop(self) -> None:
+        """
+        Stop a AutoMLJob resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "AutoMLJobName": self.auto_ml_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.stop_auto_ml_job(**operation_input_args)
+
+        logger.info(f"Stopping {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a AutoMLJob resource.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+
+        """
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay("Waiting for AutoMLJob...", display, status_callback) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.auto_ml_job_status
+                waiter_display.update(current_status)
+
+                if current_status in terminal_states:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+
+                    if "failed" in current_status.lower():
+                        raise FailedStatusError(
+                            resource_type="AutoMLJob",
+                            status=current_status,
+                            reason=self.failure_reason,
+                        )
+
+                    return
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="AutoMLJob", status=current_status)
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["AutoMLJob"]:
+        """
+        Get all AutoMLJob resources
+
+        Parameters:
+            creation_time_after: Request a list of jobs, using a filter for time.
+            creation_time_before: Request a list of jobs, using a filter for time.
+            last_modified_time_after: Request a list of jobs, using a filter for time.
+            last_modified_time_before: Request a list of jobs, using a filter for time.
+            name_contains: Request a list of jobs, using a search filter for name.
+            status_equals: Request a list of jobs, using a filter for status.
+            sort_order: The sort order for the results. The default is Descending.
+            sort_by: The parameter by which to sort the results. The default is Name.
+            max_results: Request a list of jobs up to a specified limit.
+            next_token: If the previous response was truncated, you receive this token. Use it in your next request to receive the next set of results.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed AutoMLJob resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+            "MaxResults": max_results,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_auto_ml_jobs",
+            summaries_key="AutoMLJobSummaries",
+            summary_name="AutoMLJobSummary",
+            resource_cls=AutoMLJob,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    @Base.add_validate_call
+    def get_all_candidates(
+        self,
+        status_equals: Optional[str] = Unassigned(),
+        candidate_name_equals: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator[shapes.AutoMLCandidate]:
+        """
+        List the candidates created for the job.
+
+        Parameters:
+            status_equals: List the candidates for the job and filter by status.
+            candidate_name_equals: List the candidates for the job and filter by candidate name.
+            sort_order: The sort order for the results. The default is Ascending.
+            sort_by: The parameter by which to sort the results. The default is Descending.
+            max_results: List the job's candidates up to a specified limit.
+            next_token: If the previous response was truncated, you receive this token. Use it in your next request to receive the next set of results.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed AutoMLCandidate.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "AutoMLJobName": self.auto_ml_job_name,
+            "StatusEquals": status_equals,
+            "CandidateNameEquals": candidate_name_equals,
+            "SortOrder": sort_order,
+            "SortBy": sort_by,
+            "MaxResults": max_results,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_candidates_for_auto_ml_job",
+            summaries_key="Candidates",
+            summary_name="AutoMLCandidate",
+            resource_cls=shapes.AutoMLCandidate,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["AutoMLJob"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["AutoMLJob"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["AutoMLJob"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of stop, running it on the thread pool of the async bridge, with
+    # the signature and docstring of stop
+    @functools.wraps(stop, assigned=("__module__", "__doc__"))
+    async def astop(self, *args, **kwargs) -> None:
+        return await run_async(self.stop, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_completion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait, waiting for a AutoMLJob resource without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["AutoMLJob"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,436 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class AutoMLJobV2(Base):
+    """
+    Class representing resource AutoMLJobV2
+
+    Attributes:
+        auto_ml_job_name: Returns the name of the AutoML job V2.
+        auto_ml_job_arn: Returns the Amazon Resource Name (ARN) of the AutoML job V2.
+        auto_ml_job_input_data_config: Returns an array of channel objects describing the input data and their location.
+        output_data_config: Returns the job's output data config.
+        role_arn: The ARN of the IAM role that has read permission to the input data location and write permission to the output data location in Amazon S3.
+        creation_time: Returns the creation time of the AutoML job V2.
+        last_modified_time: Returns the job's last modified time.
+        auto_ml_job_status: Returns the status of the AutoML job V2.
+        auto_ml_job_secondary_status: Returns the secondary status of the AutoML job V2.
+        auto_ml_job_objective: Returns the job's objective.
+        auto_ml_problem_type_config: Returns the configuration settings of the problem type set for the AutoML job V2.
+        auto_ml_problem_type_config_name: Returns the name of the problem type configuration set for the AutoML job V2.
+        end_time: Returns the end time of the AutoML job V2.
+        failure_reason: Returns the reason for the failure of the AutoML job V2, when applicable.
+        partial_failure_reasons: Returns a list of reasons for partial failures within an AutoML job V2.
+        best_candidate: Information about the candidate produced by an AutoML training job V2, including its status, steps, and other properties.
+        auto_ml_job_artifacts:
+        resolved_attributes: Returns the resolved attributes used by the AutoML job V2.
+        model_deploy_config: Indicates whether the model was deployed automatically to an endpoint and the name of that endpoint if deployed automatically.
+        model_deploy_result: Provides information about endpoint for the model deployment.
+        data_split_config: Returns the configuration settings of how the data are split into train and validation datasets.
+        security_config: Returns the security configuration for traffic encryption or Amazon VPC settings.
+        auto_ml_compute_config: The compute configuration used for the AutoML job V2.
+
+    """
+
+    auto_ml_job_name: str
+    auto_ml_job_arn: Optional[str] = Unassigned()
+    auto_ml_job_input_data_config: Optional[List[shapes.AutoMLJobChannel]] = Unassigned()
+    output_data_config: Optional[shapes.AutoMLOutputDataConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    auto_ml_job_objective: Optional[shapes.AutoMLJobObjective] = Unassigned()
+    auto_ml_problem_type_config: Optional[shapes.AutoMLProblemTypeConfig] = Unassigned()
+    auto_ml_problem_type_config_name: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    partial_failure_reasons: Optional[List[shapes.AutoMLPartialFailureReason]] = Unassigned()
+    best_candidate: Optional[shapes.AutoMLCandidate] = Unassigned()
+    auto_ml_job_status: Optional[str] = Unassigned()
+    auto_ml_job_secondary_status: Optional[str] = Unassigned()
+    auto_ml_job_artifacts: Optional[shapes.AutoMLJobArtifacts] = Unassigned()
+    resolved_attributes: Optional[shapes.AutoMLResolvedAttributes] = Unassigned()
+    model_deploy_config: Optional[shapes.ModelDeployConfig] = Unassigned()
+    model_deploy_result: Optional[shapes.ModelDeployResult] = Unassigned()
+    data_split_config: Optional[shapes.AutoMLDataSplitConfig] = Unassigned()
+    security_config: Optional[shapes.AutoMLSecurityConfig] = Unassigned()
+    auto_ml_compute_config: Optional[shapes.AutoMLComputeConfig] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["auto_ml_job_status"]
+    _terminal_states: ClassVar[List[str]] = ["Completed", "Failed", "Stopped"]
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "auto_ml_job_v2_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object auto_ml_job_v2")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "output_data_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "role_arn": {"type": "string"},
+                "auto_ml_problem_type_config": {
+                    "time_series_forecasting_job_config": {
+                        "feature_specification_s3_uri": {"type": "string"}
+                    },
+                    "tabular_job_config": {"feature_specification_s3_uri": {"type": "string"}},
+                },
+                "security_config": {
+                    "volume_kms_key_id": {"type": "string"},
+                    "vpc_config": {
+                        "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+                "auto_ml_compute_config": {
+                    "emr_serverless_compute_config": {"execution_role_arn": {"type": "string"}}
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "AutoMLJobV2", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        auto_ml_job_name: str,
+        auto_ml_job_input_data_config: List[shapes.AutoMLJobChannel],
+        output_data_config: shapes.AutoMLOutputDataConfig,
+        auto_ml_problem_type_config: shapes.AutoMLProblemTypeConfig,
+        role_arn: str,
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        security_config: Optional[shapes.AutoMLSecurityConfig] = Unassigned(),
+        auto_ml_job_objective: Optional[shapes.AutoMLJobObjective] = Unassigned(),
+        model_deploy_config: Optional[shapes.ModelDeployConfig] = Unassigned(),
+        data_split_config: Optional[shapes.AutoMLDataSplitConfig] = Unassigned(),
+        auto_ml_compute_config: Optional[shapes.AutoMLComputeConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["AutoMLJobV2"]:
+        """
+        Create a AutoMLJobV2 resource
+
+        Parameters:
+            auto_ml_job_name: Identifies an Autopilot job. The name must be unique to your account and is case insensitive.
+            auto_ml_job_input_data_config: An array of channel objects describing the input data and their location. Each channel is a named input source. Similar to the InputDataConfig attribute in the CreateAutoMLJob input parameters. The supported formats depend on the problem type:   For tabular problem types: S3Prefix, ManifestFile.   For image classification: S3Prefix, ManifestFile, AugmentedManifestFile.   For text classification: S3Prefix.   For time-series forecasting: S3Prefix.   For text generation (LLMs fine-tuning): S3Prefix.
+            output_data_config: Provides information about encryption and the Amazon S3 output path needed to store artifacts from an AutoML job.
+            auto_ml_problem_type_config: Defines the configuration settings of one of the supported problem types.
+            role_arn: The ARN of the role that is used to access the data.
+            tags: An array of key-value pairs. You can use tags to categorize your Amazon Web Services resources in different ways, such as by purpose, owner, or environment. For more information, see Tagging Amazon Web ServicesResources. Tag keys must be unique per resource.
+            security_config: The security configuration for traffic encryption or Amazon VPC settings.
+            auto_ml_job_objective: Specifies a metric to minimize or maximize as the objective of a job. If not specified, the default objective metric depends on the problem type. For the list of default values per problem type, see AutoMLJobObjective.    For tabular problem types: You must either provide both the AutoMLJobObjective and indicate the type of supervised learning problem in AutoMLProblemTypeConfig (TabularJobConfig.ProblemType), or none at all.   For text generation problem types (LLMs fine-tuning): Fine-tuning language models in Autopilot does not require setting the AutoMLJobObjective field. Autopilot fine-tunes LLMs without requiring multiple candidates to be trained and evaluated. Instead, using your dataset, Autopilot directly fine-tunes your target model to enhance a default objective metric, the cross-entropy loss. After fine-tuning a language model, you can evaluate the quality of its generated text using different metrics. For a list of the available metrics, see Metrics for fine-tuning LLMs in Autopilot.
+            model_deploy_config: Specifies how to generate the endpoint name for an automatic one-click Autopilot model deployment.
+            data_split_config: This structure specifies how to split the data into train and validation datasets. The validation and training datasets must contain the same headers. For jobs created by calling CreateAutoMLJob, the validation dataset must be less than 2 GB in size.  This attribute must not be set for the time-series forecasting problem type, as Autopilot automatically splits the input dataset into training and validation sets.
+            auto_ml_compute_config: Specifies the compute configuration for the AutoML job V2.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The AutoMLJobV2 resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating auto_ml_job_v2 resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "AutoMLJobName": auto_ml_job_name,
+            "AutoMLJobInputDataConfig": auto_ml_job_input_data_config,
+            "OutputDataConfig": output_data_config,
+            "AutoMLProblemTypeConfig": auto_ml_problem_type_config,
+            "RoleArn": role_arn,
+            "Tags": tags,
+            "SecurityConfig": security_config,
+            "AutoMLJobObjective": auto_ml_job_objective,
+            "ModelDeployConfig": model_deploy_config,
+            "DataSplitConfig": data_split_config,
+            "AutoMLComputeConfig": auto_ml_compute_config,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="AutoMLJobV2", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_auto_ml_job_v2(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(auto_ml_job_name=auto_ml_job_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        auto_ml_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["AutoMLJobV2"]:
+        """
+        Get a AutoMLJobV2 resource
+
+        Parameters:
+            auto_ml_job_name: Requests information about an AutoML job V2 using its unique name.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The AutoMLJobV2 resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "AutoMLJobName": auto_ml_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_auto_ml_job_v2(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeAutoMLJobV2Response")
+        auto_ml_job_v2 = build_from_response(cls, transformed_response)
+        auto_ml_job_v2._set_client_context(session=session, region_name=region)
+        return auto_ml_job_v2
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["AutoMLJobV2"]:
+        """
+        Refresh a AutoMLJobV2 resource
+
+        Returns:
+            The AutoMLJobV2 resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "AutoMLJobName": self.auto_ml_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_auto_ml_job_v2(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeAutoMLJobV2Response", self)
+        return self
+
+    @Base.add_validate_call
+    def wait(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a AutoMLJobV2 resource.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+
+        """
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for AutoMLJobV2...", display, status_callback
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.auto_ml_job_status
+                waiter_display.update(current_status)
+
+                if current_status in terminal_states:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+
+                    if "failed" in current_status.lower():
+                        raise FailedStatusError(
+                            resource_type="AutoMLJobV2",
+                            status=current_status,
+                            reason=self.failure_reason,
+                        )
+
+                    return
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="AutoMLJobV2", status=current_status)
+                poller.sleep(current_status)
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["AutoMLJobV2"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["AutoMLJobV2"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["AutoMLJobV2"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_completion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait, waiting for a AutoMLJobV2 resource without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, poll=poll, timeout=timeout)
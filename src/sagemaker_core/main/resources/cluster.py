@@ -0,0 +1,934 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class Cluster(Base):
+    """
+    Class representing resource Cluster
+
+    Attributes:
+        cluster_arn: The Amazon Resource Name (ARN) of the SageMaker HyperPod cluster.
+        cluster_status: The status of the SageMaker HyperPod cluster.
+        instance_groups: The instance groups of the SageMaker HyperPod cluster.
+        cluster_name: The name of the SageMaker HyperPod cluster.
+        creation_time: The time when the SageMaker Cluster is created.
+        failure_message: The failure message of the SageMaker HyperPod cluster.
+        restricted_instance_groups: The specialized instance groups for training models like Amazon Nova to be created in the SageMaker HyperPod cluster.
+        vpc_config:
+        orchestrator: The type of orchestrator used for the SageMaker HyperPod cluster.
+        tiered_storage_config: The current configuration for managed tier checkpointing on the HyperPod cluster. For example, this shows whether the feature is enabled and the percentage of cluster memory allocated for checkpoint storage.
+        node_recovery: The node recovery mode configured for the SageMaker HyperPod cluster.
+        node_provisioning_mode: The mode used for provisioning nodes in the cluster.
+        cluster_role: The Amazon Resource Name (ARN) of the IAM role that HyperPod uses for cluster autoscaling operations.
+        auto_scaling: The current autoscaling configuration and status for the autoscaler.
+
+    """
+
+    cluster_name: str
+    cluster_arn: Optional[str] = Unassigned()
+    cluster_status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    failure_message: Optional[str] = Unassigned()
+    instance_groups: Optional[List[shapes.ClusterInstanceGroupDetails]] = Unassigned()
+    restricted_instance_groups: Optional[List[shapes.ClusterRestrictedInstanceGroupDetails]] = (
+        Unassigned()
+    )
+    vpc_config: Optional[shapes.VpcConfig] = Unassigned()
+    orchestrator: Optional[shapes.ClusterOrchestrator] = Unassigned()
+    tiered_storage_config: Optional[shapes.ClusterTieredStorageConfig] = Unassigned()
+    node_recovery: Optional[str] = Unassigned()
+    node_provisioning_mode: Optional[str] = Unassigned()
+    cluster_role: Optional[str] = Unassigned()
+    auto_scaling: Optional[shapes.ClusterAutoScalingConfigOutput] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["cluster_status"]
+    _terminal_states: ClassVar[List[str]] = []
+    _failure_reason_attribute: ClassVar[Optional[str]] = None
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "cluster_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object cluster")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "vpc_config": {
+                    "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+                "cluster_role": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Cluster", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        cluster_name: str,
+        instance_groups: Optional[List[shapes.ClusterInstanceGroupSpecification]] = Unassigned(),
+        restricted_instance_groups: Optional[
+            List[shapes.ClusterRestrictedInstanceGroupSpecification]
+        ] = Unassigned(),
+        vpc_config: Optional[shapes.VpcConfig] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        orchestrator: Optional[shapes.ClusterOrchestrator] = Unassigned(),
+        node_recovery: Optional[str] = Unassigned(),
+        tiered_storage_config: Optional[shapes.ClusterTieredStorageConfig] = Unassigned(),
+        node_provisioning_mode: Optional[str] = Unassigned(),
+        cluster_role: Optional[str] = Unassigned(),
+        auto_scaling: Optional[shapes.ClusterAutoScalingConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Cluster"]:
+        """
+        Create a Cluster resource
+
+        Parameters:
+            cluster_name: The name for the new SageMaker HyperPod cluster.
+            instance_groups: The instance groups to be created in the SageMaker HyperPod cluster.
+            restricted_instance_groups: The specialized instance groups for training models like Amazon Nova to be created in the SageMaker HyperPod cluster.
+            vpc_config: Specifies the Amazon Virtual Private Cloud (VPC) that is associated with the Amazon SageMaker HyperPod cluster. You can control access to and from your resources by configuring your VPC. For more information, see Give SageMaker access to resources in your Amazon VPC.  When your Amazon VPC and subnets support IPv6, network communications differ based on the cluster orchestration platform:   Slurm-orchestrated clusters automatically configure nodes with dual IPv6 and IPv4 addresses, allowing immediate IPv6 network communications.   In Amazon EKS-orchestrated clusters, nodes receive dual-stack addressing, but pods can only use IPv6 when the Amazon EKS cluster is explicitly IPv6-enabled. For information about deploying an IPv6 Amazon EKS cluster, see Amazon EKS IPv6 Cluster Deployment.   Additional resources for IPv6 configuration:   For information about adding IPv6 support to your VPC, see to IPv6 Support for VPC.   For information about creating a new IPv6-compatible VPC, see Amazon VPC Creation Guide.   To configure SageMaker HyperPod with a custom Amazon VPC, see Custom Amazon VPC Setup for SageMaker HyperPod.
+            tags: Custom tags for managing the SageMaker HyperPod cluster as an Amazon Web Services resource. You can add tags to your cluster in the same way you add them in other Amazon Web Services services that support tagging. To learn more about tagging Amazon Web Services resources in general, see Tagging Amazon Web Services Resources User Guide.
+            orchestrator: The type of orchestrator to use for the SageMaker HyperPod cluster. Currently, supported values are "Eks" and "Slurm", which is to use an Amazon Elastic Kubernetes Service or Slurm cluster as the orchestrator.  If you specify the Orchestrator field, you must provide exactly one orchestrator configuration: either Eks or Slurm. Specifying both or providing an empty configuration returns a validation error.
+            node_recovery: The node recovery mode for the SageMaker HyperPod cluster. When set to Automatic, SageMaker HyperPod will automatically reboot or replace faulty nodes when issues are detected. When set to None, cluster administrators will need to manually manage any faulty cluster instances.
+            tiered_storage_config: The configuration for managed tier checkpointing on the HyperPod cluster. When enabled, this feature uses a multi-tier storage approach for storing model checkpoints, providing faster checkpoint operations and improved fault tolerance across cluster nodes.
+            node_provisioning_mode: The mode for provisioning nodes in the cluster. You can specify the following modes:    Continuous: Scaling behavior that enables 1) concurrent operation execution within instance groups, 2) continuous retry mechanisms for failed operations, 3) enhanced customer visibility into cluster events through detailed event streams, 4) partial provisioning capabilities. Your clusters and instance groups remain InService while scaling. This mode is only supported for EKS orchestrated clusters.
+            cluster_role: The Amazon Resource Name (ARN) of the IAM role that HyperPod assumes to perform cluster autoscaling operations. This role must have permissions for sagemaker:BatchAddClusterNodes and sagemaker:BatchDeleteClusterNodes. This is only required when autoscaling is enabled and when HyperPod is performing autoscaling operations.
+            auto_scaling: The autoscaling configuration for the cluster. Enables automatic scaling of cluster nodes based on workload demand using a Karpenter-based system.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Cluster resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating cluster resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "ClusterName": cluster_name,
+            "InstanceGroups": instance_groups,
+            "RestrictedInstanceGroups": restricted_instance_groups,
+            "VpcConfig": vpc_config,
+            "Tags": tags,
+            "Orchestrator": orchestrator,
+            "NodeRecovery": node_recovery,
+            "TieredStorageConfig": tiered_storage_config,
+            "NodeProvisioningMode": node_provisioning_mode,
+            "ClusterRole": cluster_role,
+            "AutoScaling": auto_scaling,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="Cluster", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_cluster(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(cluster_name=cluster_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        cluster_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Cluster"]:
+        """
+        Get a Cluster resource
+
+        Parameters:
+            cluster_name: The string name or the Amazon Resource Name (ARN) of the SageMaker HyperPod cluster.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Cluster resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ClusterName": cluster_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_cluster(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeClusterResponse")
+        cluster = build_from_response(cls, transformed_response)
+        cluster._set_client_context(session=session, region_name=region)
+        return cluster
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["Cluster"]:
+        """
+        Refresh a Cluster resource
+
+        Returns:
+            The Cluster resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_cluster(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeClusterResponse", self)
+        return self
+
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def update(
+        self,
+        instance_groups: Optional[List[shapes.ClusterInstanceGroupSpecification]] = Unassigned(),
+        restricted_instance_groups: Optional[
+            List[shapes.ClusterRestrictedInstanceGroupSpecification]
+        ] = Unassigned(),
+        tiered_storage_config: Optional[shapes.ClusterTieredStorageConfig] = Unassigned(),
+        node_recovery: Optional[str] = Unassigned(),
+        instance_groups_to_delete: Optional[List[str]] = Unassigned(),
+        node_provisioning_mode: Optional[str] = Unassigned(),
+        cluster_role: Optional[str] = Unassigned(),
+        auto_scaling: Optional[shapes.ClusterAutoScalingConfig] = Unassigned(),
+        orchestrator: Optional[shapes.ClusterOrchestrator] = Unassigned(),
+    ) -> Optional["Cluster"]:
+        """
+        Update a Cluster resource
+
+        Parameters:
+            instance_groups_to_delete: Specify the names of the instance groups to delete. Use a single , as the separator between multiple names.
+
+        Returns:
+            The Cluster resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating cluster resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+            "InstanceGroups": instance_groups,
+            "RestrictedInstanceGroups": restricted_instance_groups,
+            "TieredStorageConfig": tiered_storage_config,
+            "NodeRecovery": node_recovery,
+            "InstanceGroupsToDelete": instance_groups_to_delete,
+            "NodeProvisioningMode": node_provisioning_mode,
+            "ClusterRole": cluster_role,
+            "AutoScaling": auto_scaling,
+            "Orchestrator": orchestrator,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_cluster(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a Cluster resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_cluster(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait_for_status(
+        self,
+        target_status: Literal[
+            "Creating",
+            "Deleting",
+            "Failed",
+            "InService",
+            "RollingBack",
+            "SystemUpdating",
+            "Updating",
+        ],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a Cluster resource to reach certain status.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            f"Waiting for Cluster to reach [bold]{target_status} status...",
+            display,
+            status_callback,
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.cluster_status
+                waiter_display.update(current_status)
+
+                if target_status == current_status:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+                    return
+
+                if "failed" in current_status.lower():
+                    raise FailedStatusError(
+                        resource_type="Cluster", status=current_status, reason="(Unknown)"
+                    )
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="Cluster", status=current_status)
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def wait_for_delete(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a Cluster resource to be deleted.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for Cluster to be deleted...", display, status_callback, transient=False
+        ) as waiter_display:
+            while True:
+                try:
+                    poller.call(self.refresh)
+                    current_status = self.cluster_status
+                    waiter_display.update(current_status)
+
+                    if timeout is not None and time.time() - start_time >= timeout:
+                        raise TimeoutExceededError(resouce_type="Cluster", status=current_status)
+                except botocore.exceptions.ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+
+                    if "ResourceNotFound" in error_code or "ValidationException" in error_code:
+                        logger.info("Resource was not found. It may have been deleted.")
+                        return
+                    raise e
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        training_plan_arn: Optional[str] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Cluster"]:
+        """
+        Get all Cluster resources
+
+        Parameters:
+            creation_time_after: Set a start time for the time range during which you want to list SageMaker HyperPod clusters. Timestamps are formatted according to the ISO 8601 standard.  Acceptable formats include:    YYYY-MM-DDThh:mm:ss.sssTZD (UTC), for example, 2014-10-01T20:30:00.000Z     YYYY-MM-DDThh:mm:ss.sssTZD (with offset), for example, 2014-10-01T12:30:00.000-08:00     YYYY-MM-DD, for example, 2014-10-01    Unix time in seconds, for example, 1412195400. This is also referred to as Unix Epoch time and represents the number of seconds since midnight, January 1, 1970 UTC.   For more information about the timestamp format, see Timestamp in the Amazon Web Services Command Line Interface User Guide.
+            creation_time_before: Set an end time for the time range during which you want to list SageMaker HyperPod clusters. A filter that returns nodes in a SageMaker HyperPod cluster created before the specified time. The acceptable formats are the same as the timestamp formats for CreationTimeAfter. For more information about the timestamp format, see Timestamp in the Amazon Web Services Command Line Interface User Guide.
+            max_results: Specifies the maximum number of clusters to evaluate for the operation (not necessarily the number of matching items). After SageMaker processes the number of clusters up to MaxResults, it stops the operation and returns the matching clusters up to that point. If all the matching clusters are desired, SageMaker will go through all the clusters until NextToken is empty.
+            name_contains: Set the maximum number of instances to print in the list.
+            next_token: Set the next token to retrieve the list of SageMaker HyperPod clusters.
+            sort_by: The field by which to sort results. The default value is CREATION_TIME.
+            sort_order: The sort order for results. The default value is Ascending.
+            training_plan_arn: The Amazon Resource Name (ARN); of the training plan to filter clusters by. For more information about reserving GPU capacity for your SageMaker HyperPod clusters using Amazon SageMaker Training Plan, see  CreateTrainingPlan .
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed Cluster resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "MaxResults": max_results,
+            "NameContains": name_contains,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "TrainingPlanArn": training_plan_arn,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_clusters",
+            summaries_key="ClusterSummaries",
+            summary_name="ClusterSummary",
+            resource_cls=Cluster,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    @Base.add_validate_call
+    def get_node(
+        self,
+        node_id: Optional[str] = Unassigned(),
+        node_logical_id: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional[shapes.ClusterNodeDetails]:
+        """
+        Retrieves information of a node (also called a instance interchangeably) of a SageMaker HyperPod cluster.
+
+        Parameters:
+            node_id: The ID of the SageMaker HyperPod cluster node.
+            node_logical_id: The logical identifier of the node to describe. You can specify either NodeLogicalId or InstanceId, but not both. NodeLogicalId can be used to describe nodes that are still being provisioned and don't yet have an InstanceId assigned.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            shapes.ClusterNodeDetails
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+            "NodeId": node_id,
+            "NodeLogicalId": node_logical_id,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling describe_cluster_node API")
+        response = client.describe_cluster_node(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        transformed_response = transform(response, "DescribeClusterNodeResponse")
+        return build_from_response(shapes.ClusterNodeDetails, transformed_response)
+
+    @Base.add_validate_call
+    def get_all_nodes(
+        self,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        instance_group_name_contains: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        include_node_logical_ids: Optional[bool] = Unassigned(),
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator[shapes.ClusterNodeDetails]:
+        """
+        Retrieves the list of instances (also called nodes interchangeably) in a SageMaker HyperPod cluster.
+
+        Parameters:
+            creation_time_after: A filter that returns nodes in a SageMaker HyperPod cluster created after the specified time. Timestamps are formatted according to the ISO 8601 standard.  Acceptable formats include:    YYYY-MM-DDThh:mm:ss.sssTZD (UTC), for example, 2014-10-01T20:30:00.000Z     YYYY-MM-DDThh:mm:ss.sssTZD (with offset), for example, 2014-10-01T12:30:00.000-08:00     YYYY-MM-DD, for example, 2014-10-01    Unix time in seconds, for example, 1412195400. This is also referred to as Unix Epoch time and represents the number of seconds since midnight, January 1, 1970 UTC.   For more information about the timestamp format, see Timestamp in the Amazon Web Services Command Line Interface User Guide.
+            creation_time_before: A filter that returns nodes in a SageMaker HyperPod cluster created before the specified time. The acceptable formats are the same as the timestamp formats for CreationTimeAfter. For more information about the timestamp format, see Timestamp in the Amazon Web Services Command Line Interface User Guide.
+            instance_group_name_contains: A filter that returns the instance groups whose name contain a specified string.
+            max_results: The maximum number of nodes to return in the response.
+            next_token: If the result of the previous ListClusterNodes request was truncated, the response includes a NextToken. To retrieve the next set of cluster nodes, use the token in the next request.
+            sort_by: The field by which to sort results. The default value is CREATION_TIME.
+            sort_order: The sort order for results. The default value is Ascending.
+            include_node_logical_ids: Specifies whether to include nodes that are still being provisioned in the response. When set to true, the response includes all nodes regardless of their provisioning status. When set to False (default), only nodes with assigned InstanceIds are returned.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed ClusterNodeDetails.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "InstanceGroupNameContains": instance_group_name_contains,
+            "MaxResults": max_results,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "IncludeNodeLogicalIds": include_node_logical_ids,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_cluster_nodes",
+            summaries_key="ClusterNodeSummaries",
+            summary_name="ClusterNodeSummary",
+            resource_cls=shapes.ClusterNodeDetails,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    @Base.add_validate_call
+    def update_software(
+        self,
+        deployment_config: Optional[shapes.DeploymentConfiguration] = Unassigned(),
+        image_id: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> None:
+        """
+        Updates the platform software of a SageMaker HyperPod cluster for security patching.
+
+        Parameters:
+            deployment_config: The configuration to use when updating the AMI versions.
+            image_id: When configuring your HyperPod cluster, you can specify an image ID using one of the following options:    HyperPodPublicAmiId: Use a HyperPod public AMI    CustomAmiId: Use your custom AMI    default: Use the default latest system image   If you choose to use a custom AMI (CustomAmiId), ensure it meets the following requirements:   Encryption: The custom AMI must be unencrypted.   Ownership: The custom AMI must be owned by the same Amazon Web Services account that is creating the HyperPod cluster.   Volume support: Only the primary AMI snapshot volume is supported; additional AMI volumes are not supported.   When updating the instance group's AMI through the UpdateClusterSoftware operation, if an instance group uses a custom AMI, you must provide an ImageId or use the default as input. Note that if you don't specify an instance group in your UpdateClusterSoftware request, then all of the instance groups are patched with the specified image.
+            session: Boto3 session.
+            region: Region name.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+            "InstanceGroups": self.instance_groups,
+            "DeploymentConfig": deployment_config,
+            "ImageId": image_id,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling update_cluster_software API")
+        response = client.update_cluster_software(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+    @Base.add_validate_call
+    def batch_delete_nodes(
+        self,
+        node_ids: Optional[List[str]] = Unassigned(),
+        node_logical_ids: Optional[List[str]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional[shapes.BatchDeleteClusterNodesResponse]:
+        """
+        Deletes specific nodes within a SageMaker HyperPod cluster.
+
+        Parameters:
+            node_ids: A list of node IDs to be deleted from the specified cluster.    For SageMaker HyperPod clusters using the Slurm workload manager, you cannot remove instances that are configured as Slurm controller nodes.   If you need to delete more than 99 instances, contact Support for assistance.
+            node_logical_ids: A list of NodeLogicalIds identifying the nodes to be deleted. You can specify up to 50 NodeLogicalIds. You must specify either NodeLogicalIds, InstanceIds, or both, with a combined maximum of 50 identifiers.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            shapes.BatchDeleteClusterNodesResponse
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ClusterName": self.cluster_name,
+            "NodeIds": node_ids,
+            "NodeLogicalIds": node_logical_ids,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling batch_delete_cluster_nodes API")
+        response = client.batch_delete_cluster_nodes(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        transformed_response = transform(response, "BatchDeleteClusterNodesResponse")
+        return build_from_response(shapes.BatchDeleteClusterNodesResponse, transformed_response)
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["Cluster"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["Cluster"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["Cluster"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["Cluster"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_status(
+        self,
+        target_status: Literal[
+            "Creating",
+            "Deleting",
+            "Failed",
+            "InService",
+            "RollingBack",
+            "SystemUpdating",
+            "Updating",
+        ],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_status, waiting for a Cluster resource to reach certain status without blocking the event loop.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+    @Base.add_validate_call
+    async def await_deletion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_delete, waiting for a Cluster resource to be deleted without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+            TimeoutExceededError:  If the resource is not deleted before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_for_delete_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["Cluster"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
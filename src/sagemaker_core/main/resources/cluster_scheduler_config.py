@@ -0,0 +1,676 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class ClusterSchedulerConfig(Base):
+    """
+    Class representing resource ClusterSchedulerConfig
+
+    Attributes:
+        cluster_scheduler_config_arn: ARN of the cluster policy.
+        cluster_scheduler_config_id: ID of the cluster policy.
+        name: Name of the cluster policy.
+        cluster_scheduler_config_version: Version of the cluster policy.
+        status: Status of the cluster policy.
+        creation_time: Creation time of the cluster policy.
+        failure_reason: Failure reason of the cluster policy.
+        status_details: Additional details about the status of the cluster policy. This field provides context when the policy is in a non-active state, such as during creation, updates, or if failures occur.
+        cluster_arn: ARN of the cluster where the cluster policy is applied.
+        scheduler_config: Cluster policy configuration. This policy is used for task prioritization and fair-share allocation. This helps prioritize critical workloads and distributes idle compute across entities.
+        description: Description of the cluster policy.
+        created_by:
+        last_modified_time: Last modified time of the cluster policy.
+        last_modified_by:
+
+    """
+
+    cluster_scheduler_config_id: str
+    cluster_scheduler_config_arn: Optional[str] = Unassigned()
+    name: Optional[str] = Unassigned()
+    cluster_scheduler_config_version: Optional[int] = Unassigned()
+    status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    status_details: Optional[Dict[str, str]] = Unassigned()
+    cluster_arn: Optional[str] = Unassigned()
+    scheduler_config: Optional[shapes.SchedulerConfig] = Unassigned()
+    description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[shapes.UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[shapes.UserContext] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["status"]
+    _terminal_states: ClassVar[List[str]] = []
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "cluster_scheduler_config_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object cluster_scheduler_config")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def create(
+        cls,
+        name: str,
+        cluster_arn: str,
+        scheduler_config: shapes.SchedulerConfig,
+        description: Optional[str] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["ClusterSchedulerConfig"]:
+        """
+        Create a ClusterSchedulerConfig resource
+
+        Parameters:
+            name: Name for the cluster policy.
+            cluster_arn: ARN of the cluster.
+            scheduler_config: Configuration about the monitoring schedule.
+            description: Description of the cluster policy.
+            tags: Tags of the cluster policy.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The ClusterSchedulerConfig resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating cluster_scheduler_config resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "Name": name,
+            "ClusterArn": cluster_arn,
+            "SchedulerConfig": scheduler_config,
+            "Description": description,
+            "Tags": tags,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="ClusterSchedulerConfig", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_cluster_scheduler_config(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(
+            cluster_scheduler_config_id=response["ClusterSchedulerConfigId"],
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        cluster_scheduler_config_id: str,
+        cluster_scheduler_config_version: Optional[int] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["ClusterSchedulerConfig"]:
+        """
+        Get a ClusterSchedulerConfig resource
+
+        Parameters:
+            cluster_scheduler_config_id: ID of the cluster policy.
+            cluster_scheduler_config_version: Version of the cluster policy.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The ClusterSchedulerConfig resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ClusterSchedulerConfigId": cluster_scheduler_config_id,
+            "ClusterSchedulerConfigVersion": cluster_scheduler_config_version,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_cluster_scheduler_config(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeClusterSchedulerConfigResponse")
+        cluster_scheduler_config = build_from_response(cls, transformed_response)
+        cluster_scheduler_config._set_client_context(session=session, region_name=region)
+        return cluster_scheduler_config
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["ClusterSchedulerConfig"]:
+        """
+        Refresh a ClusterSchedulerConfig resource
+
+        Returns:
+            The ClusterSchedulerConfig resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ClusterSchedulerConfigId": self.cluster_scheduler_config_id,
+            "ClusterSchedulerConfigVersion": self.cluster_scheduler_config_version,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_cluster_scheduler_config(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeClusterSchedulerConfigResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def update(
+        self,
+        target_version: int,
+        scheduler_config: Optional[shapes.SchedulerConfig] = Unassigned(),
+        description: Optional[str] = Unassigned(),
+    ) -> Optional["ClusterSchedulerConfig"]:
+        """
+        Update a ClusterSchedulerConfig resource
+
+        Parameters:
+            target_version: Target version.
+
+        Returns:
+            The ClusterSchedulerConfig resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating cluster_scheduler_config resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ClusterSchedulerConfigId": self.cluster_scheduler_config_id,
+            "TargetVersion": target_version,
+            "SchedulerConfig": scheduler_config,
+            "Description": description,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_cluster_scheduler_config(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a ClusterSchedulerConfig resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ClusterSchedulerConfigId": self.cluster_scheduler_config_id,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_cluster_scheduler_config(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait_for_status(
+        self,
+        target_status: Literal[
+            "Creating",
+            "CreateFailed",
+            "CreateRollbackFailed",
+            "Created",
+            "Updating",
+            "UpdateFailed",
+            "UpdateRollbackFailed",
+            "Updated",
+            "Deleting",
+            "DeleteFailed",
+            "DeleteRollbackFailed",
+            "Deleted",
+        ],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a ClusterSchedulerConfig resource to reach certain status.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            f"Waiting for ClusterSchedulerConfig to reach [bold]{target_status} status...",
+            display,
+            status_callback,
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.status
+                waiter_display.update(current_status)
+
+                if target_status == current_status:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+                    return
+
+                if "failed" in current_status.lower():
+                    raise FailedStatusError(
+                        resource_type="ClusterSchedulerConfig",
+                        status=current_status,
+                        reason=self.failure_reason,
+                    )
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(
+                        resouce_type="ClusterSchedulerConfig", status=current_status
+                    )
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def wait_for_delete(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a ClusterSchedulerConfig resource to be deleted.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for ClusterSchedulerConfig to be deleted...",
+            display,
+            status_callback,
+            transient=False,
+        ) as waiter_display:
+            while True:
+                try:
+                    poller.call(self.refresh)
+                    current_status = self.status
+                    waiter_display.update(current_status)
+
+                    if current_status.lower() == "deleted":
+                        print("Resource was deleted.")
+                        return
+
+                    if timeout is not None and time.time() - start_time >= timeout:
+                        raise TimeoutExceededError(
+                            resouce_type="ClusterSchedulerConfig", status=current_status
+                        )
+                except botocore.exceptions.ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+
+                    if "ResourceNotFound" in error_code or "ValidationException" in error_code:
+                        logger.info("Resource was not found. It may have been deleted.")
+                        return
+                    raise e
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        cluster_arn: Optional[str] = Unassigned(),
+        status: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["ClusterSchedulerConfig"]:
+        """
+        Get all ClusterSchedulerConfig resources
+
+        Parameters:
+            created_after: Filter for after this creation time. The input for this parameter is a Unix timestamp. To convert a date and time into a Unix timestamp, see EpochConverter.
+            created_before: Filter for before this creation time. The input for this parameter is a Unix timestamp. To convert a date and time into a Unix timestamp, see EpochConverter.
+            name_contains: Filter for name containing this string.
+            cluster_arn: Filter for ARN of the cluster.
+            status: Filter for status.
+            sort_by: Filter for sorting the list by a given value. For example, sort by name, creation time, or status.
+            sort_order: The order of the list. By default, listed in Descending order according to by SortBy. To change the list order, you can specify SortOrder to be Ascending.
+            next_token: If the previous response was truncated, you will receive this token. Use it in your next request to receive the next set of results.
+            max_results: The maximum number of cluster policies to list.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed ClusterSchedulerConfig resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "NameContains": name_contains,
+            "ClusterArn": cluster_arn,
+            "Status": status,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "MaxResults": max_results,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_cluster_scheduler_configs",
+            summaries_key="ClusterSchedulerConfigSummaries",
+            summary_name="ClusterSchedulerConfigSummary",
+            resource_cls=ClusterSchedulerConfig,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["ClusterSchedulerConfig"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["ClusterSchedulerConfig"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["ClusterSchedulerConfig"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["ClusterSchedulerConfig"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_status(
+        self,
+        target_status: Literal[
+            "Creating",
+            "CreateFailed",
+            "CreateRollbackFailed",
+            "Created",
+            "Updating",
+            "UpdateFailed",
+            "UpdateRollbackFailed",
+            "Updated",
+            "Deleting",
+            "DeleteFailed",
+            "DeleteRollbackFailed",
+            "Deleted",
+        ],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_status, waiting for a ClusterSchedulerConfig resource to reach certain status without blocking the event loop.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+    @Base.add_validate_call
+    async def await_deletion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_delete, waiting for a ClusterSchedulerConfig resource to be deleted without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+            TimeoutExceededError:  If the resource is not deleted before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_for_delete_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["ClusterSchedulerConfig"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,292 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class Device(Base):
+    """
+    Class representing resource Device
+
+    Attributes:
+        device_name: The unique identifier of the device.
+        device_fleet_name: The name of the fleet the device belongs to.
+        registration_time: The timestamp of the last registration or de-reregistration.
+        device_arn: The Amazon Resource Name (ARN) of the device.
+        description: A description of the device.
+        iot_thing_name: The Amazon Web Services Internet of Things (IoT) object thing name associated with the device.
+        latest_heartbeat: The last heartbeat received from the device.
+        models: Models on the device.
+        max_models: The maximum number of models.
+        next_token: The response from the last list when returning a list large enough to need tokening.
+        agent_version: Edge Manager agent version.
+
+    """
+
+    device_name: str
+    device_fleet_name: str
+    device_arn: Optional[str] = Unassigned()
+    description: Optional[str] = Unassigned()
+    iot_thing_name: Optional[str] = Unassigned()
+    registration_time: Optional[datetime.datetime] = Unassigned()
+    latest_heartbeat: Optional[datetime.datetime] = Unassigned()
+    models: Optional[List[shapes.EdgeModel]] = Unassigned()
+    max_models: Optional[int] = Unassigned()
+    next_token: Optional[str] = Unassigned()
+    agent_version: Optional[str] = Unassigned()
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "device_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object device")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        device_name: str,
+        device_fleet_name: str,
+        next_token: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Device"]:
+        """
+        Get a Device resource
+
+        Parameters:
+            device_name: The unique ID of the device.
+            device_fleet_name: The name of the fleet the devices belong to.
+            next_token: Next token of device description.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Device resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "NextToken": next_token,
+            "DeviceName": device_name,
+            "DeviceFleetName": device_fleet_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_device(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeDeviceResponse")
+        device = build_from_response(cls, transformed_response)
+        device._set_client_context(session=session, region_name=region)
+        return device
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["Device"]:
+        """
+        Refresh a Device resource
+
+        Returns:
+            The Device resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "NextToken": self.next_token,
+            "DeviceName": self.device_name,
+            "DeviceFleetName": self.device_fleet_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_device(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeDeviceResponse", self)
+        return self
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        max_results: Optional[int] = Unassigned(),
+        latest_heartbeat_after: Optional[datetime.datetime] = Unassigned(),
+        model_name: Optional[str] = Unassigned(),
+        device_fleet_name: Optional[str] = Unassigned(),
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Device"]:
+        """
+        Get all Device resources
+
+        Parameters:
+            next_token: The response from the last list when returning a list large enough to need tokening.
+            max_results: Maximum number of results to select.
+            latest_heartbeat_after: Select fleets where the job was updated after X
+            model_name: A filter that searches devices that contains this name in any of their models.
+            device_fleet_name: Filter for fleets containing this name in their device fleet name.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed Device resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "MaxResults": max_results,
+            "LatestHeartbeatAfter": latest_heartbeat_after,
+            "ModelName": model_name,
+            "DeviceFleetName": device_fleet_name,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_devices",
+            summaries_key="DeviceSummaries",
+            summary_name="DeviceSummary",
+            resource_cls=Device,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["Device"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["Device"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["Device"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,752 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class Domain(Base):
+    """
+    Class representing resource Domain
+
+    Attributes:
+        domain_arn: The domain's Amazon Resource Name (ARN).
+        domain_id: The domain ID.
+        domain_name: The domain name.
+        home_efs_file_system_id: The ID of the Amazon Elastic File System managed by this Domain.
+        single_sign_on_managed_application_instance_id: The IAM Identity Center managed application instance ID.
+        single_sign_on_application_arn: The ARN of the application managed by SageMaker AI in IAM Identity Center. This value is only returned for domains created after October 1, 2023.
+        status: The status.
+        creation_time: The creation time.
+        last_modified_time: The last modified time.
+        failure_reason: The failure reason.
+        security_group_id_for_domain_boundary: The ID of the security group that authorizes traffic between the RSessionGateway apps and the RStudioServerPro app.
+        auth_mode: The domain's authentication mode.
+        default_user_settings: Settings which are applied to UserProfiles in this domain if settings are not explicitly specified in a given UserProfile.
+        domain_settings: A collection of Domain settings.
+        app_network_access_type: Specifies the VPC used for non-EFS traffic. The default value is PublicInternetOnly.    PublicInternetOnly - Non-EFS traffic is through a VPC managed by Amazon SageMaker AI, which allows direct internet access    VpcOnly - All traffic is through the specified VPC and subnets
+        home_efs_file_system_kms_key_id: Use KmsKeyId.
+        subnet_ids: The VPC subnets that the domain uses for communication.
+        url: The domain's URL.
+        vpc_id: The ID of the Amazon Virtual Private Cloud (VPC) that the domain uses for communication.
+        kms_key_id: The Amazon Web Services KMS customer managed key used to encrypt the EFS volume attached to the domain.
+        app_security_group_management: The entity that creates and manages the required security groups for inter-app communication in VPCOnly mode. Required when CreateDomain.AppNetworkAccessType is VPCOnly and DomainSettings.RStudioServerProDomainSettings.DomainExecutionRoleArn is provided.
+        tag_propagation: Indicates whether custom tag propagation is supported for the domain.
+        default_space_settings: The default settings for shared spaces that users create in the domain.
+
+    """
+
+    domain_id: str
+    domain_arn: Optional[str] = Unassigned()
+    domain_name: Optional[str] = Unassigned()
+    home_efs_file_system_id: Optional[str] = Unassigned()
+    single_sign_on_managed_application_instance_id: Optional[str] = Unassigned()
+    single_sign_on_application_arn: Optional[str] = Unassigned()
+    status: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    security_group_id_for_domain_boundary: Optional[str] = Unassigned()
+    auth_mode: Optional[str] = Unassigned()
+    default_user_settings: Optional[shapes.UserSettings] = Unassigned()
+    domain_settings: Optional[shapes.DomainSettings] = Unassigned()
+    app_network_access_type: Optional[str] = Unassigned()
+    home_efs_file_system_kms_key_id: Optional[str] = Unassigned()
+    subnet_ids: Optional[List[str]] = Unassigned()
+    url: Optional[str] = Unassigned()
+    vpc_id: Optional[str] = Unassigned()
+    kms_key_id: Optional[str] = Unassigned()
+    app_security_group_management: Optional[str] = Unassigned()
+    tag_propagation: Optional[str] = Unassigned()
+    default_space_settings: Optional[shapes.DefaultSpaceSettings] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["status"]
+    _terminal_states: ClassVar[List[str]] = []
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "domain_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object domain")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "security_group_id_for_domain_boundary": {"type": "string"},
+                "default_user_settings": {
+                    "execution_role": {"type": "string"},
+                    "security_groups": {"type": "array", "items": {"type": "string"}},
+                    "sharing_settings": {
+                        "s3_output_path": {"type": "string"},
+                        "s3_kms_key_id": {"type": "string"},
+                    },
+                    "canvas_app_settings": {
+                        "time_series_forecasting_settings": {
+                            "amazon_forecast_role_arn": {"type": "string"}
+                        },
+                        "model_register_settings": {
+                            "cross_account_model_register_role_arn": {"type": "string"}
+                        },
+                        "workspace_settings": {
+                            "s3_artifact_path": {"type": "string"},
+                            "s3_kms_key_id": {"type": "string"},
+                        },
+                        "generative_ai_settings": {"amazon_bedrock_role_arn": {"type": "string"}},
+                        "emr_serverless_settings": {"execution_role_arn": {"type": "string"}},
+                    },
+                    "jupyter_lab_app_settings": {
+                        "emr_settings": {
+                            "assumable_role_arns": {"type": "array", "items": {"type": "string"}},
+                            "execution_role_arns": {"type": "array", "items": {"type": "string"}},
+                        }
+                    },
+                },
+                "domain_settings": {
+                    "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                    "r_studio_server_pro_domain_settings": {
+                        "domain_execution_role_arn": {"type": "string"}
+                    },
+                    "execution_role_identity_config": {"type": "string"},
+                    "unified_studio_settings": {"project_s3_path": {"type": "string"}},
+                },
+                "home_efs_file_system_kms_key_id": {"type": "string"},
+                "subnet_ids": {"type": "array", "items": {"type": "string"}},
+                "kms_key_id": {"type": "string"},
+                "app_security_group_management": {"type": "string"},
+                "default_space_settings": {
+                    "execution_role": {"type": "string"},
+                    "security_groups": {"type": "array", "items": {"type": "string"}},
+                    "jupyter_lab_app_settings": {
+                        "emr_settings": {
+                            "assumable_role_arns": {"type": "array", "items": {"type": "string"}},
+                            "execution_role_arns": {"type": "array", "items": {"type": "string"}},
+                        }
+                    },
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "Domain", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        domain_name: str,
+        auth_mode: str,
+        default_user_settings: shapes.UserSettings,
+        domain_settings: Optional[shapes.DomainSettings] = Unassigned(),
+        subnet_ids: Optional[List[str]] = Unassigned(),
+        vpc_id: Optional[str] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        app_network_access_type: Optional[str] = Unassigned(),
+        home_efs_file_system_kms_key_id: Optional[str] = Unassigned(),
+        kms_key_id: Optional[str] = Unassigned(),
+        app_security_group_management: Optional[str] = Unassigned(),
+        tag_propagation: Optional[str] = Unassigned(),
+        default_space_settings: Optional[shapes.DefaultSpaceSettings] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Domain"]:
+        """
+        Create a Domain resource
+
+        Parameters:
+            domain_name: A name for the domain.
+            auth_mode: The mode of authentication that members use to access the domain.
+            default_user_settings: The default settings to use to create a user profile when UserSettings isn't specified in the call to the CreateUserProfile API.  SecurityGroups is aggregated when specified in both calls. For all other settings in UserSettings, the values specified in CreateUserProfile take precedence over those specified in CreateDomain.
+            domain_settings: A collection of Domain settings.
+            subnet_ids: The VPC subnets that the domain uses for communication. The field is optional when the AppNetworkAccessType parameter is set to PublicInternetOnly for domains created from Amazon SageMaker Unified Studio.
+            vpc_id: The ID of the Amazon Virtual Private Cloud (VPC) that the domain uses for communication. The field is optional when the AppNetworkAccessType parameter is set to PublicInternetOnly for domains created from Amazon SageMaker Unified Studio.
+            tags: Tags to associated with the Domain. Each tag consists of a key and an optional value. Tag keys must be unique per resource. Tags are searchable using the Search API. Tags that you specify for the Domain are also added to all Apps that the Domain launches.
+            app_network_access_type: Specifies the VPC used for non-EFS traffic. The default value is PublicInternetOnly.    PublicInternetOnly - Non-EFS traffic is through a VPC managed by Amazon SageMaker AI, which allows direct internet access    VpcOnly - All traffic is through the specified VPC and subnets
+            home_efs_file_system_kms_key_id: Use KmsKeyId.
+            kms_key_id: SageMaker AI uses Amazon Web Services KMS to encrypt EFS and EBS volumes attached to the domain with an Amazon Web Services managed key by default. For more control, specify a customer managed key.
+            app_security_group_management: The entity that creates and manages the required security groups for inter-app communication in VPCOnly mode. Required when CreateDomain.AppNetworkAccessType is VPCOnly and DomainSettings.RStudioServerProDomainSettings.DomainExecutionRoleArn is provided. If setting up the domain for use with RStudio, this value must be set to Service.
+            tag_propagation: Indicates whether custom tag propagation is supported for the domain. Defaults to DISABLED.
+            default_space_settings: The default settings for shared spaces that users create in the domain.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Domain resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating domain resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "DomainName": domain_name,
+            "AuthMode": auth_mode,
+            "DefaultUserSettings": default_user_settings,
+            "DomainSettings": domain_settings,
+            "SubnetIds": subnet_ids,
+            "VpcId": vpc_id,
+            "Tags": tags,
+            "AppNetworkAccessType": app_network_access_type,
+            "HomeEfsFileSystemKmsKeyId": home_efs_file_system_kms_key_id,
+            "KmsKeyId": kms_key_id,
+            "AppSecurityGroupManagement": app_security_group_management,
+            "TagPropagation": tag_propagation,
+            "DefaultSpaceSettings": default_space_settings,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="Domain", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_domain(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(domain_id=response["DomainId"], session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        domain_id: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["Domain"]:
+        """
+        Get a Domain resource
+
+        Parameters:
+            domain_id: The domain ID.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The Domain resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "DomainId": domain_id,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_domain(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeDomainResponse")
+        domain = build_from_response(cls, transformed_response)
+        domain._set_client_context(session=session, region_name=region)
+        return domain
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["Domain"]:
+        """
+        Refresh a Domain resource
+
+        Returns:
+            The Domain resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_domain(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeDomainResponse", self)
+        return self
+
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def update(
+        self,
+        default_user_settings: Optional[shapes.UserSettings] = Unassigned(),
+        domain_settings_for_update: Optional[shapes.DomainSettingsForUpdate] = Unassigned(),
+        app_security_group_management: Optional[str] = Unassigned(),
+        default_space_settings: Optional[shapes.DefaultSpaceSettings] = Unassigned(),
+        subnet_ids: Optional[List[str]] = Unassigned(),
+        app_network_access_type: Optional[str] = Unassigned(),
+        tag_propagation: Optional[str] = Unassigned(),
+        vpc_id: Optional[str] = Unassigned(),
+    ) -> Optional["Domain"]:
+        """
+        Update a Domain resource
+
+        Parameters:
+            domain_settings_for_update: A collection of DomainSettings configuration values to update.
+
+        Returns:
+            The Domain resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating domain resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "DefaultUserSettings": default_user_settings,
+            "DomainSettingsForUpdate": domain_settings_for_update,
+            "AppSecurityGroupManagement": app_security_group_management,
+            "DefaultSpaceSettings": default_space_settings,
+            "SubnetIds": subnet_ids,
+            "AppNetworkAccessType": app_network_access_type,
+            "TagPropagation": tag_propagation,
+            "VpcId": vpc_id,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_domain(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+        retention_policy: Optional[shapes.RetentionPolicy] = Unassigned(),
+    ) -> None:
+        """
+        Delete a Domain resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "DomainId": self.domain_id,
+            "RetentionPolicy": retention_policy,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_domain(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait_for_status(
+        self,
+        target_status: Literal[
+            "Deleting",
+            "Failed",
+            "InService",
+            "Pending",
+            "Updating",
+            "Update_Failed",
+            "Delete_Failed",
+        ],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a Domain resource to reach certain status.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            f"Waiting for Domain to reach [bold]{target_status} status...", display, status_callback
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.status
+                waiter_display.update(current_status)
+
+                if target_status == current_status:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+                    return
+
+                if "failed" in current_status.lower():
+                    raise FailedStatusError(
+                        resource_type="Domain", status=current_status, reason=self.failure_reason
+                    )
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="Domain", status=current_status)
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def wait_for_delete(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a Domain resource to be deleted.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for Domain to be deleted...", display, status_callback, transient=False
+        ) as waiter_display:
+            while True:
+                try:
+                    poller.call(self.refresh)
+                    current_status = self.status
+                    waiter_display.update(current_status)
+
+                    if (
+                        "delete_failed" in current_status.lower()
+                        or "deletefailed" in current_status.lower()
+                    ):
+                        raise DeleteFailedStatusError(
+                            resource_type="Domain", reason=self.failure_reason
+                        )
+
+                    if timeout is not None and time.time() - start_time >= timeout:
+                        raise TimeoutExceededError(resouce_type="Domain", status=current_status)
+                except botocore.exceptions.ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+
+                    if "ResourceNotFound" in error_code or "ValidationException" in error_code:
+                        logger.info("Resource was not found. It may have been deleted.")
+                        return
+                    raise e
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        max_results: Optional[int] = Unassigned(),
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["Domain"]:
+        """
+        Get all Domain resources
+
+        Parameters:
+            next_token: If the previous response was truncated, you will receive this token. Use it in your next request to receive the next set of results.
+            max_results: This parameter defines the maximum number of results that can be return in a single response. The MaxResults parameter is an upper bound, not a target. If there are more results available than the value specified, a NextToken is provided in the response. The NextToken indicates that the user should get the next set of results by providing this token as a part of a subsequent call. The default value for MaxResults is 10.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed Domain resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "MaxResults": max_results,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_domains",
+            summaries_key="Domains",
+            summary_name="DomainDetails",
+            resource_cls=Domain,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["Domain"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["Domain"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["Domain"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["Domain"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_status(
+        self,
+        target_status: Literal[
+            "Deleting",
+            "Failed",
+            "InService",
+            "Pending",
+            "Updating",
+            "Update_Failed",
+            "Delete_Failed",
+        ],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_status, waiting for a Domain resource to reach certain status without blocking the event loop.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+    @Base.add_validate_call
+    async def await_deletion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_delete, waiting for a Domain resource to be deleted without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+            TimeoutExceededError:  If the resource is not deleted before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_for_delete_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["Domain"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,535 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class EdgePackagingJob(Base):
+    """
+    Class representing resource EdgePackagingJob
+
+    Attributes:
+        edge_packaging_job_arn: The Amazon Resource Name (ARN) of the edge packaging job.
+        edge_packaging_job_name: The name of the edge packaging job.
+        edge_packaging_job_status: The current status of the packaging job.
+        compilation_job_name: The name of the SageMaker Neo compilation job that is used to locate model artifacts that are being packaged.
+        model_name: The name of the model.
+        model_version: The version of the model.
+        role_arn: The Amazon Resource Name (ARN) of an IAM role that enables Amazon SageMaker to download and upload the model, and to contact Neo.
+        output_config: The output configuration for the edge packaging job.
+        resource_key: The Amazon Web Services KMS key to use when encrypting the EBS volume the job run on.
+        edge_packaging_job_status_message: Returns a message describing the job status and error messages.
+        creation_time: The timestamp of when the packaging job was created.
+        last_modified_time: The timestamp of when the job was last updated.
+        model_artifact: The Amazon Simple Storage (S3) URI where model artifacts ares stored.
+        model_signature: The signature document of files in the model artifact.
+        preset_deployment_output: The output of a SageMaker Edge Manager deployable resource.
+
+    """
+
+    edge_packaging_job_name: str
+    edge_packaging_job_arn: Optional[str] = Unassigned()
+    compilation_job_name: Optional[str] = Unassigned()
+    model_name: Optional[str] = Unassigned()
+    model_version: Optional[str] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    output_config: Optional[shapes.EdgeOutputConfig] = Unassigned()
+    resource_key: Optional[str] = Unassigned()
+    edge_packaging_job_status: Optional[str] = Unassigned()
+    edge_packaging_job_status_message: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    model_artifact: Optional[str] = Unassigned()
+    model_signature: Optional[str] = Unassigned()
+    preset_deployment_output: Optional[shapes.EdgePresetDeploymentOutput] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["edge_packaging_job_status"]
+    _terminal_states: ClassVar[List[str]] = ["COMPLETED", "FAILED", "STOPPED"]
+    _failure_reason_attribute: ClassVar[Optional[str]] = "edge_packaging_job_status_message"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "edge_packaging_job_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object edge_packaging_job")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "role_arn": {"type": "string"},
+                "output_config": {
+                    "s3_output_location": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "EdgePackagingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        edge_packaging_job_name: str,
+        compilation_job_name: Union[str, object],
+        model_name: Union[str, object],
+        model_version: str,
+        role_arn: str,
+        output_config: shapes.EdgeOutputConfig,
+        resource_key: Optional[str] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["EdgePackagingJob"]:
+        """
+        Create a EdgePackagingJob resource
+
+        Parameters:
+            edge_packaging_job_name: The name of the edge packaging job.
+            compilation_job_name: The name of the SageMaker Neo compilation job that will be used to locate model artifacts for packaging.
+            model_name: The name of the model.
+            model_version: The version of the model.
+            role_arn: The Amazon Resource Name (ARN) of an IAM role that enables Amazon SageMaker to download and upload the model, and to contact SageMaker Neo.
+            output_config: Provides information about the output location for the packaged model.
+            resource_key: The Amazon Web Services KMS key to use when encrypting the EBS volume the edge packaging job runs on.
+            tags: Creates tags for the packaging job.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The EdgePackagingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating edge_packaging_job resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "EdgePackagingJobName": edge_packaging_job_name,
+            "CompilationJobName": compilation_job_name,
+            "ModelName": model_name,
+            "ModelVersion": model_version,
+            "RoleArn": role_arn,
+            "OutputConfig": output_config,
+            "ResourceKey": resource_key,
+            "Tags": tags,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="EdgePackagingJob", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_edge_packaging_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(
+            edge_packaging_job_name=edge_packaging_job_name, session=session, region=region
+        )
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        edge_packaging_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["EdgePackagingJob"]:
+        """
+        Get a EdgePackagingJob resource
+
+        Parameters:
+            edge_packaging_job_name: The name of the edge packaging job.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The EdgePackagingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "EdgePackagingJobName": edge_packaging_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_edge_packaging_job(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeEdgePackagingJobResponse")
+        edge_packaging_job = build_from_response(cls, transformed_response)
+        edge_packaging_job._set_client_context(session=session, region_name=region)
+        return edge_packaging_job
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["EdgePackagingJob"]:
+        """
+        Refresh a EdgePackagingJob resource
+
+        Returns:
+            The EdgePackagingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "EdgePackagingJobName": self.edge_packaging_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_edge_packaging_job(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeEdgePackagingJobResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def stop(self) -> None:
+        """
+        Stop a EdgePackagingJob resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "EdgePackagingJobName": self.edge_packaging_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.stop_edge_packaging_job(**operation_input_args)
+
+        logger.info(f"Stopping {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a EdgePackagingJob resource.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+
+        """
+        terminal_states = ["COMPLETED", "FAILED", "STOPPED"]
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for EdgePackagingJob...", display, status_callback
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.edge_packaging_job_status
+                waiter_display.update(current_status)
+
+                if current_status in terminal_states:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+
+                    if "failed" in current_status.lower():
+                        raise FailedStatusError(
+                            resource_type="EdgePackagingJob",
+                            status=current_status,
+                            reason=self.edge_packaging_job_status_message,
+                        )
+
+                    return
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(
+                        resouce_type="EdgePackagingJob", status=current_status
+                    )
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        max_results: Optional[int] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        model_name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["EdgePackagingJob"]:
+        """
+        Get all EdgePackagingJob resources
+
+        Parameters:
+            next_token: The response from the last list when returning a list large enough to need tokening.
+            max_results: Maximum number of results to select.
+            creation_time_after: Select jobs where the job was created after specified time.
+            creation_time_before: Select jobs where the job was created before specified time.
+            last_modified_time_after: Select jobs where the job was updated after specified time.
+            last_modified_time_before: Select jobs where the job was updated before specified time.
+            name_contains: Filter for jobs containing this name in their packaging job name.
+            model_name_contains: Filter for jobs where the model name contains this string.
+            status_equals: The job status to filter for.
+            sort_by: Use to specify what column to sort by.
+            sort_order: What direction to sort by.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed EdgePackagingJob resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "MaxResults": max_results,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "ModelNameContains": model_name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_edge_packaging_jobs",
+            summaries_key="EdgePackagingJobSummaries",
+            summary_name="EdgePackagingJobSummary",
+            resource_cls=EdgePackagingJob,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["EdgePackagingJob"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["EdgePackagingJob"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["EdgePackagingJob"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of stop, running it on the thread pool of the async bridge, with
+    # the signature and docstring of stop
+    @functools.wraps(stop, assigned=("__module__", "__doc__"))
+    async def astop(self, *args, **kwargs) -> None:
+        return await run_async(self.stop, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_completion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait, waiting for a EdgePackagingJob resource without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["EdgePackagingJob"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
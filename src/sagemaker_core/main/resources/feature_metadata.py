@@ -0,0 +1,260 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class FeatureMetadata(Base):
+    """
+    Class representing resource FeatureMetadata
+
+    Attributes:
+        feature_group_arn: The Amazon Resource Number (ARN) of the feature group that contains the feature.
+        feature_group_name: The name of the feature group that you've specified.
+        feature_name: The name of the feature that you've specified.
+        feature_type: The data type of the feature.
+        creation_time: A timestamp indicating when the feature was created.
+        last_modified_time: A timestamp indicating when the metadata for the feature group was modified. For example, if you add a parameter describing the feature, the timestamp changes to reflect the last time you
+        description: The description you added to describe the feature.
+        parameters: The key-value pairs that you added to describe the feature.
+
+    """
+
+    feature_group_name: str
+    feature_name: str
+    feature_group_arn: Optional[str] = Unassigned()
+    feature_type: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    description: Optional[str] = Unassigned()
+    parameters: Optional[List[shapes.FeatureParameter]] = Unassigned()
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "feature_metadata_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object feature_metadata")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        feature_group_name: str,
+        feature_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["FeatureMetadata"]:
+        """
+        Get a FeatureMetadata resource
+
+        Parameters:
+            feature_group_name: The name or Amazon Resource Name (ARN) of the feature group containing the feature.
+            feature_name: The name of the feature.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The FeatureMetadata resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "FeatureGroupName": feature_group_name,
+            "FeatureName": feature_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_feature_metadata(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeFeatureMetadataResponse")
+        feature_metadata = build_from_response(cls, transformed_response)
+        feature_metadata._set_client_context(session=session, region_name=region)
+        return feature_metadata
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["FeatureMetadata"]:
+        """
+        Refresh a FeatureMetadata resource
+
+        Returns:
+            The FeatureMetadata resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+            "FeatureName": self.feature_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_feature_metadata(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeFeatureMetadataResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def update(
+        self,
+        description: Optional[str] = Unassigned(),
+        parameter_additions: Optional[List[shapes.FeatureParameter]] = Unassigned(),
+        parameter_removals: Optional[List[str]] = Unassigned(),
+    ) -> Optional["FeatureMetadata"]:
+        """
+        Update a FeatureMetadata resource
+
+        Parameters:
+            parameter_additions: A list of key-value pairs that you can add to better describe the feature.
+            parameter_removals: A list of parameter keys that you can specify to remove parameters that describe your feature.
+
+        Returns:
+            The FeatureMetadata resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating feature_metadata resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "FeatureGroupName": self.feature_group_name,
+            "FeatureName": self.feature_name,
+            "Description": description,
+            "ParameterAdditions": parameter_additions,
+            "ParameterRemovals": parameter_removals,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_feature_metadata(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["FeatureMetadata"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["FeatureMetadata"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["FeatureMetadata"]:
+        return await run_async(self.update, *args, **kwargs)
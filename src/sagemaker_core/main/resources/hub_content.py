@@ -0,0 +1,690 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class HubContent(Base):
+    """
+    Class representing resource HubContent
+
+    Attributes:
+        hub_content_name: The name of the hub content.
+        hub_content_arn: The Amazon Resource Name (ARN) of the hub content.
+        hub_content_version: The version of the hub content.
+        hub_content_type: The type of hub content.
+        document_schema_version: The document schema version for the hub content.
+        hub_name: The name of the hub that contains the content.
+        hub_arn: The Amazon Resource Name (ARN) of the hub that contains the content.
+        hub_content_document: The hub content document that describes information about the hub content such as type, associated containers, scripts, and more.
+        hub_content_status: The status of the hub content.
+        creation_time: The date and time that hub content was created.
+        hub_content_display_name: The display name of the hub content.
+        hub_content_description: A description of the hub content.
+        hub_content_markdown: A string that provides a description of the hub content. This string can include links, tables, and standard markdown formating.
+        sage_maker_public_hub_content_arn: The ARN of the public hub content.
+        reference_min_version: The minimum version of the hub content.
+        support_status: The support status of the hub content.
+        hub_content_search_keywords: The searchable keywords for the hub content.
+        hub_content_dependencies: The location of any dependencies that the hub content has, such as scripts, model artifacts, datasets, or notebooks.
+        failure_reason: The failure reason if importing hub content failed.
+        last_modified_time: The last modified time of the hub content.
+
+    """
+
+    hub_content_type: str
+    hub_content_name: str
+    hub_content_arn: Optional[str] = Unassigned()
+    hub_content_version: Optional[str] = Unassigned()
+    document_schema_version: Optional[str] = Unassigned()
+    hub_arn: Optional[str] = Unassigned()
+    hub_content_display_name: Optional[str] = Unassigned()
+    hub_content_description: Optional[str] = Unassigned()
+    hub_content_markdown: Optional[str] = Unassigned()
+    hub_content_document: Optional[str] = Unassigned()
+    sage_maker_public_hub_content_arn: Optional[str] = Unassigned()
+    reference_min_version: Optional[str] = Unassigned()
+    support_status: Optional[str] = Unassigned()
+    hub_content_search_keywords: Optional[List[str]] = Unassigned()
+    hub_content_dependencies: Optional[List[shapes.HubContentDependency]] = Unassigned()
+    hub_content_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    hub_name: Optional[str] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["support_status"]
+    _terminal_states: ClassVar[List[str]] = []
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "hub_content_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object hub_content")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        hub_name: str,
+        hub_content_type: str,
+        hub_content_name: str,
+        hub_content_version: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["HubContent"]:
+        """
+        Get a HubContent resource
+
+        Parameters:
+            hub_name: The name of the hub that contains the content to describe.
+            hub_content_type: The type of content in the hub.
+            hub_content_name: The name of the content to describe.
+            hub_content_version: The version of the content to describe.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The HubContent resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "HubName": hub_name,
+            "HubContentType": hub_content_type,
+            "HubContentName": hub_content_name,
+            "HubContentVersion": hub_content_version,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_hub_content(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeHubContentResponse")
+        hub_content = build_from_response(cls, transformed_response)
+        hub_content._set_client_context(session=session, region_name=region)
+        return hub_content
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["HubContent"]:
+        """
+        Refresh a HubContent resource
+
+        Returns:
+            The HubContent resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "HubContentVersion": self.hub_content_version,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_hub_content(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeHubContentResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def update(
+        self,
+        hub_content_type: str,
+        hub_content_version: str,
+        hub_content_display_name: Optional[str] = Unassigned(),
+        hub_content_description: Optional[str] = Unassigned(),
+        hub_content_markdown: Optional[str] = Unassigned(),
+        hub_content_search_keywords: Optional[List[str]] = Unassigned(),
+        support_status: Optional[str] = Unassigned(),
+    ) -> Optional["HubContent"]:
+        """
+        Update a HubContent resource
+
+        Returns:
+            The HubContent resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating hub_content resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentName": self.hub_content_name,
+            "HubContentType": hub_content_type,
+            "HubContentVersion": hub_content_version,
+            "HubContentDisplayName": hub_content_display_name,
+            "HubContentDescription": hub_content_description,
+            "HubContentMarkdown": hub_content_markdown,
+            "HubContentSearchKeywords": hub_content_search_keywords,
+            "SupportStatus": support_status,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_hub_content(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a HubContent resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "HubContentVersion": self.hub_content_version,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_hub_content(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait_for_status(
+        self,
+        target_status: Literal["Supported", "Deprecated", "Restricted"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a HubContent resource to reach certain status.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            f"Waiting for HubContent to reach [bold]{target_status} status...",
+            display,
+            status_callback,
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.support_status
+                waiter_display.update(current_status)
+
+                if target_status == current_status:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+                    return
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="HubContent", status=current_status)
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def load(
+        cls,
+        hub_content_name: str,
+        hub_content_type: str,
+        document_schema_version: str,
+        hub_name: str,
+        hub_content_document: str,
+        hub_content_version: Optional[str] = Unassigned(),
+        hub_content_display_name: Optional[str] = Unassigned(),
+        hub_content_description: Optional[str] = Unassigned(),
+        hub_content_markdown: Optional[str] = Unassigned(),
+        support_status: Optional[str] = Unassigned(),
+        hub_content_search_keywords: Optional[List[str]] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["HubContent"]:
+        """
+        Import a HubContent resource
+
+        Parameters:
+            hub_content_name: The name of the hub content to import.
+            hub_content_type: The type of hub content to import.
+            document_schema_version: The version of the hub content schema to import.
+            hub_name: The name of the hub to import content into.
+            hub_content_document: The hub content document that describes information about the hub content such as type, associated containers, scripts, and more.
+            hub_content_version: The version of the hub content to import.
+            hub_content_display_name: The display name of the hub content to import.
+            hub_content_description: A description of the hub content to import.
+            hub_content_markdown: A string that provides a description of the hub content. This string can include links, tables, and standard markdown formating.
+            support_status: The status of the hub content resource.
+            hub_content_search_keywords: The searchable keywords of the hub content.
+            tags: Any tags associated with the hub content.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The HubContent resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info(f"Importing hub_content resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "HubContentName": hub_content_name,
+            "HubContentVersion": hub_content_version,
+            "HubContentType": hub_content_type,
+            "DocumentSchemaVersion": document_schema_version,
+            "HubName": hub_name,
+            "HubContentDisplayName": hub_content_display_name,
+            "HubContentDescription": hub_content_description,
+            "HubContentMarkdown": hub_content_markdown,
+            "HubContentDocument": hub_content_document,
+            "SupportStatus": support_status,
+            "HubContentSearchKeywords": hub_content_search_keywords,
+            "Tags": tags,
+        }
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # import the resource
+        response = client.import_hub_content(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(
+            hub_name=hub_name,
+            hub_content_type=hub_content_type,
+            hub_content_name=hub_content_name,
+            session=session,
+            region=region,
+        )
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        hub_name: str,
+        hub_content_type: str,
+        name_contains: Optional[str] = Unassigned(),
+        max_schema_version: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["HubContent"]:
+        """
+        Get all HubContent resources
+
+        Parameters:
+            hub_name: The name of the hub to list the contents of.
+            hub_content_type: The type of hub content to list.
+            name_contains: Only list hub content if the name contains the specified string.
+            max_schema_version: The upper bound of the hub content schema verion.
+            creation_time_before: Only list hub content that was created before the time specified.
+            creation_time_after: Only list hub content that was created after the time specified.
+            sort_by: Sort hub content versions by either name or creation time.
+            sort_order: Sort hubs by ascending or descending order.
+            max_results: The maximum amount of hub content to list.
+            next_token: If the response to a previous ListHubContents request was truncated, the response includes a NextToken. To retrieve the next set of hub content, use the token in the next request.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed HubContent resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "HubName": hub_name,
+            "HubContentType": hub_content_type,
+            "NameContains": name_contains,
+            "MaxSchemaVersion": max_schema_version,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "MaxResults": max_results,
+        }
+        extract_name_mapping = {"hub_content_arn": ["hub-content/", "hub_name"]}
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_hub_contents",
+            summaries_key="HubContentSummaries",
+            summary_name="HubContentInfo",
+            resource_cls=HubContent,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            extract_name_mapping=extract_name_mapping,
+            list_method_kwargs=operation_input_args,
+        )
+
+    @Base.add_validate_call
+    def get_all_versions(
+        self,
+        min_version: Optional[str] = Unassigned(),
+        max_schema_version: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["HubContent"]:
+        """
+        List hub content versions.
+
+        Parameters:
+            min_version: The lower bound of the hub content versions to list.
+            max_schema_version: The upper bound of the hub content schema version.
+            creation_time_before: Only list hub content versions that were created before the time specified.
+            creation_time_after: Only list hub content versions that were created after the time specified.
+            sort_by: Sort hub content versions by either name or creation time.
+            sort_order: Sort hub content versions by ascending or descending order.
+            max_results: The maximum number of hub content versions to list.
+            next_token: If the response to a previous ListHubContentVersions request was truncated, the response includes a NextToken. To retrieve the next set of hub content versions, use the token in the next request.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed HubContent.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "HubName": self.hub_name,
+            "HubContentType": self.hub_content_type,
+            "HubContentName": self.hub_content_name,
+            "MinVersion": min_version,
+            "MaxSchemaVersion": max_schema_version,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "MaxResults": max_results,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_hub_content_versions",
+            summaries_key="HubContentSummaries",
+            summary_name="HubContentInfo",
+            resource_cls=HubContent,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["HubContent"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["HubContent"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["HubContent"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_status(
+        self,
+        target_status: Literal["Supported", "Deprecated", "Restricted"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_status, waiting for a HubContent resource to reach certain status without blocking the event loop.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of load, running it on the thread pool of the async bridge, with
+    # the signature and docstring of load
+    @classmethod
+    @functools.wraps(load.__func__, assigned=("__module__", "__doc__"))
+    async def aload(cls, *args, **kwargs) -> Optional["HubContent"]:
+        return await run_async(cls.load, *args, **kwargs)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["HubContent"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
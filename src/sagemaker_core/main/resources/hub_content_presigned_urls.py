@@ -0,0 +1,171 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class HubContentPresignedUrls(Base):
+    """
+    Class representing resource HubContentPresignedUrls
+
+    Attributes:
+        hub_name: The name or Amazon Resource Name (ARN) of the hub that contains the content. For public content, use SageMakerPublicHub.
+        hub_content_type: The type of hub content to access. Valid values include Model, Notebook, and ModelReference.
+        hub_content_name: The name of the hub content for which to generate presigned URLs. This identifies the specific model or content within the hub.
+        authorized_url_configs: An array of authorized URL configurations, each containing a presigned URL and its corresponding local file path for proper file organization during download.
+        hub_content_version: The version of the hub content. If not specified, the latest version is used.
+        access_config: Configuration settings for accessing the hub content, including end-user license agreement acceptance for gated models and expected S3 URL validation.
+        max_results: The maximum number of presigned URLs to return in the response. Default value is 100. Large models may contain hundreds of files, requiring pagination to retrieve all URLs.
+        next_token: A token for pagination. If present, indicates that more presigned URLs are available. Use this token in a subsequent request to retrieve additional URLs.
+
+    """
+
+    hub_name: Union[str, object]
+    hub_content_type: str
+    hub_content_name: Union[str, object]
+    authorized_url_configs: List[shapes.AuthorizedUrl]
+    hub_content_version: Optional[str] = Unassigned()
+    access_config: Optional[shapes.PresignedUrlAccessConfig] = Unassigned()
+    max_results: Optional[int] = Unassigned()
+    next_token: Optional[str] = Unassigned()
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "hub_content_presigned_urls_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object hub_content_presigned_urls")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def create(
+        cls,
+        hub_name: Union[str, object],
+        hub_content_type: str,
+        hub_content_name: Union[str, object],
+        hub_content_version: Optional[str] = Unassigned(),
+        access_config: Optional[shapes.PresignedUrlAccessConfig] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        next_token: Optional[str] = Unassigned(),
+    ) -> Optional["HubContentPresignedUrls"]:
+        """
+        Create a HubContentPresignedUrls resource
+
+        Parameters:
+            hub_name: The name or Amazon Resource Name (ARN) of the hub that contains the content. For public content, use SageMakerPublicHub.
+            hub_content_type: The type of hub content to access. Valid values include Model, Notebook, and ModelReference.
+            hub_content_name: The name of the hub content for which to generate presigned URLs. This identifies the specific model or content within the hub.
+            hub_content_version: The version of the hub content. If not specified, the latest version is used.
+            access_config: Configuration settings for accessing the hub content, including end-user license agreement acceptance for gated models and expected S3 URL validation.
+            max_results: The maximum number of presigned URLs to return in the response. Default value is 100. Large models may contain hundreds of files, requiring pagination to retrieve all URLs.
+            next_token:  A token for pagination. Use this token to retrieve the next set of presigned URLs when the response is truncated.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The HubContentPresignedUrls resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        operation_input_args = {
+            "HubName": hub_name,
+            "HubContentType": hub_content_type,
+            "HubContentName": hub_content_name,
+            "HubContentVersion": hub_content_version,
+            "AccessConfig": access_config,
+            "MaxResults": max_results,
+            "NextToken": next_token,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling create_hub_content_presigned_urls API")
+        response = client.create_hub_content_presigned_urls(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        transformed_response = transform(response, "CreateHubContentPresignedUrlsResponse")
+        return cls(**operation_input_args, **transformed_response)
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["HubContentPresignedUrls"]:
+        return await run_async(cls.create, *args, **kwargs)
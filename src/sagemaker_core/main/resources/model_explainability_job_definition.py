@@ -0,0 +1,481 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class ModelExplainabilityJobDefinition(Base):
+    """
+    Class representing resource ModelExplainabilityJobDefinition
+
+    Attributes:
+        job_definition_arn: The Amazon Resource Name (ARN) of the model explainability job.
+        job_definition_name: The name of the explainability job definition. The name must be unique within an Amazon Web Services Region in the Amazon Web Services account.
+        creation_time: The time at which the model explainability job was created.
+        model_explainability_app_specification: Configures the model explainability job to run a specified Docker container image.
+        model_explainability_job_input: Inputs for the model explainability job.
+        model_explainability_job_output_config:
+        job_resources:
+        role_arn: The Amazon Resource Name (ARN) of the IAM role that has read permission to the input data location and write permission to the output data location in Amazon S3.
+        model_explainability_baseline_config: The baseline configuration for a model explainability job.
+        network_config: Networking options for a model explainability job.
+        stopping_condition:
+
+    """
+
+    job_definition_name: str
+    job_definition_arn: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    model_explainability_baseline_config: Optional[shapes.ModelExplainabilityBaselineConfig] = (
+        Unassigned()
+    )
+    model_explainability_app_specification: Optional[shapes.ModelExplainabilityAppSpecification] = (
+        Unassigned()
+    )
+    model_explainability_job_input: Optional[shapes.ModelExplainabilityJobInput] = Unassigned()
+    model_explainability_job_output_config: Optional[shapes.MonitoringOutputConfig] = Unassigned()
+    job_resources: Optional[shapes.MonitoringResources] = Unassigned()
+    network_config: Optional[shapes.MonitoringNetworkConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    stopping_condition: Optional[shapes.MonitoringStoppingCondition] = Unassigned()
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "model_explainability_job_definition_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object model_explainability_job_definition")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_explainability_job_input": {
+                    "endpoint_input": {
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                    "batch_transform_input": {
+                        "data_captured_destination_s3_uri": {"type": "string"},
+                        "s3_input_mode": {"type": "string"},
+                        "s3_data_distribution_type": {"type": "string"},
+                    },
+                },
+                "model_explainability_job_output_config": {"kms_key_id": {"type": "string"}},
+                "job_resources": {"cluster_config": {"volume_kms_key_id": {"type": "string"}}},
+                "role_arn": {"type": "string"},
+                "model_explainability_baseline_config": {
+                    "constraints_resource": {"s3_uri": {"type": "string"}}
+                },
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelExplainabilityJobDefinition", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        job_definition_name: str,
+        model_explainability_app_specification: shapes.ModelExplainabilityAppSpecification,
+        model_explainability_job_input: shapes.ModelExplainabilityJobInput,
+        model_explainability_job_output_config: shapes.MonitoringOutputConfig,
+        job_resources: shapes.MonitoringResources,
+        role_arn: str,
+        model_explainability_baseline_config: Optional[
+            shapes.ModelExplainabilityBaselineConfig
+        ] = Unassigned(),
+        network_config: Optional[shapes.MonitoringNetworkConfig] = Unassigned(),
+        stopping_condition: Optional[shapes.MonitoringStoppingCondition] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["ModelExplainabilityJobDefinition"]:
+        """
+        Create a ModelExplainabilityJobDefinition resource
+
+        Parameters:
+            job_definition_name:  The name of the model explainability job definition. The name must be unique within an Amazon Web Services Region in the Amazon Web Services account.
+            model_explainability_app_specification: Configures the model explainability job to run a specified Docker container image.
+            model_explainability_job_input: Inputs for the model explainability job.
+            model_explainability_job_output_config:
+            job_resources:
+            role_arn: The Amazon Resource Name (ARN) of an IAM role that Amazon SageMaker AI can assume to perform tasks on your behalf.
+            model_explainability_baseline_config: The baseline configuration for a model explainability job.
+            network_config: Networking options for a model explainability job.
+            stopping_condition:
+            tags: (Optional) An array of key-value pairs. For more information, see  Using Cost Allocation Tags in the Amazon Web Services Billing and Cost Management User Guide.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The ModelExplainabilityJobDefinition resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating model_explainability_job_definition resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+            "ModelExplainabilityBaselineConfig": model_explainability_baseline_config,
+            "ModelExplainabilityAppSpecification": model_explainability_app_specification,
+            "ModelExplainabilityJobInput": model_explainability_job_input,
+            "ModelExplainabilityJobOutputConfig": model_explainability_job_output_config,
+            "JobResources": job_resources,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="ModelExplainabilityJobDefinition",
+            operation_input_args=operation_input_args,
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_model_explainability_job_definition(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(job_definition_name=job_definition_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        job_definition_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["ModelExplainabilityJobDefinition"]:
+        """
+        Get a ModelExplainabilityJobDefinition resource
+
+        Parameters:
+            job_definition_name: The name of the model explainability job definition. The name must be unique within an Amazon Web Services Region in the Amazon Web Services account.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The ModelExplainabilityJobDefinition resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "JobDefinitionName": job_definition_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_model_explainability_job_definition(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(
+            response, "DescribeModelExplainabilityJobDefinitionResponse"
+        )
+        model_explainability_job_definition = build_from_response(cls, transformed_response)
+        model_explainability_job_definition._set_client_context(session=session, region_name=region)
+        return model_explainability_job_definition
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["ModelExplainabilityJobDefinition"]:
+        """
+        Refresh a ModelExplainabilityJobDefinition resource
+
+        Returns:
+            The ModelExplainabilityJobDefinition resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_model_explainability_job_definition(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeModelExplainabilityJobDefinitionResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a ModelExplainabilityJobDefinition resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "JobDefinitionName": self.job_definition_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_model_explainability_job_definition(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        endpoint_name: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["ModelExplainabilityJobDefinition"]:
+        """
+        Get all ModelExplainabilityJobDefinition resources
+
+        Parameters:
+            endpoint_name: Name of the endpoint to monitor for model explainability.
+            sort_by: Whether to sort results by the Name or CreationTime field. The default is CreationTime.
+            sort_order: Whether to sort the results in Ascending or Descending order. The default is Descending.
+            next_token: The token returned if the response is truncated. To retrieve the next set of job executions, use it in the next request.
+            max_results: The maximum number of jobs to return in the response. The default value is 10.
+            name_contains: Filter for model explainability jobs whose name contains a specified string.
+            creation_time_before: A filter that returns only model explainability jobs created before a specified time.
+            creation_time_after: A filter that returns only model explainability jobs created after a specified time.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed ModelExplainabilityJobDefinition resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "EndpointName": endpoint_name,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "MaxResults": max_results,
+            "NameContains": name_contains,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+        }
+
+        custom_key_mapping = {
+            "monitoring_job_definition_name": "job_definition_name",
+            "monitoring_job_definition_arn": "job_definition_arn",
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_model_explainability_job_definitions",
+            summaries_key="JobDefinitionSummaries",
+            summary_name="MonitoringJobDefinitionSummary",
+            resource_cls=ModelExplainabilityJobDefinition,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            custom_key_mapping=custom_key_mapping,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["ModelExplainabilityJobDefinition"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["ModelExplainabilityJobDefinition"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["ModelExplainabilityJobDefinition"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["ModelExplainabilityJobDefinition"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,855 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class ModelPackage(Base):
+    """
+    Class representing resource ModelPackage
+
+    Attributes:
+        model_package_name: The name of the model package being described.
+        model_package_arn: The Amazon Resource Name (ARN) of the model package.
+        creation_time: A timestamp specifying when the model package was created.
+        model_package_status: The current status of the model package.
+        model_package_status_details: Details about the current status of the model package.
+        model_package_group_name: If the model is a versioned model, the name of the model group that the versioned model belongs to.
+        model_package_version: The version of the model package.
+        model_package_registration_type:  The package registration type of the model package output.
+        model_package_description: A brief summary of the model package.
+        inference_specification: Details about inference jobs that you can run with models based on this model package.
+        source_algorithm_specification: Details about the algorithm that was used to create the model package.
+        validation_specification: Configurations for one or more transform jobs that SageMaker runs to test the model package.
+        certify_for_marketplace: Whether the model package is certified for listing on Amazon Web Services Marketplace.
+        model_approval_status: The approval status of the model package.
+        created_by:
+        metadata_properties:
+        model_metrics: Metrics for the model.
+        last_modified_time: The last time that the model package was modified.
+        last_modified_by:
+        approval_description: A description provided for the model approval.
+        domain: The machine learning domain of the model package you specified. Common machine learning domains include computer vision and natural language processing.
+        task: The machine learning task you specified that your model package accomplishes. Common machine learning tasks include object detection and image classification.
+        sample_payload_url: The Amazon Simple Storage Service (Amazon S3) path where the sample payload are stored. This path points to a single gzip compressed tar archive (.tar.gz suffix).
+        customer_metadata_properties: The metadata properties associated with the model package versions.
+        drift_check_baselines: Represents the drift check baselines that can be used when the model monitor is set using the model package. For more information, see the topic on Drift Detection against Previous Baselines in SageMaker Pipelines in the Amazon SageMaker Developer Guide.
+        additional_inference_specifications: An array of additional Inference Specification objects. Each additional Inference Specification specifies artifacts based on this model package that can be used on inference endpoints. Generally used with SageMaker Neo to store the compiled artifacts.
+        skip_model_validation: Indicates if you want to skip model validation.
+        source_uri: The URI of the source for the model package.
+        security_config: The KMS Key ID (KMSKeyId) used for encryption of model package information.
+        model_card: The model card associated with the model package. Since ModelPackageModelCard is tied to a model package, it is a specific usage of a model card and its schema is simplified compared to the schema of ModelCard. The ModelPackageModelCard schema does not include model_package_details, and model_overview is composed of the model_creator and model_artifact properties. For more information about the model package model card schema, see Model package model card schema. For more information about the model card associated with the model package, see View the Details of a Model Version.
+        model_life_cycle:  A structure describing the current state of the model in its life cycle.
+
+    """
+
+    model_package_name: str
+    model_package_group_name: Optional[str] = Unassigned()
+    model_package_version: Optional[int] = Unassigned()
+    model_package_registration_type: Optional[str] = Unassigned()
+    model_package_arn: Optional[str] = Unassigned()
+    model_package_description: Optional[str] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    inference_specification: Optional[shapes.InferenceSpecification] = Unassigned()
+    source_algorithm_specification: Optional[shapes.SourceAlgorithmSpecification] = Unassigned()
+    validation_specification: Optional[shapes.ModelPackageValidationSpecification] = Unassigned()
+    model_package_status: Optional[str] = Unassigned()
+    model_package_status_details: Optional[shapes.ModelPackageStatusDetails] = Unassigned()
+    certify_for_marketplace: Optional[bool] = Unassigned()
+    model_approval_status: Optional[str] = Unassigned()
+    created_by: Optional[shapes.UserContext] = Unassigned()
+    metadata_properties: Optional[shapes.MetadataProperties] = Unassigned()
+    model_metrics: Optional[shapes.ModelMetrics] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[shapes.UserContext] = Unassigned()
+    approval_description: Optional[str] = Unassigned()
+    domain: Optional[str] = Unassigned()
+    task: Optional[str] = Unassigned()
+    sample_payload_url: Optional[str] = Unassigned()
+    customer_metadata_properties: Optional[Dict[str, str]] = Unassigned()
+    drift_check_baselines: Optional[shapes.DriftCheckBaselines] = Unassigned()
+    additional_inference_specifications: Optional[
+        List[shapes.AdditionalInferenceSpecificationDefinition]
+    ] = Unassigned()
+    skip_model_validation: Optional[str] = Unassigned()
+    source_uri: Optional[str] = Unassigned()
+    security_config: Optional[shapes.ModelPackageSecurityConfig] = Unassigned()
+    model_card: Optional[shapes.ModelPackageModelCard] = Unassigned()
+    model_life_cycle: Optional[shapes.ModelLifeCycle] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["model_package_status"]
+    _terminal_states: ClassVar[List[str]] = []
+    _failure_reason_attribute: ClassVar[Optional[str]] = None
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "model_package_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object model_package")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "validation_specification": {"validation_role": {"type": "string"}},
+                "model_metrics": {
+                    "model_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_data_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "bias": {
+                        "report": {"s3_uri": {"type": "string"}},
+                        "pre_training_report": {"s3_uri": {"type": "string"}},
+                        "post_training_report": {"s3_uri": {"type": "string"}},
+                    },
+                    "explainability": {"report": {"s3_uri": {"type": "string"}}},
+                },
+                "drift_check_baselines": {
+                    "bias": {
+                        "config_file": {"s3_uri": {"type": "string"}},
+                        "pre_training_constraints": {"s3_uri": {"type": "string"}},
+                        "post_training_constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "explainability": {
+                        "constraints": {"s3_uri": {"type": "string"}},
+                        "config_file": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                    "model_data_quality": {
+                        "statistics": {"s3_uri": {"type": "string"}},
+                        "constraints": {"s3_uri": {"type": "string"}},
+                    },
+                },
+                "security_config": {"kms_key_id": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ModelPackage", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        model_package_name: Optional[str] = Unassigned(),
+        model_package_group_name: Optional[Union[str, object]] = Unassigned(),
+        model_package_description: Optional[str] = Unassigned(),
+        model_package_registration_type: Optional[str] = Unassigned(),
+        inference_specification: Optional[shapes.InferenceSpecification] = Unassigned(),
+        validation_specification: Optional[
+            shapes.ModelPackageValidationSpecification
+        ] = Unassigned(),
+        source_algorithm_specification: Optional[
+            shapes.SourceAlgorithmSpecification
+        ] = Unassigned(),
+        certify_for_marketplace: Optional[bool] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        model_approval_status: Optional[str] = Unassigned(),
+        metadata_properties: Optional[shapes.MetadataProperties] = Unassigned(),
+        model_metrics: Optional[shapes.ModelMetrics] = Unassigned(),
+        client_token: Optional[str] = Unassigned(),
+        domain: Optional[str] = Unassigned(),
+        task: Optional[str] = Unassigned(),
+        sample_payload_url: Optional[str] = Unassigned(),
+        customer_metadata_properties: Optional[Dict[str, str]] = Unassigned(),
+        drift_check_baselines: Optional[shapes.DriftCheckBaselines] = Unassigned(),
+        additional_inference_specifications: Optional[
+            List[shapes.AdditionalInferenceSpecificationDefinition]
+        ] = Unassigned(),
+        skip_model_validation: Optional[str] = Unassigned(),
+        source_uri: Optional[str] = Unassigned(),
+        security_config: Optional[shapes.ModelPackageSecurityConfig] = Unassigned(),
+        model_card: Optional[shapes.ModelPackageModelCard] = Unassigned(),
+        model_life_cycle: Optional[shapes.ModelLifeCycle] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["ModelPackage"]:
+        """
+        Create a ModelPackage resource
+
+        Parameters:
+            model_package_name: The name of the model package. The name must have 1 to 63 characters. Valid characters are a-z, A-Z, 0-9, and - (hyphen). This parameter is required for unversioned models. It is not applicable to versioned models.
+            model_package_group_name: The name or Amazon Resource Name (ARN) of the model package group that this model version belongs to. This parameter is required for versioned models, and does not apply to unversioned models.
+            model_package_description: A description of the model package.
+            model_package_registration_type:  The package registration type of the model package input.
+            inference_specification: Specifies details about inference jobs that you can run with models based on this model package, including the following information:   The Amazon ECR paths of containers that contain the inference code and model artifacts.   The instance types that the model package supports for transform jobs and real-time endpoints used for inference.   The input and output content formats that the model package supports for inference.
+            validation_specification: Specifies configurations for one or more transform jobs that SageMaker runs to test the model package.
+            source_algorithm_specification: Details about the algorithm that was used to create the model package.
+            certify_for_marketplace: Whether to certify the model package for listing on Amazon Web Services Marketplace. This parameter is optional for unversioned models, and does not apply to versioned models.
+            tags: A list of key value pairs associated with the model. For more information, see Tagging Amazon Web Services resources in the Amazon Web Services General Reference Guide. If you supply ModelPackageGroupName, your model package belongs to the model group you specify and uses the tags associated with the model group. In this case, you cannot supply a tag argument.
+            model_approval_status: Whether the model is approved for deployment. This parameter is optional for versioned models, and does not apply to unversioned models. For versioned models, the value of this parameter must be set to Approved to deploy the model.
+            metadata_properties:
+            model_metrics: A structure that contains model metrics reports.
+            client_token: A unique token that guarantees that the call to this API is idempotent.
+            domain: The machine learning domain of your model package and its components. Common machine learning domains include computer vision and natural language processing.
+            task: The machine learning task your model package accomplishes. Common machine learning tasks include object detection and image classification. The following tasks are supported by Inference Recommender: "IMAGE_CLASSIFICATION" \| "OBJECT_DETECTION" \| "TEXT_GENERATION" \|"IMAGE_SEGMENTATION" \| "FILL_MASK" \| "CLASSIFICATION" \| "REGRESSION" \| "OTHER". Specify "OTHER" if none of the tasks listed fit your use case.
+            sample_payload_url: The Amazon Simple Storage Service (Amazon S3) path where the sample payload is stored. This path must point to a single gzip compressed tar archive (.tar.gz suffix). This archive can hold multiple files that are all equally used in the load test. Each file in the archive must satisfy the size constraints of the InvokeEndpoint call.
+            customer_metadata_properties: The metadata properties associated with the model package versions.
+            drift_check_baselines: Represents the drift check baselines that can be used when the model monitor is set using the model package. For more information, see the topic on Drift Detection against Previous Baselines in SageMaker Pipelines in the Amazon SageMaker Developer Guide.
+            additional_inference_specifications: An array of additional Inference Specification objects. Each additional Inference Specification specifies artifacts based on this model package that can be used on inference endpoints. Generally used with SageMaker Neo to store the compiled artifacts.
+            skip_model_validation: Indicates if you want to skip model validation.
+            source_uri: The URI of the source for the model package. If you want to clone a model package, set it to the model package Amazon Resource Name (ARN). If you want to register a model, set it to the model ARN.
+            security_config: The KMS Key ID (KMSKeyId) used for encryption of model package information.
+            model_card: The model card associated with the model package. Since ModelPackageModelCard is tied to a model package, it is a specific usage of a model card and its schema is simplified compared to the schema of ModelCard. The ModelPackageModelCard schema does not include model_package_details, and model_overview is composed of the model_creator and model_artifact properties. For more information about the model package model card schema, see Model package model card schema. For more information about the model card associated with the model package, see View the Details of a Model Version.
+            model_life_cycle:  A structure describing the current state of the model in its life cycle.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The ModelPackage resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating model_package resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "ModelPackageName": model_package_name,
+            "ModelPackageGroupName": model_package_group_name,
+            "ModelPackageDescription": model_package_description,
+            "ModelPackageRegistrationType": model_package_registration_type,
+            "InferenceSpecification": inference_specification,
+            "ValidationSpecification": validation_specification,
+            "SourceAlgorithmSpecification": source_algorithm_specification,
+            "CertifyForMarketplace": certify_for_marketplace,
+            "Tags": tags,
+            "ModelApprovalStatus": model_approval_status,
+            "MetadataProperties": metadata_properties,
+            "ModelMetrics": model_metrics,
+            "ClientToken": client_token,
+            "Domain": domain,
+            "Task": task,
+            "SamplePayloadUrl": sample_payload_url,
+            "CustomerMetadataProperties": customer_metadata_properties,
+            "DriftCheckBaselines": drift_check_baselines,
+            "AdditionalInferenceSpecifications": additional_inference_specifications,
+            "SkipModelValidation": skip_model_validation,
+            "SourceUri": source_uri,
+            "SecurityConfig": security_config,
+            "ModelCard": model_card,
+            "ModelLifeCycle": model_life_cycle,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="ModelPackage", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_model_package(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(
+            model_package_name=response["ModelPackageName"], session=session, region=region
+        )
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        model_package_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["ModelPackage"]:
+        """
+        Get a ModelPackage resource
+
+        Parameters:
+            model_package_name: The name or Amazon Resource Name (ARN) of the model package to describe. When you specify a name, the name must have 1 to 63 characters. Valid characters are a-z, A-Z, 0-9, and - (hyphen).
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The ModelPackage resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        operation_input_args = {
+            "ModelPackageName": model_package_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_model_package(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeModelPackageOutput")
+        model_package = build_from_response(cls, transformed_response)
+        model_package._set_client_context(session=session, region_name=region)
+        return model_package
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["ModelPackage"]:
+        """
+        Refresh a ModelPackage resource
+
+        Returns:
+            The ModelPackage resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        operation_input_args = {
+            "ModelPackageName": self.model_package_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_model_package(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeModelPackageOutput", self)
+        return self
+
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def update(
+        self,
+        model_approval_status: Optional[str] = Unassigned(),
+        model_package_registration_type: Optional[str] = Unassigned(),
+        approval_description: Optional[str] = Unassigned(),
+        customer_metadata_properties: Optional[Dict[str, str]] = Unassigned(),
+        customer_metadata_properties_to_remove: Optional[List[str]] = Unassigned(),
+        additional_inference_specifications_to_add: Optional[
+            List[shapes.AdditionalInferenceSpecificationDefinition]
+        ] = Unassigned(),
+        inference_specification: Optional[shapes.InferenceSpecification] = Unassigned(),
+        source_uri: Optional[str] = Unassigned(),
+        model_card: Optional[shapes.ModelPackageModelCard] = Unassigned(),
+        model_life_cycle: Optional[shapes.ModelLifeCycle] = Unassigned(),
+        client_token: Optional[str] = Unassigned(),
+    ) -> Optional["ModelPackage"]:
+        """
+        Update a ModelPackage resource
+
+        Parameters:
+            customer_metadata_properties_to_remove: The metadata properties associated with the model package versions to remove.
+            additional_inference_specifications_to_add: An array of additional Inference Specification objects to be added to the existing array additional Inference Specification. Total number of additional Inference Specifications can not exceed 15. Each additional Inference Specification specifies artifacts based on this model package that can be used on inference endpoints. Generally used with SageMaker Neo to store the compiled artifacts.
+            client_token:  A unique token that guarantees that the call to this API is idempotent.
+
+        Returns:
+            The ModelPackage resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+        """
+
+        logger.info("Updating model_package resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ModelPackageArn": self.model_package_arn,
+            "ModelApprovalStatus": model_approval_status,
+            "ModelPackageRegistrationType": model_package_registration_type,
+            "ApprovalDescription": approval_description,
+            "CustomerMetadataProperties": customer_metadata_properties,
+            "CustomerMetadataPropertiesToRemove": customer_metadata_properties_to_remove,
+            "AdditionalInferenceSpecificationsToAdd": additional_inference_specifications_to_add,
+            "InferenceSpecification": inference_specification,
+            "SourceUri": source_uri,
+            "ModelCard": model_card,
+            "ModelLifeCycle": model_life_cycle,
+            "ClientToken": client_token,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_model_package(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a ModelPackage resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ModelPackageName": self.model_package_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_model_package(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait_for_status(
+        self,
+        target_status: Literal["Pending", "InProgress", "Completed", "Failed", "Deleting"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a ModelPackage resource to reach certain status.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            f"Waiting for ModelPackage to reach [bold]{target_status} status...",
+            display,
+            status_callback,
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.model_package_status
+                waiter_display.update(current_status)
+
+                if target_status == current_status:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+                    return
+
+                if "failed" in current_status.lower():
+                    raise FailedStatusError(
+                        resource_type="ModelPackage", status=current_status, reason="(Unknown)"
+                    )
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="ModelPackage", status=current_status)
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def wait_for_delete(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a ModelPackage resource to be deleted.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for ModelPackage to be deleted...", display, status_callback, transient=False
+        ) as waiter_display:
+            while True:
+                try:
+                    poller.call(self.refresh)
+                    current_status = self.model_package_status
+                    waiter_display.update(current_status)
+
+                    if timeout is not None and time.time() - start_time >= timeout:
+                        raise TimeoutExceededError(
+                            resouce_type="ModelPackage", status=current_status
+                        )
+                except botocore.exceptions.ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+
+                    if "ResourceNotFound" in error_code or "ValidationException" in error_code:
+                        logger.info("Resource was not found. It may have been deleted.")
+                        return
+                    raise e
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        model_approval_status: Optional[str] = Unassigned(),
+        model_package_group_name: Optional[str] = Unassigned(),
+        model_package_type: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["ModelPackage"]:
+        """
+        Get all ModelPackage resources
+
+        Parameters:
+            creation_time_after: A filter that returns only model packages created after the specified time (timestamp).
+            creation_time_before: A filter that returns only model packages created before the specified time (timestamp).
+            max_results: The maximum number of model packages to return in the response.
+            name_contains: A string in the model package name. This filter returns only model packages whose name contains the specified string.
+            model_approval_status: A filter that returns only the model packages with the specified approval status.
+            model_package_group_name: A filter that returns only model versions that belong to the specified model group.
+            model_package_type: A filter that returns only the model packages of the specified type. This can be one of the following values.    UNVERSIONED - List only unversioined models. This is the default value if no ModelPackageType is specified.    VERSIONED - List only versioned models.    BOTH - List both versioned and unversioned models.
+            next_token: If the response to a previous ListModelPackages request was truncated, the response includes a NextToken. To retrieve the next set of model packages, use the token in the next request.
+            sort_by: The parameter by which to sort the results. The default is CreationTime.
+            sort_order: The sort order for the results. The default is Ascending.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed ModelPackage resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "MaxResults": max_results,
+            "NameContains": name_contains,
+            "ModelApprovalStatus": model_approval_status,
+            "ModelPackageGroupName": model_package_group_name,
+            "ModelPackageType": model_package_type,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_model_packages",
+            summaries_key="ModelPackageSummaryList",
+            summary_name="ModelPackageSummary",
+            resource_cls=ModelPackage,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    @Base.add_validate_call
+    def batch_get(
+        self,
+        model_package_arn_list: List[str],
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional[shapes.BatchDescribeModelPackageOutput]:
+        """
+        This action batch describes a list of versioned model packages.
+
+        Parameters:
+            model_package_arn_list: The list of Amazon Resource Name (ARN) of the model package groups.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            shapes.BatchDescribeModelPackageOutput
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        operation_input_args = {
+            "ModelPackageArnList": model_package_arn_list,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling batch_describe_model_package API")
+        response = client.batch_describe_model_package(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        transformed_response = transform(response, "BatchDescribeModelPackageOutput")
+        return build_from_response(shapes.BatchDescribeModelPackageOutput, transformed_response)
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["ModelPackage"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["ModelPackage"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["ModelPackage"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["ModelPackage"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_status(
+        self,
+        target_status: Literal["Pending", "InProgress", "Completed", "Failed", "Deleting"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_status, waiting for a ModelPackage resource to reach certain status without blocking the event loop.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+    @Base.add_validate_call
+    async def await_deletion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_delete, waiting for a ModelPackage resource to be deleted without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+            TimeoutExceededError:  If the resource is not deleted before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_for_delete_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["ModelPackage"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
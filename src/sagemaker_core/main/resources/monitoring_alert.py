@@ -0,0 +1,297 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class MonitoringAlert(Base):
+    """
+    Class representing resource MonitoringAlert
+
+    Attributes:
+        monitoring_alert_name: The name of a monitoring alert.
+        creation_time: A timestamp that indicates when a monitor alert was created.
+        last_modified_time: A timestamp that indicates when a monitor alert was last updated.
+        alert_status: The current status of an alert.
+        datapoints_to_alert: Within EvaluationPeriod, how many execution failures will raise an alert.
+        evaluation_period: The number of most recent monitoring executions to consider when evaluating alert status.
+        actions: A list of alert actions taken in response to an alert going into InAlert status.
+
+    """
+
+    monitoring_alert_name: str
+    creation_time: datetime.datetime
+    last_modified_time: datetime.datetime
+    alert_status: str
+    datapoints_to_alert: int
+    evaluation_period: int
+    actions: shapes.MonitoringAlertActions
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "monitoring_alert_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object monitoring_alert")
+        return None
+
+    @Base.add_validate_call
+    def update(
+        self,
+        monitoring_schedule_name: str,
+        datapoints_to_alert: int,
+        evaluation_period: int,
+    ) -> Optional["MonitoringAlert"]:
+        """
+        Update a MonitoringAlert resource
+
+        Parameters:
+            monitoring_schedule_name: The name of a monitoring schedule.
+
+        Returns:
+            The MonitoringAlert resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating monitoring_alert resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "MonitoringScheduleName": monitoring_schedule_name,
+            "MonitoringAlertName": self.monitoring_alert_name,
+            "DatapointsToAlert": datapoints_to_alert,
+            "EvaluationPeriod": evaluation_period,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_monitoring_alert(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        monitoring_schedule_name: str,
+        max_results: Optional[int] = Unassigned(),
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["MonitoringAlert"]:
+        """
+        Get all MonitoringAlert resources
+
+        Parameters:
+            monitoring_schedule_name: The name of a monitoring schedule.
+            next_token: If the result of the previous ListMonitoringAlerts request was truncated, the response includes a NextToken. To retrieve the next set of alerts in the history, use the token in the next request.
+            max_results: The maximum number of results to display. The default is 100.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed MonitoringAlert resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "MonitoringScheduleName": monitoring_schedule_name,
+            "MaxResults": max_results,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_monitoring_alerts",
+            summaries_key="MonitoringAlertSummaries",
+            summary_name="MonitoringAlertSummary",
+            resource_cls=MonitoringAlert,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    @Base.add_validate_call
+    def list_history(
+        self,
+        monitoring_schedule_name: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        next_token: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional[shapes.MonitoringAlertHistorySummary]:
+        """
+        Gets a list of past alerts in a model monitoring schedule.
+
+        Parameters:
+            monitoring_schedule_name: The name of a monitoring schedule.
+            sort_by: The field used to sort results. The default is CreationTime.
+            sort_order: The sort order, whether Ascending or Descending, of the alert history. The default is Descending.
+            next_token: If the result of the previous ListMonitoringAlertHistory request was truncated, the response includes a NextToken. To retrieve the next set of alerts in the history, use the token in the next request.
+            max_results: The maximum number of results to display. The default is 100.
+            creation_time_before: A filter that returns only alerts created on or before the specified time.
+            creation_time_after: A filter that returns only alerts created on or after the specified time.
+            status_equals: A filter that retrieves only alerts with a specific status.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            shapes.MonitoringAlertHistorySummary
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "MonitoringScheduleName": monitoring_schedule_name,
+            "MonitoringAlertName": self.monitoring_alert_name,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "NextToken": next_token,
+            "MaxResults": max_results,
+            "CreationTimeBefore": creation_time_before,
+            "CreationTimeAfter": creation_time_after,
+            "StatusEquals": status_equals,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling list_monitoring_alert_history API")
+        response = client.list_monitoring_alert_history(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        transformed_response = transform(response, "ListMonitoringAlertHistoryResponse")
+        return build_from_response(shapes.MonitoringAlertHistorySummary, transformed_response)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["MonitoringAlert"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["MonitoringAlert"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
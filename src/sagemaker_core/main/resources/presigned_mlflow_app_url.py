@@ -0,0 +1,152 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class PresignedMlflowAppUrl(Base):
+    """
+    Class representing resource PresignedMlflowAppUrl
+
+    Attributes:
+        arn: The ARN of the MLflow App to connect to your MLflow UI.
+        expires_in_seconds: The duration in seconds that your presigned URL is valid. The presigned URL can be used only once.
+        session_expiration_duration_in_seconds: The duration in seconds that your presigned URL is valid. The presigned URL can be used only once.
+        authorized_url: A presigned URL with an authorization token.
+
+    """
+
+    arn: str
+    expires_in_seconds: Optional[int] = Unassigned()
+    session_expiration_duration_in_seconds: Optional[int] = Unassigned()
+    authorized_url: Optional[str] = Unassigned()
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "presigned_mlflow_app_url_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object presigned_mlflow_app_url")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def create(
+        cls,
+        arn: str,
+        expires_in_seconds: Optional[int] = Unassigned(),
+        session_expiration_duration_in_seconds: Optional[int] = Unassigned(),
+    ) -> Optional["PresignedMlflowAppUrl"]:
+        """
+        Create a PresignedMlflowAppUrl resource
+
+        Parameters:
+            arn: The ARN of the MLflow App to connect to your MLflow UI.
+            expires_in_seconds: The duration in seconds that your presigned URL is valid. The presigned URL can be used only once.
+            session_expiration_duration_in_seconds: The duration in seconds that your presigned URL is valid. The presigned URL can be used only once.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The PresignedMlflowAppUrl resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        operation_input_args = {
+            "Arn": arn,
+            "ExpiresInSeconds": expires_in_seconds,
+            "SessionExpirationDurationInSeconds": session_expiration_duration_in_seconds,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling create_presigned_mlflow_app_url API")
+        response = client.create_presigned_mlflow_app_url(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        transformed_response = transform(response, "CreatePresignedMlflowAppUrlResponse")
+        return cls(**operation_input_args, **transformed_response)
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["PresignedMlflowAppUrl"]:
+        return await run_async(cls.create, *args, **kwargs)
@@ -0,0 +1,652 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class ProcessingJob(Base):
+    """
+    Class representing resource ProcessingJob
+
+    Attributes:
+        processing_job_name: The name of the processing job. The name must be unique within an Amazon Web Services Region in the Amazon Web Services account.
+        processing_resources: Identifies the resources, ML compute instances, and ML storage volumes to deploy for a processing job. In distributed training, you specify more than one instance.
+        app_specification: Configures the processing job to run a specified container image.
+        processing_job_arn: The Amazon Resource Name (ARN) of the processing job.
+        processing_job_status: Provides the status of a processing job.
+        creation_time: The time at which the processing job was created.
+        processing_inputs: The inputs for a processing job.
+        processing_output_config: Output configuration for the processing job.
+        stopping_condition: The time limit for how long the processing job is allowed to run.
+        environment: The environment variables set in the Docker container.
+        network_config: Networking options for a processing job.
+        role_arn: The Amazon Resource Name (ARN) of an IAM role that Amazon SageMaker can assume to perform tasks on your behalf.
+        experiment_config: The configuration information used to create an experiment.
+        exit_message: An optional string, up to one KB in size, that contains metadata from the processing container when the processing job exits.
+        failure_reason: A string, up to one KB in size, that contains the reason a processing job failed, if it failed.
+        processing_end_time: The time at which the processing job completed.
+        processing_start_time: The time at which the processing job started.
+        last_modified_time: The time at which the processing job was last modified.
+        monitoring_schedule_arn: The ARN of a monitoring schedule for an endpoint associated with this processing job.
+        auto_ml_job_arn: The ARN of an AutoML job associated with this processing job.
+        training_job_arn: The ARN of a training job associated with this processing job.
+
+    """
+
+    processing_job_name: str
+    processing_inputs: Optional[List[shapes.ProcessingInput]] = Unassigned()
+    processing_output_config: Optional[shapes.ProcessingOutputConfig] = Unassigned()
+    processing_resources: Optional[shapes.ProcessingResources] = Unassigned()
+    stopping_condition: Optional[shapes.ProcessingStoppingCondition] = Unassigned()
+    app_specification: Optional[shapes.AppSpecification] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    network_config: Optional[shapes.NetworkConfig] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    experiment_config: Optional[shapes.ExperimentConfig] = Unassigned()
+    processing_job_arn: Optional[str] = Unassigned()
+    processing_job_status: Optional[str] = Unassigned()
+    exit_message: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    processing_end_time: Optional[datetime.datetime] = Unassigned()
+    processing_start_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    monitoring_schedule_arn: Optional[str] = Unassigned()
+    auto_ml_job_arn: Optional[str] = Unassigned()
+    training_job_arn: Optional[str] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["processing_job_status"]
+    _terminal_states: ClassVar[List[str]] = ["Completed", "Failed", "Stopped"]
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "processing_job_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object processing_job")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "processing_resources": {
+                    "cluster_config": {"volume_kms_key_id": {"type": "string"}}
+                },
+                "processing_output_config": {"kms_key_id": {"type": "string"}},
+                "network_config": {
+                    "vpc_config": {
+                        "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                        "subnets": {"type": "array", "items": {"type": "string"}},
+                    }
+                },
+                "role_arn": {"type": "string"},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "ProcessingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        processing_job_name: str,
+        processing_resources: shapes.ProcessingResources,
+        app_specification: shapes.AppSpecification,
+        role_arn: str,
+        processing_inputs: Optional[List[shapes.ProcessingInput]] = Unassigned(),
+        processing_output_config: Optional[shapes.ProcessingOutputConfig] = Unassigned(),
+        stopping_condition: Optional[shapes.ProcessingStoppingCondition] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        network_config: Optional[shapes.NetworkConfig] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        experiment_config: Optional[shapes.ExperimentConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["ProcessingJob"]:
+        """
+        Create a ProcessingJob resource
+
+        Parameters:
+            processing_job_name:  The name of the processing job. The name must be unique within an Amazon Web Services Region in the Amazon Web Services account.
+            processing_resources: Identifies the resources, ML compute instances, and ML storage volumes to deploy for a processing job. In distributed training, you specify more than one instance.
+            app_specification: Configures the processing job to run a specified Docker container image.
+            role_arn: The Amazon Resource Name (ARN) of an IAM role that Amazon SageMaker can assume to perform tasks on your behalf.
+            processing_inputs: An array of inputs configuring the data to download into the processing container.
+            processing_output_config: Output configuration for the processing job.
+            stopping_condition: The time limit for how long the processing job is allowed to run.
+            environment: The environment variables to set in the Docker container. Up to 100 key and values entries in the map are supported.  Do not include any security-sensitive information including account access IDs, secrets, or tokens in any environment fields. As part of the shared responsibility model, you are responsible for any potential exposure, unauthorized access, or compromise of your sensitive data if caused by security-sensitive information included in the request environment variable or plain text fields.
+            network_config: Networking options for a processing job, such as whether to allow inbound and outbound network calls to and from processing containers, and the VPC subnets and security groups to use for VPC-enabled processing jobs.
+            tags: (Optional) An array of key-value pairs. For more information, see Using Cost Allocation Tags in the Amazon Web Services Billing and Cost Management User Guide.  Do not include any security-sensitive information including account access IDs, secrets, or tokens in any tags. As part of the shared responsibility model, you are responsible for any potential exposure, unauthorized access, or compromise of your sensitive data if caused by security-sensitive information included in the request tag variable or plain text fields.
+            experiment_config:
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The ProcessingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating processing_job resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "ProcessingInputs": processing_inputs,
+            "ProcessingOutputConfig": processing_output_config,
+            "ProcessingJobName": processing_job_name,
+            "ProcessingResources": processing_resources,
+            "StoppingCondition": stopping_condition,
+            "AppSpecification": app_specification,
+            "Environment": environment,
+            "NetworkConfig": network_config,
+            "RoleArn": role_arn,
+            "Tags": tags,
+            "ExperimentConfig": experiment_config,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="ProcessingJob", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_processing_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(processing_job_name=processing_job_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        processing_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["ProcessingJob"]:
+        """
+        Get a ProcessingJob resource
+
+        Parameters:
+            processing_job_name: The name of the processing job. The name must be unique within an Amazon Web Services Region in the Amazon Web Services account.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The ProcessingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ProcessingJobName": processing_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_processing_job(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeProcessingJobResponse")
+        processing_job = build_from_response(cls, transformed_response)
+        processing_job._set_client_context(session=session, region_name=region)
+        return processing_job
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["ProcessingJob"]:
+        """
+        Refresh a ProcessingJob resource
+
+        Returns:
+            The ProcessingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_processing_job(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeProcessingJobResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a ProcessingJob resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_processing_job(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def stop(self) -> None:
+        """
+        Stop a ProcessingJob resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "ProcessingJobName": self.processing_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.stop_processing_job(**operation_input_args)
+
+        logger.info(f"Stopping {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        logs: Optional[bool] = False,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a ProcessingJob resource.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            logs: Whether to print logs while waiting.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+
+        """
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        instance_count = self.processing_resources.cluster_config.instance_count
+        if logs:
+            multi_stream_logger = MultiLogStreamHandler(
+                log_group_name=f"/aws/sagemaker/ProcessingJobs",
+                log_stream_name_prefix=self.get_name(),
+                expected_stream_count=instance_count,
+            )
+
+        with WaiterDisplay(
+            "Waiting for ProcessingJob...", display, status_callback
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.processing_job_status
+                waiter_display.update(current_status)
+
+                if logs:
+                    stream_log_events = multi_stream_logger.get_latest_log_events(
+                        flush=current_status in terminal_states
+                    )
+                    for stream_id, event in stream_log_events:
+                        logger.info(f"{stream_id}:\n{event['message']}")
+
+                if current_status in terminal_states:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+
+                    if "failed" in current_status.lower():
+                        raise FailedStatusError(
+                            resource_type="ProcessingJob",
+                            status=current_status,
+                            reason=self.failure_reason,
+                        )
+
+                    return
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="ProcessingJob", status=current_status)
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def stream_logs(
+        self,
+        follow: bool = True,
+        start_time: Optional[datetime.datetime] = None,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        filter_pattern: Optional[str] = None,
+    ) -> JobLogStreamer:
+        """
+        Stream the log events of a ProcessingJob resource.
+
+        Parameters:
+            follow: Whether to keep polling for new log events until the resource reaches a terminal state, rather than only getting the log events that exist at this moment.
+            start_time: The time of the first log events to get. Defaults to None, getting the log events from the start of the job.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to follow the logs before timing out.
+            filter_pattern: The CloudWatch Logs filter pattern the log events must match.
+
+        Returns:
+            JobLogStreamer: The LogEvents of the ProcessingJob, fetched while iterating over them with for or async for.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+        """
+        instance_count = self.processing_resources.cluster_config.instance_count
+        return JobLogStreamer(
+            self,
+            log_group_name=f"/aws/sagemaker/ProcessingJobs",
+            instance_count=instance_count,
+            follow=follow,
+            start_time=start_time,
+            poll=poll,
+            timeout=timeout,
+            filter_pattern=filter_pattern,
+        )
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["ProcessingJob"]:
+        """
+        Get all ProcessingJob resources
+
+        Parameters:
+            creation_time_after: A filter that returns only processing jobs created after the specified time.
+            creation_time_before: A filter that returns only processing jobs created after the specified time.
+            last_modified_time_after: A filter that returns only processing jobs modified after the specified time.
+            last_modified_time_before: A filter that returns only processing jobs modified before the specified time.
+            name_contains: A string in the processing job name. This filter returns only processing jobs whose name contains the specified string.
+            status_equals: A filter that retrieves only processing jobs with a specific status.
+            sort_by: The field to sort results by. The default is CreationTime.
+            sort_order: The sort order for results. The default is Ascending.
+            next_token: If the result of the previous ListProcessingJobs request was truncated, the response includes a NextToken. To retrieve the next set of processing jobs, use the token in the next request.
+            max_results: The maximum number of processing jobs to return in the response.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed ProcessingJob resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "MaxResults": max_results,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_processing_jobs",
+            summaries_key="ProcessingJobSummaries",
+            summary_name="ProcessingJobSummary",
+            resource_cls=ProcessingJob,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["ProcessingJob"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["ProcessingJob"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["ProcessingJob"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    # Asynchronous counterpart of stop, running it on the thread pool of the async bridge, with
+    # the signature and docstring of stop
+    @functools.wraps(stop, assigned=("__module__", "__doc__"))
+    async def astop(self, *args, **kwargs) -> None:
+        return await run_async(self.stop, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_completion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait, waiting for a ProcessingJob resource without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["ProcessingJob"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,929 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class TrainingJob(Base):
+    """
+    Class representing resource TrainingJob
+
+    Attributes:
+        training_job_name:  Name of the model training job.
+        training_job_arn: The Amazon Resource Name (ARN) of the training job.
+        model_artifacts: Information about the Amazon S3 location that is configured for storing model artifacts.
+        training_job_status: The status of the training job. SageMaker provides the following training job statuses:    InProgress - The training is in progress.    Completed - The training job has completed.    Failed - The training job has failed. To see the reason for the failure, see the FailureReason field in the response to a DescribeTrainingJobResponse call.    Stopping - The training job is stopping.    Stopped - The training job has stopped.   For more detailed information, see SecondaryStatus.
+        secondary_status:  Provides detailed information about the state of the training job. For detailed information on the secondary status of the training job, see StatusMessage under SecondaryStatusTransition. SageMaker provides primary statuses and secondary statuses that apply to each of them:  InProgress     Starting - Starting the training job.    Pending - The training job is waiting for compute capacity or compute resource provision.    Downloading - An optional stage for algorithms that support File training input mode. It indicates that data is being downloaded to the ML storage volumes.    Training - Training is in progress.    Interrupted - The job stopped because the managed spot training instances were interrupted.     Uploading - Training is complete and the model artifacts are being uploaded to the S3 location.    Completed     Completed - The training job has completed.    Failed     Failed - The training job has failed. The reason for the failure is returned in the FailureReason field of DescribeTrainingJobResponse.    Stopped     MaxRuntimeExceeded - The job stopped because it exceeded the maximum allowed runtime.    MaxWaitTimeExceeded - The job stopped because it exceeded the maximum allowed wait time.    Stopped - The training job has stopped.    Stopping     Stopping - Stopping the training job.      Valid values for SecondaryStatus are subject to change.   We no longer support the following secondary statuses:    LaunchingMLInstances     PreparingTraining     DownloadingTrainingImage
+        stopping_condition: Specifies a limit to how long a model training job can run. It also specifies how long a managed Spot training job has to complete. When the job reaches the time limit, SageMaker ends the training job. Use this API to cap model training costs. To stop a job, SageMaker sends the algorithm the SIGTERM signal, which delays job termination for 120 seconds. Algorithms can use this 120-second window to save the model artifacts, so the results of training are not lost.
+        creation_time: A timestamp that indicates when the training job was created.
+        tuning_job_arn: The Amazon Resource Name (ARN) of the associated hyperparameter tuning job if the training job was launched by a hyperparameter tuning job.
+        labeling_job_arn: The Amazon Resource Name (ARN) of the SageMaker Ground Truth labeling job that created the transform or training job.
+        auto_ml_job_arn: The Amazon Resource Name (ARN) of an AutoML job.
+        failure_reason: If the training job failed, the reason it failed.
+        hyper_parameters: Algorithm-specific parameters.
+        algorithm_specification: Information about the algorithm used for training, and algorithm metadata.
+        role_arn: The Amazon Web Services Identity and Access Management (IAM) role configured for the training job.
+        input_data_config: An array of Channel objects that describes each data input channel.
+        output_data_config: The S3 path where model artifacts that you configured when creating the job are stored. SageMaker creates subfolders for model artifacts.
+        resource_config: Resources, including ML compute instances and ML storage volumes, that are configured for model training.
+        warm_pool_status: The status of the warm pool associated with the training job.
+        vpc_config: A VpcConfig object that specifies the VPC that this training job has access to. For more information, see Protect Training Jobs by Using an Amazon Virtual Private Cloud.
+        training_start_time: Indicates the time when the training job starts on training instances. You are billed for the time interval between this time and the value of TrainingEndTime. The start time in CloudWatch Logs might be later than this time. The difference is due to the time it takes to download the training data and to the size of the training container.
+        training_end_time: Indicates the time when the training job ends on training instances. You are billed for the time interval between the value of TrainingStartTime and this time. For successful jobs and stopped jobs, this is the time after model artifacts are uploaded. For failed jobs, this is the time when SageMaker detects a job failure.
+        last_modified_time: A timestamp that indicates when the status of the training job was last modified.
+        secondary_status_transitions: A history of all of the secondary statuses that the training job has transitioned through.
+        final_metric_data_list: A collection of MetricData objects that specify the names, values, and dates and times that the training algorithm emitted to Amazon CloudWatch.
+        enable_network_isolation: If you want to allow inbound or outbound network calls, except for calls between peers within a training cluster for distributed training, choose True. If you enable network isolation for training jobs that are configured to use a VPC, SageMaker downloads and uploads customer data and model artifacts through the specified VPC, but the training container does not have network access.
+        enable_inter_container_traffic_encryption: To encrypt all communications between ML compute instances in distributed training, choose True. Encryption provides greater security for distributed training, but training might take longer. How long it takes depends on the amount of communication between compute instances, especially if you use a deep learning algorithms in distributed training.
+        enable_managed_spot_training: A Boolean indicating whether managed spot training is enabled (True) or not (False).
+        checkpoint_config:
+        training_time_in_seconds: The training time in seconds.
+        billable_time_in_seconds: The billable time in seconds. Billable time refers to the absolute wall-clock time. Multiply BillableTimeInSeconds by the number of instances (InstanceCount) in your training cluster to get the total compute time SageMaker bills you if you run distributed training. The formula is as follows: BillableTimeInSeconds \* InstanceCount . You can calculate the savings from using managed spot training using the formula (1 - BillableTimeInSeconds / TrainingTimeInSeconds) \* 100. For example, if BillableTimeInSeconds is 100 and TrainingTimeInSeconds is 500, the savings is 80%.
+        billable_token_count:  The billable token count for eligible serverless training jobs.
+        debug_hook_config:
+        experiment_config:
+        debug_rule_configurations: Configuration information for Amazon SageMaker Debugger rules for debugging output tensors.
+        tensor_board_output_config:
+        debug_rule_evaluation_statuses: Evaluation status of Amazon SageMaker Debugger rules for debugging on a training job.
+        profiler_config:
+        profiler_rule_configurations: Configuration information for Amazon SageMaker Debugger rules for profiling system and framework metrics.
+        profiler_rule_evaluation_statuses: Evaluation status of Amazon SageMaker Debugger rules for profiling on a training job.
+        profiling_status: Profiling status of a training job.
+        environment: The environment variables to set in the Docker container.  Do not include any security-sensitive information including account access IDs, secrets, or tokens in any environment fields. As part of the shared responsibility model, you are responsible for any potential exposure, unauthorized access, or compromise of your sensitive data if caused by security-sensitive information included in the request environment variable or plain text fields.
+        retry_strategy: The number of times to retry the job when the job fails due to an InternalServerError.
+        remote_debug_config: Configuration for remote debugging. To learn more about the remote debugging functionality of SageMaker, see Access a training container through Amazon Web Services Systems Manager (SSM) for remote debugging.
+        infra_check_config: Contains information about the infrastructure health check configuration for the training job.
+        serverless_job_config:  The configuration for serverless training jobs.
+        mlflow_config:  The MLflow configuration using SageMaker managed MLflow.
+        model_package_config:  The configuration for the model package.
+        mlflow_details:  The MLflow details of this job.
+        progress_info:  The Serverless training job progress information.
+        output_model_package_arn:  The Amazon Resource Name (ARN) of the output model package containing model weights or checkpoints.
+
+    """
+
+    training_job_name: str
+    training_job_arn: Optional[str] = Unassigned()
+    tuning_job_arn: Optional[str] = Unassigned()
+    labeling_job_arn: Optional[str] = Unassigned()
+    auto_ml_job_arn: Optional[str] = Unassigned()
+    model_artifacts: Optional[shapes.ModelArtifacts] = Unassigned()
+    training_job_status: Optional[str] = Unassigned()
+    secondary_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    hyper_parameters: Optional[Dict[str, str]] = Unassigned()
+    algorithm_specification: Optional[shapes.AlgorithmSpecification] = Unassigned()
+    role_arn: Optional[str] = Unassigned()
+    input_data_config: Optional[List[shapes.Channel]] = Unassigned()
+    output_data_config: Optional[shapes.OutputDataConfig] = Unassigned()
+    resource_config: Optional[shapes.ResourceConfig] = Unassigned()
+    warm_pool_status: Optional[shapes.WarmPoolStatus] = Unassigned()
+    vpc_config: Optional[shapes.VpcConfig] = Unassigned()
+    stopping_condition: Optional[shapes.StoppingCondition] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    training_start_time: Optional[datetime.datetime] = Unassigned()
+    training_end_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    secondary_status_transitions: Optional[List[shapes.SecondaryStatusTransition]] = Unassigned()
+    final_metric_data_list: Optional[List[shapes.MetricData]] = Unassigned()
+    enable_network_isolation: Optional[bool] = Unassigned()
+    enable_inter_container_traffic_encryption: Optional[bool] = Unassigned()
+    enable_managed_spot_training: Optional[bool] = Unassigned()
+    checkpoint_config: Optional[shapes.CheckpointConfig] = Unassigned()
+    training_time_in_seconds: Optional[int] = Unassigned()
+    billable_time_in_seconds: Optional[int] = Unassigned()
+    billable_token_count: Optional[int] = Unassigned()
+    debug_hook_config: Optional[shapes.DebugHookConfig] = Unassigned()
+    experiment_config: Optional[shapes.ExperimentConfig] = Unassigned()
+    debug_rule_configurations: Optional[List[shapes.DebugRuleConfiguration]] = Unassigned()
+    tensor_board_output_config: Optional[shapes.TensorBoardOutputConfig] = Unassigned()
+    debug_rule_evaluation_statuses: Optional[List[shapes.DebugRuleEvaluationStatus]] = Unassigned()
+    profiler_config: Optional[shapes.ProfilerConfig] = Unassigned()
+    profiler_rule_configurations: Optional[List[shapes.ProfilerRuleConfiguration]] = Unassigned()
+    profiler_rule_evaluation_statuses: Optional[List[shapes.ProfilerRuleEvaluationStatus]] = (
+        Unassigned()
+    )
+    profiling_status: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    retry_strategy: Optional[shapes.RetryStrategy] = Unassigned()
+    remote_debug_config: Optional[shapes.RemoteDebugConfig] = Unassigned()
+    infra_check_config: Optional[shapes.InfraCheckConfig] = Unassigned()
+    serverless_job_config: Optional[shapes.ServerlessJobConfig] = Unassigned()
+    mlflow_config: Optional[shapes.MlflowConfig] = Unassigned()
+    model_package_config: Optional[shapes.ModelPackageConfig] = Unassigned()
+    mlflow_details: Optional[shapes.MlflowDetails] = Unassigned()
+    progress_info: Optional[shapes.TrainingProgressInfo] = Unassigned()
+    output_model_package_arn: Optional[str] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["training_job_status"]
+    _terminal_states: ClassVar[List[str]] = ["Completed", "Failed", "Stopped"]
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "training_job_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object training_job")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "model_artifacts": {"s3_model_artifacts": {"type": "string"}},
+                "role_arn": {"type": "string"},
+                "output_data_config": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "resource_config": {"volume_kms_key_id": {"type": "string"}},
+                "vpc_config": {
+                    "security_group_ids": {"type": "array", "items": {"type": "string"}},
+                    "subnets": {"type": "array", "items": {"type": "string"}},
+                },
+                "checkpoint_config": {"s3_uri": {"type": "string"}},
+                "debug_hook_config": {"s3_output_path": {"type": "string"}},
+                "tensor_board_output_config": {"s3_output_path": {"type": "string"}},
+                "profiler_config": {"s3_output_path": {"type": "string"}},
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "TrainingJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        training_job_name: str,
+        role_arn: str,
+        output_data_config: shapes.OutputDataConfig,
+        hyper_parameters: Optional[Dict[str, str]] = Unassigned(),
+        algorithm_specification: Optional[shapes.AlgorithmSpecification] = Unassigned(),
+        input_data_config: Optional[List[shapes.Channel]] = Unassigned(),
+        resource_config: Optional[shapes.ResourceConfig] = Unassigned(),
+        vpc_config: Optional[shapes.VpcConfig] = Unassigned(),
+        stopping_condition: Optional[shapes.StoppingCondition] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        enable_network_isolation: Optional[bool] = Unassigned(),
+        enable_inter_container_traffic_encryption: Optional[bool] = Unassigned(),
+        enable_managed_spot_training: Optional[bool] = Unassigned(),
+        checkpoint_config: Optional[shapes.CheckpointConfig] = Unassigned(),
+        debug_hook_config: Optional[shapes.DebugHookConfig] = Unassigned(),
+        debug_rule_configurations: Optional[List[shapes.DebugRuleConfiguration]] = Unassigned(),
+        tensor_board_output_config: Optional[shapes.TensorBoardOutputConfig] = Unassigned(),
+        experiment_config: Optional[shapes.ExperimentConfig] = Unassigned(),
+        profiler_config: Optional[shapes.ProfilerConfig] = Unassigned(),
+        profiler_rule_configurations: Optional[
+            List[shapes.ProfilerRuleConfiguration]
+        ] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        retry_strategy: Optional[shapes.RetryStrategy] = Unassigned(),
+        remote_debug_config: Optional[shapes.RemoteDebugConfig] = Unassigned(),
+        infra_check_config: Optional[shapes.InfraCheckConfig] = Unassigned(),
+        session_chaining_config: Optional[shapes.SessionChainingConfig] = Unassigned(),
+        serverless_job_config: Optional[shapes.ServerlessJobConfig] = Unassigned(),
+        mlflow_config: Optional[shapes.MlflowConfig] = Unassigned(),
+        model_package_config: Optional[shapes.ModelPackageConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["TrainingJob"]:
+        """
+        Create a TrainingJob resource
+
+        Parameters:
+            training_job_name: The name of the training job. The name must be unique within an Amazon Web Services Region in an Amazon Web Services account.
+            role_arn: The Amazon Resource Name (ARN) of an IAM role that SageMaker can assume to perform tasks on your behalf.  During model training, SageMaker needs your permission to read input data from an S3 bucket, download a Docker image that contains training code, write model artifacts to an S3 bucket, write logs to Amazon CloudWatch Logs, and publish metrics to Amazon CloudWatch. You grant permissions for all of these tasks to an IAM role. For more information, see SageMaker Roles.   To be able to pass this role to SageMaker, the caller of this API must have the iam:PassRole permission.
+            output_data_config: Specifies the path to the S3 location where you want to store model artifacts. SageMaker creates subfolders for the artifacts.
+            hyper_parameters: Algorithm-specific parameters that influence the quality of the model. You set hyperparameters before you start the learning process. For a list of hyperparameters for each training algorithm provided by SageMaker, see Algorithms.  You can specify a maximum of 100 hyperparameters. Each hyperparameter is a key-value pair. Each key and value is limited to 256 characters, as specified by the Length Constraint.   Do not include any security-sensitive information including account access IDs, secrets, or tokens in any hyperparameter fields. As part of the shared responsibility model, you are responsible for any potential exposure, unauthorized access, or compromise of your sensitive data if caused by any security-sensitive information included in the request hyperparameter variable or plain text fields.
+            algorithm_specification: The registry path of the Docker image that contains the training algorithm and algorithm-specific metadata, including the input mode. For more information about algorithms provided by SageMaker, see Algorithms. For information about providing your own algorithms, see Using Your Own Algorithms with Amazon SageMaker.
+            input_data_config: An array of Channel objects. Each channel is a named input source. InputDataConfig describes the input data and its location.  Algorithms can accept input data from one or more channels. For example, an algorithm might have two channels of input data, training_data and validation_data. The configuration for each channel provides the S3, EFS, or FSx location where the input data is stored. It also provides information about the stored data: the MIME type, compression method, and whether the data is wrapped in RecordIO format.  Depending on the input mode that the algorithm supports, SageMaker either copies input data files from an S3 bucket to a local directory in the Docker container, or makes it available as input streams. For example, if you specify an EFS location, input data files are available as input streams. They do not need to be downloaded. Your input must be in the same Amazon Web Services region as your training job.
+            resource_config: The resources, including the ML compute instances and ML storage volumes, to use for model training.  ML storage volumes store model artifacts and incremental states. Training algorithms might also use ML storage volumes for scratch space. If you want SageMaker to use the ML storage volume to store the training data, choose File as the TrainingInputMode in the algorithm specification. For distributed training algorithms, specify an instance count greater than 1.
+            vpc_config: A VpcConfig object that specifies the VPC that you want your training job to connect to. Control access to and from your training container by configuring the VPC. For more information, see Protect Training Jobs by Using an Amazon Virtual Private Cloud.
+            stopping_condition: Specifies a limit to how long a model training job can run. It also specifies how long a managed Spot training job has to complete. When the job reaches the time limit, SageMaker ends the training job. Use this API to cap model training costs. To stop a job, SageMaker sends the algorithm the SIGTERM signal, which delays job termination for 120 seconds. Algorithms can use this 120-second window to save the model artifacts, so the results of training are not lost.
+            tags: An array of key-value pairs. You can use tags to categorize your Amazon Web Services resources in different ways, for example, by purpose, owner, or environment. For more information, see Tagging Amazon Web Services Resources.  Do not include any security-sensitive information including account access IDs, secrets, or tokens in any tags. As part of the shared responsibility model, you are responsible for any potential exposure, unauthorized access, or compromise of your sensitive data if caused by any security-sensitive information included in the request tag variable or plain text fields.
+            enable_network_isolation: Isolates the training container. No inbound or outbound network calls can be made, except for calls between peers within a training cluster for distributed training. If you enable network isolation for training jobs that are configured to use a VPC, SageMaker downloads and uploads customer data and model artifacts through the specified VPC, but the training container does not have network access.
+            enable_inter_container_traffic_encryption: To encrypt all communications between ML compute instances in distributed training, choose True. Encryption provides greater security for distributed training, but training might take longer. How long it takes depends on the amount of communication between compute instances, especially if you use a deep learning algorithm in distributed training. For more information, see Protect Communications Between ML Compute Instances in a Distributed Training Job.
+            enable_managed_spot_training: To train models using managed spot training, choose True. Managed spot training provides a fully managed and scalable infrastructure for training machine learning models. this option is useful when training jobs can be interrupted and when there is flexibility when the training job is run.  The complete and intermediate results of jobs are stored in an Amazon S3 bucket, and can be used as a starting point to train models incrementally. Amazon SageMaker provides metrics and logs in CloudWatch. They can be used to see when managed spot training jobs are running, interrupted, resumed, or completed.
+            checkpoint_config: Contains information about the output location for managed spot training checkpoint data.
+            debug_hook_config:
+            debug_rule_configurations: Configuration information for Amazon SageMaker Debugger rules for debugging output tensors.
+            tensor_board_output_config:
+            experiment_config:
+            profiler_config:
+            profiler_rule_configurations: Configuration information for Amazon SageMaker Debugger rules for profiling system and framework metrics.
+            environment: The environment variables to set in the Docker container.  Do not include any security-sensitive information including account access IDs, secrets, or tokens in any environment fields. As part of the shared responsibility model, you are responsible for any potential exposure, unauthorized access, or compromise of your sensitive data if caused by security-sensitive information included in the request environment variable or plain text fields.
+            retry_strategy: The number of times to retry the job when the job fails due to an InternalServerError.
+            remote_debug_config: Configuration for remote debugging. To learn more about the remote debugging functionality of SageMaker, see Access a training container through Amazon Web Services Systems Manager (SSM) for remote debugging.
+            infra_check_config: Contains information about the infrastructure health check configuration for the training job.
+            session_chaining_config: Contains information about attribute-based access control (ABAC) for the training job.
+            serverless_job_config:  The configuration for serverless training jobs.
+            mlflow_config:  The MLflow configuration using SageMaker managed MLflow.
+            model_package_config:  The configuration for the model package.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The TrainingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating training_job resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "TrainingJobName": training_job_name,
+            "HyperParameters": hyper_parameters,
+            "AlgorithmSpecification": algorithm_specification,
+            "RoleArn": role_arn,
+            "InputDataConfig": input_data_config,
+            "OutputDataConfig": output_data_config,
+            "ResourceConfig": resource_config,
+            "VpcConfig": vpc_config,
+            "StoppingCondition": stopping_condition,
+            "Tags": tags,
+            "EnableNetworkIsolation": enable_network_isolation,
+            "EnableInterContainerTrafficEncryption": enable_inter_container_traffic_encryption,
+            "EnableManagedSpotTraining": enable_managed_spot_training,
+            "CheckpointConfig": checkpoint_config,
+            "DebugHookConfig": debug_hook_config,
+            "DebugRuleConfigurations": debug_rule_configurations,
+            "TensorBoardOutputConfig": tensor_board_output_config,
+            "ExperimentConfig": experiment_config,
+            "ProfilerConfig": profiler_config,
+            "ProfilerRuleConfigurations": profiler_rule_configurations,
+            "Environment": environment,
+            "RetryStrategy": retry_strategy,
+            "RemoteDebugConfig": remote_debug_config,
+            "InfraCheckConfig": infra_check_config,
+            "SessionChainingConfig": session_chaining_config,
+            "ServerlessJobConfig": serverless_job_config,
+            "MlflowConfig": mlflow_config,
+            "ModelPackageConfig": model_package_config,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="TrainingJob", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_training_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(training_job_name=training_job_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        training_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["TrainingJob"]:
+        """
+        Get a TrainingJob resource
+
+        Parameters:
+            training_job_name: The name of the training job.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The TrainingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "TrainingJobName": training_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_training_job(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeTrainingJobResponse")
+        training_job = build_from_response(cls, transformed_response)
+        training_job._set_client_context(session=session, region_name=region)
+        return training_job
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["TrainingJob"]:
+        """
+        Refresh a TrainingJob resource
+
+        Returns:
+            The TrainingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_training_job(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeTrainingJobResponse", self)
+        return self
+
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def update(
+        self,
+        profiler_config: Optional[shapes.ProfilerConfigForUpdate] = Unassigned(),
+        profiler_rule_configurations: Optional[
+            List[shapes.ProfilerRuleConfiguration]
+        ] = Unassigned(),
+        resource_config: Optional[shapes.ResourceConfigForUpdate] = Unassigned(),
+        remote_debug_config: Optional[shapes.RemoteDebugConfigForUpdate] = Unassigned(),
+    ) -> Optional["TrainingJob"]:
+        """
+        Update a TrainingJob resource
+
+        Returns:
+            The TrainingJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating training_job resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+            "ProfilerConfig": profiler_config,
+            "ProfilerRuleConfigurations": profiler_rule_configurations,
+            "ResourceConfig": resource_config,
+            "RemoteDebugConfig": remote_debug_config,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_training_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a TrainingJob resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_training_job(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def stop(self) -> None:
+        """
+        Stop a TrainingJob resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "TrainingJobName": self.training_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.stop_training_job(**operation_input_args)
+
+        logger.info(f"Stopping {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        logs: Optional[bool] = False,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a TrainingJob resource.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            logs: Whether to print logs while waiting.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+
+        """
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        instance_count = (
+            sum(
+                instance_group.instance_count
+                for instance_group in self.resource_config.instance_groups
+            )
+            if self.resource_config.instance_groups
+            and not isinstance(self.resource_config.instance_groups, Unassigned)
+            else self.resource_config.instance_count
+        )
+
+        if logs:
+            multi_stream_logger = MultiLogStreamHandler(
+                log_group_name=f"/aws/sagemaker/TrainingJobs",
+                log_stream_name_prefix=self.get_name(),
+                expected_stream_count=instance_count,
+            )
+
+        with WaiterDisplay(
+            "Waiting for TrainingJob...", display, status_callback
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.training_job_status
+                waiter_display.update(current_status)
+
+                if logs:
+                    stream_log_events = multi_stream_logger.get_latest_log_events(
+                        flush=current_status in terminal_states
+                    )
+                    for stream_id, event in stream_log_events:
+                        logger.info(f"{stream_id}:\n{event['message']}")
+
+                if current_status in terminal_states:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+
+                    if "failed" in current_status.lower():
+                        raise FailedStatusError(
+                            resource_type="TrainingJob",
+                            status=current_status,
+                            reason=self.failure_reason,
+                        )
+
+                    return
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="TrainingJob", status=current_status)
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def wait_for_delete(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a TrainingJob resource to be deleted.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            "Waiting for TrainingJob to be deleted...", display, status_callback, transient=False
+        ) as waiter_display:
+            while True:
+                try:
+                    poller.call(self.refresh)
+                    current_status = self.training_job_status
+                    waiter_display.update(current_status)
+
+                    if timeout is not None and time.time() - start_time >= timeout:
+                        raise TimeoutExceededError(
+                            resouce_type="TrainingJob", status=current_status
+                        )
+                except botocore.exceptions.ClientError as e:
+                    error_code = e.response["Error"]["Code"]
+
+                    if "ResourceNotFound" in error_code or "ValidationException" in error_code:
+                        logger.info("Resource was not found. It may have been deleted.")
+                        return
+                    raise e
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def stream_logs(
+        self,
+        follow: bool = True,
+        start_time: Optional[datetime.datetime] = None,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        filter_pattern: Optional[str] = None,
+    ) -> JobLogStreamer:
+        """
+        Stream the log events of a TrainingJob resource.
+
+        Parameters:
+            follow: Whether to keep polling for new log events until the resource reaches a terminal state, rather than only getting the log events that exist at this moment.
+            start_time: The time of the first log events to get. Defaults to None, getting the log events from the start of the job.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to follow the logs before timing out.
+            filter_pattern: The CloudWatch Logs filter pattern the log events must match.
+
+        Returns:
+            JobLogStreamer: The LogEvents of the TrainingJob, fetched while iterating over them with for or async for.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+        """
+        instance_count = (
+            sum(
+                instance_group.instance_count
+                for instance_group in self.resource_config.instance_groups
+            )
+            if self.resource_config.instance_groups
+            and not isinstance(self.resource_config.instance_groups, Unassigned)
+            else self.resource_config.instance_count
+        )
+
+        return JobLogStreamer(
+            self,
+            log_group_name=f"/aws/sagemaker/TrainingJobs",
+            instance_count=instance_count,
+            follow=follow,
+            start_time=start_time,
+            poll=poll,
+            timeout=timeout,
+            filter_pattern=filter_pattern,
+        )
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        max_results: Optional[int] = Unassigned(),
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        warm_pool_status_equals: Optional[str] = Unassigned(),
+        training_plan_arn_equals: Optional[str] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["TrainingJob"]:
+        """
+        Get all TrainingJob resources
+
+        Parameters:
+            next_token: If the result of the previous ListTrainingJobs request was truncated, the response includes a NextToken. To retrieve the next set of training jobs, use the token in the next request.
+            max_results: The maximum number of training jobs to return in the response.
+            creation_time_after: A filter that returns only training jobs created after the specified time (timestamp).
+            creation_time_before: A filter that returns only training jobs created before the specified time (timestamp).
+            last_modified_time_after: A filter that returns only training jobs modified after the specified time (timestamp).
+            last_modified_time_before: A filter that returns only training jobs modified before the specified time (timestamp).
+            name_contains: A string in the training job name. This filter returns only training jobs whose name contains the specified string.
+            status_equals: A filter that retrieves only training jobs with a specific status.
+            sort_by: The field to sort results by. The default is CreationTime.
+            sort_order: The sort order for results. The default is Ascending.
+            warm_pool_status_equals: A filter that retrieves only training jobs with a specific warm pool status.
+            training_plan_arn_equals: The Amazon Resource Name (ARN); of the training plan to filter training jobs by. For more information about reserving GPU capacity for your SageMaker training jobs using Amazon SageMaker Training Plan, see  CreateTrainingPlan .
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed TrainingJob resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "MaxResults": max_results,
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "WarmPoolStatusEquals": warm_pool_status_equals,
+            "TrainingPlanArnEquals": training_plan_arn_equals,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_training_jobs",
+            summaries_key="TrainingJobSummaries",
+            summary_name="TrainingJobSummary",
+            resource_cls=TrainingJob,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["TrainingJob"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["TrainingJob"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["TrainingJob"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["TrainingJob"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    # Asynchronous counterpart of stop, running it on the thread pool of the async bridge, with
+    # the signature and docstring of stop
+    @functools.wraps(stop, assigned=("__module__", "__doc__"))
+    async def astop(self, *args, **kwargs) -> None:
+        return await run_async(self.stop, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_completion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait, waiting for a TrainingJob resource without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, poll=poll, timeout=timeout)
+
+    @Base.add_validate_call
+    async def await_deletion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_delete, waiting for a TrainingJob resource to be deleted without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+            TimeoutExceededError:  If the resource is not deleted before the timeout.
+            DeleteFailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_for_delete_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["TrainingJob"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -0,0 +1,627 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class TransformJob(Base):
+    """
+    Class representing resource TransformJob
+
+    Attributes:
+        transform_job_name: The name of the transform job.
+        transform_job_arn: The Amazon Resource Name (ARN) of the transform job.
+        transform_job_status: The status of the transform job. If the transform job failed, the reason is returned in the FailureReason field.
+        model_name: The name of the model used in the transform job.
+        transform_input: Describes the dataset to be transformed and the Amazon S3 location where it is stored.
+        transform_resources: Describes the resources, including ML instance types and ML instance count, to use for the transform job.
+        creation_time: A timestamp that shows when the transform Job was created.
+        failure_reason: If the transform job failed, FailureReason describes why it failed. A transform job creates a log file, which includes error messages, and stores it as an Amazon S3 object. For more information, see Log Amazon SageMaker Events with Amazon CloudWatch.
+        max_concurrent_transforms: The maximum number of parallel requests on each instance node that can be launched in a transform job. The default value is 1.
+        model_client_config: The timeout and maximum number of retries for processing a transform job invocation.
+        max_payload_in_mb: The maximum payload size, in MB, used in the transform job.
+        batch_strategy: Specifies the number of records to include in a mini-batch for an HTTP inference request. A record  is a single unit of input data that inference can be made on. For example, a single line in a CSV file is a record.  To enable the batch strategy, you must set SplitType to Line, RecordIO, or TFRecord.
+        environment: The environment variables to set in the Docker container. We support up to 16 key and values entries in the map.
+        transform_output: Identifies the Amazon S3 location where you want Amazon SageMaker to save the results from the transform job.
+        data_capture_config: Configuration to control how SageMaker captures inference data.
+        transform_start_time: Indicates when the transform job starts on ML instances. You are billed for the time interval between this time and the value of TransformEndTime.
+        transform_end_time: Indicates when the transform job has been completed, or has stopped or failed. You are billed for the time interval between this time and the value of TransformStartTime.
+        labeling_job_arn: The Amazon Resource Name (ARN) of the Amazon SageMaker Ground Truth labeling job that created the transform or training job.
+        auto_ml_job_arn: The Amazon Resource Name (ARN) of the AutoML transform job.
+        data_processing:
+        experiment_config:
+
+    """
+
+    transform_job_name: str
+    transform_job_arn: Optional[str] = Unassigned()
+    transform_job_status: Optional[str] = Unassigned()
+    failure_reason: Optional[str] = Unassigned()
+    model_name: Optional[str] = Unassigned()
+    max_concurrent_transforms: Optional[int] = Unassigned()
+    model_client_config: Optional[shapes.ModelClientConfig] = Unassigned()
+    max_payload_in_mb: Optional[int] = Unassigned()
+    batch_strategy: Optional[str] = Unassigned()
+    environment: Optional[Dict[str, str]] = Unassigned()
+    transform_input: Optional[shapes.TransformInput] = Unassigned()
+    transform_output: Optional[shapes.TransformOutput] = Unassigned()
+    data_capture_config: Optional[shapes.BatchDataCaptureConfig] = Unassigned()
+    transform_resources: Optional[shapes.TransformResources] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    transform_start_time: Optional[datetime.datetime] = Unassigned()
+    transform_end_time: Optional[datetime.datetime] = Unassigned()
+    labeling_job_arn: Optional[str] = Unassigned()
+    auto_ml_job_arn: Optional[str] = Unassigned()
+    data_processing: Optional[shapes.DataProcessing] = Unassigned()
+    experiment_config: Optional[shapes.ExperimentConfig] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["transform_job_status"]
+    _terminal_states: ClassVar[List[str]] = ["Completed", "Failed", "Stopped"]
+    _failure_reason_attribute: ClassVar[Optional[str]] = "failure_reason"
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "transform_job_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object transform_job")
+        return None
+
+    def populate_inputs_decorator(create_func):
+        @functools.wraps(create_func)
+        def wrapper(*args, **kwargs):
+            config_schema_for_resource = {
+                "transform_input": {
+                    "data_source": {
+                        "s3_data_source": {
+                            "s3_data_type": {"type": "string"},
+                            "s3_uri": {"type": "string"},
+                        }
+                    }
+                },
+                "transform_resources": {"volume_kms_key_id": {"type": "string"}},
+                "transform_output": {
+                    "s3_output_path": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+                "data_capture_config": {
+                    "destination_s3_uri": {"type": "string"},
+                    "kms_key_id": {"type": "string"},
+                },
+            }
+            return create_func(
+                *args,
+                **Base.get_updated_kwargs_with_configured_attributes(
+                    config_schema_for_resource, "TransformJob", **kwargs
+                ),
+            )
+
+        return wrapper
+
+    @classmethod
+    @populate_inputs_decorator
+    @Base.add_validate_call
+    def create(
+        cls,
+        transform_job_name: str,
+        model_name: Union[str, object],
+        transform_input: shapes.TransformInput,
+        transform_output: shapes.TransformOutput,
+        transform_resources: shapes.TransformResources,
+        max_concurrent_transforms: Optional[int] = Unassigned(),
+        model_client_config: Optional[shapes.ModelClientConfig] = Unassigned(),
+        max_payload_in_mb: Optional[int] = Unassigned(),
+        batch_strategy: Optional[str] = Unassigned(),
+        environment: Optional[Dict[str, str]] = Unassigned(),
+        data_capture_config: Optional[shapes.BatchDataCaptureConfig] = Unassigned(),
+        data_processing: Optional[shapes.DataProcessing] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        experiment_config: Optional[shapes.ExperimentConfig] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["TransformJob"]:
+        """
+        Create a TransformJob resource
+
+        Parameters:
+            transform_job_name: The name of the transform job. The name must be unique within an Amazon Web Services Region in an Amazon Web Services account.
+            model_name: The name of the model that you want to use for the transform job. ModelName must be the name of an existing Amazon SageMaker model within an Amazon Web Services Region in an Amazon Web Services account.
+            transform_input: Describes the input source and the way the transform job consumes it.
+            transform_output: Describes the results of the transform job.
+            transform_resources: Describes the resources, including ML instance types and ML instance count, to use for the transform job.
+            max_concurrent_transforms: The maximum number of parallel requests that can be sent to each instance in a transform job. If MaxConcurrentTransforms is set to 0 or left unset, Amazon SageMaker checks the optional execution-parameters to determine the settings for your chosen algorithm. If the execution-parameters endpoint is not enabled, the default value is 1. For more information on execution-parameters, see How Containers Serve Requests. For built-in algorithms, you don't need to set a value for MaxConcurrentTransforms.
+            model_client_config: Configures the timeout and maximum number of retries for processing a transform job invocation.
+            max_payload_in_mb: The maximum allowed size of the payload, in MB. A payload is the data portion of a record (without metadata). The value in MaxPayloadInMB must be greater than, or equal to, the size of a single record. To estimate the size of a record in MB, divide the size of your dataset by the number of records. To ensure that the records fit within the maximum payload size, we recommend using a slightly larger value. The default value is 6 MB.  The value of MaxPayloadInMB cannot be greater than 100 MB. If you specify the MaxConcurrentTransforms parameter, the value of (MaxConcurrentTransforms \* MaxPayloadInMB) also cannot exceed 100 MB. For cases where the payload might be arbitrarily large and is transmitted using HTTP chunked encoding, set the value to 0. This feature works only in supported algorithms. Currently, Amazon SageMaker built-in algorithms do not support HTTP chunked encoding.
+            batch_strategy: Specifies the number of records to include in a mini-batch for an HTTP inference request. A record  is a single unit of input data that inference can be made on. For example, a single line in a CSV file is a record.  To enable the batch strategy, you must set the SplitType property to Line, RecordIO, or TFRecord. To use only one record when making an HTTP invocation request to a container, set BatchStrategy to SingleRecord and SplitType to Line. To fit as many records in a mini-batch as can fit within the MaxPayloadInMB limit, set BatchStrategy to MultiRecord and SplitType to Line.
+            environment: The environment variables to set in the Docker container. Don't include any sensitive data in your environment variables. We support up to 16 key and values entries in the map.
+            data_capture_config: Configuration to control how SageMaker captures inference data.
+            data_processing: The data structure used to specify the data to be used for inference in a batch transform job and to associate the data that is relevant to the prediction results in the output. The input filter provided allows you to exclude input data that is not needed for inference in a batch transform job. The output filter provided allows you to include input data relevant to interpreting the predictions in the output from the job. For more information, see Associate Prediction Results with their Corresponding Input Records.
+            tags: (Optional) An array of key-value pairs. For more information, see Using Cost Allocation Tags in the Amazon Web Services Billing and Cost Management User Guide.
+            experiment_config:
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The TransformJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceInUse: Resource being accessed is in use.
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating transform_job resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "TransformJobName": transform_job_name,
+            "ModelName": model_name,
+            "MaxConcurrentTransforms": max_concurrent_transforms,
+            "ModelClientConfig": model_client_config,
+            "MaxPayloadInMB": max_payload_in_mb,
+            "BatchStrategy": batch_strategy,
+            "Environment": environment,
+            "TransformInput": transform_input,
+            "TransformOutput": transform_output,
+            "DataCaptureConfig": data_capture_config,
+            "TransformResources": transform_resources,
+            "DataProcessing": data_processing,
+            "Tags": tags,
+            "ExperimentConfig": experiment_config,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="TransformJob", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_transform_job(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(transform_job_name=transform_job_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        transform_job_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["TransformJob"]:
+        """
+        Get a TransformJob resource
+
+        Parameters:
+            transform_job_name: The name of the transform job that you want to view details of.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The TransformJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "TransformJobName": transform_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_transform_job(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeTransformJobResponse")
+        transform_job = build_from_response(cls, transformed_response)
+        transform_job._set_client_context(session=session, region_name=region)
+        return transform_job
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["TransformJob"]:
+        """
+        Refresh a TransformJob resource
+
+        Returns:
+            The TransformJob resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "TransformJobName": self.transform_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_transform_job(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeTransformJobResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def stop(self) -> None:
+        """
+        Stop a TransformJob resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "TransformJobName": self.transform_job_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.stop_transform_job(**operation_input_args)
+
+        logger.info(f"Stopping {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        logs: Optional[bool] = False,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a TransformJob resource.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            logs: Whether to print logs while waiting.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+
+        """
+        terminal_states = ["Completed", "Failed", "Stopped"]
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        instance_count = self.transform_resources.instance_count
+        if logs:
+            multi_stream_logger = MultiLogStreamHandler(
+                log_group_name=f"/aws/sagemaker/TransformJobs",
+                log_stream_name_prefix=self.get_name(),
+                expected_stream_count=instance_count,
+            )
+
+        with WaiterDisplay(
+            "Waiting for TransformJob...", display, status_callback
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.transform_job_status
+                waiter_display.update(current_status)
+
+                if logs:
+                    stream_log_events = multi_stream_logger.get_latest_log_events(
+                        flush=current_status in terminal_states
+                    )
+                    for stream_id, event in stream_log_events:
+                        logger.info(f"{stream_id}:\n{event['message']}")
+
+                if current_status in terminal_states:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+
+                    if "failed" in current_status.lower():
+                        raise FailedStatusError(
+                            resource_type="TransformJob",
+                            status=current_status,
+                            reason=self.failure_reason,
+                        )
+
+                    return
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="TransformJob", status=current_status)
+                poller.sleep(current_status)
+
+    @Base.add_validate_call
+    def stream_logs(
+        self,
+        follow: bool = True,
+        start_time: Optional[datetime.datetime] = None,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        filter_pattern: Optional[str] = None,
+    ) -> JobLogStreamer:
+        """
+        Stream the log events of a TransformJob resource.
+
+        Parameters:
+            follow: Whether to keep polling for new log events until the resource reaches a terminal state, rather than only getting the log events that exist at this moment.
+            start_time: The time of the first log events to get. Defaults to None, getting the log events from the start of the job.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to follow the logs before timing out.
+            filter_pattern: The CloudWatch Logs filter pattern the log events must match.
+
+        Returns:
+            JobLogStreamer: The LogEvents of the TransformJob, fetched while iterating over them with for or async for.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+        """
+        instance_count = self.transform_resources.instance_count
+        return JobLogStreamer(
+            self,
+            log_group_name=f"/aws/sagemaker/TransformJobs",
+            instance_count=instance_count,
+            follow=follow,
+            start_time=start_time,
+            poll=poll,
+            timeout=timeout,
+            filter_pattern=filter_pattern,
+        )
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        creation_time_after: Optional[datetime.datetime] = Unassigned(),
+        creation_time_before: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+        last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+        name_contains: Optional[str] = Unassigned(),
+        status_equals: Optional[str] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        parallel_shards: Optional[int] = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["TransformJob"]:
+        """
+        Get all TransformJob resources
+
+        Parameters:
+            creation_time_after: A filter that returns only transform jobs created after the specified time.
+            creation_time_before: A filter that returns only transform jobs created before the specified time.
+            last_modified_time_after: A filter that returns only transform jobs modified after the specified time.
+            last_modified_time_before: A filter that returns only transform jobs modified before the specified time.
+            name_contains: A string in the transform job name. This filter returns only transform jobs whose name contains the specified string.
+            status_equals: A filter that retrieves only transform jobs with a specific status.
+            sort_by: The field to sort results by. The default is CreationTime.
+            sort_order: The sort order for results. The default is Descending.
+            next_token: If the result of the previous ListTransformJobs request was truncated, the response includes a NextToken. To retrieve the next set of transform jobs, use the token in the next request.
+            max_results: The maximum number of transform jobs to return in the response. The default value is 10.
+            parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed TransformJob resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "CreationTimeAfter": creation_time_after,
+            "CreationTimeBefore": creation_time_before,
+            "LastModifiedTimeAfter": last_modified_time_after,
+            "LastModifiedTimeBefore": last_modified_time_before,
+            "NameContains": name_contains,
+            "StatusEquals": status_equals,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "MaxResults": max_results,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_transform_jobs",
+            summaries_key="TransformJobSummaries",
+            summary_name="TransformJobSummary",
+            resource_cls=TransformJob,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            parallel_shards=parallel_shards,
+            list_method_kwargs=operation_input_args,
+        )
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["TransformJob"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["TransformJob"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["TransformJob"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of stop, running it on the thread pool of the async bridge, with
+    # the signature and docstring of stop
+    @functools.wraps(stop, assigned=("__module__", "__doc__"))
+    async def astop(self, *args, **kwargs) -> None:
+        return await run_async(self.stop, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_completion(
+        self,
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait, waiting for a TransformJob resource without blocking the event loop.
+
+        Parameters:
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["TransformJob"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
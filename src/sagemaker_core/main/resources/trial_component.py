@@ -0,0 +1,773 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import botocore
+import datetime
+import time
+import functools
+from pydantic import validate_call, ConfigDict, BaseModel
+from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any
+from boto3.session import Session
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.codec import transform, build_from_response
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.utils import (
+    SageMakerClient,
+    ResourceIterator,
+    AsyncResourceIterator,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    WaiterDisplay,
+    get_textual_rich_logger,
+    snake_to_pascal,
+    pascal_to_snake,
+    is_not_primitive,
+    is_not_str_dict,
+    is_primitive_list,
+    serialize,
+    run_async,
+)
+from sagemaker_core.main.default_configs_helper import (
+    load_default_configs_for_resource_name,
+    get_config_value,
+)
+from sagemaker_core.main.exceptions import *
+import sagemaker_core.main.shapes as shapes
+
+from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler
+from sagemaker_core.main.waiters import wait_async, wait_for_delete_async
+from sagemaker_core.main.resources._base import Base, logger
+
+
+class TrialComponent(Base):
+    """
+    Class representing resource TrialComponent
+
+    Attributes:
+        trial_component_name: The name of the trial component.
+        trial_component_arn: The Amazon Resource Name (ARN) of the trial component.
+        display_name: The name of the component as displayed. If DisplayName isn't specified, TrialComponentName is displayed.
+        source: The Amazon Resource Name (ARN) of the source and, optionally, the job type.
+        status: The status of the component. States include:   InProgress   Completed   Failed
+        start_time: When the component started.
+        end_time: When the component ended.
+        creation_time: When the component was created.
+        created_by: Who created the trial component.
+        last_modified_time: When the component was last modified.
+        last_modified_by: Who last modified the component.
+        parameters: The hyperparameters of the component.
+        input_artifacts: The input artifacts of the component.
+        output_artifacts: The output artifacts of the component.
+        metadata_properties:
+        metrics: The metrics for the component.
+        lineage_group_arn: The Amazon Resource Name (ARN) of the lineage group.
+        sources: A list of ARNs and, if applicable, job types for multiple sources of an experiment run.
+
+    """
+
+    trial_component_name: str
+    trial_component_arn: Optional[str] = Unassigned()
+    display_name: Optional[str] = Unassigned()
+    source: Optional[shapes.TrialComponentSource] = Unassigned()
+    status: Optional[shapes.TrialComponentStatus] = Unassigned()
+    start_time: Optional[datetime.datetime] = Unassigned()
+    end_time: Optional[datetime.datetime] = Unassigned()
+    creation_time: Optional[datetime.datetime] = Unassigned()
+    created_by: Optional[shapes.UserContext] = Unassigned()
+    last_modified_time: Optional[datetime.datetime] = Unassigned()
+    last_modified_by: Optional[shapes.UserContext] = Unassigned()
+    parameters: Optional[Dict[str, shapes.TrialComponentParameterValue]] = Unassigned()
+    input_artifacts: Optional[Dict[str, shapes.TrialComponentArtifact]] = Unassigned()
+    output_artifacts: Optional[Dict[str, shapes.TrialComponentArtifact]] = Unassigned()
+    metadata_properties: Optional[shapes.MetadataProperties] = Unassigned()
+    metrics: Optional[List[shapes.TrialComponentMetricSummary]] = Unassigned()
+    lineage_group_arn: Optional[str] = Unassigned()
+    sources: Optional[List[shapes.TrialComponentSource]] = Unassigned()
+
+    _status_attributes: ClassVar[List[str]] = ["status", "primary_status"]
+    _terminal_states: ClassVar[List[str]] = []
+    _failure_reason_attribute: ClassVar[Optional[str]] = None
+
+    def get_name(self) -> str:
+        attributes = vars(self)
+        resource_name = "trial_component_name"
+        resource_name_split = resource_name.split("_")
+        attribute_name_candidates = []
+
+        l = len(resource_name_split)
+        for i in range(0, l):
+            attribute_name_candidates.append("_".join(resource_name_split[i:l]))
+
+        for attribute, value in attributes.items():
+            if attribute == "name" or attribute in attribute_name_candidates:
+                return value
+        logger.error("Name attribute not found for object trial_component")
+        return None
+
+    @classmethod
+    @Base.add_validate_call
+    def create(
+        cls,
+        trial_component_name: str,
+        display_name: Optional[str] = Unassigned(),
+        status: Optional[shapes.TrialComponentStatus] = Unassigned(),
+        start_time: Optional[datetime.datetime] = Unassigned(),
+        end_time: Optional[datetime.datetime] = Unassigned(),
+        parameters: Optional[Dict[str, shapes.TrialComponentParameterValue]] = Unassigned(),
+        input_artifacts: Optional[Dict[str, shapes.TrialComponentArtifact]] = Unassigned(),
+        output_artifacts: Optional[Dict[str, shapes.TrialComponentArtifact]] = Unassigned(),
+        metadata_properties: Optional[shapes.MetadataProperties] = Unassigned(),
+        tags: Optional[List[shapes.Tag]] = Unassigned(),
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["TrialComponent"]:
+        """
+        Create a TrialComponent resource
+
+        Parameters:
+            trial_component_name: The name of the component. The name must be unique in your Amazon Web Services account and is not case-sensitive.
+            display_name: The name of the component as displayed. The name doesn't need to be unique. If DisplayName isn't specified, TrialComponentName is displayed.
+            status: The status of the component. States include:   InProgress   Completed   Failed
+            start_time: When the component started.
+            end_time: When the component ended.
+            parameters: The hyperparameters for the component.
+            input_artifacts: The input artifacts for the component. Examples of input artifacts are datasets, algorithms, hyperparameters, source code, and instance types.
+            output_artifacts: The output artifacts for the component. Examples of output artifacts are metrics, snapshots, logs, and images.
+            metadata_properties:
+            tags: A list of tags to associate with the component. You can use Search API to search on the tags.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The TrialComponent resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ConfigSchemaValidationError: Raised when a configuration file does not adhere to the schema
+            LocalConfigNotFoundError: Raised when a configuration file is not found in local file system
+            S3ConfigNotFoundError: Raised when a configuration file is not found in S3
+        """
+
+        logger.info("Creating trial_component resource.")
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "TrialComponentName": trial_component_name,
+            "DisplayName": display_name,
+            "Status": status,
+            "StartTime": start_time,
+            "EndTime": end_time,
+            "Parameters": parameters,
+            "InputArtifacts": input_artifacts,
+            "OutputArtifacts": output_artifacts,
+            "MetadataProperties": metadata_properties,
+            "Tags": tags,
+        }
+
+        operation_input_args = Base.populate_chained_attributes(
+            resource_name="TrialComponent", operation_input_args=operation_input_args
+        )
+
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.create_trial_component(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        return cls.get(trial_component_name=trial_component_name, session=session, region=region)
+
+    @classmethod
+    @Base.add_validate_call
+    def get(
+        cls,
+        trial_component_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional["TrialComponent"]:
+        """
+        Get a TrialComponent resource
+
+        Parameters:
+            trial_component_name: The name of the trial component to describe.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            The TrialComponent resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "TrialComponentName": trial_component_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+        response = client.describe_trial_component(**operation_input_args)
+
+        logger.debug(response)
+
+        # deserialize the response
+        transformed_response = transform(response, "DescribeTrialComponentResponse")
+        trial_component = build_from_response(cls, transformed_response)
+        trial_component._set_client_context(session=session, region_name=region)
+        return trial_component
+
+    @Base.add_validate_call
+    def refresh(
+        self,
+    ) -> Optional["TrialComponent"]:
+        """
+        Refresh a TrialComponent resource
+
+        Returns:
+            The TrialComponent resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = self._get_resource_client()
+        response = client.describe_trial_component(**operation_input_args)
+
+        # deserialize response and update self
+        transform(response, "DescribeTrialComponentResponse", self)
+        return self
+
+    @Base.add_validate_call
+    def update(
+        self,
+        display_name: Optional[str] = Unassigned(),
+        status: Optional[shapes.TrialComponentStatus] = Unassigned(),
+        start_time: Optional[datetime.datetime] = Unassigned(),
+        end_time: Optional[datetime.datetime] = Unassigned(),
+        parameters: Optional[Dict[str, shapes.TrialComponentParameterValue]] = Unassigned(),
+        parameters_to_remove: Optional[List[str]] = Unassigned(),
+        input_artifacts: Optional[Dict[str, shapes.TrialComponentArtifact]] = Unassigned(),
+        input_artifacts_to_remove: Optional[List[str]] = Unassigned(),
+        output_artifacts: Optional[Dict[str, shapes.TrialComponentArtifact]] = Unassigned(),
+        output_artifacts_to_remove: Optional[List[str]] = Unassigned(),
+    ) -> Optional["TrialComponent"]:
+        """
+        Update a TrialComponent resource
+
+        Parameters:
+            parameters_to_remove: The hyperparameters to remove from the component.
+            input_artifacts_to_remove: The input artifacts to remove from the component.
+            output_artifacts_to_remove: The output artifacts to remove from the component.
+
+        Returns:
+            The TrialComponent resource.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ConflictException: There was a conflict when you attempted to modify a SageMaker entity such as an Experiment or Artifact.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        logger.info("Updating trial_component resource.")
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+            "DisplayName": display_name,
+            "Status": status,
+            "StartTime": start_time,
+            "EndTime": end_time,
+            "Parameters": parameters,
+            "ParametersToRemove": parameters_to_remove,
+            "InputArtifacts": input_artifacts,
+            "InputArtifactsToRemove": input_artifacts_to_remove,
+            "OutputArtifacts": output_artifacts,
+            "OutputArtifactsToRemove": output_artifacts_to_remove,
+        }
+        logger.debug(f"Input request: {operation_input_args}")
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        # create the resource
+        response = client.update_trial_component(**operation_input_args)
+        logger.debug(f"Response: {response}")
+        self.refresh()
+
+        return self
+
+    @Base.add_validate_call
+    def delete(
+        self,
+    ) -> None:
+        """
+        Delete a TrialComponent resource
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = self._get_resource_client()
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client.delete_trial_component(**operation_input_args)
+
+        logger.info(f"Deleting {self.__class__.__name__} - {self.get_name()}")
+
+    @Base.add_validate_call
+    def wait_for_status(
+        self,
+        target_status: Literal["InProgress", "Completed", "Failed", "Stopping", "Stopped"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Wait for a TrialComponent resource to reach certain status.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+            display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+            status_callback: A function called with the status of the resource at every poll.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        start_time = time.time()
+        poller = Poller(poll, timeout)
+
+        with WaiterDisplay(
+            f"Waiting for TrialComponent to reach [bold]{target_status} status...",
+            display,
+            status_callback,
+        ) as waiter_display:
+            while True:
+                poller.call(self.refresh)
+                current_status = self.status.primary_status
+                waiter_display.update(current_status)
+
+                if target_status == current_status:
+                    logger.info(f"Final Resource Status: [bold]{current_status}")
+                    return
+
+                if "failed" in current_status.lower():
+                    raise FailedStatusError(
+                        resource_type="TrialComponent", status=current_status, reason="(Unknown)"
+                    )
+
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise TimeoutExceededError(resouce_type="TrialComponent", status=current_status)
+                poller.sleep(current_status)
+
+    @classmethod
+    @Base.add_validate_call
+    def get_all(
+        cls,
+        experiment_name: Optional[str] = Unassigned(),
+        trial_name: Optional[str] = Unassigned(),
+        source_arn: Optional[str] = Unassigned(),
+        created_after: Optional[datetime.datetime] = Unassigned(),
+        created_before: Optional[datetime.datetime] = Unassigned(),
+        sort_by: Optional[str] = Unassigned(),
+        sort_order: Optional[str] = Unassigned(),
+        max_results: Optional[int] = Unassigned(),
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> ResourceIterator["TrialComponent"]:
+        """
+        Get all TrialComponent resources
+
+        Parameters:
+            experiment_name: A filter that returns only components that are part of the specified experiment. If you specify ExperimentName, you can't filter by SourceArn or TrialName.
+            trial_name: A filter that returns only components that are part of the specified trial. If you specify TrialName, you can't filter by ExperimentName or SourceArn.
+            source_arn: A filter that returns only components that have the specified source Amazon Resource Name (ARN). If you specify SourceArn, you can't filter by ExperimentName or TrialName.
+            created_after: A filter that returns only components created after the specified time.
+            created_before: A filter that returns only components created before the specified time.
+            sort_by: The property used to sort results. The default value is CreationTime.
+            sort_order: The sort order. The default value is Descending.
+            max_results: The maximum number of components to return in the response. The default value is 10.
+            next_token: If the previous call to ListTrialComponents didn't return the full set of components, the call returns a token for getting the next set of components.
+            hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+            hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+            prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            Iterator for listed TrialComponent resources.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        operation_input_args = {
+            "ExperimentName": experiment_name,
+            "TrialName": trial_name,
+            "SourceArn": source_arn,
+            "CreatedAfter": created_after,
+            "CreatedBefore": created_before,
+            "SortBy": sort_by,
+            "SortOrder": sort_order,
+            "MaxResults": max_results,
+        }
+
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        return ResourceIterator(
+            client=client,
+            session=session,
+            region_name=region,
+            list_method="list_trial_components",
+            summaries_key="TrialComponentSummaries",
+            summary_name="TrialComponentSummary",
+            resource_cls=TrialComponent,
+            hydrate=hydrate,
+            hydrate_concurrency=hydrate_concurrency,
+            prefetch_pages=prefetch_pages,
+            list_method_kwargs=operation_input_args,
+        )
+
+    @Base.add_validate_call
+    def associate_trail(
+        self,
+        trial_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> None:
+        """
+        Associates a trial component with a trial.
+
+        Parameters:
+            trial_name: The name of the trial to associate with.
+            session: Boto3 session.
+            region: Region name.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceLimitExceeded: You have exceeded an SageMaker resource limit. For example, you might have too many training jobs created.
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+            "TrialName": trial_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling associate_trial_component API")
+        response = client.associate_trial_component(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+    @Base.add_validate_call
+    def disassociate_trail(
+        self,
+        trial_name: str,
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> None:
+        """
+        Disassociates a trial component from a trial.
+
+        Parameters:
+            trial_name: The name of the trial to disassociate from.
+            session: Boto3 session.
+            region: Region name.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+            ResourceNotFound: Resource being access is not found.
+        """
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+            "TrialName": trial_name,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker"
+        )
+
+        logger.debug(f"Calling disassociate_trial_component API")
+        response = client.disassociate_trial_component(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+    @Base.add_validate_call
+    def batch_put_metrics(
+        self,
+        metric_data: List[shapes.RawMetricData],
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> None:
+        """
+        Used to ingest training metrics into SageMaker.
+
+        Parameters:
+            metric_data: A list of raw metric values to put.
+            session: Boto3 session.
+            region: Region name.
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        operation_input_args = {
+            "TrialComponentName": self.trial_component_name,
+            "MetricData": metric_data,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker-metrics"
+        )
+
+        logger.debug(f"Calling batch_put_metrics API")
+        response = client.batch_put_metrics(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+    @classmethod
+    @Base.add_validate_call
+    def batch_get_metrics(
+        cls,
+        metric_queries: List[shapes.MetricQuery],
+        session: Optional[Session] = None,
+        region: Optional[str] = None,
+    ) -> Optional[shapes.BatchGetMetricsResponse]:
+        """
+        Used to retrieve training metrics from SageMaker.
+
+        Parameters:
+            metric_queries: Queries made to retrieve training metrics from SageMaker.
+            session: Boto3 session.
+            region: Region name.
+
+        Returns:
+            shapes.BatchGetMetricsResponse
+
+        Raises:
+            botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+                The error message and error code can be parsed from the exception as follows:
+                ```
+                try:
+                    # AWS service call here
+                except botocore.exceptions.ClientError as e:
+                    error_message = e.response['Error']['Message']
+                    error_code = e.response['Error']['Code']
+                ```
+        """
+
+        operation_input_args = {
+            "MetricQueries": metric_queries,
+        }
+        # serialize the input request
+        operation_input_args = serialize(operation_input_args)
+        logger.debug(f"Serialized input request: {operation_input_args}")
+
+        client = Base.get_sagemaker_client(
+            session=session, region_name=region, service_name="sagemaker-metrics"
+        )
+
+        logger.debug(f"Calling batch_get_metrics API")
+        response = client.batch_get_metrics(**operation_input_args)
+        logger.debug(f"Response: {response}")
+
+        transformed_response = transform(response, "BatchGetMetricsResponse")
+        return build_from_response(shapes.BatchGetMetricsResponse, transformed_response)
+
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["TrialComponent"]:
+        return await run_async(cls.create, *args, **kwargs)
+
+    # Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+    # the signature and docstring of get
+    @classmethod
+    @functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+    async def aget(cls, *args, **kwargs) -> Optional["TrialComponent"]:
+        return await run_async(cls.get, *args, **kwargs)
+
+    # Asynchronous counterpart of refresh, running it on the thread pool of the async bridge, with
+    # the signature and docstring of refresh
+    @functools.wraps(refresh, assigned=("__module__", "__doc__"))
+    async def arefresh(self, *args, **kwargs) -> Optional["TrialComponent"]:
+        return await run_async(self.refresh, *args, **kwargs)
+
+    # Asynchronous counterpart of update, running it on the thread pool of the async bridge, with
+    # the signature and docstring of update
+    @functools.wraps(update, assigned=("__module__", "__doc__"))
+    async def aupdate(self, *args, **kwargs) -> Optional["TrialComponent"]:
+        return await run_async(self.update, *args, **kwargs)
+
+    # Asynchronous counterpart of delete, running it on the thread pool of the async bridge, with
+    # the signature and docstring of delete
+    @functools.wraps(delete, assigned=("__module__", "__doc__"))
+    async def adelete(self, *args, **kwargs) -> None:
+        return await run_async(self.delete, *args, **kwargs)
+
+    @Base.add_validate_call
+    async def await_status(
+        self,
+        target_status: Literal["InProgress", "Completed", "Failed", "Stopping", "Stopped"],
+        poll: Union[int, PollStrategy] = 5,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Asynchronous counterpart of wait_for_status, waiting for a TrialComponent resource to reach certain status without blocking the event loop.
+
+        Parameters:
+            target_status: The status to wait for.
+            poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+            timeout: The maximum number of seconds to wait before timing out.
+
+        Raises:
+            TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+            FailedStatusError:   If the resource reaches a failed state.
+            WaiterError: Raised when an error occurs while waiting.
+        """
+        await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+    # Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+    # signature and docstring of get_all
+    @classmethod
+    @functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+    def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["TrialComponent"]:
+        return AsyncResourceIterator(cls.get_all(*args, **kwargs))
@@ -14,11 +14,20 @@ import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional, Any, Union
-from sagemaker_core.main.utils import Unassigned
+from sagemaker_core.main.utils import Unassigned, DeferredModelSignature
 
 
 class Base(BaseModel):
-    model_config = ConfigDict(protected_namespaces=(), validate_assignment=True, extra="forbid")
+    # Core schemas are built on first use of a shape rather than for every shape at import
+    model_config = ConfigDict(
+        protected_namespaces=(), validate_assignment=True, extra="forbid", defer_build=True
+    )
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        if not cls.__pydantic_complete__:
+            cls.__signature__ = DeferredModelSignature()
 
 
 class InternalDependencyException(Base):
@@ -11,22 +11,50 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import asyncio
+import contextvars
+import copy
+import csv
 import datetime
+import heapq
+import itertools
+import json
 import logging
 import os
+import queue
+import random
 import re
 import subprocess
+import threading
+import time
+import weakref
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from boto3.session import Session
 from botocore.config import Config
-from rich import reconfigure
-from rich.console import Console
+from botocore.exceptions import ClientError
+from rich import get_console, reconfigure
+from rich.console import Console, Group
+from rich.live import Live
 from rich.logging import RichHandler
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.status import Status
 from rich.style import Style
 from rich.theme import Theme
 from rich.traceback import install
-from typing import Any, Dict, List, TypeVar, Generic, Type
-from sagemaker_core.main.code_injection.codec import transform
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Generic, Type, Union
+from sagemaker_core.main.code_injection.codec import (
+    NAME_CONVERSION_CACHE_SIZE,
+    build_from_response,
+    transform,
+    snake_to_pascal,
+    pascal_to_snake,
+    trusted_responses,
+)
+from sagemaker_core.main.code_injection.shape_dag import SHAPE_DAG, SNAKE_TO_PASCAL_NAMES
 from sagemaker_core.main.code_injection.constants import Color
 from sagemaker_core.main.user_agent import get_user_agent_extra_suffix
 
@@ -64,15 +92,15 @@ def convert_to_snake_case(entity_name):
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", snake_case).lower()
 
 
-def snake_to_pascal(snake_str):
+def convert_to_pascal_case(entity_name):
     """
-    Convert a snake_case string to PascalCase.
+    Convert a snake_case string to PascalCase by title casing each component.
     Args:
-        snake_str (str): The snake_case string to be converted.
+        entity_name (str): The snake_case string to convert.
     Returns:
-        str: The PascalCase string.
+        str: The converted string in PascalCase.
     """
-    components = snake_str.split("_")
+    components = entity_name.split("_")
     return "".join(x.title() for x in components[0:])
 
 
@@ -195,11 +223,6 @@ logger = get_textual_rich_logger(__name__)
 
 T = TypeVar("T")
 
-SPECIAL_SNAKE_TO_PASCAL_MAPPINGS = {
-    "volume_size_in_g_b": "VolumeSizeInGB",
-    "volume_size_in_gb": "VolumeSizeInGB",
-}
-
 
 def configure_logging(log_level=None):
     """Configure the logging configuration based on log level.
@@ -244,37 +267,6 @@ def is_snake_case(s: str):
     return True
 
 
-def snake_to_pascal(snake_str):
-    """
-    Convert a snake_case string to PascalCase.
-
-    Args:
-        snake_str (str): The snake_case string to be converted.
-
-    Returns:
-        str: The PascalCase string.
-
-    """
-    if pascal_str := SPECIAL_SNAKE_TO_PASCAL_MAPPINGS.get(snake_str):
-        return pascal_str
-    components = snake_str.split("_")
-    return "".join(x.title() for x in components[0:])
-
-
-def pascal_to_snake(pascal_str):
-    """
-    Converts a PascalCase string to snake_case.
-
-    Args:
-        pascal_str (str): The PascalCase string to be converted.
-
-    Returns:
-        str: The converted snake_case string.
-    """
-    snake_case = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", pascal_str)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", snake_case).lower()
-
-
 def is_not_primitive(obj):
     return not isinstance(obj, (int, float, str, bool, datetime.datetime))
 
@@ -302,6 +294,21 @@ class Unassigned:
         return cls._instance
 
 
+class DeferredModelSignature:
+    """
+    Signature of a pydantic model whose schema building is deferred.
+
+    Pydantic only sets the signature of a model once its schema is built, so the model is built
+    when its signature is first inspected, e.g. by help() or notebook tooltips.
+    """
+
+    def __get__(self, instance, owner):
+        if instance is not None:
+            raise AttributeError("__signature__")
+        owner.model_rebuild()
+        return owner.__signature__
+
+
 class SingletonMeta(type):
     """
     Singleton metaclass. Ensures that a single instance of a class using this metaclass is created.
@@ -320,46 +327,234 @@ class SingletonMeta(type):
         return cls._instances[cls]
 
 
-class SageMakerClient(metaclass=SingletonMeta):
+# Services whose clients are configured with the runtime HTTP config of the client pool
+RUNTIME_SERVICE_NAMES = ("sagemaker-runtime", "sagemaker-featurestore-runtime")
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    """
+    HTTP connection settings of boto3 clients.
+
+    Settings left as None keep the botocore defaults.
+
+    Attributes:
+        max_pool_connections (int): The maximum number of connections kept in the connection pool.
+            Should be at least the number of threads calling the client concurrently.
+        tcp_keepalive (bool): Whether to enable TCP keep-alive on the connections.
+        connect_timeout (float): The time in seconds until a timeout is raised when connecting.
+        read_timeout (float): The time in seconds until a timeout is raised when reading.
+        retry_mode (str): The retry mode, one of legacy, standard or adaptive.
+        max_attempts (int): The maximum number of attempts of a request, including the first one.
+    """
+
+    max_pool_connections: Optional[int] = None
+    tcp_keepalive: Optional[bool] = None
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    retry_mode: Optional[str] = None
+    max_attempts: Optional[int] = None
+
+    def to_config(self) -> Config:
+        """
+        Build the botocore config of the settings.
+
+        Returns:
+            Config: The botocore config, holding only the settings that are set.
+        """
+        options = {
+            "max_pool_connections": self.max_pool_connections,
+            "tcp_keepalive": self.tcp_keepalive,
+            "connect_timeout": self.connect_timeout,
+            "read_timeout": self.read_timeout,
+        }
+        retries = {"mode": self.retry_mode, "total_max_attempts": self.max_attempts}
+        retries = {key: value for key, value in retries.items() if value is not None}
+        if retries:
+            options["retries"] = retries
+        return Config(**{key: value for key, value in options.items() if value is not None})
+
+
+class SageMakerClientPool:
     """
-    A singleton class for creating a SageMaker client.
+    A thread-safe pool of boto3 clients.
+
+    Clients are created lazily on first use and are shared by all callers asking for the same
+    session, region, service and client config. Clients of callers without a session are created
+    from a single default session owned by the pool. Resources keep the session and region they
+    were fetched with, so that their methods use the clients of that session and region.
+
+    Clients are held per session with weak references to the sessions, so the clients of sessions
+    created per request are released along with their sessions.
+
+    The config of a client is built from, in increasing order of precedence, the SageMakerCore user
+    agent, the pool wide max_pool_connections, the runtime HTTP config for the runtime services,
+    the config of the caller and the max_pool_connections of the caller.
+
+    Example:
+        SageMakerClient.pool.runtime_http_config = HttpConfig(
+            max_pool_connections=64, tcp_keepalive=True, retry_mode="adaptive"
+        )
     """
 
     def __init__(
         self,
-        session: Session = None,
-        region_name: str = None,
-        config: Config = None,
+        max_pool_connections: Optional[int] = None,
+        runtime_http_config: Optional[HttpConfig] = None,
     ):
         """
-        Initializes the SageMakerClient with a boto3 session, region name, and service name.
-        Creates a boto3 client using the provided session, region, and service.
+        Initializes an empty SageMakerClientPool.
+
+        Args:
+            max_pool_connections (int, optional): The default maximum number of connections kept in
+                the HTTP connection pool of each client. Defaults to the botocore default.
+            runtime_http_config (HttpConfig, optional): The HTTP config of the clients of the
+                sagemaker-runtime and sagemaker-featurestore-runtime services.
+        """
+        self.max_pool_connections = max_pool_connections
+        self.runtime_http_config = runtime_http_config
+        self._clients = weakref.WeakKeyDictionary()
+        self._default_session = None
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        service_name: str,
+        session: Optional[Session] = None,
+        region_name: Optional[str] = None,
+        config: Optional[Config] = None,
+        max_pool_connections: Optional[int] = None,
+    ) -> Any:
+        """
+        Get the client of a service, creating it on first use.
+
+        Args:
+            service_name (str): The service name, e.g. sagemaker or sagemaker-runtime.
+            session (Session, optional): The boto3 session. Defaults to the default session of the pool.
+            region_name (str, optional): The region name. Defaults to the region of the session.
+            config (Config, optional): The botocore config, merged into the default config.
+            max_pool_connections (int, optional): The maximum number of connections kept in the
+                HTTP connection pool of the client. Defaults to the pool wide setting.
+
+        Returns:
+            Any: The client of that service.
         """
         if session is None:
-            logger.warning("No boto3 session provided. Creating a new session.")
-            session = Session(region_name=region_name)
+            session = self._get_default_session()
+
+        http_config = None
+        if service_name in RUNTIME_SERVICE_NAMES:
+            http_config = self.runtime_http_config
+        config_options = (
+            None if config is None else repr(sorted(config._user_provided_options.items()))
+        )
+        key = (
+            region_name,
+            service_name,
+            config_options,
+            max_pool_connections or self.max_pool_connections,
+            http_config,
+        )
+        client = self._clients.get(session, {}).get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            session_clients = self._clients.setdefault(session, {})
+            client = session_clients.get(key)
+            if client is None:
+                client = self._create_client(
+                    service_name,
+                    session,
+                    region_name,
+                    self._build_config(config, max_pool_connections, http_config),
+                )
+                session_clients[key] = client
+        return client
+
+    def clear(self):
+        """Remove all clients from the pool, they are recreated on next use."""
+        with self._lock:
+            self._clients = weakref.WeakKeyDictionary()
+            self._default_session = None
+
+    def _get_default_session(self) -> Session:
+        with self._lock:
+            if self._default_session is None:
+                logger.warning("No boto3 session provided. Creating a new session.")
+                self._default_session = Session()
+            return self._default_session
+
+    def _build_config(
+        self,
+        config: Optional[Config],
+        max_pool_connections: Optional[int],
+        http_config: Optional[HttpConfig],
+    ) -> Config:
+        user_agent_extra = get_user_agent_extra_suffix()
+        client_config = Config(user_agent_extra=user_agent_extra)
+        if self.max_pool_connections is not None:
+            client_config = client_config.merge(
+                Config(max_pool_connections=self.max_pool_connections)
+            )
+        if http_config is not None:
+            client_config = client_config.merge(http_config.to_config())
+        if config is not None:
+            client_config = client_config.merge(config)
+            if config.user_agent_extra and user_agent_extra not in config.user_agent_extra:
+                # Keep the user agent of the caller along with the SageMakerCore one
+                client_config = client_config.merge(
+                    Config(user_agent_extra=f"{config.user_agent_extra} {user_agent_extra}")
+                )
+        if max_pool_connections is not None:
+            client_config = client_config.merge(Config(max_pool_connections=max_pool_connections))
+        return client_config
 
+    def _create_client(
+        self,
+        service_name: str,
+        session: Session,
+        region_name: Optional[str],
+        config: Config,
+    ) -> Any:
         if region_name is None:
             logger.warning("No region provided. Using default region.")
             region_name = session.region_name
 
-        if config is None:
-            logger.warning("No config provided. Using default config.")
-            config = Config(retries={"max_attempts": 10, "mode": "standard"})
+        return session.client(service_name, region_name, config=config)
+
+
+class SageMakerClient:
+    """
+    A class for getting the clients of the SageMaker services.
+
+    Clients are taken from a pool shared by all instances, so they are created once per session,
+    region, service and config, and only for the services that are actually used.
+    """
+
+    pool = SageMakerClientPool()
+
+    def __init__(
+        self,
+        session: Session = None,
+        region_name: str = None,
+        config: Config = None,
+        max_pool_connections: int = None,
+    ):
+        """
+        Initializes the SageMakerClient with a boto3 session, region name and client config.
 
-        self.config = Config(user_agent_extra=get_user_agent_extra_suffix())
+        Args:
+            session (Session, optional): The boto3 session. Defaults to the default session of the pool.
+            region_name (str, optional): The region name. Defaults to the region of the session.
+            config (Config, optional): The botocore config, merged into the default config.
+            max_pool_connections (int, optional): The maximum number of connections kept in the
+                HTTP connection pool of each client. Defaults to the setting of the pool.
+        """
         self.session = session
         self.region_name = region_name
-        self.sagemaker_client = session.client("sagemaker", region_name, config=self.config)
-        self.sagemaker_runtime_client = session.client(
-            "sagemaker-runtime", region_name, config=self.config
-        )
-        self.sagemaker_featurestore_runtime_client = session.client(
-            "sagemaker-featurestore-runtime", region_name, config=self.config
-        )
-        self.sagemaker_metrics_client = session.client(
-            "sagemaker-metrics", region_name, config=self.config
-        )
+        self.config = config
+        self.max_pool_connections = max_pool_connections
 
     def get_client(self, service_name: str) -> Any:
         """
@@ -371,8 +566,533 @@ class SageMakerClient(metaclass=SingletonMeta):
         Returns:
             Any: the client of that service
         """
-        service_name = service_name.replace("-", "_")
-        return getattr(self, service_name + "_client")
+        return self.pool.get_client(
+            service_name,
+            session=self.session,
+            region_name=self.region_name,
+            config=self.config,
+            max_pool_connections=self.max_pool_connections,
+        )
+
+    @property
+    def sagemaker_client(self) -> Any:
+        return self.get_client("sagemaker")
+
+    @property
+    def sagemaker_runtime_client(self) -> Any:
+        return self.get_client("sagemaker-runtime")
+
+    @property
+    def sagemaker_featurestore_runtime_client(self) -> Any:
+        return self.get_client("sagemaker-featurestore-runtime")
+
+    @property
+    def sagemaker_metrics_client(self) -> Any:
+        return self.get_client("sagemaker-metrics")
+
+
+# Error codes of throttled calls, retried with back-off by the AdaptiveConcurrencyLimiter
+THROTTLING_ERROR_CODES = ("ThrottlingException", "Throttling", "TooManyRequestsException")
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    A thread-safe limiter of the number of concurrent calls, backing off when calls are throttled.
+
+    The concurrency is halved on every throttled call, down to a single call at a time, and raised
+    by one on every other call, up to the max concurrency. Throttled calls are retried after an
+    exponential delay with full jitter.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_attempts: int = 8,
+        base_delay: float = 0.1,
+        max_delay: float = 20.0,
+    ):
+        """
+        Initializes an AdaptiveConcurrencyLimiter.
+
+        Args:
+            max_concurrency (int): The maximum number of concurrent calls.
+            max_attempts (int, optional): The maximum number of attempts of a throttled call,
+                including the first one. Defaults to 8.
+            base_delay (float, optional): The delay in seconds before the first retry.
+                Defaults to 0.1.
+            max_delay (float, optional): The maximum delay in seconds before a retry.
+                Defaults to 20.
+        """
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.concurrency = max_concurrency
+        self._active = 0
+        self._condition = threading.Condition()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call a function once fewer calls than the current concurrency are running.
+
+        Args:
+            func (Callable): The function to call.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            Any: The return value of the function.
+
+        Raises:
+            botocore.exceptions.ClientError: The error of the last attempt if the call is still
+                throttled after max_attempts, or the error of a call failing for another reason.
+        """
+        attempt = 0
+        while True:
+            with self._condition:
+                while self._active >= self.concurrency:
+                    self._condition.wait()
+                self._active += 1
+
+            throttled = False
+            try:
+                return func(*args, **kwargs)
+            except ClientError as e:
+                throttled = e.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+                attempt += 1
+                if not throttled or attempt >= self.max_attempts:
+                    raise
+            finally:
+                self._release(throttled)
+
+            time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt)))
+
+    def _release(self, throttled: bool):
+        with self._condition:
+            self._active -= 1
+            if throttled:
+                self.concurrency = max(1, self.concurrency // 2)
+            elif self.concurrency < self.max_concurrency:
+                self.concurrency += 1
+            self._condition.notify_all()
+
+
+# Maximum delay in seconds between the polls of a waiter, when backing off
+MAX_POLL_DELAY = 300
+
+
+class PollStrategy:
+    """
+    Base class of the strategies choosing the delays between the polls of waiters.
+
+    Waiters poll with a copy of the strategy they are given, reset at the start of the wait and
+    whenever the status of the resource changes, so a strategy can be shared by many waiters.
+    """
+
+    def reset(self):
+        """Reset the delays, at the start of a wait and when the status changes."""
+
+    def next_delay(self) -> float:
+        """Get the number of seconds to wait before the next poll."""
+        raise NotImplementedError
+
+    def throttled_delay(self, attempt: int) -> float:
+        """
+        Get the number of seconds to wait before polling again after a throttled poll.
+
+        Args:
+            attempt (int): The number of consecutive throttled polls, starting at 1.
+
+        Returns:
+            float: The delay, doubled on every consecutive throttled poll up to MAX_POLL_DELAY.
+        """
+        return min(self.next_delay() * 2**attempt, MAX_POLL_DELAY)
+
+
+class FixedPollStrategy(PollStrategy):
+    """Polls with the same delay, like waiters given an integer poll."""
+
+    def __init__(self, delay: float = 5):
+        """
+        Initializes a FixedPollStrategy.
+
+        Args:
+            delay (float, optional): The number of seconds between polls. Defaults to 5.
+        """
+        self.delay = delay
+
+    def next_delay(self) -> float:
+        return self.delay
+
+
+class ExponentialPollStrategy(PollStrategy):
+    """
+    Polls with delays growing exponentially up to a cap, with jitter.
+
+    The delays start again from the initial delay when the status of the resource changes, so that
+    the next transitions are noticed quickly, and grow while the status stays the same.
+
+    Example:
+        training_job.wait(poll=ExponentialPollStrategy(initial_delay=5, max_delay=120))
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 5,
+        max_delay: float = MAX_POLL_DELAY,
+        multiplier: float = 2,
+        jitter: bool = True,
+    ):
+        """
+        Initializes an ExponentialPollStrategy.
+
+        Args:
+            initial_delay (float, optional): The delay in seconds before the first poll after a
+                status change. Defaults to 5.
+            max_delay (float, optional): The maximum delay in seconds. Defaults to 300.
+            multiplier (float, optional): The factor applied to the delay after every poll.
+                Defaults to 2.
+            jitter (bool, optional): Whether to wait a random delay between half and all of the
+                delay, spreading the polls of waiters started together. Defaults to True.
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.delay = initial_delay
+
+    def reset(self):
+        self.delay = self.initial_delay
+
+    def next_delay(self) -> float:
+        delay = self.delay
+        self.delay = min(self.max_delay, self.delay * self.multiplier)
+        if self.jitter:
+            return random.uniform(delay / 2, delay)
+        return delay
+
+    def throttled_delay(self, attempt: int) -> float:
+        # The delays already grow on every poll
+        return self.next_delay()
+
+
+class Poller:
+    """
+    Polls a resource for a waiter, following a poll strategy.
+
+    Throttled polls are retried after the throttled delay of the strategy instead of failing the
+    waiter, until the timeout of the waiter.
+    """
+
+    def __init__(self, poll: Union[int, PollStrategy], timeout: Optional[int] = None):
+        """
+        Initializes a Poller.
+
+        Args:
+            poll (Union[int, PollStrategy]): The number of seconds to wait between each poll, or the
+                strategy choosing the delays between polls.
+            timeout (int, optional): The maximum number of seconds to retry throttled polls.
+                Defaults to None, retrying without a timeout.
+        """
+        if isinstance(poll, PollStrategy):
+            self.strategy = copy.copy(poll)
+        else:
+            self.strategy = FixedPollStrategy(poll)
+        self.strategy.reset()
+        self.timeout = timeout
+        self.start_time = time.time()
+        self.last_status = None
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call a poll function, retrying it while it is throttled.
+
+        Args:
+            func (Callable): The function polling the resource, e.g. its refresh method.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            Any: The return value of the function.
+
+        Raises:
+            botocore.exceptions.ClientError: The error of a call failing for another reason than
+                throttling, or still throttled after the timeout.
+        """
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in THROTTLING_ERROR_CODES:
+                    raise
+                if self.timeout is not None and time.time() - self.start_time >= self.timeout:
+                    raise
+                attempt += 1
+                delay = self.strategy.throttled_delay(attempt)
+                logger.debug(f"Poll was throttled, retrying in {delay:.1f} seconds.")
+                time.sleep(delay)
+
+    def next_delay(self, current_status: Any) -> float:
+        """
+        Get the number of seconds to wait before the next poll, resetting the strategy when the
+        status changed since the previous poll.
+
+        Args:
+            current_status (Any): The status of the resource at this poll.
+
+        Returns:
+            float: The delay before the next poll.
+        """
+        if current_status != self.last_status:
+            self.last_status = current_status
+            self.strategy.reset()
+        return self.strategy.next_delay()
+
+    def sleep(self, current_status: Any):
+        """
+        Wait before the next poll.
+
+        Args:
+            current_status (Any): The status of the resource at this poll.
+        """
+        time.sleep(self.next_delay(current_status))
+
+
+# Environment variable enabling ("true") or disabling ("false") the Rich display of waiters
+WAITER_DISPLAY_ENV_VAR = "SAGEMAKER_CORE_WAITER_DISPLAY"
+
+waiter_display_enabled = None
+
+
+def configure_waiter_display(display: Optional[bool] = None):
+    """Enable or disable the Rich display of waiters globally.
+
+    Usage:
+        Disable the display in batch jobs, whose output is not read interactively
+        configure_waiter_display(False)
+
+    Args:
+        display (bool, optional): Whether waiters display the status of resources in a Rich Live
+            panel, unless a waiter is given its own display argument. Defaults to None, enabling
+            the display if the SAGEMAKER_CORE_WAITER_DISPLAY environment variable is "true", or if
+            it is not set and the console is interactive.
+    """
+    global waiter_display_enabled
+    waiter_display_enabled = display
+
+
+def is_waiter_display_enabled(display: Optional[bool] = None) -> bool:
+    """
+    Whether a waiter displays the status of resources in a Rich Live panel.
+
+    Args:
+        display (bool, optional): The display argument of the waiter. Defaults to None, following
+            the global setting of configure_waiter_display.
+
+    Returns:
+        bool: Whether the waiter displays the status of resources.
+    """
+    if display is not None:
+        return display
+    if waiter_display_enabled is not None:
+        return waiter_display_enabled
+    if env_display := os.environ.get(WAITER_DISPLAY_ENV_VAR):
+        return env_display.strip().lower() in ("1", "true", "yes", "on")
+    console = get_console()
+    return console.is_terminal or console.is_jupyter
+
+
+class WaiterDisplay:
+    """
+    Displays the status of a resource waited for in a Rich Live panel.
+
+    Without display, e.g. in non-interactive environments, no Rich renderable is built and the
+    status of every poll is only passed to the status callback.
+
+    Example:
+        with WaiterDisplay("Waiting...", display, status_callback) as waiter_display:
+            waiter_display.update(current_status)
+    """
+
+    def __init__(
+        self,
+        description: str,
+        display: Optional[bool] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        transient: bool = True,
+    ):
+        """
+        Initializes a WaiterDisplay.
+
+        Args:
+            description (str): The description of the wait shown next to its spinner.
+            display (bool, optional): Whether to display the status in a Rich Live panel. Defaults
+                to None, following is_waiter_display_enabled.
+            status_callback (Callable[[str], None], optional): A function called with the status
+                of the resource at every poll. Defaults to None.
+            transient (bool, optional): Whether the panel is removed once the wait ends. Defaults
+                to True.
+        """
+        self.description = description
+        self.display = is_waiter_display_enabled(display)
+        self.status_callback = status_callback
+        self.transient = transient
+        self.status = None
+        self.live = None
+
+    def __enter__(self) -> "WaiterDisplay":
+        if self.display:
+            progress = Progress(
+                SpinnerColumn("bouncingBar"),
+                TextColumn("{task.description}"),
+                TimeElapsedColumn(),
+            )
+            progress.add_task(self.description)
+            self.status = Status("Current status:")
+            self.live = Live(
+                Panel(
+                    Group(progress, self.status),
+                    title="Wait Log Panel",
+                    border_style=Style(color=Color.BLUE.value),
+                ),
+                transient=self.transient,
+            )
+            self.live.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.live is not None:
+            self.live.__exit__(exc_type, exc_value, traceback)
+            self.live = None
+
+    def update(self, current_status: str):
+        """
+        Show the status of the resource at the current poll.
+
+        Args:
+            current_status (str): The status of the resource.
+        """
+        if self.status is not None:
+            self.status.update(f"Current status: [bold]{current_status}")
+        if self.status_callback is not None:
+            self.status_callback(current_status)
+
+
+# Default maximum number of threads of the async bridge
+ASYNC_BRIDGE_MAX_WORKERS = 64
+
+
+class AsyncBridge:
+    """
+    Runs the blocking calls of the asynchronous resource methods on a thread pool.
+
+    The thread pool is shared by all event loops and created on first use. It is separate from the
+    default executor of the event loop, so that many concurrent waiters do not starve it.
+    """
+
+    def __init__(self, max_workers: int = ASYNC_BRIDGE_MAX_WORKERS):
+        """
+        Initializes an AsyncBridge.
+
+        Args:
+            max_workers (int, optional): The maximum number of blocking calls run concurrently.
+                Defaults to ASYNC_BRIDGE_MAX_WORKERS.
+        """
+        self.max_workers = max_workers
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def configure(self, max_workers: int):
+        """
+        Set the maximum number of blocking calls run concurrently.
+
+        The current thread pool completes the calls already submitted to it, and the next calls
+        are run on a new thread pool.
+
+        Args:
+            max_workers (int): The maximum number of blocking calls run concurrently.
+        """
+        with self.lock:
+            self.max_workers = max_workers
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool of the bridge, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The thread pool running the blocking calls.
+        """
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="sagemaker-core-async"
+                )
+            return self.executor
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the thread pool, without blocking the event loop.
+
+        The function runs in a copy of the context of the calling coroutine, like asyncio.to_thread.
+
+        Args:
+            func (Callable): The blocking function.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            Any: The return value of the function.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.get_executor(), partial(context.run, func, *args, **kwargs)
+        )
+
+
+ASYNC_BRIDGE = AsyncBridge()
+
+
+async def run_async(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking function on the thread pool of the async bridge.
+
+    Args:
+        func (Callable): The blocking function.
+        *args: The positional arguments of the function.
+        **kwargs: The keyword arguments of the function.
+
+    Returns:
+        Any: The return value of the function.
+    """
+    return await ASYNC_BRIDGE.run(func, *args, **kwargs)
+
+
+# Interval in seconds at which a prefetching thread blocked on a full queue checks if it was stopped
+PREFETCH_POLL_INTERVAL = 0.5
+
+
+# Lower bound of the creation time windows of sharded listings without CreationTimeAfter
+SHARDING_START_TIME = datetime.datetime(2017, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Padding of the inner creation time bounds of sharded listings
+SHARD_BOUND_PADDING = datetime.timedelta(seconds=1)
+
+# Number of summaries per page of sharded listings without MaxResults
+SHARDED_PAGE_SIZE = 100
+
+# Sort order of sharded listings without SortOrder, as list methods default to different orders
+SHARDED_SORT_ORDER = "Ascending"
+
+# Maximum number of pages buffered per window of sharded listings without prefetch_pages
+SHARD_PREFETCH_PAGES = 2
+
+# Member types exported as JSON strings by the columnar exports, instead of flattened columns
+JSON_COLUMN_TYPES = ("list", "map", "structure")
 
 
 class ResourceIterator(Generic[T]):
@@ -388,6 +1108,12 @@ class ResourceIterator(Generic[T]):
         list_method_kwargs: dict = {},
         custom_key_mapping: dict = None,
         extract_name_mapping: dict = None,
+        hydrate: bool = False,
+        hydrate_concurrency: Optional[int] = None,
+        prefetch_pages: int = 0,
+        parallel_shards: Optional[int] = None,
+        session: Optional[Session] = None,
+        region_name: Optional[str] = None,
     ):
         """Initialize a ResourceIterator object
 
@@ -400,19 +1126,42 @@ class ResourceIterator(Generic[T]):
             list_method_kwargs (dict, optional): The kwargs used to make list method calls. Defaults to {}.
             custom_key_mapping (dict, optional): The custom key mapping used to map keys from summary object to those expected from resource object during initialization. Defaults to None.
             extract_name_mapping (dict, optional): The extract name mapping used to extract names from arn in summary object and map to those expected from resource object during initialization. Defaults to None.
+            hydrate (bool, optional): Whether to refresh every resource object before returning it. Otherwise resource objects only hold the fields of their summary, and the other fields are loaded on first access. Defaults to False.
+            hydrate_concurrency (int, optional): The maximum number of resource objects of a page refreshed concurrently, backing off when refreshes are throttled. Implies hydrate. Defaults to None, refreshing resource objects one at a time.
+            prefetch_pages (int, optional): The maximum number of pages listed ahead on a background thread while the current page is iterated. Defaults to 0, listing every page once the previous one is consumed.
+            parallel_shards (int, optional): The number of creation time windows listed concurrently, splitting the range between the CreationTimeAfter and CreationTimeBefore list method kwargs. The windows are listed and their summaries merged in the order of the SortBy and SortOrder list method kwargs, in ascending order if SortOrder is not set. Pages of windows not iterated yet are buffered, up to prefetch_pages pages per window, or 2 if not set. Defaults to None, listing every page in sequence.
+            session (Session, optional): The boto3 session the client was created with, kept by the resource objects to refresh them with the clients of that session. Defaults to None.
+            region_name (str, optional): The region name the client was created with, kept by the resource objects to refresh them in that region. Defaults to None.
         """
         self.summaries_key = summaries_key
         self.summary_name = summary_name
         self.client = client
+        self.session = session
+        self.region_name = region_name
         self.list_method = list_method
         self.list_method_kwargs = list_method_kwargs
         self.custom_key_mapping = custom_key_mapping
         self.extract_name_mapping = extract_name_mapping
+        self.hydrate = hydrate or bool(hydrate_concurrency)
+        self.hydrate_concurrency = hydrate_concurrency
+        self.hydrate_limiter = (
+            AdaptiveConcurrencyLimiter(hydrate_concurrency) if hydrate_concurrency else None
+        )
+        self.prefetch_pages = prefetch_pages
+        self.page_queue = None
+        self.prefetch_stop = None
+        self.parallel_shards = parallel_shards
+        self.shard_pages = None
+        self.shards_exhausted = False
 
         self.resource_cls = resource_cls
         self.index = 0
         self.summary_list = []
+        self.resource_list = None
         self.next_token = None
+        self.page_token = None
+        self.page_listed = False
+        self.resume_index = 0
 
     def __iter__(self):
         return self
@@ -425,61 +1174,700 @@ class ResourceIterator(Generic[T]):
             summary = self.summary_list[self.index]
             self.index += 1
 
-            # Initialize the resource object
-            if is_primitive_class(self.resource_cls):
-                # If the resource class is a primitive class, there will be only one element in the summary
-                resource_object = list(summary.values())[0]
-            else:
-                # Transform the resource summary into format to initialize object
-                init_data = transform(summary, self.summary_name)
-
-                if self.custom_key_mapping:
-                    init_data = {self.custom_key_mapping.get(k, k): v for k, v in init_data.items()}
-
-                # Extract name from arn. Currently implemented for HubContent and ImageVersion
-                if self.extract_name_mapping:
-                    for arn, target in self.extract_name_mapping.items():
-                        name = init_data[arn].split(target[0])[1].split("/")[0]
-                        init_data.update({target[1]: name})
-
-                # Filter out the fields that are not in the resource class
-                fields = self.resource_cls.__annotations__
-                init_data = {k: v for k, v in init_data.items() if k in fields}
+            # Resource objects of the page were already built and refreshed concurrently
+            if self.resource_list is not None:
+                return self.resource_list[self.index - 1]
 
-                resource_object = self.resource_cls(**init_data)
+            resource_object = self._build_resource_object(summary)
 
-            # If the resource object has refresh method, refresh and return it
+            # If the resource object has refresh method, refresh it now or on first access of a field
+            # not in the summary
             if hasattr(resource_object, "refresh"):
-                resource_object.refresh()
+                if self.hydrate:
+                    resource_object.refresh()
+                else:
+                    fields = type(resource_object).model_fields
+                    for field_name in fields.keys() - resource_object.model_fields_set:
+                        resource_object.__dict__.pop(field_name, None)
             return resource_object
 
-        # If index reached the end of summary_list, and there is no next token, raise StopIteration
+        # If index reached the end of summary_list, and there is no next page, raise StopIteration
         elif (
             len(self.summary_list) > 0
             and self.index >= len(self.summary_list)
-            and (not self.next_token)
+            and (not self._has_next_page())
         ):
             raise StopIteration
 
         # Otherwise, get the next page of summaries by calling the list method with the next token if available
         else:
-            if self.next_token:
-                response = getattr(self.client, self.list_method)(
-                    NextToken=self.next_token, **self.list_method_kwargs
-                )
-            else:
-                response = getattr(self.client, self.list_method)(**self.list_method_kwargs)
-
-            self.summary_list = response.get(self.summaries_key, [])
-            self.next_token = response.get("NextToken", None)
-            self.index = 0
+            self._list_next_page()
 
             # If list_method returned an empty list, raise StopIteration
             if len(self.summary_list) == 0:
                 raise StopIteration
 
+            if (
+                self.hydrate_limiter
+                and hasattr(self.resource_cls, "refresh")
+                and self.index < len(self.summary_list)
+            ):
+                # A resumed page only refreshes the resource objects not returned before
+                self.resource_list = [None] * self.index + self._hydrate_concurrently(
+                    self.summary_list[self.index :]
+                )
+
             return self.__next__()
 
+    def pages(self, transformed: bool = False) -> Iterator[List[dict]]:
+        """
+        Iterate over the pages of summaries, without building resource objects.
+
+        Continues from the position of the iterator, starting with the summaries of the current page
+        that were not returned yet.
+
+        Args:
+            transformed (bool, optional): Whether to transform the summaries into dicts with
+                snake_case keys. Defaults to False, yielding the summaries of the list responses.
+
+        Yields:
+            List[dict]: The summaries of a page.
+        """
+        while True:
+            if self.index >= len(self.summary_list):
+                if len(self.summary_list) > 0 and not self._has_next_page():
+                    return
+                self._list_next_page()
+                if len(self.summary_list) == 0:
+                    return
+                continue
+
+            summaries = self.summary_list[self.index :]
+            self.index = len(self.summary_list)
+            if transformed:
+                summaries = [transform(summary, self.summary_name) for summary in summaries]
+            yield summaries
+
+    def summaries(self) -> Iterator[Any]:
+        """
+        Iterate over the summaries as summary shapes, without building resource objects.
+
+        Yields:
+            Any: The summary shape of a listed resource, or the value of the summary if the
+                resource class is a primitive class.
+        """
+        # Imported here, shapes depends on this module
+        from sagemaker_core.main import shapes
+
+        summary_cls = None
+        if not is_primitive_class(self.resource_cls):
+            summary_cls = getattr(shapes, self.summary_name)
+
+        for page in self.pages():
+            for summary in page:
+                if summary_cls is None:
+                    yield list(summary.values())[0]
+                else:
+                    yield build_from_response(summary_cls, transform(summary, self.summary_name))
+
+    def column_pages(self, columns: Optional[List[str]] = None) -> Iterator[Dict[str, list]]:
+        """
+        Iterate over the pages of summaries as columns, without building resource objects.
+
+        Nested shapes of the summaries are flattened into columns with dotted snake_case names,
+        e.g. warm_pool_status.status. Lists and maps are kept as JSON strings.
+
+        Args:
+            columns (List[str], optional): The names of the columns, or of nested shapes to get all
+                their columns. Defaults to all the columns of the summary shape.
+
+        Yields:
+            Dict[str, list]: The values of the summaries of a page, by column name.
+
+        Raises:
+            ValueError: If a column is not a member of the summary shape.
+        """
+        summary_columns = self._get_summary_columns(columns)
+        for page in self.pages():
+            yield {
+                name: _get_column_values(page, path, member_type)
+                for name, path, member_type in summary_columns
+            }
+
+    def to_table(self, columns: Optional[List[str]] = None) -> Any:
+        """
+        Get the summaries as a pyarrow Table, built from the columns of every page.
+
+        Requires the optional pyarrow dependency.
+
+        Args:
+            columns (List[str], optional): The names of the columns, or of nested shapes to get all
+                their columns. Defaults to all the columns of the summary shape.
+
+        Returns:
+            pyarrow.Table: The table of the summaries.
+        """
+        pyarrow = _import_pyarrow()
+        schema = self._get_arrow_schema(pyarrow, columns)
+        batches = [
+            pyarrow.RecordBatch.from_pydict(page, schema=schema)
+            for page in self.column_pages(columns)
+        ]
+        return pyarrow.Table.from_batches(batches, schema=schema)
+
+    def to_parquet(self, path: str, columns: Optional[List[str]] = None, **kwargs) -> int:
+        """
+        Write the summaries to a Parquet file, one page at a time.
+
+        Requires the optional pyarrow dependency.
+
+        Args:
+            path (str): The path of the Parquet file.
+            columns (List[str], optional): The names of the columns, or of nested shapes to get all
+                their columns. Defaults to all the columns of the summary shape.
+            **kwargs: The options of the pyarrow.parquet.ParquetWriter, e.g. compression.
+
+        Returns:
+            int: The number of rows written.
+        """
+        pyarrow = _import_pyarrow()
+        import pyarrow.parquet
+
+        schema = self._get_arrow_schema(pyarrow, columns)
+        rows = 0
+        with pyarrow.parquet.ParquetWriter(path, schema, **kwargs) as writer:
+            for page in self.column_pages(columns):
+                batch = pyarrow.RecordBatch.from_pydict(page, schema=schema)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        return rows
+
+    def to_csv(self, path: str, columns: Optional[List[str]] = None) -> int:
+        """
+        Write the summaries to a CSV file with a header row, one page at a time.
+
+        Timestamps are written in ISO 8601 format and missing values as empty fields.
+
+        Args:
+            path (str): The path of the CSV file.
+            columns (List[str], optional): The names of the columns, or of nested shapes to get all
+                their columns. Defaults to all the columns of the summary shape.
+
+        Returns:
+            int: The number of rows written.
+        """
+        names = [name for name, _, _ in self._get_summary_columns(columns)]
+        rows = 0
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            for page in self.column_pages(columns):
+                page_rows = list(zip(*(map(_to_csv_value, page[name]) for name in names)))
+                writer.writerows(page_rows)
+                rows += len(page_rows)
+        return rows
+
+    def checkpoint(self) -> dict:
+        """
+        Get the position of the iterator as a JSON serializable state, to resume iterating from it.
+
+        The state holds the token of the current page and the number of its summaries already
+        returned, so resuming lists the current page again instead of every page before it.
+
+        Returns:
+            dict: The state to resume iterating from with ResourceIterator.resume.
+
+        Raises:
+            ValueError: If the iterator lists parallel shards, as their merged pages have no token.
+        """
+        if self.parallel_shards:
+            raise ValueError("Can not checkpoint a ResourceIterator listing parallel shards.")
+
+        if not self.page_listed:
+            page_token, index = self.next_token, self.resume_index
+        elif self.index >= len(self.summary_list) and self.next_token:
+            page_token, index = self.next_token, 0
+        else:
+            page_token, index = self.page_token, self.index
+
+        return {
+            "resource_cls": self.resource_cls.__name__,
+            "summaries_key": self.summaries_key,
+            "summary_name": self.summary_name,
+            "list_method": self.list_method,
+            "list_method_kwargs": _to_checkpoint_value(self.list_method_kwargs),
+            "custom_key_mapping": self.custom_key_mapping,
+            "extract_name_mapping": self.extract_name_mapping,
+            "hydrate": self.hydrate,
+            "hydrate_concurrency": self.hydrate_concurrency,
+            "prefetch_pages": self.prefetch_pages,
+            "page_token": page_token,
+            "index": index,
+        }
+
+    @classmethod
+    def resume(
+        cls,
+        state: dict,
+        client: Any = None,
+        session: Optional[Session] = None,
+        region_name: Optional[str] = None,
+    ) -> "ResourceIterator":
+        """
+        Create an iterator continuing from a state returned by checkpoint.
+
+        Args:
+            state (dict): The state returned by checkpoint.
+            client (Any, optional): The sagemaker client object used to make list method calls.
+                Defaults to the sagemaker client of the session and region.
+            session (Session, optional): The boto3 session, when no client is given.
+            region_name (str, optional): The region name, when no client is given.
+
+        Returns:
+            ResourceIterator: An iterator starting with the first resource not returned before the
+                checkpoint.
+        """
+        if client is None:
+            client = SageMakerClient(session=session, region_name=region_name).get_client(
+                service_name="sagemaker"
+            )
+
+        iterator = cls(
+            client=client,
+            summaries_key=state["summaries_key"],
+            summary_name=state["summary_name"],
+            resource_cls=_get_checkpointed_class(state["resource_cls"]),
+            list_method=state["list_method"],
+            list_method_kwargs=state["list_method_kwargs"],
+            custom_key_mapping=state.get("custom_key_mapping"),
+            extract_name_mapping=state.get("extract_name_mapping"),
+            hydrate=state.get("hydrate", False),
+            hydrate_concurrency=state.get("hydrate_concurrency"),
+            prefetch_pages=state.get("prefetch_pages", 0),
+            session=session,
+            region_name=region_name,
+        )
+        iterator.next_token = state.get("page_token")
+        iterator.resume_index = state.get("index", 0)
+        return iterator
+
+    def close(self):
+        """Stop listing pages ahead on the background thread."""
+        if self.prefetch_stop is not None:
+            self.prefetch_stop.set()
+        self.page_queue = None
+        self.prefetch_stop = None
+
+    def __del__(self):
+        self.close()
+
+    def _has_next_page(self) -> bool:
+        """Whether there may be a page after the current page."""
+        if self.parallel_shards:
+            return not self.shards_exhausted
+        return bool(self.next_token)
+
+    def _list_next_page(self):
+        """List the page of the next token, and make it the current page."""
+        self.page_token = self.next_token
+        self.page_listed = True
+        if self.parallel_shards:
+            if self.shard_pages is None:
+                self.shard_pages = self._list_shards()
+            summaries = next(self.shard_pages, None)
+            self.shards_exhausted = summaries is None
+            response = {self.summaries_key: summaries or []}
+        elif self.prefetch_pages:
+            response = self._get_prefetched_page()
+        elif self.next_token:
+            response = getattr(self.client, self.list_method)(
+                NextToken=self.next_token, **self.list_method_kwargs
+            )
+        else:
+            response = getattr(self.client, self.list_method)(**self.list_method_kwargs)
+
+        self.summary_list = response.get(self.summaries_key, [])
+        self.next_token = response.get("NextToken", None)
+        # A resumed iterator skips the summaries of its first page returned before the checkpoint
+        self.index = min(self.resume_index, len(self.summary_list))
+        self.resume_index = 0
+        self.resource_list = None
+
+    def _get_prefetched_page(self) -> dict:
+        """Get the next page listed on the background thread, starting it on the first page."""
+        if self.page_queue is None:
+            self.page_queue = queue.Queue(maxsize=self.prefetch_pages)
+            self.prefetch_stop = threading.Event()
+            # The thread does not reference the iterator, so that abandoned iterators are closed
+            threading.Thread(
+                target=_prefetch_pages,
+                args=(
+                    getattr(self.client, self.list_method),
+                    self.list_method_kwargs,
+                    self.summaries_key,
+                    self.next_token,
+                    self.page_queue,
+                    self.prefetch_stop,
+                ),
+                daemon=True,
+            ).start()
+
+        page = self.page_queue.get()
+        if isinstance(page, Exception):
+            self.close()
+            raise page
+        if not page.get("NextToken") or not page.get(self.summaries_key):
+            # The background thread stopped after the last page
+            self.close()
+        return page
+
+    def _list_shards(self) -> Iterator[List[dict]]:
+        """List the creation time windows concurrently, yielding pages of their merged summaries."""
+        after = _as_utc(self.list_method_kwargs.get("CreationTimeAfter") or SHARDING_START_TIME)
+        before = _as_utc(
+            self.list_method_kwargs.get("CreationTimeBefore")
+            or datetime.datetime.now(datetime.timezone.utc)
+        )
+        width = (before - after) / self.parallel_shards
+        bounds = [after + width * shard for shard in range(self.parallel_shards)] + [before]
+
+        # Every window is listed in the same explicit order, which the windows are then merged in
+        sort_order = self.list_method_kwargs.get("SortOrder") or SHARDED_SORT_ORDER
+        descending = str(sort_order).lower() == "descending"
+
+        self.prefetch_stop = threading.Event()
+        shards = []
+        for shard in range(self.parallel_shards):
+            lower = bounds[shard] if shard > 0 else None
+            upper = bounds[shard + 1] if shard < self.parallel_shards - 1 else None
+            list_method_kwargs = dict(self.list_method_kwargs, SortOrder=sort_order)
+            # Inner bounds are padded, whatever the service considers inclusive, and the summaries
+            # are then assigned to a single window by their creation time
+            if lower is not None:
+                list_method_kwargs["CreationTimeAfter"] = lower - SHARD_BOUND_PADDING
+            if upper is not None:
+                list_method_kwargs["CreationTimeBefore"] = upper + SHARD_BOUND_PADDING
+            pages = queue.Queue(maxsize=self.prefetch_pages or SHARD_PREFETCH_PAGES)
+            threading.Thread(
+                target=_prefetch_pages,
+                args=(
+                    getattr(self.client, self.list_method),
+                    list_method_kwargs,
+                    self.summaries_key,
+                    None,
+                    pages,
+                    self.prefetch_stop,
+                ),
+                daemon=True,
+            ).start()
+            shards.append(self._get_shard_summaries(pages, lower, upper))
+
+        sort_by = self.list_method_kwargs.get("SortBy")
+        # Sort by values are either PascalCase or UPPER_SNAKE_CASE names of the summary members
+        sort_field = sort_by.title().replace("_", "") if sort_by and sort_by.isupper() else sort_by
+        if sort_field is None or sort_field == "CreationTime":
+            # The windows do not overlap, so they are iterated one after the other
+            if descending:
+                shards.reverse()
+            summaries = itertools.chain.from_iterable(shards)
+        else:
+            sort_fields = (sort_field, f"{self.resource_cls.__name__}{sort_field}")
+
+            def sort_key(summary):
+                # Summaries prefix some members with the resource name, e.g. TrainingJobName
+                key = next((key for key in sort_fields if key in summary), None) or next(
+                    (key for key in summary if key.endswith(sort_field)), None
+                )
+                value = summary.get(key) if key else None
+                return (value is None, value if value is not None else "")
+
+            summaries = heapq.merge(*shards, key=sort_key, reverse=descending)
+
+        page_size = self.list_method_kwargs.get("MaxResults") or SHARDED_PAGE_SIZE
+        page = []
+        for summary in summaries:
+            page.append(summary)
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+        self.close()
+
+    def _get_shard_summaries(
+        self,
+        pages: queue.Queue,
+        lower: Optional[datetime.datetime],
+        upper: Optional[datetime.datetime],
+    ) -> Iterator[dict]:
+        """Get the summaries of a window listed on a background thread, created within its bounds."""
+        while True:
+            page = pages.get()
+            if isinstance(page, Exception):
+                self.close()
+                raise page
+            for summary in page.get(self.summaries_key, []):
+                creation_time = summary.get("CreationTime")
+                if creation_time is not None:
+                    creation_time = _as_utc(creation_time)
+                    if (lower is not None and creation_time < lower) or (
+                        upper is not None and creation_time >= upper
+                    ):
+                        continue
+                yield summary
+            if not page.get("NextToken") or not page.get(self.summaries_key):
+                return
+
+    def _get_summary_columns(self, columns: Optional[List[str]]) -> List[tuple]:
+        """Get the (name, member path, member type) of the selected columns of the summary shape."""
+        summary_columns = _get_shape_columns(self.summary_name)
+        if columns is None:
+            return list(summary_columns)
+
+        selected = []
+        for column in columns:
+            matched = [
+                summary_column
+                for summary_column in summary_columns
+                if summary_column[0] == column or summary_column[0].startswith(f"{column}.")
+            ]
+            if not matched:
+                raise ValueError(f"{column} is not a column of {self.summary_name}.")
+            selected.extend(matched)
+        return selected
+
+    def _get_arrow_schema(self, pyarrow: Any, columns: Optional[List[str]]) -> Any:
+        """Get the pyarrow schema of the selected columns of the summary shape."""
+        arrow_types = {
+            "boolean": pyarrow.bool_(),
+            "integer": pyarrow.int64(),
+            "long": pyarrow.int64(),
+            "float": pyarrow.float64(),
+            "double": pyarrow.float64(),
+            "timestamp": pyarrow.timestamp("us", tz="UTC"),
+            "blob": pyarrow.binary(),
+        }
+        return pyarrow.schema(
+            [
+                (name, arrow_types.get(member_type, pyarrow.string()))
+                for name, _, member_type in self._get_summary_columns(columns)
+            ]
+        )
+
+    def _build_resource_object(self, summary: dict) -> T:
+        """Build the resource object of a summary, holding only the fields of the summary."""
+        if is_primitive_class(self.resource_cls):
+            # If the resource class is a primitive class, there will be only one element in the summary
+            return list(summary.values())[0]
+
+        # Transform the resource summary into format to initialize object
+        init_data = transform(summary, self.summary_name)
+
+        if self.custom_key_mapping:
+            init_data = {self.custom_key_mapping.get(k, k): v for k, v in init_data.items()}
+
+        # Extract name from arn. Currently implemented for HubContent and ImageVersion
+        if self.extract_name_mapping:
+            for arn, target in self.extract_name_mapping.items():
+                name = init_data[arn].split(target[0])[1].split("/")[0]
+                init_data.update({target[1]: name})
+
+        # Filter out the fields that are not in the resource class
+        fields = self.resource_cls.__annotations__
+        init_data = {k: v for k, v in init_data.items() if k in fields}
+
+        resource_object = build_from_response(self.resource_cls, init_data)
+        # Resource objects are refreshed, when hydrated or on first access, in the session and
+        # region they were listed in
+        if hasattr(resource_object, "refresh"):
+            resource_object._set_client_context(session=self.session, region_name=self.region_name)
+        return resource_object
+
+    def _hydrate_concurrently(self, summaries: List[dict]) -> List[T]:
+        """Build and refresh the resource objects of a page in a thread pool, keeping the order."""
+        resource_objects = [self._build_resource_object(summary) for summary in summaries]
+        with ThreadPoolExecutor(
+            max_workers=min(self.hydrate_concurrency, len(resource_objects))
+        ) as executor:
+            # Refresh in a copy of the context of the caller, as AsyncBridge.run does
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self.hydrate_limiter.call,
+                    resource_object.refresh,
+                )
+                for resource_object in resource_objects
+            ]
+            # Consume the results to raise the first error of a refresh
+            for future in futures:
+                future.result()
+        return resource_objects
+
+
+class AsyncResourceIterator(Generic[T]):
+    """
+    Asynchronous iterator over the resources of a ResourceIterator.
+
+    Listing pages and hydrating resources run on the thread pool of the async bridge, while the
+    resources of a page already listed are returned without leaving the event loop.
+
+    Example:
+        async for training_job in TrainingJob.aget_all(status_equals="InProgress"):
+            print(training_job.training_job_name)
+    """
+
+    def __init__(self, iterator: ResourceIterator[T]):
+        """
+        Initializes an AsyncResourceIterator.
+
+        Args:
+            iterator (ResourceIterator[T]): The iterator listing the resources.
+        """
+        self.iterator = iterator
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> T:
+        iterator = self.iterator
+        # The next resource was already listed, and building it does not call the service
+        if iterator.index < len(iterator.summary_list) and (
+            iterator.resource_list is not None or not iterator.hydrate
+        ):
+            return next(iterator)
+
+        # StopIteration cannot be raised through a future, the end is marked by the iterator itself
+        resource = await run_async(next, iterator, iterator)
+        if resource is iterator:
+            raise StopAsyncIteration
+        return resource
+
+
+def _to_checkpoint_value(value: Any) -> Any:
+    """Convert list method kwargs to JSON serializable values, datetimes to ISO 8601 strings."""
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _to_checkpoint_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_checkpoint_value(item) for item in value]
+    return value
+
+
+def _get_checkpointed_class(name: str) -> Type:
+    """Get the resource, shape or primitive class of a ResourceIterator checkpoint by its name."""
+    for primitive_cls in (str, int, bool, float, datetime.datetime):
+        if primitive_cls.__name__ == name:
+            return primitive_cls
+
+    # Imported here, resources and shapes depend on this module
+    from sagemaker_core.main import resources, shapes
+
+    resource_cls = getattr(resources, name, None) or getattr(shapes, name, None)
+    if resource_cls is None:
+        raise ValueError(f"Unknown resource class {name} in ResourceIterator checkpoint.")
+    return resource_cls
+
+
+@lru_cache(maxsize=None)
+def _get_shape_columns(shape_name: str) -> tuple:
+    """Get the (name, member path, member type) of the flattened columns of a summary shape."""
+    if shape_name not in SHAPE_DAG:
+        # Summaries of primitive resource classes hold a single member named after the shape
+        return ((pascal_to_snake(shape_name), (shape_name,), "string"),)
+
+    columns = []
+
+    def add_columns(shape_name: str, prefix: str, path: tuple, parent_shapes: set):
+        for member in SHAPE_DAG[shape_name]["members"]:
+            name = prefix + pascal_to_snake(member["name"])
+            member_path = path + (member["name"],)
+            # Recursive shapes are kept as JSON strings, like lists and maps
+            if member["type"] == "structure" and member["shape"] not in parent_shapes:
+                add_columns(
+                    member["shape"], f"{name}.", member_path, parent_shapes | {member["shape"]}
+                )
+            else:
+                columns.append((name, member_path, member["type"]))
+
+    add_columns(shape_name, "", (), {shape_name})
+    return tuple(columns)
+
+
+def _get_column_values(summaries: List[dict], path: tuple, member_type: str) -> list:
+    """Get the values of a column of a page of summaries, None where the member is missing."""
+    values = []
+    for summary in summaries:
+        value = summary
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None and member_type in JSON_COLUMN_TYPES:
+            value = json.dumps(value, default=str)
+        values.append(value)
+    return values
+
+
+def _to_csv_value(value: Any) -> Any:
+    """Convert a column value to a CSV field, timestamps to ISO 8601 strings."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow, an optional dependency only required by the Arrow and Parquet exports."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required to export resources to Arrow tables and Parquet files. "
+            "Install it with: pip install 'sagemaker-core[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def _as_utc(value: datetime.datetime) -> datetime.datetime:
+    """Get a timezone aware datetime, taking naive datetimes as UTC like botocore does."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def _prefetch_pages(
+    list_method: Callable,
+    list_method_kwargs: dict,
+    summaries_key: str,
+    next_token: Optional[str],
+    pages: queue.Queue,
+    stop: threading.Event,
+):
+    """List pages into a bounded queue until the last page is listed or stop is set."""
+    while True:
+        try:
+            if next_token:
+                page = list_method(NextToken=next_token, **list_method_kwargs)
+            else:
+                page = list_method(**list_method_kwargs)
+            next_token = page.get("NextToken", None)
+            last_page = not next_token or not page.get(summaries_key)
+        except Exception as e:
+            # Raised by the iterator when it gets to this page
+            page, last_page = e, True
+
+        while True:
+            if stop.is_set():
+                return
+            try:
+                pages.put(page, timeout=PREFETCH_POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+
+        if last_page:
+            return
+
 
 def serialize(value: Any) -> Any:
     """
@@ -540,6 +1928,21 @@ def _serialize_list(value: List) -> list:
     return serialized_list
 
 
+@lru_cache(maxsize=NAME_CONVERSION_CACHE_SIZE)
+def _shape_attribute_to_member_name(attribute_name: str) -> str:
+    """
+    Convert a shape attribute name that is missing from the name table to its member name
+
+    Args:
+       attribute_name (str): The attribute name of the shape
+
+    Returns:
+        str: The member name used in requests
+    """
+    key = snake_to_pascal(attribute_name) if is_snake_case(attribute_name) else attribute_name
+    return key[0].upper() + key[1:]
+
+
 def _serialize_shape(value: Any) -> dict:
     """
     Serialize a shape object defined in resource.py or shape.py to a dict
@@ -553,6 +1956,6 @@ def _serialize_shape(value: Any) -> dict:
     serialized_dict = {}
     for k, v in vars(value).items():
         if serialize_result := serialize(v):
-            key = snake_to_pascal(k) if is_snake_case(k) else k
-            serialized_dict.update({key[0].upper() + key[1:]: serialize_result})
+            key = SNAKE_TO_PASCAL_NAMES.get(k) or _shape_attribute_to_member_name(k)
+            serialized_dict.update({key: serialize_result})
     return serialized_dict
@@ -0,0 +1,377 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Waiters polling many resources from a single poller, and asynchronous waiters."""
+
+import asyncio
+import contextlib
+import contextvars
+import time
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Literal, Optional, Union
+from botocore.exceptions import ClientError
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
+from rich.status import Status
+from rich.style import Style
+from sagemaker_core.main.code_injection.constants import Color
+from sagemaker_core.main.exceptions import (
+    DeleteFailedStatusError,
+    FailedStatusError,
+    TimeoutExceededError,
+)
+from sagemaker_core.main.utils import (
+    AdaptiveConcurrencyLimiter,
+    Poller,
+    PollStrategy,
+    Unassigned,
+    get_textual_rich_logger,
+    is_waiter_display_enabled,
+    run_async,
+)
+
+logger = get_textual_rich_logger(__name__)
+
+
+@dataclass
+class WaitResult:
+    """
+    The outcome of waiting for a resource with wait_all.
+
+    Attributes:
+        resource: The resource waited for.
+        status: The last status of the resource.
+        error: The error of the resource, if it reached a failed state, timed out or failed to be
+            refreshed.
+    """
+
+    resource: Any
+    status: Optional[str] = None
+    error: Optional[Exception] = None
+
+
+def wait_all(
+    resources: List[Any],
+    target_status: Optional[str] = None,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+    max_concurrency: int = 10,
+    on_failure: Literal["raise", "return"] = "raise",
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[Any, str], None]] = None,
+) -> List[WaitResult]:
+    """
+    Wait for many resources at once, refreshing all of them from a single poller.
+
+    Every poll refreshes the resources still waited for in a bounded thread pool, backing off when
+    the describe calls are throttled, and a single panel shows the progress of all of them. A
+    resource is no longer refreshed once it reaches the target status, or a terminal state of its
+    wait method if no target status is given.
+
+    Example:
+        results = wait_all(TrainingJob.get_all(status_equals="InProgress"), timeout=3600)
+
+    Args:
+        resources (List[Any]): The resources to wait for, of any resource classes with a wait or
+            wait_for_status method.
+        target_status (str, optional): The status to wait for. Defaults to None, waiting for the
+            terminal states of resources with a wait method.
+        poll (Union[int, PollStrategy], optional): The number of seconds to wait between each
+            poll, or the PollStrategy choosing the delays between polls. Defaults to 5.
+        timeout (int, optional): The maximum number of seconds to wait before timing out.
+            Defaults to None, waiting without a timeout.
+        max_concurrency (int, optional): The maximum number of resources refreshed concurrently.
+            Defaults to 10.
+        on_failure (str, optional): Whether to "raise" the error of the first resource reaching a
+            failed state, failing to be refreshed or timing out, or to "return" the errors of all
+            the resources in their results once the other resources reached their target.
+            Defaults to "raise".
+        display (bool, optional): Whether to display the progress in a Rich Live panel. Defaults to
+            None, displaying it in interactive environments unless disabled with
+            configure_waiter_display.
+        status_callback (Callable[[Any, str], None], optional): A function called with every
+            refreshed resource and its status at every poll. Defaults to None.
+
+    Returns:
+        List[WaitResult]: The results of the resources, in the order of the resources.
+
+    Raises:
+        ValueError: If a resource has no status to wait for, or no terminal states when no target
+            status is given.
+        FailedStatusError: If a resource reaches a failed state and on_failure is "raise".
+        botocore.exceptions.ClientError: If a resource fails to be refreshed, e.g. when it was
+            deleted, and on_failure is "raise".
+        TimeoutExceededError: If resources do not reach their target before the timeout and
+            on_failure is "raise".
+    """
+    resources = list(resources)
+    for resource in resources:
+        _check_waitable(resource, target_status)
+    results = [WaitResult(resource=resource) for resource in resources]
+    if not resources:
+        return results
+
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+    poller = Poller(poll, timeout)
+    start_time = time.time()
+    pending = list(range(len(resources)))
+
+    # Without display no Rich renderable is built, e.g. in non-interactive environments
+    progress = status = task = None
+    live = contextlib.nullcontext()
+    if is_waiter_display_enabled(display):
+        progress = Progress(
+            SpinnerColumn("bouncingBar"),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+        )
+        target_description = f" to reach [bold]{target_status} status" if target_status else ""
+        task = progress.add_task(
+            f"Waiting for {len(resources)} resources{target_description}...", total=len(resources)
+        )
+        status = Status("Current statuses:")
+        live = Live(
+            Panel(
+                Group(progress, status),
+                title="Wait Log Panel",
+                border_style=Style(color=Color.BLUE.value),
+            ),
+            transient=True,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(resources))) as executor, live:
+        while True:
+            poll_start_time = time.time()
+            # Refresh in a copy of the context of the caller, as AsyncBridge.run does
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, _refresh_status, resources[index], limiter
+                )
+                for index in pending
+            ]
+
+            still_pending = []
+            for index, future in zip(pending, futures):
+                resource = resources[index]
+                try:
+                    current_status = future.result()
+                except Exception as error:
+                    # A resource failing to be refreshed, e.g. deleted while waited for, does not
+                    # stop waiting for the other resources
+                    results[index].error = error
+                    if on_failure == "raise":
+                        raise
+                    continue
+                results[index].status = current_status
+                if status_callback is not None:
+                    status_callback(resource, current_status)
+                if _reached_target(resource, current_status, target_status):
+                    continue
+                if failed_status_error := _get_failed_status_error(
+                    resource, current_status, target_status
+                ):
+                    results[index].error = failed_status_error
+                    if on_failure == "raise":
+                        raise results[index].error
+                    continue
+                still_pending.append(index)
+            pending = still_pending
+
+            if progress is not None:
+                progress.update(task, completed=len(resources) - len(pending))
+                status.update(f"Current statuses: {_format_status_counts(results)}")
+
+            if not pending:
+                break
+
+            if timeout is not None and time.time() - start_time >= timeout:
+                for index in pending:
+                    results[index].error = TimeoutExceededError(
+                        resource_type=type(resources[index]).__name__,
+                        status=results[index].status,
+                    )
+                if on_failure == "raise":
+                    raise results[pending[0]].error
+                break
+            poll_delay = poller.next_delay(tuple(result.status for result in results))
+            time.sleep(max(0, poll_delay - (time.time() - poll_start_time)))
+
+    logger.info(f"Final Resource Statuses: {_format_status_counts(results)}")
+    return results
+
+
+async def wait_async(
+    resource: Any,
+    target_status: Optional[str] = None,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+) -> str:
+    """
+    Wait for a resource without blocking the event loop.
+
+    The refreshes of the resource run on the thread pool of the async bridge and the delays between
+    polls are asyncio sleeps, so that many resources can be waited for from one event loop.
+
+    Example:
+        await asyncio.gather(*(wait_async(job) for job in training_jobs))
+
+    Args:
+        resource (Any): The resource to wait for, of a resource class with a wait or
+            wait_for_status method.
+        target_status (str, optional): The status to wait for. Defaults to None, waiting for the
+            terminal states of resources with a wait method.
+        poll (Union[int, PollStrategy], optional): The number of seconds to wait between each
+            poll, or the PollStrategy choosing the delays between polls. Defaults to 5.
+        timeout (int, optional): The maximum number of seconds to wait before timing out.
+            Defaults to None, waiting without a timeout.
+
+    Returns:
+        str: The final status of the resource.
+
+    Raises:
+        ValueError: If the resource has no status to wait for, or no terminal states when no target
+            status is given.
+        FailedStatusError: If the resource reaches a failed state.
+        TimeoutExceededError: If the resource does not reach its target before the timeout.
+    """
+    _check_waitable(resource, target_status)
+    start_time = time.time()
+    poller = Poller(poll, timeout)
+
+    while True:
+        current_status = await run_async(_refresh_status, resource, poller)
+        if _reached_target(resource, current_status, target_status):
+            logger.debug(f"Final Resource Status: [bold]{current_status}")
+            return current_status
+        if failed_status_error := _get_failed_status_error(resource, current_status, target_status):
+            raise failed_status_error
+
+        if timeout is not None and time.time() - start_time >= timeout:
+            raise TimeoutExceededError(resource_type=type(resource).__name__, status=current_status)
+        await asyncio.sleep(poller.next_delay(current_status))
+
+
+async def wait_for_delete_async(
+    resource: Any,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+) -> None:
+    """
+    Wait for a resource to be deleted without blocking the event loop.
+
+    Args:
+        resource (Any): The resource to wait for, of a resource class with a wait_for_delete method.
+        poll (Union[int, PollStrategy], optional): The number of seconds to wait between each
+            poll, or the PollStrategy choosing the delays between polls. Defaults to 5.
+        timeout (int, optional): The maximum number of seconds to wait before timing out.
+            Defaults to None, waiting without a timeout.
+
+    Raises:
+        botocore.exceptions.ClientError: If refreshing the resource fails for another reason than
+            the resource not being found.
+        DeleteFailedStatusError: If the resource reaches a delete failed state.
+        TimeoutExceededError: If the resource is not deleted before the timeout.
+    """
+    start_time = time.time()
+    poller = Poller(poll, timeout)
+
+    while True:
+        try:
+            current_status = await run_async(_refresh_status, resource, poller)
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if "ResourceNotFound" in error_code or "ValidationException" in error_code:
+                logger.debug("Resource was not found. It may have been deleted.")
+                return
+            raise e
+
+        if "delete_failed" in current_status.lower() or "deletefailed" in current_status.lower():
+            raise DeleteFailedStatusError(
+                resource_type=type(resource).__name__, reason=_get_failure_reason(resource)
+            )
+        if current_status.lower() == "deleted":
+            return
+
+        if timeout is not None and time.time() - start_time >= timeout:
+            raise TimeoutExceededError(resource_type=type(resource).__name__, status=current_status)
+        await asyncio.sleep(poller.next_delay(current_status))
+
+
+def _check_waitable(resource: Any, target_status: Optional[str]):
+    """Check that a resource has a status to wait for, and terminal states without a target."""
+    resource_type = type(resource).__name__
+    if not getattr(resource, "_status_attributes", None):
+        raise ValueError(f"{resource_type} resources do not have a status to wait for.")
+    if target_status is None and not resource._terminal_states:
+        raise ValueError(f"A target_status is required to wait for {resource_type} resources.")
+
+
+def _refresh_status(resource: Any, caller: Union[AdaptiveConcurrencyLimiter, Poller]) -> str:
+    """Refresh a resource, retrying throttled calls, and get its current status."""
+    caller.call(resource.refresh)
+    current_status = resource
+    for attribute in resource._status_attributes:
+        current_status = getattr(current_status, attribute)
+    return current_status
+
+
+def _reached_target(resource: Any, current_status: str, target_status: Optional[str]) -> bool:
+    """Whether a resource reached the target status, or a terminal state that is not failed."""
+    if target_status is not None:
+        return current_status == target_status
+    return current_status in resource._terminal_states and "failed" not in current_status.lower()
+
+
+def _get_failed_status_error(
+    resource: Any, current_status: str, target_status: Optional[str]
+) -> Optional[FailedStatusError]:
+    """Get the error of a resource in a failed state, or a terminal state other than the target."""
+    # A resource in another terminal state than the target status will never reach it
+    if "failed" in current_status.lower() or (
+        target_status and current_status in resource._terminal_states
+    ):
+        return FailedStatusError(
+            resource_type=type(resource).__name__,
+            status=current_status,
+            reason=_get_failure_reason(resource),
+        )
+    return None
+
+
+def _get_failure_reason(resource: Any) -> str:
+    """Get the failure reason of a resource, if it has one."""
+    failure_reason = None
+    if resource._failure_reason_attribute:
+        failure_reason = getattr(resource, resource._failure_reason_attribute)
+    if failure_reason is None or isinstance(failure_reason, Unassigned):
+        return "(Unknown)"
+    return failure_reason
+
+
+def _format_status_counts(results: List[WaitResult]) -> str:
+    """Format the number of resources in each status."""
+    counts = Counter(result.status for result in results if result.status is not None)
+    return ", ".join(f"[bold]{status}[/bold]: {count}" for status, count in sorted(counts.items()))
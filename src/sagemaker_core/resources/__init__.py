@@ -1 +1,11 @@
-from ..main.resources import *
+from ..main import resources as _resources
+
+__all__ = _resources.__all__
+
+
+def __getattr__(name):
+    return getattr(_resources, name)
+
+
+def __dir__():
+    return dir(_resources)
@@ -46,7 +46,7 @@ BASIC_JSON_TYPES_TO_PYTHON_TYPES = {
 
 BASIC_RETURN_TYPES = {"str", "int", "bool", "float", "datetime.datetime"}
 
-SHAPE_DAG_FILE_PATH = os.getcwd() + "/src/sagemaker_core/main/code_injection/shape_dag.py"
+SHAPE_DAG_FILE_PATH = os.getcwd() + "/src/sagemaker_core/main/code_injection/shape_dag.pkl"
 PYTHON_TYPES_TO_BASIC_JSON_TYPES = {
     "str": "string",
     "int": "integer",
@@ -90,7 +90,9 @@ GENERATED_CLASSES_LOCATION = os.getcwd() + "/src/sagemaker_core/main"
 UTILS_CODEGEN_FILE_NAME = "utils.py"
 DEFAULT_CONFIGS_CODEGEN_FILE_NAME = "default_configs_helper.py"
 
-RESOURCES_CODEGEN_FILE_NAME = "resources.py"
+RESOURCES_CODEGEN_PACKAGE_NAME = "resources"
+
+RESOURCES_BASE_MODULE_NAME = "_base"
 
 SHAPES_CODEGEN_FILE_NAME = "shapes.py"
 
@@ -99,3 +101,9 @@ CONFIG_SCHEMA_FILE_NAME = "config_schema.py"
 API_COVERAGE_JSON_FILE_PATH = os.getcwd() + "/src/sagemaker_core/tools/api_coverage.json"
 
 SHAPES_WITH_JSON_FIELD_ALIAS = ["MonitoringDatasetFormat"]  # Shapes with field name with "json"
+
+# snake_case names that do not title case back to their PascalCase member name
+SPECIAL_SNAKE_TO_PASCAL_MAPPINGS = {
+    "volume_size_in_g_b": "VolumeSizeInGB",
+    "volume_size_in_gb": "VolumeSizeInGB",
+}
@@ -13,8 +13,10 @@
 """Generates the resource classes for the service model."""
 from functools import lru_cache
 
+import ast
 import os
 import json
+import warnings
 from sagemaker_core.main.code_injection.codec import pascal_to_snake
 from sagemaker_core.main.config_schema import SAGEMAKER_PYTHON_SDK_CONFIG_SCHEMA
 from sagemaker_core.main.exceptions import DefaultConfigsError
@@ -22,7 +24,8 @@ from sagemaker_core.main.utils import get_textual_rich_logger
 from sagemaker_core.tools.constants import (
     BASIC_RETURN_TYPES,
     GENERATED_CLASSES_LOCATION,
-    RESOURCES_CODEGEN_FILE_NAME,
+    RESOURCES_BASE_MODULE_NAME,
+    RESOURCES_CODEGEN_PACKAGE_NAME,
     LICENCES_STRING,
     TERMINAL_STATES,
     LOGGER_STRING,
@@ -35,6 +38,7 @@ from sagemaker_core.tools.method import Method, MethodType
 from sagemaker_core.main.utils import (
     add_indent,
     convert_to_snake_case,
+    convert_to_pascal_case,
     snake_to_pascal,
     remove_html_tags,
     escape_special_rst_characters,
@@ -55,6 +59,7 @@ from sagemaker_core.tools.templates import (
     INITIALIZE_CLIENT_TEMPLATE,
     REFRESH_METHOD_TEMPLATE,
     RESOURCE_BASE_CLASS_TEMPLATE,
+    RESOURCES_PACKAGE_INIT_TEMPLATE,
     RETURN_ITERATOR_TEMPLATE,
     SERIALIZE_INPUT_TEMPLATE,
     STOP_METHOD_TEMPLATE,
@@ -62,18 +67,29 @@ from sagemaker_core.tools.templates import (
     WAIT_FOR_DELETE_METHOD_TEMPLATE,
     WAIT_METHOD_TEMPLATE,
     WAIT_FOR_STATUS_METHOD_TEMPLATE,
+    WAIT_STATUS_ATTRIBUTES_TEMPLATE,
     UPDATE_METHOD_TEMPLATE,
     POPULATE_DEFAULTS_DECORATOR_TEMPLATE,
     CREATE_METHOD_TEMPLATE_WITHOUT_DEFAULTS,
     IMPORT_METHOD_TEMPLATE,
     FAILED_STATUS_ERROR_TEMPLATE,
     GET_NAME_METHOD_TEMPLATE,
+    GET_ALL_ITERATOR_OPTIONS_DOCSTRING,
+    ITERATOR_OPTIONS_DOCSTRING,
+    PARALLEL_SHARDS_DOCSTRING,
     GET_ALL_METHOD_NO_ARGS_TEMPLATE,
     GET_ALL_METHOD_WITH_ARGS_TEMPLATE,
     UPDATE_METHOD_TEMPLATE_WITHOUT_DECORATOR,
     RESOURCE_METHOD_EXCEPTION_DOCSTRING,
     INIT_WAIT_LOGS_TEMPLATE,
+    STREAM_LOGS_METHOD_TEMPLATE,
     PRINT_WAIT_LOGS,
+    ASYNC_METHOD_TEMPLATE,
+    ASYNC_CLASS_METHOD_TEMPLATE,
+    ASYNC_GET_ALL_METHOD_TEMPLATE,
+    AWAIT_COMPLETION_METHOD_TEMPLATE,
+    AWAIT_STATUS_METHOD_TEMPLATE,
+    AWAIT_DELETION_METHOD_TEMPLATE,
 )
 from sagemaker_core.tools.data_extractor import (
     load_combined_shapes_data,
@@ -178,7 +194,7 @@ class ResourcesCodeGen:
             "import time",
             "import functools",
             "from pydantic import validate_call, ConfigDict, BaseModel",
-            "from typing import Dict, List, Literal, Optional, Union, Any\n"
+            "from typing import Callable, ClassVar, Dict, List, Literal, Optional, Union, Any\n"
             "from boto3.session import Session",
             "from rich.console import Group",
             "from rich.live import Live",
@@ -186,12 +202,11 @@ class ResourcesCodeGen:
             "from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn",
             "from rich.status import Status",
             "from rich.style import Style",
-            "from sagemaker_core.main.code_injection.codec import transform",
+            "from sagemaker_core.main.code_injection.codec import transform, build_from_response",
             "from sagemaker_core.main.code_injection.constants import Color",
-            "from sagemaker_core.main.utils import SageMakerClient, ResourceIterator, Unassigned, get_textual_rich_logger, "
-            "snake_to_pascal, pascal_to_snake, is_not_primitive, is_not_str_dict, is_primitive_list, serialize",
+            "from sagemaker_core.main.utils import SageMakerClient, ResourceIterator, AsyncResourceIterator, Poller, PollStrategy, Unassigned, "
+            "WaiterDisplay, get_textual_rich_logger, snake_to_pascal, pascal_to_snake, is_not_primitive, is_not_str_dict, is_primitive_list, serialize, run_async",
             "from sagemaker_core.main.default_configs_helper import load_default_configs_for_resource_name, get_config_value",
-            "from sagemaker_core.main.logs import MultiLogStreamHandler",
             "from sagemaker_core.main.exceptions import *",
             "import sagemaker_core.main.shapes as shapes",
         ]
@@ -235,66 +250,147 @@ class ResourcesCodeGen:
             class_attributes=class_attributes,
         )
 
+    def generate_base_module_imports(self) -> str:
+        """
+        Generate the import statements for the base module of the resources package.
+
+        Returns:
+            str: The import statements.
+        """
+        imports = self.generate_imports()
+        imports += "import inspect\n"
+        imports += f"import {self.resources_package} as resources\n"
+        return imports + "\n"
+
+    def generate_resource_module_imports(self, resource_name: str, resource_class: str) -> str:
+        """
+        Generate the import statements for the module of a single resource.
+
+        Args:
+            resource_name (str): The name of the resource.
+            resource_class (str): The generated resource class.
+
+        Returns:
+            str: The import statements.
+        """
+        imports = self.generate_imports()
+        imports += "from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler\n"
+        imports += "from sagemaker_core.main.waiters import wait_async, wait_for_delete_async\n"
+        imports += (
+            f"from {self.resources_package}.{RESOURCES_BASE_MODULE_NAME} import Base, logger\n"
+        )
+        for referenced_resource in self._get_referenced_resources(resource_name, resource_class):
+            imports += (
+                f"from {self.resources_package}.{self.resource_modules[referenced_resource]} "
+                f"import {referenced_resource}\n"
+            )
+        return imports + "\n\n"
+
+    def _get_referenced_resources(self, resource_name: str, resource_class: str) -> list:
+        """
+        Get the other generated resources used by the code of a generated resource class.
+
+        Args:
+            resource_name (str): The name of the resource.
+            resource_class (str): The generated resource class.
+
+        Returns:
+            list: The sorted names of the referenced resources.
+        """
+        with warnings.catch_warnings():
+            # Docstrings copied from the service JSON contain invalid escape sequences
+            warnings.simplefilter("ignore")
+            resource_class_tree = ast.parse(resource_class)
+        referenced_resources = {
+            node.id
+            for node in ast.walk(resource_class_tree)
+            if isinstance(node, ast.Name) and node.id in self.resource_modules
+        }
+        referenced_resources.discard(resource_name)
+        return sorted(referenced_resources)
+
     def generate_resources(
         self,
         output_folder: str = GENERATED_CLASSES_LOCATION,
-        file_name: str = RESOURCES_CODEGEN_FILE_NAME,
+        package_name: str = RESOURCES_CODEGEN_PACKAGE_NAME,
     ) -> None:
         """
-        Generate the resources file.
+        Generate the resources package, with one module per resource and a lazy loading __init__.
 
         Args:
             output_folder (str, optional): The output folder path. Defaults to "GENERATED_CLASSES_LOCATION".
-            file_name (str, optional): The output file name. Defaults to "RESOURCES_CODEGEN_FILE_NAME".
+            package_name (str, optional): The output package name. Defaults to "RESOURCES_CODEGEN_PACKAGE_NAME".
         """
-        # Check if the output folder exists, if not, create it
-        os.makedirs(output_folder, exist_ok=True)
+        self.resources_package = f"sagemaker_core.main.{package_name}"
+        package_folder = os.path.join(output_folder, package_name)
 
-        # Create the full path for the output file
-        output_file = os.path.join(output_folder, file_name)
+        # Recreate the package folder so that modules of removed resources do not linger
+        os.makedirs(package_folder, exist_ok=True)
+        for existing_file in os.listdir(package_folder):
+            if existing_file.endswith(".py"):
+                os.remove(os.path.join(package_folder, existing_file))
 
-        # Open the output file
-        with open(output_file, "w") as file:
-            # Generate and write the license to the file
+        # Generate the base module with the shared imports, logger and the Base class
+        with open(os.path.join(package_folder, f"{RESOURCES_BASE_MODULE_NAME}.py"), "w") as file:
             file.write(self.generate_license())
-
-            # Generate and write the imports to the file
-            file.write(self.generate_imports())
-
-            # Generate and write the logging statements to the file
+            file.write(self.generate_base_module_imports())
             file.write(self.generate_logging())
-
-            # Generate and write the base class to the file
             file.write(self.generate_base_class())
 
-            self.resource_names = [
-                row["resource_name"] for _, row in self.resources_plan.iterrows()
-            ]
-            # Iterate over the rows in the resources plan
-            for _, row in self.resources_plan.iterrows():
-                # Extract the necessary data from the row
-                resource_name = row["resource_name"]
-                class_methods = row["class_methods"]
-                object_methods = row["object_methods"]
-                additional_methods = row["additional_methods"]
-                raw_actions = row["raw_actions"]
-                resource_status_chain = row["resource_status_chain"]
-                resource_states = row["resource_states"]
-
-                # Generate the resource class
-                resource_class = self.generate_resource_class(
-                    resource_name,
-                    class_methods,
-                    object_methods,
-                    additional_methods,
-                    raw_actions,
-                    resource_status_chain,
-                    resource_states,
-                )
+        self.resource_names = [row["resource_name"] for _, row in self.resources_plan.iterrows()]
+        resource_classes = {}
+        # Iterate over the rows in the resources plan
+        for _, row in self.resources_plan.iterrows():
+            # Extract the necessary data from the row
+            resource_name = row["resource_name"]
+            class_methods = row["class_methods"]
+            object_methods = row["object_methods"]
+            additional_methods = row["additional_methods"]
+            raw_actions = row["raw_actions"]
+            resource_status_chain = row["resource_status_chain"]
+            resource_states = row["resource_states"]
+
+            # Generate the resource class
+            resource_class = self.generate_resource_class(
+                resource_name,
+                class_methods,
+                object_methods,
+                additional_methods,
+                raw_actions,
+                resource_status_chain,
+                resource_states,
+            )
 
-                # If the resource class was successfully generated, write it to the file
-                if resource_class:
-                    file.write(f"{resource_class}\n\n")
+            # Keep the resource class only if it was successfully generated
+            if resource_class:
+                resource_classes[resource_name] = resource_class
+
+        # Write each resource class to its own module
+        self.resource_modules = {
+            resource_name: pascal_to_snake(resource_name) for resource_name in resource_classes
+        }
+        for resource_name, resource_class in resource_classes.items():
+            module_file = os.path.join(package_folder, f"{self.resource_modules[resource_name]}.py")
+            with open(module_file, "w") as file:
+                file.write(self.generate_license())
+                file.write(self.generate_resource_module_imports(resource_name, resource_class))
+                file.write(f"{resource_class}\n")
+
+        # Generate the package __init__ which maps resource names to their modules
+        with open(os.path.join(package_folder, "__init__.py"), "w") as file:
+            file.write(self.generate_license())
+            file.write(
+                RESOURCES_PACKAGE_INIT_TEMPLATE.format(
+                    resource_modules=add_indent(
+                        "\n".join(
+                            f'"{resource_name}": "{module_name}",'
+                            for resource_name, module_name in self.resource_modules.items()
+                        ),
+                        4,
+                    ),
+                    base_module_name=RESOURCES_BASE_MODULE_NAME,
+                )
+            )
 
     def _evaluate_method(
         self, resource_name: str, method_name: str, methods: list, **kwargs
@@ -376,6 +472,11 @@ class ResourcesCodeGen:
             # Add the class attributes and methods to the class definition
             resource_class += add_indent(class_attributes_string, 4)
 
+            if wait_status_attributes := self.generate_wait_status_attributes(
+                resource_name, object_methods
+            ):
+                resource_class += add_indent(wait_status_attributes, 4)
+
             resource_lower = convert_to_snake_case(resource_name)
             get_name_method = self.generate_get_name_method(resource_lower=resource_lower)
             resource_class += add_indent(get_name_method, 4)
@@ -434,16 +535,42 @@ class ResourcesCodeGen:
             ):
                 resource_class += add_indent(wait_for_delete_method, 4)
 
+            stream_logs_method = ""
+            if "wait" in object_methods and resource_name in RESOURCE_WITH_LOGS:
+                stream_logs_method = self.generate_stream_logs_method(resource_name)
+                resource_class += add_indent(stream_logs_method, 4)
+
             if import_method := self._evaluate_method(resource_name, "import", class_methods):
                 resource_class += add_indent(import_method, 4)
 
             if list_method := self._evaluate_method(resource_name, "get_all", class_methods):
                 resource_class += add_indent(list_method, 4)
 
+            generated_methods = [
+                method_name
+                for method_name, method in [
+                    ("create", create_method),
+                    ("get", get_method),
+                    ("refresh", refresh_method),
+                    ("update", update_method),
+                    ("delete", delete_method),
+                    ("stop", stop_method),
+                    ("wait", wait_method),
+                    ("wait_for_status", wait_for_status_method),
+                    ("wait_for_delete", wait_for_delete_method),
+                    ("stream_logs", stream_logs_method),
+                    ("load", import_method),
+                    ("get_all", list_method),
+                ]
+                if method
+            ]
+            async_methods = self.generate_async_methods(resource_name, generated_methods)
+
         else:
             # If there's no 'get' or 'list' or 'create' method, generate a class with no attributes
             resource_attributes = []
             resource_class = basic_class_content
+            async_methods = ""
 
             # if there are no attributes or methods including addition operations
             # class need not be generated
@@ -455,6 +582,13 @@ class ResourcesCodeGen:
             for method in self.resource_methods[resource_name].values():
                 formatted_method = self.generate_method(method, resource_attributes)
                 resource_class += add_indent(formatted_method, 4)
+                if method.method_name == "get_all":
+                    async_methods += ASYNC_GET_ALL_METHOD_TEMPLATE.format(
+                        resource_name=resource_name
+                    )
+
+        if async_methods:
+            resource_class += add_indent(async_methods, 4)
 
         # Return the class definition
         return resource_class
@@ -512,7 +646,7 @@ class ResourcesCodeGen:
                 class_attributes["hub_name"] = "Optional[str] = Unassigned()"
                 class_attributes_string = class_attributes_string.replace("hub_name: str", "")
                 class_attributes_string = (
-                    class_attributes_string + "hub_name: Optional[str] = Unassigned()"
+                    class_attributes_string + "hub_name: Optional[str] = Unassigned()\n"
                 )
 
             return class_attributes, class_attributes_string, attributes_and_documentation
@@ -580,7 +714,7 @@ class ResourcesCodeGen:
                 and attr.endswith("name")
                 and attr[: -len("_name")] != resource_name_snake_case
                 and attr != "name"
-                and snake_to_pascal(attr[: -len("_name")]) in resource_names
+                and convert_to_pascal_case(attr[: -len("_name")]) in resource_names
             ):
                 if value.startswith("Optional"):
                     init_data_body += f"{attr}: Optional[Union[str, object]] = Unassigned()\n"
@@ -646,7 +780,7 @@ class ResourcesCodeGen:
                 attr.endswith("name")
                 and attr[: -len("_name")] != resource_name_in_snake_case
                 and attr != "name"
-                and snake_to_pascal(attr[: -len("_name")]) in self.resource_names
+                and convert_to_pascal_case(attr[: -len("_name")]) in self.resource_names
             ):
                 if attr_type.startswith("Optional"):
                     method_args += f"{attr}: Optional[Union[str, object]] = Unassigned(),"
@@ -960,6 +1094,7 @@ class ResourcesCodeGen:
         return_string: str = None,
         include_default_configs_errors: bool = False,
         exclude_resource_attrs: list = None,
+        iterator_options_docstring: str = None,
     ) -> str:
         """
         Generate the docstring for a method of a resource.
@@ -974,6 +1109,7 @@ class ResourcesCodeGen:
             return_string (str): The return string.
             include_default_configs_errors (bool): Whether to include default configs errors.
             exclude_resource_attrs (list): A list of attributes to exclude from the docstring.
+            iterator_options_docstring (str): The documentation of the ResourceIterator options.
 
         Returns:
             str: The generated docstring for the IMPORT method.
@@ -990,8 +1126,11 @@ class ResourcesCodeGen:
                 docstring += f"\nParameters:\n"
                 docstring += _shape_attr_documentation_string
 
+        if iterator_options_docstring:
+            docstring += add_indent(f"{iterator_options_docstring}\n")
+
         if include_session_region:
-            if not _shape_attr_documentation_string:
+            if not _shape_attr_documentation_string and not iterator_options_docstring:
                 docstring += f"\nParameters:\n"
             docstring += add_indent(f"session: Boto3 session.\nregion: Region name.\n")
 
@@ -1454,7 +1593,7 @@ class ResourcesCodeGen:
         # TODO: merge this with generate_get_all_method
         operation_metadata = self.operations[method.operation_name]
         operation_input_shape_name = operation_metadata["input"]["shape"]
-        exclude_list = ["next_token", "max_results"]
+        exclude_list = ["next_token"]
         if method.method_type == MethodType.CLASS.value:
             decorator = "@classmethod"
             method_args = add_indent("cls,\n", 4)
@@ -1473,6 +1612,27 @@ class ResourcesCodeGen:
                 operation_metadata, False, resource_attributes, exclude_list
             )
             exclude_resource_attrs = resource_attributes
+
+        iterator_options_docstring = ITERATOR_OPTIONS_DOCSTRING
+        iterator_option_args = ["prefetch_pages=prefetch_pages"]
+        if method.method_name == "get_all":
+            # Stands in for the get_all method of the resource, so takes the same iterator options
+            operation_input_members = self.shapes[operation_input_shape_name]["members"]
+            iterator_options_docstring = GET_ALL_ITERATOR_OPTIONS_DOCSTRING
+            iterator_option_args = [
+                "hydrate=hydrate",
+                "hydrate_concurrency=hydrate_concurrency",
+                "prefetch_pages=prefetch_pages",
+            ]
+            if {"CreationTimeAfter", "CreationTimeBefore"} <= operation_input_members.keys():
+                method_args += add_indent("parallel_shards: Optional[int] = None,\n", 4)
+                iterator_options_docstring = (
+                    f"{PARALLEL_SHARDS_DOCSTRING}\n{GET_ALL_ITERATOR_OPTIONS_DOCSTRING}"
+                )
+                iterator_option_args.append("parallel_shards=parallel_shards")
+            method_args += add_indent("hydrate: bool = False,\n", 4)
+            method_args += add_indent("hydrate_concurrency: Optional[int] = None,\n", 4)
+        method_args += add_indent("prefetch_pages: int = 0,\n", 4)
         method_args += add_indent("session: Optional[Session] = None,\n", 4)
         method_args += add_indent("region: Optional[str] = None,", 4)
 
@@ -1503,10 +1663,13 @@ class ResourcesCodeGen:
         # TODO: add rules for custom key mapping and list methods with no args
         resource_iterator_args_list = [
             "client=client",
+            "session=session",
+            "region_name=region",
             f"list_method='{list_method}'",
             f"summaries_key='{summaries_key}'",
             f"summary_name='{summary_name}'",
             f"resource_cls={iterator_return_type}",
+            *iterator_option_args,
             "list_method_kwargs=operation_input_args",
         ]
 
@@ -1529,6 +1692,7 @@ class ResourcesCodeGen:
             include_session_region=True,
             return_string=return_string,
             exclude_resource_attrs=exclude_resource_attrs,
+            iterator_options_docstring=iterator_options_docstring,
         )
 
         return GENERIC_METHOD_TEMPLATE.format(
@@ -1581,6 +1745,49 @@ class ResourcesCodeGen:
 
         raise ValueError(f"Instance count reference not found for resource {resource_name}")
 
+    def generate_wait_status_attributes(self, resource_name: str, object_methods: list) -> str:
+        """Auto-Generate the class attributes describing the status of a waitable resource.
+
+        They let waiters that are not methods of the resource, like wait_all, read its status.
+
+        Args:
+            resource_name (str): The resource name.
+            object_methods (list): The object methods.
+
+        Returns:
+            str: The formatted class attributes, or an empty string if the resource has no waiter.
+        """
+        if "wait" not in object_methods and "wait_for_status" not in object_methods:
+            return ""
+
+        resource_status_chain, resource_states = (
+            self.resources_extractor.get_status_chain_and_states(resource_name)
+        )
+
+        # The terminal states are those waited for by the wait method
+        terminal_resource_states = []
+        if "wait" in object_methods:
+            terminal_resource_states = [
+                state
+                for state in resource_states
+                if any(
+                    terminal_state.lower() in state.lower() for terminal_state in TERMINAL_STATES
+                )
+            ]
+
+        failure_reason = self._get_failure_reason_ref(resource_name)
+        failure_reason_attribute = None
+        if failure_reason.startswith("self."):
+            failure_reason_attribute = failure_reason[len("self.") :]
+
+        return WAIT_STATUS_ATTRIBUTES_TEMPLATE.format(
+            status_attributes=[
+                convert_to_snake_case(member["name"]) for member in resource_status_chain
+            ],
+            terminal_states=terminal_resource_states,
+            failure_reason_attribute=repr(failure_reason_attribute),
+        )
+
     def generate_wait_method(self, resource_name: str) -> str:
         """Auto-Generate WAIT Method for a waitable resource.
 
@@ -1618,8 +1825,8 @@ class ResourcesCodeGen:
         init_wait_logs = ""
         print_wait_logs = ""
         if resource_name in RESOURCE_WITH_LOGS:
-            logs_arg = "logs: Optional[bool] = False,"
-            logs_arg_doc = "logs: Whether to print logs while waiting.\n"
+            logs_arg = "\n    logs: Optional[bool] = False,"
+            logs_arg_doc = "\n        logs: Whether to print logs while waiting."
 
             instance_count = self._get_instance_count_ref(resource_name)
             init_wait_logs = add_indent(
@@ -1642,6 +1849,21 @@ class ResourcesCodeGen:
         )
         return formatted_method
 
+    def generate_stream_logs_method(self, resource_name: str) -> str:
+        """Auto-Generate STREAM_LOGS Method for a job resource writing logs.
+
+        Args:
+            resource_name (str): The resource name.
+
+        Returns:
+            str: The formatted stream_logs Method template.
+        """
+        return STREAM_LOGS_METHOD_TEMPLATE.format(
+            resource_name=resource_name,
+            get_instance_count=self._get_instance_count_ref(resource_name),
+            job_type=resource_name,
+        )
+
     def generate_wait_for_status_method(self, resource_name: str) -> str:
         """Auto-Generate WAIT_FOR_STATUS Method for a waitable resource.
 
@@ -1716,6 +1938,55 @@ class ResourcesCodeGen:
         )
         return formatted_method
 
+    def generate_async_methods(self, resource_name: str, generated_methods: list) -> str:
+        """Auto-Generate the asynchronous counterparts of the generated methods of a resource.
+
+        Operations run on the thread pool of the async bridge, and waiters poll without blocking
+        the event loop.
+
+        Args:
+            resource_name (str): The resource name.
+            generated_methods (list): The names of the methods generated for the resource.
+
+        Returns:
+            str: The formatted asynchronous methods.
+        """
+        return_types = {
+            "create": f'Optional["{resource_name}"]',
+            "get": f'Optional["{resource_name}"]',
+            "refresh": f'Optional["{resource_name}"]',
+            "update": f'Optional["{resource_name}"]',
+            "delete": "None",
+            "stop": "None",
+            "load": f'Optional["{resource_name}"]',
+        }
+        async_methods = ""
+        for method_name in generated_methods:
+            if method_name in ("create", "get", "load"):
+                async_methods += ASYNC_CLASS_METHOD_TEMPLATE.format(
+                    method_name=method_name, return_type=return_types[method_name]
+                )
+            elif method_name in return_types:
+                async_methods += ASYNC_METHOD_TEMPLATE.format(
+                    method_name=method_name, return_type=return_types[method_name]
+                )
+            elif method_name == "wait":
+                async_methods += AWAIT_COMPLETION_METHOD_TEMPLATE.format(
+                    resource_name=resource_name
+                )
+            elif method_name == "wait_for_status":
+                _, resource_states = self.resources_extractor.get_status_chain_and_states(
+                    resource_name
+                )
+                async_methods += AWAIT_STATUS_METHOD_TEMPLATE.format(
+                    resource_name=resource_name, resource_states=resource_states
+                )
+            elif method_name == "wait_for_delete":
+                async_methods += AWAIT_DELETION_METHOD_TEMPLATE.format(resource_name=resource_name)
+            elif method_name == "get_all":
+                async_methods += ASYNC_GET_ALL_METHOD_TEMPLATE.format(resource_name=resource_name)
+        return async_methods
+
     def generate_get_all_method(self, resource_name: str) -> str:
         """Auto-Generate 'get_all' class Method [list API] for a resource.
 
@@ -1795,10 +2066,15 @@ class ResourcesCodeGen:
 
         resource_iterator_args_list = [
             "client=client",
+            "session=session",
+            "region_name=region",
             f"list_method='{operation}'",
             f"summaries_key='{summaries_key}'",
             f"summary_name='{summary_name}'",
             f"resource_cls={resource_name}",
+            "hydrate=hydrate",
+            "hydrate_concurrency=hydrate_concurrency",
+            "prefetch_pages=prefetch_pages",
         ]
 
         if custom_key_mapping_str:
@@ -1807,7 +2083,7 @@ class ResourcesCodeGen:
         if extract_name_mapping_str:
             resource_iterator_args_list.append(f"extract_name_mapping=extract_name_mapping")
 
-        exclude_list = ["next_token", "max_results"]
+        exclude_list = ["next_token"]
         get_all_args = self._generate_method_args(operation_input_shape_name, exclude_list)
 
         if not get_all_args.strip().strip(","):
@@ -1821,6 +2097,7 @@ class ResourcesCodeGen:
                 custom_key_mapping=custom_key_mapping_str,
                 extract_name_mapping=extract_name_mapping_str,
                 resource_iterator_args=resource_iterator_args,
+                iterator_options_docstring=add_indent(GET_ALL_ITERATOR_OPTIONS_DOCSTRING, 8),
             )
             return formatted_method
 
@@ -1828,6 +2105,19 @@ class ResourcesCodeGen:
             operation_metadata, is_class_method=True, exclude_list=exclude_list
         )
 
+        # Listings filtered by creation time can be sharded into creation time windows
+        iterator_options_docstring = GET_ALL_ITERATOR_OPTIONS_DOCSTRING
+        operation_input_members = self.shapes[operation_input_shape_name]["members"]
+        if {"CreationTimeAfter", "CreationTimeBefore"} <= operation_input_members.keys():
+            get_all_args += "\n" + add_indent("parallel_shards: Optional[int] = None,", 4)
+            iterator_options_docstring = (
+                f"{PARALLEL_SHARDS_DOCSTRING}\n{GET_ALL_ITERATOR_OPTIONS_DOCSTRING}"
+            )
+            resource_iterator_args_list.insert(
+                resource_iterator_args_list.index("prefetch_pages=prefetch_pages") + 1,
+                "parallel_shards=parallel_shards",
+            )
+
         resource_iterator_args_list.append("list_method_kwargs=operation_input_args")
         resource_iterator_args = ",\n".join(resource_iterator_args_list)
         resource_iterator_args = add_indent(resource_iterator_args, 8)
@@ -1841,6 +2131,7 @@ class ResourcesCodeGen:
             include_session_region=True,
             include_return_resource_docstring=False,
             return_string=f"Returns:\n" f"    Iterator for listed {resource_name} resources.\n",
+            iterator_options_docstring=iterator_options_docstring,
         )
 
         formatted_method = GET_ALL_METHOD_WITH_ARGS_TEMPLATE.format(
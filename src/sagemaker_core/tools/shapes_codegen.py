@@ -213,7 +213,7 @@ class ShapesCodeGen:
         imports += "\n"
         imports += "from pydantic import BaseModel, ConfigDict, Field\n"
         imports += "from typing import List, Dict, Optional, Any, Union\n"
-        imports += "from sagemaker_core.main.utils import Unassigned"
+        imports += "from sagemaker_core.main.utils import Unassigned, DeferredModelSignature"
         imports += "\n"
         return imports
 
@@ -11,8 +11,6 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Extracts the shapes to DAG structure."""
-import textwrap
-import pprint
 from functools import lru_cache
 from typing import Optional, Any
 
@@ -20,12 +18,13 @@ from sagemaker_core.tools.constants import (
     BASIC_JSON_TYPES_TO_PYTHON_TYPES,
     SHAPE_DAG_FILE_PATH,
     SHAPES_WITH_JSON_FIELD_ALIAS,
+    SPECIAL_SNAKE_TO_PASCAL_MAPPINGS,
 )
 from sagemaker_core.main.utils import (
-    reformat_file_with_black,
     convert_to_snake_case,
-    snake_to_pascal,
+    convert_to_pascal_case,
 )
+from sagemaker_core.main.code_injection.shape_dag import dump_shape_dag_data
 from sagemaker_core.tools.data_extractor import load_combined_shapes_data
 
 
@@ -41,10 +40,10 @@ class ShapesExtractor:
         self.combined_shapes = combined_shapes or load_combined_shapes_data()
 
         self.shape_dag = self.get_shapes_dag()
-        with open(SHAPE_DAG_FILE_PATH, "w") as f:
-            f.write("SHAPE_DAG=")
-            f.write(textwrap.indent(pprint.pformat(self.shape_dag, width=1), "") + "\n")
-        reformat_file_with_black(SHAPE_DAG_FILE_PATH)
+        pascal_to_snake_names, snake_to_pascal_names = self.get_member_name_tables()
+        dump_shape_dag_data(
+            SHAPE_DAG_FILE_PATH, self.shape_dag, pascal_to_snake_names, snake_to_pascal_names
+        )
 
     # @property
     def get_shapes_dag(self):
@@ -126,6 +125,33 @@ class ShapesExtractor:
                 _dag[shape]["value_type"] = _all_shapes[_map_value_shape]["type"]
         return _dag
 
+    def get_member_name_tables(self):
+        """
+        Generates the PascalCase <-> snake_case name tables for all structure members in the Shape DAG.
+
+        The tables let the runtime convert request and response keys with a dict lookup instead
+        of regex substitutions. A few members share a snake_case name (ie, RoleArn and RoleARN),
+        for those the name produced by plain title casing is kept in the reverse table.
+        SPECIAL_SNAKE_TO_PASCAL_MAPPINGS is folded into the reverse table.
+
+        :return: The PascalCase -> snake_case table and the snake_case -> PascalCase table.
+        :rtype: tuple
+        """
+        pascal_to_snake_names = {}
+        for shape_attrs in self.shape_dag.values():
+            for member in shape_attrs.get("members", []):
+                pascal_to_snake_names[member["name"]] = convert_to_snake_case(member["name"])
+
+        snake_to_pascal_names = {}
+        for pascal_name, snake_name in sorted(pascal_to_snake_names.items()):
+            if snake_name not in snake_to_pascal_names or pascal_name == convert_to_pascal_case(
+                snake_name
+            ):
+                snake_to_pascal_names[snake_name] = pascal_name
+        snake_to_pascal_names.update(SPECIAL_SNAKE_TO_PASCAL_MAPPINGS)
+
+        return pascal_to_snake_names, snake_to_pascal_names
+
     def _evaluate_list_type(self, member_shape, add_shapes_prefix=True):
         list_shape_name = member_shape["member"]["shape"]
         list_shape_member = self.combined_shapes[list_shape_name]
@@ -204,7 +230,7 @@ class ShapesExtractor:
                 and attr.endswith("name")
                 and attr[: -len("_name")] != shape
                 and attr != "name"
-                and snake_to_pascal(attr[: -len("_name")]) in resource_names
+                and convert_to_pascal_case(attr[: -len("_name")]) in resource_names
             ):
                 if value.startswith("Optional"):
                     init_data_body += f"{attr}: Optional[Union[str, object]] = Unassigned()\n"
@@ -20,6 +20,38 @@ class {class_name}:
 {object_methods}
 """
 
+RESOURCES_PACKAGE_INIT_TEMPLATE = """
+import importlib
+
+RESOURCE_MODULES = {{
+{resource_modules}
+}}
+
+__all__ = ["Base", *RESOURCE_MODULES]
+
+
+def __getattr__(name: str):
+    \"\"\"
+    Lazily import resource classes from their modules on first access (PEP 562).
+
+    Other names resolve against the base module, which holds the Base class and the shared imports.
+    \"\"\"
+    if name.startswith("__"):
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    module_name = RESOURCE_MODULES.get(name, "{base_module_name}")
+    module = importlib.import_module(f"{{__name__}}.{{module_name}}")
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+"""
+
 RESOURCE_METHOD_EXCEPTION_DOCSTRING = """
 Raises:
     botocore.exceptions.ClientError: This exception is raised for AWS service related errors. 
@@ -106,7 +138,7 @@ def load(
 ) -> Optional["{resource_name}"]:
 {docstring}
     logger.info(f"Importing {resource_lower} resource.")
-    client = SageMakerClient(session=session, region_name=region, service_name='{service_name}').client
+    client = Base.get_sagemaker_client(session=session, region_name=region, service_name='{service_name}')
 
     operation_input_args = {{
 {operation_input_args}
@@ -152,7 +184,7 @@ def update(
 ) -> Optional["{resource_name}"]:
 {docstring}
     logger.info("Updating {resource_lower} resource.")
-    client = Base.get_sagemaker_client()
+    client = self._get_resource_client()
 
     operation_input_args = {{
 {operation_input_args}
@@ -179,7 +211,7 @@ def update(
 ) -> Optional["{resource_name}"]:
 {docstring}
     logger.info("Updating {resource_lower} resource.")
-    client = Base.get_sagemaker_client()
+    client = self._get_resource_client()
 
     operation_input_args = {{
 {operation_input_args}
@@ -231,7 +263,8 @@ def get(
 
     # deserialize the response
     transformed_response = transform(response, '{describe_operation_output_shape}')
-    {resource_lower} = cls(**transformed_response)
+    {resource_lower} = build_from_response(cls, transformed_response)
+    {resource_lower}._set_client_context(session=session, region_name=region)
     return {resource_lower}
 """
 
@@ -249,7 +282,7 @@ def refresh(
     operation_input_args = serialize(operation_input_args)
     logger.debug(f"Serialized input request: {{operation_input_args}}")
 
-    client = Base.get_sagemaker_client()
+    client = self._get_resource_client()
     response = client.{operation}(**operation_input_args)
 
     # deserialize response and update self
@@ -257,6 +290,12 @@ def refresh(
     return self
 """
 
+WAIT_STATUS_ATTRIBUTES_TEMPLATE = """
+_status_attributes: ClassVar[List[str]] = {status_attributes}
+_terminal_states: ClassVar[List[str]] = {terminal_states}
+_failure_reason_attribute: ClassVar[Optional[str]] = {failure_reason_attribute}
+"""
+
 FAILED_STATUS_ERROR_TEMPLATE = """
 if "failed" in current_status.lower():
     raise FailedStatusError(resource_type="{resource_name}", status=current_status, reason={reason})
@@ -273,8 +312,10 @@ if logs:
 """
 
 PRINT_WAIT_LOGS = """
-if logs and multi_stream_logger.ready():
-    stream_log_events = multi_stream_logger.get_latest_log_events()
+if logs:
+    stream_log_events = multi_stream_logger.get_latest_log_events(
+        flush=current_status in terminal_states
+    )
     for stream_id, event in stream_log_events:
         logger.info(f"{stream_id}:\\n{event['message']}")
 """
@@ -284,17 +325,20 @@ WAIT_METHOD_TEMPLATE = '''
 @Base.add_validate_call
 def wait(
     self,
-    poll: int = 5,
-    timeout: Optional[int] = None,
-    {logs_arg}
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,{logs_arg}
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a {resource_name} resource.
     
     Parameters:
-        poll: The number of seconds to wait between each poll.
-        timeout: The maximum number of seconds to wait before timing out.
-        {logs_arg_doc}
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to wait before timing out.{logs_arg_doc}
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
+
     Raises:
         TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
         FailedStatusError:   If the resource reaches a failed state.
@@ -303,28 +347,14 @@ def wait(
     """
     terminal_states = {terminal_resource_states}
     start_time = time.time()
-
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{{task.description}}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task("Waiting for {resource_name}...")
-    status = Status("Current status:")
+    poller = Poller(poll, timeout)
     {init_wait_logs}
 
-    with Live(
-        Panel(
-            Group(progress, status),
-            title="Wait Log Panel",
-            border_style=Style(color=Color.BLUE.value
-            )
-        ),
-        transient=True
-    ):
+    with WaiterDisplay("Waiting for {resource_name}...", display, status_callback) as waiter_display:
         while True:
-            self.refresh()
+            poller.call(self.refresh)
             current_status = self{status_key_path}
-            status.update(f"Current status: [bold]{{current_status}}")
+            waiter_display.update(current_status)
             {print_wait_logs}
             if current_status in terminal_states:
                 logger.info(f"Final Resource Status: [bold]{{current_status}}")
@@ -333,7 +363,7 @@ def wait(
 
             if timeout is not None and time.time() - start_time >= timeout:
                 raise TimeoutExceededError(resouce_type="{resource_name}", status=current_status)
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
 
 WAIT_FOR_STATUS_METHOD_TEMPLATE = '''
@@ -341,16 +371,20 @@ WAIT_FOR_STATUS_METHOD_TEMPLATE = '''
 def wait_for_status(
     self,
     target_status: Literal{resource_states},
-    poll: int = 5,
-    timeout: Optional[int] = None
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a {resource_name} resource to reach certain status.
     
     Parameters:
         target_status: The status to wait for.
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
     
     Raises:
         TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
@@ -358,27 +392,15 @@ def wait_for_status(
         WaiterError: Raised when an error occurs while waiting.
     """
     start_time = time.time()
+    poller = Poller(poll, timeout)
 
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{{task.description}}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task(f"Waiting for {resource_name} to reach [bold]{{target_status}} status...")
-    status = Status("Current status:")
-
-    with Live(
-        Panel(
-            Group(progress, status),
-            title="Wait Log Panel",
-            border_style=Style(color=Color.BLUE.value
-            )
-        ),
-        transient=True
-    ):
+    with WaiterDisplay(
+        f"Waiting for {resource_name} to reach [bold]{{target_status}} status...", display, status_callback
+    ) as waiter_display:
         while True:
-            self.refresh()
+            poller.call(self.refresh)
             current_status = self{status_key_path}
-            status.update(f"Current status: [bold]{{current_status}}")
+            waiter_display.update(current_status)
 
             if target_status == current_status:
                 logger.info(f"Final Resource Status: [bold]{{current_status}}")
@@ -386,22 +408,26 @@ def wait_for_status(
 {failed_error_block}
             if timeout is not None and time.time() - start_time >= timeout:
                 raise TimeoutExceededError(resouce_type="{resource_name}", status=current_status)
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
 
 WAIT_FOR_DELETE_METHOD_TEMPLATE = '''
 @Base.add_validate_call
 def wait_for_delete(
     self,
-    poll: int = 5,
+    poll: Union[int, PollStrategy] = 5,
     timeout: Optional[int] = None,
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a {resource_name} resource to be deleted.
     
     Parameters:
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
     
     Raises:
         botocore.exceptions.ClientError: This exception is raised for AWS service related errors. 
@@ -418,20 +444,16 @@ def wait_for_delete(
         WaiterError: Raised when an error occurs while waiting.
     """
     start_time = time.time()
+    poller = Poller(poll, timeout)
 
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{{task.description}}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task("Waiting for {resource_name} to be deleted...")
-    status = Status("Current status:")
-
-    with Live(Panel(Group(progress, status), title="Wait Log Panel", border_style=Style(color=Color.BLUE.value))):
+    with WaiterDisplay(
+        "Waiting for {resource_name} to be deleted...", display, status_callback, transient=False
+    ) as waiter_display:
         while True:
             try:
-                self.refresh()
+                poller.call(self.refresh)
                 current_status = self{status_key_path}
-                status.update(f"Current status: [bold]{{current_status}}")
+                waiter_display.update(current_status)
 {delete_failed_error_block}
 {deleted_status_check}
 
@@ -444,7 +466,46 @@ def wait_for_delete(
                     logger.info("Resource was not found. It may have been deleted.")
                     return
                 raise e
-            time.sleep(poll)
+            poller.sleep(current_status)
+'''
+
+STREAM_LOGS_METHOD_TEMPLATE = '''
+@Base.add_validate_call
+def stream_logs(
+    self,
+    follow: bool = True,
+    start_time: Optional[datetime.datetime] = None,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+    filter_pattern: Optional[str] = None,
+) -> JobLogStreamer:
+    """
+    Stream the log events of a {resource_name} resource.
+    
+    Parameters:
+        follow: Whether to keep polling for new log events until the resource reaches a terminal state, rather than only getting the log events that exist at this moment.
+        start_time: The time of the first log events to get. Defaults to None, getting the log events from the start of the job.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to follow the logs before timing out.
+        filter_pattern: The CloudWatch Logs filter pattern the log events must match.
+    
+    Returns:
+        JobLogStreamer: The LogEvents of the {resource_name}, fetched while iterating over them with for or async for.
+    
+    Raises:
+        TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+    """
+    instance_count = {get_instance_count}
+    return JobLogStreamer(
+        self,
+        log_group_name=f"/aws/sagemaker/{job_type}s",
+        instance_count=instance_count,
+        follow=follow,
+        start_time=start_time,
+        poll=poll,
+        timeout=timeout,
+        filter_pattern=filter_pattern,
+    )
 '''
 
 DELETE_FAILED_STATUS_CHECK = """
@@ -465,7 +526,7 @@ def delete(
 {delete_args}
     ) -> None:
 {docstring}
-    client = Base.get_sagemaker_client()
+    client = self._get_resource_client()
 
     operation_input_args = {{
 {operation_input_args}
@@ -483,7 +544,7 @@ STOP_METHOD_TEMPLATE = """
 @Base.add_validate_call
 def stop(self) -> None:
 {docstring}
-    client = SageMakerClient().client
+    client = self._get_resource_client()
 
     operation_input_args = {{
 {operation_input_args}
@@ -503,6 +564,9 @@ GET_ALL_METHOD_WITH_ARGS_TEMPLATE = """
 def get_all(
     cls,
 {get_all_args}
+    hydrate: bool = False,
+    hydrate_concurrency: Optional[int] = None,
+    prefetch_pages: int = 0,
     session: Optional[Session] = None,
     region: Optional[str] = None,
 ) -> ResourceIterator["{resource}"]:
@@ -528,6 +592,9 @@ GET_ALL_METHOD_NO_ARGS_TEMPLATE = '''
 @Base.add_validate_call
 def get_all(
     cls,
+    hydrate: bool = False,
+    hydrate_concurrency: Optional[int] = None,
+    prefetch_pages: int = 0,
     session: Optional[Session] = None,
     region: Optional[str] = None,
 ) -> ResourceIterator["{resource}"]:
@@ -535,6 +602,7 @@ def get_all(
     Get all {resource} resources.
     
     Parameters:
+{iterator_options_docstring}
         session: Boto3 session.
         region: Region name.
 
@@ -550,6 +618,109 @@ def get_all(
     )
 '''
 
+ASYNC_METHOD_TEMPLATE = """
+# Asynchronous counterpart of {method_name}, running it on the thread pool of the async bridge, with
+# the signature and docstring of {method_name}
+@functools.wraps({method_name}, assigned=("__module__", "__doc__"))
+async def a{method_name}(self, *args, **kwargs) -> {return_type}:
+    return await run_async(self.{method_name}, *args, **kwargs)
+"""
+
+ASYNC_CLASS_METHOD_TEMPLATE = """
+# Asynchronous counterpart of {method_name}, running it on the thread pool of the async bridge, with
+# the signature and docstring of {method_name}
+@classmethod
+@functools.wraps({method_name}.__func__, assigned=("__module__", "__doc__"))
+async def a{method_name}(cls, *args, **kwargs) -> {return_type}:
+    return await run_async(cls.{method_name}, *args, **kwargs)
+"""
+
+ASYNC_GET_ALL_METHOD_TEMPLATE = """
+# Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+# signature and docstring of get_all
+@classmethod
+@functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["{resource_name}"]:
+    return AsyncResourceIterator(cls.get_all(*args, **kwargs))
+"""
+
+AWAIT_COMPLETION_METHOD_TEMPLATE = '''
+@Base.add_validate_call
+async def await_completion(
+    self,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+) -> None:
+    """
+    Asynchronous counterpart of wait, waiting for a {resource_name} resource without blocking the event loop.
+
+    Parameters:
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to wait before timing out.
+
+    Raises:
+        TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+        FailedStatusError:   If the resource reaches a failed state.
+        WaiterError: Raised when an error occurs while waiting.
+    """
+    await wait_async(self, poll=poll, timeout=timeout)
+'''
+
+AWAIT_STATUS_METHOD_TEMPLATE = '''
+@Base.add_validate_call
+async def await_status(
+    self,
+    target_status: Literal{resource_states},
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+) -> None:
+    """
+    Asynchronous counterpart of wait_for_status, waiting for a {resource_name} resource to reach certain status without blocking the event loop.
+
+    Parameters:
+        target_status: The status to wait for.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to wait before timing out.
+
+    Raises:
+        TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+        FailedStatusError:   If the resource reaches a failed state.
+        WaiterError: Raised when an error occurs while waiting.
+    """
+    await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+'''
+
+AWAIT_DELETION_METHOD_TEMPLATE = '''
+@Base.add_validate_call
+async def await_deletion(
+    self,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+) -> None:
+    """
+    Asynchronous counterpart of wait_for_delete, waiting for a {resource_name} resource to be deleted without blocking the event loop.
+
+    Parameters:
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to wait before timing out.
+
+    Raises:
+        botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+        TimeoutExceededError:  If the resource is not deleted before the timeout.
+        DeleteFailedStatusError:   If the resource reaches a failed state.
+        WaiterError: Raised when an error occurs while waiting.
+    """
+    await wait_for_delete_async(self, poll=poll, timeout=timeout)
+'''
+
+ITERATOR_OPTIONS_DOCSTRING = """prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed."""
+
+PARALLEL_SHARDS_DOCSTRING = """parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order."""
+
+GET_ALL_ITERATOR_OPTIONS_DOCSTRING = f"""hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+{ITERATOR_OPTIONS_DOCSTRING}"""
+
 GENERIC_METHOD_TEMPLATE = """
 {decorator}
 @Base.add_validate_call
@@ -586,7 +757,7 @@ CALL_OPERATION_API_NO_ARG_TEMPLATE = """
 
 DESERIALIZE_RESPONSE_TEMPLATE = """
     transformed_response = transform(response, '{operation_output_shape}')
-    return {return_type_conversion}(**transformed_response)"""
+    return build_from_response({return_type_conversion}, transformed_response)"""
 
 DESERIALIZE_RESPONSE_TO_BASIC_TYPE_TEMPLATE = """
     return list(response.values())[0]"""
@@ -603,10 +774,48 @@ DESERIALIZE_INPUT_AND_RESPONSE_TO_CLS_TEMPLATE = """
 RESOURCE_BASE_CLASS_TEMPLATE = """
 class Base(BaseModel):
     model_config = ConfigDict(protected_namespaces=(), validate_assignment=True, extra="forbid")
+    # The session and region the resource was fetched with, used by the methods of the resource
+    _session: Optional[Session] = None
+    _region_name: Optional[str] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        # Resources are generated into per-resource modules but are exposed by the resources package
+        if cls.__module__.startswith(f"{resources.__name__}."):
+            cls.__module__ = resources.__name__
+        super().__pydantic_init_subclass__(**kwargs)
     
+    def __getattr__(self, name):
+        # Resources listed by get_all without hydration only hold the fields of their summary,
+        # the other fields are loaded with refresh on first access
+        fields = type(self).model_fields
+        if name in fields and hasattr(type(self), "refresh"):
+            unloaded_fields = {
+                field_name: field.get_default(call_default_factory=True)
+                for field_name, field in fields.items()
+                if field_name not in self.__dict__
+            }
+            self.__dict__.update(unloaded_fields)
+            try:
+                self.refresh()
+            except BaseException:
+                for field_name, default in unloaded_fields.items():
+                    if self.__dict__.get(field_name) is default:
+                        del self.__dict__[field_name]
+                raise
+            return self.__dict__[name]
+        return super().__getattr__(name)
+
     @classmethod
     def get_sagemaker_client(cls, session = None, region_name = None, service_name = 'sagemaker'):
         return SageMakerClient(session=session, region_name=region_name).get_client(service_name=service_name)
+
+    def _set_client_context(self, session: Optional[Session] = None, region_name: Optional[str] = None):
+        self._session = session
+        self._region_name = region_name
+
+    def _get_resource_client(self, service_name: str = 'sagemaker'):
+        return Base.get_sagemaker_client(session=self._session, region_name=self._region_name, service_name=service_name)
     
     @staticmethod
     def get_updated_kwargs_with_configured_attributes(
@@ -625,7 +834,7 @@ class Base(BaseModel):
                         configurable_attribute, resource_defaults, global_defaults
                     ):
                         resource_name = snake_to_pascal(configurable_attribute)
-                        class_object = getattr(shapes, resource_name, None) or globals().get(resource_name)
+                        class_object = getattr(shapes, resource_name, None) or getattr(resources, resource_name, None)
                         kwargs[configurable_attribute] = class_object(**config_value)
         except BaseException as e:
             logger.debug("Could not load Default Configs. Continuing.", exc_info=True)
@@ -671,7 +880,7 @@ class Base(BaseModel):
     @staticmethod
     def _get_chained_attribute(item_value: Any):
         resource_name = type(item_value).__name__
-        class_object = globals().get(resource_name) or getattr(shapes, resource_name, None)
+        class_object = getattr(resources, resource_name, None) or getattr(shapes, resource_name, None)
         if class_object is None:
             return item_value
         return class_object(**Base.populate_chained_attributes(
@@ -681,17 +890,42 @@ class Base(BaseModel):
 
     @staticmethod
     def add_validate_call(func):
+        validated_func = None
+
+        def get_validated_func():
+            nonlocal validated_func
+            # Build the validator once, on first call, when the annotations of func can be resolved
+            if validated_func is None:
+                config = dict(arbitrary_types_allowed=True)
+                validated_func = validate_call(config=config)(func)
+            return validated_func
+
+        if inspect.iscoroutinefunction(func):
+            # Coroutine functions stay coroutine functions, e.g. for inspect and asyncio
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await get_validated_func()(*args, **kwargs)
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            config = dict(arbitrary_types_allowed=True)
-            return validate_call(config=config)(func)(*args, **kwargs)
+            return get_validated_func()(*args, **kwargs)
         return wrapper
 
 """
 
 SHAPE_BASE_CLASS_TEMPLATE = """
 class {class_name}:
-    model_config = ConfigDict(protected_namespaces=(), validate_assignment=True, extra="forbid")
+    # Core schemas are built on first use of a shape rather than for every shape at import
+    model_config = ConfigDict(
+        protected_namespaces=(), validate_assignment=True, extra="forbid", defer_build=True
+    )
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        if not cls.__pydantic_complete__:
+            cls.__signature__ = DeferredModelSignature()
 """
 
 SHAPE_CLASS_TEMPLATE = '''
@@ -1,7 +1,17 @@
+import asyncio
 import botocore
+import datetime
 import pytest
-from unittest.mock import patch, MagicMock
-from sagemaker_core.main.logs import LogStreamHandler, MultiLogStreamHandler
+import threading
+from unittest.mock import AsyncMock, patch, MagicMock
+from sagemaker_core.main.exceptions import TimeoutExceededError
+from sagemaker_core.main.logs import (
+    FilterLogEventsHandler,
+    JobLogStreamer,
+    LogEvent,
+    LogStreamHandler,
+    MultiLogStreamHandler,
+)
 
 
 def test_single_stream_handler_get_latest():
@@ -66,6 +76,247 @@ def test_multi_stream_handler_get_latest(mock_ready):
         next(events)
 
 
+@patch("sagemaker_core.main.logs.MultiLogStreamHandler.ready", autospec=True)
+def test_multi_stream_handler_fetches_streams_concurrently(mock_ready):
+    mock_ready.return_value = True
+    # Every stream waits for the others, so the fetch only completes if they run concurrently
+    barrier = threading.Barrier(3, timeout=5)
+
+    def mock_stream(stream_name):
+        def get_latest_log_events():
+            barrier.wait()
+            for timestamp in (1, 2):
+                yield stream_name, {
+                    "ingestionTime": timestamp,
+                    "message": f"{stream_name} message {timestamp}",
+                    "timestamp": timestamp,
+                }
+
+        stream = MagicMock(spec=LogStreamHandler)
+        stream.get_latest_log_events.side_effect = get_latest_log_events
+        return stream
+
+    multi_log_stream_handler = MultiLogStreamHandler("log_group_name", "training_job_name", 3)
+    multi_log_stream_handler.streams = [mock_stream(f"stream{i}") for i in range(3)]
+
+    events = list(multi_log_stream_handler.get_latest_log_events())
+
+    assert [(stream_name, event["message"]) for stream_name, event in events] == [
+        (f"stream{i}", f"stream{i} message {j}") for j in (1, 2) for i in range(3)
+    ]
+
+
+def _mock_stream(stream_name, timestamps):
+    stream = MagicMock(spec=LogStreamHandler)
+    stream.get_latest_log_events.return_value = iter(
+        [
+            (
+                stream_name,
+                {
+                    "ingestionTime": timestamp,
+                    "message": f"message {timestamp}",
+                    "timestamp": timestamp,
+                },
+            )
+            for timestamp in timestamps
+        ]
+    )
+    return stream
+
+
+@patch("sagemaker_core.main.logs.MultiLogStreamHandler.ready", autospec=True)
+def test_multi_stream_handler_merges_streams_by_timestamp(mock_ready):
+    mock_ready.return_value = True
+
+    multi_log_stream_handler = MultiLogStreamHandler("log_group_name", "training_job_name", 3)
+    multi_log_stream_handler.streams = [
+        _mock_stream("stream0", [1, 4, 7]),
+        _mock_stream("stream1", [2, 3, 8]),
+        _mock_stream("stream2", [5, 6]),
+    ]
+
+    events = list(multi_log_stream_handler.get_latest_log_events())
+
+    assert [(stream_name, event["timestamp"]) for stream_name, event in events] == [
+        ("stream0", 1),
+        ("stream1", 2),
+        ("stream1", 3),
+        ("stream0", 4),
+        ("stream2", 5),
+        ("stream2", 6),
+        ("stream0", 7),
+        ("stream1", 8),
+    ]
+
+
+@patch("sagemaker_core.main.logs.MultiLogStreamHandler.ready", autospec=True)
+def test_multi_stream_handler_holds_back_events_within_reorder_window(mock_ready):
+    mock_ready.return_value = True
+
+    multi_log_stream_handler = MultiLogStreamHandler(
+        "log_group_name", "training_job_name", 2, reorder_window=10
+    )
+    multi_log_stream_handler.streams = [
+        _mock_stream("stream0", [1, 20, 25]),
+        _mock_stream("stream1", []),
+    ]
+
+    events = list(multi_log_stream_handler.get_latest_log_events())
+
+    # Events within 10ms of the latest event are held back for the late events of stream1
+    assert [event["timestamp"] for _, event in events] == [1]
+
+    multi_log_stream_handler.streams = [
+        _mock_stream("stream0", [40]),
+        _mock_stream("stream1", [18, 22]),
+    ]
+
+    events = list(multi_log_stream_handler.get_latest_log_events())
+
+    assert [(stream_name, event["timestamp"]) for stream_name, event in events] == [
+        ("stream1", 18),
+        ("stream0", 20),
+        ("stream1", 22),
+        ("stream0", 25),
+    ]
+
+    multi_log_stream_handler.streams = [_mock_stream("stream0", []), _mock_stream("stream1", [])]
+
+    events = list(multi_log_stream_handler.get_latest_log_events(flush=True))
+
+    assert [(stream_name, event["timestamp"]) for stream_name, event in events] == [("stream0", 40)]
+    assert multi_log_stream_handler.held_back_events == []
+
+
+def test_multi_stream_handler_tracks_next_token_per_stream():
+    responses = {
+        ("stream0", None): {
+            "nextForwardToken": "stream0-token1",
+            "events": [{"ingestionTime": 1, "message": "a", "timestamp": 1}],
+        },
+        ("stream0", "stream0-token1"): {"nextForwardToken": "stream0-token1", "events": []},
+        ("stream1", None): {"nextForwardToken": "stream1-token1", "events": []},
+        ("stream1", "stream1-token1"): {"nextForwardToken": "stream1-token2", "events": []},
+    }
+
+    def get_log_events(logStreamName, nextToken=None, **kwargs):
+        return responses[(logStreamName, nextToken)]
+
+    mock_cw_client = MagicMock()
+    mock_cw_client.get_log_events.side_effect = get_log_events
+    multi_log_stream_handler = MultiLogStreamHandler("logGroupName", "logStreamNamePrefix", 2)
+    multi_log_stream_handler.streams = [
+        LogStreamHandler("logGroupName", f"stream{i}", i) for i in range(2)
+    ]
+    for stream in multi_log_stream_handler.streams:
+        stream.cw_client = mock_cw_client
+
+    with patch.object(multi_log_stream_handler, "ready", return_value=True):
+        assert list(multi_log_stream_handler.get_latest_log_events()) == [
+            ("stream0", {"ingestionTime": 1, "message": "a", "timestamp": 1})
+        ]
+        assert list(multi_log_stream_handler.get_latest_log_events()) == []
+
+    assert [stream.next_token for stream in multi_log_stream_handler.streams] == [
+        "stream0-token1",
+        "stream1-token2",
+    ]
+
+
+def _filter_log_event(event_id, stream_name, timestamp):
+    return {
+        "eventId": event_id,
+        "logStreamName": stream_name,
+        "ingestionTime": timestamp,
+        "message": f"message {event_id}",
+        "timestamp": timestamp,
+    }
+
+
+def test_filter_log_events_handler_get_latest():
+    filter_log_events_handler = FilterLogEventsHandler(
+        "logGroupName", "logStreamNamePrefix", filter_pattern="ERROR", lookback=10
+    )
+
+    with patch.object(filter_log_events_handler, "cw_client") as mock_cw_client:
+        mock_cw_client.filter_log_events.side_effect = [
+            {
+                "events": [
+                    _filter_log_event("1", "stream1", 100),
+                    _filter_log_event("0", "stream0", 95),
+                ],
+                "nextToken": "nextToken1",
+            },
+            {"events": [_filter_log_event("2", "stream0", 120)]},
+            {
+                "events": [
+                    _filter_log_event("2", "stream0", 120),
+                    _filter_log_event("3", "stream1", 115),
+                ]
+            },
+        ]
+
+        events = list(filter_log_events_handler.get_latest_log_events())
+
+        assert [(stream_name, event["eventId"]) for stream_name, event in events] == [
+            ("stream0", "0"),
+            ("stream1", "1"),
+            ("stream0", "2"),
+        ]
+        assert filter_log_events_handler.start_time == 110
+
+        events = list(filter_log_events_handler.get_latest_log_events())
+
+        # The events already returned within the lookback window are de-duplicated
+        assert [(stream_name, event["eventId"]) for stream_name, event in events] == [
+            ("stream1", "3")
+        ]
+        call_args_list = mock_cw_client.filter_log_events.call_args_list
+        assert call_args_list[0].kwargs == {
+            "logGroupName": "logGroupName",
+            "logStreamNamePrefix": "logStreamNamePrefix/",
+            "filterPattern": "ERROR",
+        }
+        assert call_args_list[1].kwargs["nextToken"] == "nextToken1"
+        assert call_args_list[2].kwargs["startTime"] == 110
+
+
+def test_filter_log_events_handler_resource_not_found():
+    filter_log_events_handler = FilterLogEventsHandler("logGroupName", "logStreamNamePrefix")
+
+    with patch.object(filter_log_events_handler, "cw_client") as mock_cw_client:
+        mock_cw_client.filter_log_events.side_effect = botocore.exceptions.ClientError(
+            error_response={"Error": {"Code": "ResourceNotFoundException"}}, operation_name="test"
+        )
+
+        assert list(filter_log_events_handler.get_latest_log_events()) == []
+        assert filter_log_events_handler.start_time is None
+
+
+def test_multi_stream_handler_uses_filter_log_events_for_many_streams():
+    assert MultiLogStreamHandler("logGroupName", "prefix", 10).filter_log_events_handler is None
+    assert MultiLogStreamHandler("logGroupName", "prefix", 11).filter_log_events_handler
+    assert MultiLogStreamHandler(
+        "logGroupName", "prefix", 1, filter_pattern="ERROR"
+    ).filter_log_events_handler
+    assert not MultiLogStreamHandler(
+        "logGroupName", "prefix", 100, use_filter_log_events=False
+    ).filter_log_events_handler
+
+    multi_log_stream_handler = MultiLogStreamHandler("logGroupName", "prefix", 100)
+    event = _filter_log_event("0", "stream0", 100)
+
+    with patch.object(multi_log_stream_handler, "cw_client") as mock_cw_client:
+        with patch.object(
+            multi_log_stream_handler.filter_log_events_handler, "get_latest_log_events"
+        ) as mock_get_latest_log_events:
+            mock_get_latest_log_events.return_value = iter([("stream0", event)])
+
+            assert multi_log_stream_handler.ready()
+            assert list(multi_log_stream_handler.get_latest_log_events()) == [("stream0", event)]
+            mock_cw_client.describe_log_streams.assert_not_called()
+
+
 def test_ready():
     mock_streams = {
         "logStreams": [{"logStreamName": "streamName"}],
@@ -82,6 +333,83 @@ def test_ready():
         mock_cw_client.describe_log_streams.assert_called_once()
 
 
+@patch("sagemaker_core.main.logs.time.time")
+def test_ready_discovers_streams_incrementally(mock_time):
+    mock_time.return_value = 0
+    stream_names = [[], ["prefix/algo-1"], ["prefix/algo-1", "prefix/algo-2"]]
+
+    multi_log_stream_handler = MultiLogStreamHandler("logGroupName", "prefix", 2)
+    with patch.object(multi_log_stream_handler, "cw_client") as mock_cw_client:
+        mock_cw_client.describe_log_streams.side_effect = [
+            {"logStreams": [{"logStreamName": name} for name in names]} for names in stream_names
+        ]
+        with patch.object(
+            multi_log_stream_handler.discovery_strategy, "next_delay", side_effect=[5, 10, 5]
+        ):
+            assert multi_log_stream_handler.ready() == False
+
+            # Streams are not described again before the back-off delay
+            mock_time.return_value = 4
+            assert multi_log_stream_handler.ready() == False
+            assert mock_cw_client.describe_log_streams.call_count == 1
+
+            # The streams that already exist are tailed while the other hosts start
+            mock_time.return_value = 5
+            assert multi_log_stream_handler.ready() == True
+            assert [stream.log_stream_name for stream in multi_log_stream_handler.streams] == [
+                "prefix/algo-1"
+            ]
+
+            mock_time.return_value = 15
+            assert multi_log_stream_handler.ready() == True
+            assert [
+                (stream.log_stream_name, stream.stream_id)
+                for stream in multi_log_stream_handler.streams
+            ] == [("prefix/algo-1", 0), ("prefix/algo-2", 1)]
+
+            # All the expected streams are known, so they are not described anymore
+            assert multi_log_stream_handler.ready() == True
+            assert mock_cw_client.describe_log_streams.call_count == 3
+
+
+@patch("sagemaker_core.main.logs.CloudWatchLogsClient")
+@patch("sagemaker_core.main.logs.time.time")
+def test_flush_discovers_streams_during_back_off(mock_time, mock_cw_logs_client):
+    mock_time.return_value = 0
+    mock_cw_client = mock_cw_logs_client.return_value.client
+    mock_cw_client.describe_log_streams.side_effect = [
+        {"logStreams": [{"logStreamName": name} for name in names]}
+        for names in [["prefix/algo-1"], ["prefix/algo-1", "prefix/algo-2"]]
+    ]
+    events = {
+        "prefix/algo-1": [{"ingestionTime": 1, "message": "a", "timestamp": 1}],
+        "prefix/algo-2": [{"ingestionTime": 2, "message": "b", "timestamp": 2}],
+    }
+    mock_cw_client.get_log_events.side_effect = lambda logStreamName, **kwargs: {
+        "nextForwardToken": f"{logStreamName}-token",
+        "events": events.pop(logStreamName, []),
+    }
+
+    multi_log_stream_handler = MultiLogStreamHandler("logGroupName", "prefix", 2)
+    assert multi_log_stream_handler.ready() == True
+
+    # The stream of the second host appears during the back-off, and is discovered
+    # once no more events are expected
+    mock_time.return_value = 1
+    assert list(multi_log_stream_handler.get_latest_log_events(flush=True)) == [
+        ("prefix/algo-1", {"ingestionTime": 1, "message": "a", "timestamp": 1}),
+        ("prefix/algo-2", {"ingestionTime": 2, "message": "b", "timestamp": 2}),
+    ]
+    assert mock_cw_client.describe_log_streams.call_count == 2
+
+
+def test_streams_are_not_shared_between_handlers():
+    multi_log_stream_handler = MultiLogStreamHandler("logGroupName", "prefix", 1)
+    multi_log_stream_handler.streams.append(LogStreamHandler("logGroupName", "prefix/algo-1", 0))
+
+    assert MultiLogStreamHandler("logGroupName", "prefix", 1).streams == []
+
+
 def test_ready_streams_set():
     log_stream = LogStreamHandler("logGroupName", "logStreamName", 0)
     multi_log_stream_handler = MultiLogStreamHandler("logGroupName", "logStreamNamePrefix", 1)
@@ -119,3 +447,126 @@ def test_ready_resource_not_found():
 
         assert result == False
         mock_cw_client.describe_log_streams.assert_called_once()
+
+
+def _mock_job(statuses):
+    job = MagicMock()
+    job.get_name.return_value = "job-name"
+    job._status_attributes = ["job_status"]
+    job._terminal_states = ["Completed", "Failed", "Stopped"]
+
+    def refresh():
+        job.job_status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return job
+
+    job.refresh.side_effect = refresh
+    return job
+
+
+def _mock_log_handler(events_by_poll):
+    log_handler = MagicMock(spec=MultiLogStreamHandler)
+    log_handler.ready.return_value = True
+    log_handler.get_latest_log_events.side_effect = [
+        iter(
+            [
+                (
+                    "stream0",
+                    {"ingestionTime": timestamp, "message": message, "timestamp": timestamp},
+                )
+                for timestamp, message in events
+            ]
+        )
+        for events in events_by_poll
+    ]
+    return log_handler
+
+
+def test_job_log_streamer_follows_logs_until_terminal_state():
+    job_log_streamer = JobLogStreamer(
+        _mock_job(["InProgress", "Completed"]), "/aws/sagemaker/TrainingJobs", 1, poll=1
+    )
+    job_log_streamer.log_handler = _mock_log_handler([[(1, "a"), (2, "b")], [(3, "c")]])
+
+    with patch.object(job_log_streamer.poller, "sleep") as mock_sleep:
+        events = list(job_log_streamer)
+
+    assert events == [
+        LogEvent(stream_id="stream0", timestamp=1, message="a", ingestion_time=1),
+        LogEvent(stream_id="stream0", timestamp=2, message="b", ingestion_time=2),
+        LogEvent(stream_id="stream0", timestamp=3, message="c", ingestion_time=3),
+    ]
+    # The held back events are flushed once the job reaches a terminal state
+    mock_get_latest_log_events = job_log_streamer.log_handler.get_latest_log_events
+    assert [call.kwargs["flush"] for call in mock_get_latest_log_events.mock_calls] == [
+        False,
+        True,
+    ]
+    mock_sleep.assert_called_once_with("InProgress")
+
+
+def test_job_log_streamer_fetches_events_while_consumed():
+    fetched_events = []
+
+    def get_latest_log_events(flush):
+        for timestamp in range(3):
+            fetched_events.append(timestamp)
+            yield "stream0", {"ingestionTime": timestamp, "message": "", "timestamp": timestamp}
+
+    job = _mock_job(["InProgress"])
+    job_log_streamer = JobLogStreamer(job, "/aws/sagemaker/TrainingJobs", 1, follow=False)
+    job_log_streamer.log_handler = MagicMock(spec=MultiLogStreamHandler)
+    job_log_streamer.log_handler.get_latest_log_events.side_effect = get_latest_log_events
+
+    events = iter(job_log_streamer)
+
+    assert next(events).timestamp == 0
+    assert fetched_events == [0]
+    assert [event.timestamp for event in events] == [1, 2]
+    # Without following the logs, the job is not polled
+    job.refresh.assert_not_called()
+
+
+def test_job_log_streamer_raises_on_timeout():
+    job_log_streamer = JobLogStreamer(
+        _mock_job(["InProgress"]), "/aws/sagemaker/TrainingJobs", 1, timeout=0
+    )
+    job_log_streamer.log_handler = _mock_log_handler([[(1, "a")]])
+
+    with pytest.raises(TimeoutExceededError):
+        list(job_log_streamer)
+
+
+@patch("sagemaker_core.main.logs.asyncio.sleep", new_callable=AsyncMock)
+def test_job_log_streamer_async_iteration(mock_sleep):
+    job_log_streamer = JobLogStreamer(
+        _mock_job(["InProgress", "InProgress", "Completed"]), "/aws/sagemaker/TrainingJobs", 1
+    )
+    job_log_streamer.log_handler = _mock_log_handler([[(1, "a")], [], [(2, "b"), (3, "c")]])
+
+    async def stream_logs():
+        return [event.message async for event in job_log_streamer]
+
+    assert asyncio.run(stream_logs()) == ["a", "b", "c"]
+    assert mock_sleep.await_count == 2
+
+
+def test_job_log_streamer_start_time():
+    start_time = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    job_log_streamer = JobLogStreamer(
+        _mock_job(["Completed"]), "/aws/sagemaker/TrainingJobs", 1, start_time=start_time
+    )
+
+    assert job_log_streamer.log_handler.start_time == 1704067200000
+
+    log_stream_handler = LogStreamHandler("logGroupName", "logStreamName", 0, 1704067200000)
+    with patch.object(log_stream_handler, "cw_client") as mock_cw_client:
+        mock_cw_client.get_log_events.return_value = {"nextForwardToken": "token", "events": []}
+
+        list(log_stream_handler.get_latest_log_events())
+
+        mock_cw_client.get_log_events.assert_called_once_with(
+            logGroupName="logGroupName",
+            logStreamName="logStreamName",
+            startFromHead=True,
+            startTime=1704067200000,
+        )
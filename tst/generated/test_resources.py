@@ -1,14 +1,20 @@
 import datetime
+import functools
 import importlib
 import inspect
+import subprocess
+import sys
 import unittest
-from unittest.mock import patch
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
 
-from sagemaker_core.main.resources import Base
+from pydantic import ValidationError, validate_call
+
+from sagemaker_core.main.resources import Base, RESOURCE_MODULES
 
 from sagemaker_core.main.code_injection.codec import pascal_to_snake, snake_to_pascal
 
-from sagemaker_core.main.utils import SageMakerClient, serialize
+from sagemaker_core.main.utils import SageMakerClientPool, serialize
 from sagemaker_core.tools.constants import BASIC_RETURN_TYPES
 from sagemaker_core.tools.data_extractor import (
     load_additional_operations_data,
@@ -17,6 +23,25 @@ from sagemaker_core.tools.data_extractor import (
 )
 
 
+def patch_resource_modules(attribute):
+    """Patch an attribute in every generated resource module with one mock, passed as mock_<attribute>."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            mock = MagicMock()
+            with ExitStack() as stack:
+                for module_name in RESOURCE_MODULES.values():
+                    stack.enter_context(
+                        patch(f"sagemaker_core.main.resources.{module_name}.{attribute}", mock)
+                    )
+                return func(*args, **kwargs, **{f"mock_{attribute}": mock})
+
+        return wrapper
+
+    return decorator
+
+
 class ResourcesTest(unittest.TestCase):
     MOCK_RESOURCES_RESPONSE_BY_RESOURCE_NAME = {}
     SHAPE_CLASSES_BY_SHAPE_NAME = {}
@@ -31,6 +56,8 @@ class ResourcesTest(unittest.TestCase):
     ADDITIONAL_METHODS = load_additional_operations_data()
     OPERATIONS = load_combined_operations_data()
     SHAPES = load_combined_shapes_data()
+    # Options of the iterators returned by get_all, not parameters of the list operations
+    ITERATOR_OPTIONS = ("hydrate", "hydrate_concurrency", "prefetch_pages", "parallel_shards")
 
     def setUp(self) -> None:
         for name, cls in inspect.getmembers(
@@ -48,9 +75,9 @@ class ResourcesTest(unittest.TestCase):
             if shape_cls.__module__ == "sagemaker_core.main.shapes":
                 self.SHAPE_CLASSES_BY_SHAPE_NAME[shape_name] = shape_cls
 
-    @patch("sagemaker_core.main.resources.transform")
-    @patch("boto3.session.Session")
-    def test_resources(self, session, mock_transform):
+    @patch_resource_modules("transform")
+    @patch.object(SageMakerClientPool, "get_client")
+    def test_resources(self, mock_get_client, mock_transform):
         report = {
             "Create": 0,
             "Update": 0,
@@ -61,7 +88,8 @@ class ResourcesTest(unittest.TestCase):
             "Others": 0,
         }
         resources = set()
-        client = SageMakerClient(session=session).get_client(service_name="sagemaker")
+        # A single mocked client serves the operations of all services
+        client = mock_get_client.return_value
         for name, cls in inspect.getmembers(
             importlib.import_module("sagemaker_core.main.resources"), inspect.isclass
         ):
@@ -153,7 +181,7 @@ class ResourcesTest(unittest.TestCase):
                                 pascal_input_args = self._convert_dict_keys_into_pascal_case(
                                     input_args
                                 )
-                                cls.get_all(**input_args).__next__()
+                                cls.get_all(**input_args, hydrate=True).__next__()
                                 mock_method.assert_called_once()
                                 mock_get_method.assert_called_once()
                                 self.assertLessEqual(
@@ -386,6 +414,55 @@ class ResourcesTest(unittest.TestCase):
         for method, count in report.items():
             print(f"Total Tests Executed for {method} = {count}")
 
+    def test_resources_are_imported_lazily(self):
+        loaded_modules = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "from sagemaker_core.resources import TrainingJob\n"
+                "print(sorted(m for m in sys.modules if m.startswith('sagemaker_core.main.resources')))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        self.assertEqual(
+            loaded_modules.strip(),
+            str(
+                [
+                    "sagemaker_core.main.resources",
+                    "sagemaker_core.main.resources._base",
+                    "sagemaker_core.main.resources.training_job",
+                ]
+            ),
+        )
+
+    def test_resources_are_exposed_by_the_resources_package(self):
+        resources_package = importlib.import_module("sagemaker_core.main.resources")
+        for name in RESOURCE_MODULES:
+            cls = getattr(resources_package, name)
+            self.assertTrue(issubclass(cls, Base))
+            self.assertEqual(cls.__module__, "sagemaker_core.main.resources")
+        with self.assertRaises(AttributeError):
+            resources_package.NotAResource
+
+    def test_add_validate_call_builds_validator_once(self):
+        with patch(
+            "sagemaker_core.main.resources._base.validate_call", wraps=validate_call
+        ) as mock_validate_call:
+
+            @Base.add_validate_call
+            def func(value: int) -> int:
+                return value
+
+            mock_validate_call.assert_not_called()
+            self.assertEqual(func(1), 1)
+            self.assertEqual(func("2"), 2)
+            with self.assertRaises(ValidationError):
+                func("not-an-int")
+            mock_validate_call.assert_called_once()
+
     def _get_function_name_for_list(self, resource_name):
         if resource_name == "code_repository":
             return "list_code_repositories"
@@ -414,6 +491,7 @@ class ResourcesTest(unittest.TestCase):
             if (
                 key != "session"
                 and key != "region"
+                and key not in self.ITERATOR_OPTIONS
                 and "Optional" not in attribute_type
                 and key != "self"
                 and "utils.Unassigned" not in attribute_type
@@ -1,4 +1,7 @@
 import ast
+import inspect
+import subprocess
+import sys
 import unittest
 
 from pydantic import BaseModel, ValidationError
@@ -42,6 +45,26 @@ class TestGeneratedShape(unittest.TestCase):
         with self.assertRaises(ValidationError):
             AdditionalS3DataSource(s3_data_type="str", s3_uri=12)
 
+    def test_shape_schemas_are_built_on_first_use(self):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from sagemaker_core.main.shapes import AdditionalS3DataSource as shape\n"
+                "print(shape.__pydantic_complete__)\n"
+                "shape(s3_data_type='filestring', s3_uri='s3/uri')\n"
+                "print(shape.__pydantic_complete__)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert output.split() == ["False", "True"]
+
+    def test_deferred_shape_signature_lists_fields(self):
+        parameters = inspect.signature(AdditionalS3DataSource).parameters
+        assert list(parameters) == ["s3_data_type", "s3_uri", "compression_type", "e_tag"]
+
     def _fetch_number_of_classes_in_file_not_inheriting_a_class(
         self, filepath: str, base_class_name: str
     ):
@@ -1,13 +1,26 @@
+import asyncio
 import pytest
 import datetime
+import gc
+import json
 import logging
+import queue
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, call
+from boto3.session import Session
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from sagemaker_core.main.resources import TrainingJob, DataQualityJobDefinition
 from sagemaker_core.main.shapes import (
     AdditionalS3DataSource,
+    ResourceConfig,
+    TrainingJobSummary,
     TrialComponent,
     TrialComponentParameterValue,
 )
+from sagemaker_core.main.code_injection.codec import is_trusted_responses
 from sagemaker_core.main.utils import *
 
 
@@ -95,6 +108,7 @@ def resource_iterator():
         list_method="list_training_jobs",
         list_method_kwargs={},
         custom_key_mapping=None,
+        hydrate=True,
     )
 
     return iterator, client, resource_cls
@@ -116,6 +130,7 @@ def resource_iterator_with_custom_key_mapping():
         resource_cls=DataQualityJobDefinition,
         custom_key_mapping=custom_key_mapping,
         list_method_kwargs={},
+        hydrate=True,
     )
     return iterator, client, resource_cls
 
@@ -318,6 +333,953 @@ def test_next_with_primitive_class(resource_iterator_with_primitive_class):
         assert client.list_aliases.call_args_list == [call()]
 
 
+def test_next_with_trusted_responses(resource_iterator):
+    iterator, client, _ = resource_iterator
+    # Trusted responses are not validated, so the unexpected status type is kept as is
+    client.list_training_jobs.return_value = {
+        "TrainingJobSummaries": [
+            {"TrainingJobName": "xgboost-iris-1", "TrainingJobStatus": 1},
+            {"TrainingJobName": "xgboost-iris-2", "TrainingJobStatus": 2},
+        ]
+    }
+
+    with patch.object(TrainingJob, "refresh"), trusted_responses():
+        training_jobs = list(iterator)
+
+    assert [training_job.training_job_name for training_job in training_jobs] == [
+        "xgboost-iris-1",
+        "xgboost-iris-2",
+    ]
+    assert [training_job.training_job_status for training_job in training_jobs] == [1, 2]
+
+
+def test_next_without_hydrate_refreshes_on_first_access_of_unloaded_field():
+    client = Mock()
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+    )
+    expected_training_job_data = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN[
+        "TrainingJobSummaries"
+    ][0]
+
+    with patch.object(TrainingJob, "refresh") as mock_refresh:
+        training_jobs = list(iterator)
+        assert mock_refresh.call_count == 0
+
+        next_item = training_jobs[0]
+        assert next_item.training_job_name == expected_training_job_data["TrainingJobName"]
+        assert next_item.training_job_status == expected_training_job_data["TrainingJobStatus"]
+        assert mock_refresh.call_count == 0
+
+        assert next_item.role_arn == Unassigned()
+        assert next_item.hyper_parameters == Unassigned()
+        assert mock_refresh.call_count == 1
+        assert next_item.training_job_name == expected_training_job_data["TrainingJobName"]
+
+
+def _patch_regional_clients(pool, clients):
+    """Patch the pool to create a mock client per region, listing and describing training jobs."""
+
+    def create_client(service_name, session, region_name, config):
+        client = clients[region_name] = Mock()
+        client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN
+        client.describe_training_job.side_effect = lambda TrainingJobName: {
+            "TrainingJobName": TrainingJobName,
+            "TrainingJobStatus": "Completed",
+            "RoleArn": f"arn:aws:iam::111111111111:role/{region_name}",
+        }
+        return client
+
+    return patch.object(pool, "_create_client", side_effect=create_client)
+
+
+def test_next_without_hydrate_refreshes_in_the_region_resources_were_listed_in():
+    pool = SageMakerClientPool()
+    clients = {}
+
+    with patch.object(SageMakerClient, "pool", pool), _patch_regional_clients(pool, clients):
+        training_job = next(TrainingJob.get_all(region="ap-south-1"))
+        assert training_job.role_arn == "arn:aws:iam::111111111111:role/ap-south-1"
+
+    assert list(clients) == ["ap-south-1"]
+    assert clients["ap-south-1"].describe_training_job.call_count == 1
+
+
+def test_next_without_hydrate_keeps_fields_unloaded_when_refresh_fails(resource_iterator):
+    iterator, client, _ = resource_iterator
+    iterator.hydrate = False
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN
+    next_item = next(iterator)
+
+    with patch.object(TrainingJob, "refresh", side_effect=[ValueError, None]) as mock_refresh:
+        with pytest.raises(ValueError):
+            next_item.role_arn
+        assert next_item.role_arn == Unassigned()
+        assert mock_refresh.call_count == 2
+
+    with pytest.raises(AttributeError):
+        next_item.not_a_field
+
+
+def test_next_with_hydrate_concurrency_refreshes_page_in_order():
+    client = Mock()
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        hydrate_concurrency=4,
+    )
+    client.list_training_jobs.side_effect = [
+        LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN,
+        LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN,
+    ]
+    expected_training_job_names = [
+        summary["TrainingJobName"]
+        for response in [
+            LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN,
+            LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN,
+        ]
+        for summary in response["TrainingJobSummaries"]
+    ]
+
+    with patch.object(TrainingJob, "refresh") as mock_refresh:
+        training_jobs = list(iterator)
+
+    assert iterator.hydrate
+    assert mock_refresh.call_count == 4
+    assert [
+        training_job.training_job_name for training_job in training_jobs
+    ] == expected_training_job_names
+
+
+def test_next_with_hydrate_concurrency_refreshes_in_the_region_resources_were_listed_in():
+    pool = SageMakerClientPool()
+    clients = {}
+
+    with patch.object(SageMakerClient, "pool", pool), _patch_regional_clients(pool, clients):
+        training_jobs = list(TrainingJob.get_all(region="ap-south-1", hydrate_concurrency=2))
+
+    assert [training_job.role_arn for training_job in training_jobs] == [
+        "arn:aws:iam::111111111111:role/ap-south-1"
+    ] * 2
+    assert list(clients) == ["ap-south-1"]
+    assert clients["ap-south-1"].describe_training_job.call_count == 2
+
+
+def test_next_with_hydrate_concurrency_refreshes_in_context_of_caller():
+    client = Mock()
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        hydrate_concurrency=4,
+    )
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN
+    trusted_refreshes = []
+
+    def refresh(self):
+        trusted_refreshes.append(is_trusted_responses())
+        return self
+
+    with patch.object(TrainingJob, "refresh", autospec=True, side_effect=refresh):
+        with trusted_responses():
+            list(iterator)
+
+    assert trusted_refreshes == [True, True]
+
+
+def test_next_with_prefetch_pages():
+    client = Mock()
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        prefetch_pages=1,
+    )
+    client.list_training_jobs.side_effect = [
+        LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN,
+        LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN,
+    ]
+    expected_training_job_names = [
+        summary["TrainingJobName"]
+        for response in [
+            LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN,
+            LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN,
+        ]
+        for summary in response["TrainingJobSummaries"]
+    ]
+
+    training_jobs = list(iterator)
+
+    assert [
+        training_job.training_job_name for training_job in training_jobs
+    ] == expected_training_job_names
+    assert client.list_training_jobs.call_args_list == [
+        call(),
+        call(NextToken=LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN["NextToken"]),
+    ]
+    assert iterator.page_queue is None
+
+
+def test_next_with_prefetch_pages_raises_list_error():
+    client = Mock()
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        prefetch_pages=2,
+    )
+    client.list_training_jobs.side_effect = [
+        LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN,
+        ValueError("list failed"),
+    ]
+
+    assert next(iterator).training_job_name == "xgboost-iris-1"
+    assert next(iterator).training_job_name == "xgboost-iris-2"
+    with pytest.raises(ValueError, match="list failed"):
+        next(iterator)
+
+
+def _mock_list_training_jobs(training_jobs, page_size=2, default_sort_order="Ascending"):
+    def as_utc(value):
+        if isinstance(value, str):
+            # Like botocore, timestamps are also accepted as ISO 8601 strings
+            value = datetime.datetime.fromisoformat(value)
+        return value.replace(tzinfo=datetime.timezone.utc) if value.tzinfo is None else value
+
+    def list_training_jobs(NextToken=None, SortBy="CreationTime", SortOrder=None, **kwargs):
+        SortOrder = SortOrder or default_sort_order
+        after = as_utc(kwargs.get("CreationTimeAfter", datetime.datetime.min))
+        before = as_utc(kwargs.get("CreationTimeBefore", datetime.datetime.max))
+        summaries = [
+            summary for summary in training_jobs if after < summary["CreationTime"] < before
+        ]
+        sort_key = "CreationTime" if SortBy == "CreationTime" else f"TrainingJob{SortBy}"
+        summaries.sort(key=lambda summary: summary[sort_key], reverse=SortOrder == "Descending")
+        start = int(NextToken or 0)
+        response = {"TrainingJobSummaries": summaries[start : start + page_size]}
+        if start + page_size < len(summaries):
+            response["NextToken"] = str(start + page_size)
+        return response
+
+    return Mock(side_effect=list_training_jobs)
+
+
+SHARDED_TRAINING_JOBS = [
+    {
+        "TrainingJobName": f"training-job-{name}",
+        "CreationTime": datetime.datetime(2024, month, 1, tzinfo=datetime.timezone.utc),
+        "TrainingJobStatus": "Completed",
+    }
+    for month, name in zip(range(1, 13), "lkjihgfedcba")
+]
+
+
+def test_next_with_parallel_shards_in_creation_time_order():
+    client = Mock()
+    client.list_training_jobs = _mock_list_training_jobs(SHARDED_TRAINING_JOBS)
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        list_method_kwargs={
+            "CreationTimeAfter": datetime.datetime(2023, 12, 1),
+            "CreationTimeBefore": datetime.datetime(2024, 12, 31),
+            "SortOrder": "Descending",
+        },
+        parallel_shards=4,
+    )
+
+    training_jobs = list(iterator)
+
+    assert [training_job.training_job_name for training_job in training_jobs] == [
+        summary["TrainingJobName"] for summary in reversed(SHARDED_TRAINING_JOBS)
+    ]
+    assert client.list_training_jobs.call_count > 4
+
+
+def test_next_with_parallel_shards_without_sort_order_lists_in_ascending_order():
+    client = Mock()
+    # Like ListEndpoints and ListModels, the list method defaults to descending order
+    client.list_training_jobs = _mock_list_training_jobs(
+        SHARDED_TRAINING_JOBS, default_sort_order="Descending"
+    )
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        list_method_kwargs={"CreationTimeAfter": datetime.datetime(2023, 12, 1)},
+        parallel_shards=3,
+    )
+
+    training_jobs = list(iterator)
+
+    assert [training_job.training_job_name for training_job in training_jobs] == [
+        summary["TrainingJobName"] for summary in SHARDED_TRAINING_JOBS
+    ]
+    assert all(
+        kwargs["SortOrder"] == "Ascending" for _, kwargs in client.list_training_jobs.call_args_list
+    )
+
+
+def test_parallel_shards_without_prefetch_pages_buffers_a_bounded_number_of_pages():
+    client = Mock()
+    client.list_training_jobs = _mock_list_training_jobs(SHARDED_TRAINING_JOBS, page_size=1)
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        list_method_kwargs={"CreationTimeAfter": datetime.datetime(2023, 12, 1)},
+        parallel_shards=2,
+    )
+
+    with patch("sagemaker_core.main.utils.queue.Queue", wraps=queue.Queue) as mock_queue:
+        assert next(iterator).training_job_name == "training-job-l"
+    iterator.close()
+
+    assert mock_queue.call_args_list == [call(maxsize=SHARD_PREFETCH_PAGES)] * 2
+
+
+def test_pages_with_parallel_shards_merges_by_sort_field():
+    client = Mock()
+    client.list_training_jobs = _mock_list_training_jobs(SHARDED_TRAINING_JOBS)
+    iterator = ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        list_method_kwargs={
+            "CreationTimeAfter": datetime.datetime(2023, 12, 1),
+            "SortBy": "Name",
+            "MaxResults": 5,
+        },
+        parallel_shards=3,
+    )
+
+    pages = list(iterator.pages())
+
+    assert [len(page) for page in pages] == [5, 5, 2]
+    assert [summary["TrainingJobName"] for page in pages for summary in page] == sorted(
+        summary["TrainingJobName"] for summary in SHARDED_TRAINING_JOBS
+    )
+
+
+def test_pages_yields_summaries_without_building_resources(resource_iterator):
+    iterator, client, _ = resource_iterator
+    client.list_training_jobs.side_effect = [
+        LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN,
+        LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN,
+    ]
+
+    with patch.object(TrainingJob, "refresh") as mock_refresh:
+        pages = list(iterator.pages())
+
+    assert pages == [
+        LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN["TrainingJobSummaries"],
+        LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN["TrainingJobSummaries"],
+    ]
+    assert mock_refresh.call_count == 0
+    assert client.list_training_jobs.call_args_list == [
+        call(),
+        call(NextToken=LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN["NextToken"]),
+    ]
+
+
+def test_pages_continues_from_the_current_position(resource_iterator):
+    iterator, client, _ = resource_iterator
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN
+    summaries = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN["TrainingJobSummaries"]
+
+    with patch.object(TrainingJob, "refresh"):
+        next(iterator)
+    pages = list(iterator.pages(transformed=True))
+
+    assert pages == [[transform(summaries[1], "TrainingJobSummary")]]
+    assert pages[0][0]["training_job_name"] == summaries[1]["TrainingJobName"]
+
+
+def test_summaries_yields_summary_shapes(resource_iterator):
+    iterator, client, _ = resource_iterator
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN
+
+    summaries = list(iterator.summaries())
+
+    assert all(isinstance(summary, TrainingJobSummary) for summary in summaries)
+    assert [summary.training_job_name for summary in summaries] == [
+        summary["TrainingJobName"]
+        for summary in LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN["TrainingJobSummaries"]
+    ]
+
+
+def test_summaries_with_primitive_class(resource_iterator_with_primitive_class):
+    iterator, client, _ = resource_iterator_with_primitive_class
+    client.list_aliases.return_value = LIST_ALIASES_RESPONSE_WITHOUT_NEXT_TOKEN
+
+    assert list(iterator.summaries()) == [
+        summary["SageMakerImageVersionAlias"]
+        for summary in LIST_ALIASES_RESPONSE_WITHOUT_NEXT_TOKEN["SageMakerImageVersionAliases"]
+    ]
+
+
+def _training_job_iterator(client, **kwargs):
+    return ResourceIterator(
+        client=client,
+        summaries_key="TrainingJobSummaries",
+        summary_name="TrainingJobSummary",
+        resource_cls=TrainingJob,
+        list_method="list_training_jobs",
+        **kwargs,
+    )
+
+
+LIST_TRAINING_JOB_RESPONSE_WITH_WARM_POOL_STATUS = {
+    "TrainingJobSummaries": [
+        {
+            "TrainingJobName": "xgboost-iris-1",
+            "CreationTime": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+            "TrainingJobStatus": "Completed",
+            "WarmPoolStatus": {
+                "Status": "Available",
+                "ResourceRetainedBillableTimeInSeconds": 60,
+            },
+        },
+        {
+            "TrainingJobName": "xgboost-iris-2",
+            "CreationTime": datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+            "TrainingJobStatus": "InProgress",
+        },
+    ],
+}
+
+
+def test_column_pages_flattens_nested_shapes(resource_iterator):
+    iterator, client, _ = resource_iterator
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITH_WARM_POOL_STATUS
+
+    with patch.object(TrainingJob, "refresh") as mock_refresh:
+        pages = list(iterator.column_pages())
+
+    assert len(pages) == 1
+    assert pages[0]["training_job_name"] == ["xgboost-iris-1", "xgboost-iris-2"]
+    assert pages[0]["warm_pool_status.status"] == ["Available", None]
+    assert pages[0]["warm_pool_status.resource_retained_billable_time_in_seconds"] == [60, None]
+    assert pages[0]["training_end_time"] == [None, None]
+    assert mock_refresh.call_count == 0
+
+
+def test_column_pages_with_columns(resource_iterator):
+    iterator, client, _ = resource_iterator
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITH_WARM_POOL_STATUS
+
+    pages = list(iterator.column_pages(columns=["training_job_status", "warm_pool_status"]))
+
+    assert list(pages[0]) == [
+        "training_job_status",
+        "warm_pool_status.status",
+        "warm_pool_status.resource_retained_billable_time_in_seconds",
+        "warm_pool_status.reused_by_job",
+    ]
+    assert pages[0]["training_job_status"] == ["Completed", "InProgress"]
+
+
+def test_column_pages_with_unknown_column_raises(resource_iterator):
+    iterator, _, _ = resource_iterator
+
+    with pytest.raises(ValueError):
+        next(iterator.column_pages(columns=["unknown_column"]))
+
+
+def test_to_csv_writes_a_row_per_summary(resource_iterator, tmp_path):
+    iterator, client, _ = resource_iterator
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITH_WARM_POOL_STATUS
+    path = tmp_path / "training_jobs.csv"
+
+    rows = iterator.to_csv(
+        str(path), columns=["training_job_name", "creation_time", "warm_pool_status.status"]
+    )
+
+    assert rows == 2
+    assert path.read_text().splitlines() == [
+        "training_job_name,creation_time,warm_pool_status.status",
+        "xgboost-iris-1,2024-01-01T00:00:00+00:00,Available",
+        "xgboost-iris-2,2024-01-02T00:00:00+00:00,",
+    ]
+
+
+def test_to_table_and_to_parquet(resource_iterator, tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    iterator, client, _ = resource_iterator
+    client.list_training_jobs.side_effect = [
+        LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN,
+        LIST_TRAINING_JOB_RESPONSE_WITH_WARM_POOL_STATUS,
+    ] * 2
+    columns = ["training_job_name", "creation_time", "warm_pool_status"]
+
+    table = iterator.to_table(columns=columns)
+    path = tmp_path / "training_jobs.parquet"
+    rows = _training_job_iterator(client).to_parquet(str(path), columns=columns)
+
+    assert table.num_rows == rows == 4
+    assert table.schema.field("creation_time").type == pyarrow.timestamp("us", tz="UTC")
+    assert table.column("warm_pool_status.status").to_pylist() == [
+        None,
+        None,
+        "Available",
+        None,
+    ]
+    assert pyarrow.parquet.read_table(str(path)).equals(table)
+
+
+def test_resume_continues_from_checkpoint_within_page():
+    client = Mock()
+    client.list_training_jobs = _mock_list_training_jobs(SHARDED_TRAINING_JOBS, page_size=5)
+    iterator = _training_job_iterator(
+        client, list_method_kwargs={"CreationTimeAfter": datetime.datetime(2023, 12, 1)}
+    )
+    returned = [next(iterator).training_job_name for _ in range(7)]
+
+    state = json.loads(json.dumps(iterator.checkpoint()))
+    resumed_client = Mock()
+    resumed_client.list_training_jobs = _mock_list_training_jobs(SHARDED_TRAINING_JOBS, page_size=5)
+    resumed = [
+        training_job.training_job_name
+        for training_job in ResourceIterator.resume(state, client=resumed_client)
+    ]
+
+    assert returned + resumed == [summary["TrainingJobName"] for summary in SHARDED_TRAINING_JOBS]
+    assert state["page_token"] == "5"
+    assert state["index"] == 2
+    assert resumed_client.list_training_jobs.call_args_list == [
+        call(NextToken="5", CreationTimeAfter="2023-12-01T00:00:00"),
+        call(NextToken="10", CreationTimeAfter="2023-12-01T00:00:00"),
+    ]
+
+
+def test_resume_from_checkpoint_at_end_of_page_lists_next_page():
+    client = Mock()
+    client.list_training_jobs = _mock_list_training_jobs(SHARDED_TRAINING_JOBS, page_size=5)
+    iterator = _training_job_iterator(client)
+    first_page = next(iterator.pages())
+
+    state = iterator.checkpoint()
+    resumed_client = Mock()
+    resumed_client.list_training_jobs = _mock_list_training_jobs(SHARDED_TRAINING_JOBS, page_size=5)
+    pages = list(ResourceIterator.resume(state, client=resumed_client).pages())
+
+    assert state["page_token"] == "5"
+    assert state["index"] == 0
+    assert [summary["TrainingJobName"] for page in [first_page] + pages for summary in page] == [
+        summary["TrainingJobName"] for summary in SHARDED_TRAINING_JOBS
+    ]
+
+
+def test_resume_from_checkpoint_of_exhausted_iterator_stops():
+    client = Mock()
+    client.list_training_jobs = _mock_list_training_jobs(SHARDED_TRAINING_JOBS, page_size=5)
+    iterator = _training_job_iterator(client)
+    list(iterator.pages())
+
+    resumed = ResourceIterator.resume(iterator.checkpoint(), client=client)
+
+    assert list(resumed) == []
+
+
+def test_checkpoint_with_parallel_shards_raises():
+    iterator = _training_job_iterator(Mock(), parallel_shards=2)
+
+    with pytest.raises(ValueError):
+        iterator.checkpoint()
+
+
+def test_is_waiter_display_enabled(monkeypatch):
+    monkeypatch.delenv(WAITER_DISPLAY_ENV_VAR, raising=False)
+    with patch("sagemaker_core.main.utils.get_console") as mock_get_console:
+        mock_get_console.return_value.is_terminal = False
+        mock_get_console.return_value.is_jupyter = False
+        assert not is_waiter_display_enabled()
+        assert is_waiter_display_enabled(True)
+
+        mock_get_console.return_value.is_terminal = True
+        assert is_waiter_display_enabled()
+
+        monkeypatch.setenv(WAITER_DISPLAY_ENV_VAR, "false")
+        assert not is_waiter_display_enabled()
+
+        configure_waiter_display(True)
+        try:
+            assert is_waiter_display_enabled()
+            assert not is_waiter_display_enabled(False)
+        finally:
+            configure_waiter_display(None)
+
+
+@patch("sagemaker_core.main.utils.Live")
+def test_waiter_display_without_display_only_calls_status_callback(mock_live):
+    statuses = []
+
+    with WaiterDisplay("Waiting...", display=False, status_callback=statuses.append) as display:
+        display.update("InProgress")
+        display.update("Completed")
+
+    mock_live.assert_not_called()
+    assert statuses == ["InProgress", "Completed"]
+
+
+@patch("sagemaker_core.main.utils.Status")
+@patch("sagemaker_core.main.utils.Live")
+def test_waiter_display_with_display(mock_live, mock_status):
+    with WaiterDisplay("Waiting...", display=True, transient=False) as display:
+        display.update("InProgress")
+
+    assert mock_live.call_args.kwargs["transient"] is False
+    mock_live.return_value.__enter__.assert_called_once()
+    mock_live.return_value.__exit__.assert_called_once()
+    mock_status.return_value.update.assert_called_once_with("Current status: [bold]InProgress")
+
+
+def test_async_resource_iterator(resource_iterator):
+    iterator, client, _ = resource_iterator
+    iterator.hydrate = False
+    listing_threads = []
+
+    def list_training_jobs(**kwargs):
+        listing_threads.append(threading.current_thread().name)
+        if "NextToken" in kwargs:
+            return LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN
+        return LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN
+
+    client.list_training_jobs.side_effect = list_training_jobs
+
+    async def collect():
+        return [training_job async for training_job in AsyncResourceIterator(iterator)]
+
+    training_jobs = asyncio.run(collect())
+
+    assert [training_job.training_job_name for training_job in training_jobs] == [
+        summary["TrainingJobName"]
+        for response in [
+            LIST_TRAINING_JOB_RESPONSE_WITH_NEXT_TOKEN,
+            LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN,
+        ]
+        for summary in response["TrainingJobSummaries"]
+    ]
+    # Pages are listed on the thread pool of the async bridge, not on the event loop
+    assert len(listing_threads) == 2
+    assert all(name.startswith("sagemaker-core-async") for name in listing_threads)
+
+
+def test_async_resource_iterator_hydrates_resources(resource_iterator):
+    iterator, client, _ = resource_iterator
+    client.list_training_jobs.return_value = LIST_TRAINING_JOB_RESPONSE_WITHOUT_NEXT_TOKEN
+
+    async def collect():
+        return [training_job async for training_job in AsyncResourceIterator(iterator)]
+
+    with patch.object(TrainingJob, "refresh") as mock_refresh:
+        training_jobs = asyncio.run(collect())
+
+    assert len(training_jobs) == 2
+    assert mock_refresh.call_count == 2
+
+
+def test_run_async_runs_on_the_async_bridge():
+    async def run():
+        return await run_async(lambda value: (value, threading.current_thread().name), 1)
+
+    value, thread_name = asyncio.run(run())
+
+    assert value == 1
+    assert thread_name.startswith("sagemaker-core-async")
+
+
+def test_async_bridge_configure_replaces_executor():
+    bridge = AsyncBridge(max_workers=2)
+    executor = bridge.get_executor()
+
+    assert bridge.get_executor() is executor
+    bridge.configure(max_workers=4)
+    assert bridge.max_workers == 4
+    assert bridge.get_executor() is not executor
+    bridge.get_executor().shutdown()
+
+
+def test_adaptive_concurrency_limiter_retries_throttled_calls():
+    throttling_error = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "DescribeTrainingJob",
+    )
+    func = Mock(side_effect=[throttling_error, throttling_error, "result"])
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8, base_delay=0)
+
+    assert limiter.call(func, "arg") == "result"
+    assert func.call_args_list == [call("arg")] * 3
+    # Halved twice on throttling, then raised by one on success
+    assert limiter.concurrency == 3
+
+
+def test_adaptive_concurrency_limiter_raises_after_max_attempts():
+    throttling_error = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "DescribeTrainingJob",
+    )
+    other_error = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "Invalid"}},
+        "DescribeTrainingJob",
+    )
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=2, max_attempts=2, base_delay=0)
+
+    func = Mock(side_effect=throttling_error)
+    with pytest.raises(ClientError):
+        limiter.call(func)
+    assert func.call_count == 2
+    assert limiter.concurrency == 1
+
+    func = Mock(side_effect=other_error)
+    with pytest.raises(ClientError):
+        limiter.call(func)
+    assert func.call_count == 1
+
+
+def test_exponential_poll_strategy_grows_to_max_delay():
+    strategy = ExponentialPollStrategy(initial_delay=1, max_delay=5, multiplier=2, jitter=False)
+
+    assert [strategy.next_delay() for _ in range(5)] == [1, 2, 4, 5, 5]
+    strategy.reset()
+    assert strategy.next_delay() == 1
+
+
+def test_exponential_poll_strategy_with_jitter():
+    strategy = ExponentialPollStrategy(initial_delay=4, max_delay=16, multiplier=2)
+
+    for expected_delay in [4, 8, 16, 16]:
+        assert expected_delay / 2 <= strategy.next_delay() <= expected_delay
+
+
+def test_poller_resets_strategy_on_status_change():
+    strategy = ExponentialPollStrategy(initial_delay=1, max_delay=60, multiplier=2, jitter=False)
+    poller = Poller(strategy)
+
+    assert [poller.next_delay("InProgress") for _ in range(3)] == [1, 2, 4]
+    assert poller.next_delay("Stopping") == 1
+    assert poller.next_delay("Stopping") == 2
+    # The strategy given to the poller is left untouched
+    assert strategy.next_delay() == 1
+
+
+def test_poller_with_fixed_poll():
+    poller = Poller(5)
+
+    assert [poller.next_delay("InProgress") for _ in range(3)] == [5, 5, 5]
+
+
+@patch("sagemaker_core.main.utils.time.sleep")
+def test_poller_retries_throttled_calls(mock_sleep):
+    throttling_error = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "DescribeTrainingJob",
+    )
+    func = Mock(side_effect=[throttling_error, throttling_error, "result"])
+    poller = Poller(ExponentialPollStrategy(initial_delay=1, jitter=False))
+
+    assert poller.call(func, "arg") == "result"
+    assert func.call_args_list == [call("arg")] * 3
+    assert mock_sleep.call_args_list == [call(1), call(2)]
+
+
+@patch("sagemaker_core.main.utils.time.sleep")
+def test_poller_raises_other_errors_and_throttling_after_timeout(mock_sleep):
+    other_error = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "Invalid"}},
+        "DescribeTrainingJob",
+    )
+    throttling_error = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "DescribeTrainingJob",
+    )
+
+    func = Mock(side_effect=other_error)
+    with pytest.raises(ClientError):
+        Poller(5).call(func)
+    assert func.call_count == 1
+
+    func = Mock(side_effect=throttling_error)
+    with pytest.raises(ClientError):
+        Poller(5, timeout=0).call(func)
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_client_pool_keys_clients_by_session_region_and_service():
+    pool = SageMakerClientPool()
+    session = Session(region_name="us-west-2")
+
+    client = pool.get_client("sagemaker", session=session, region_name="us-west-2")
+    assert pool.get_client("sagemaker", session=session, region_name="us-west-2") is client
+    assert client.meta.region_name == "us-west-2"
+
+    other_region_client = pool.get_client("sagemaker", session=session, region_name="us-east-1")
+    assert other_region_client.meta.region_name == "us-east-1"
+    other_session_client = pool.get_client(
+        "sagemaker", session=Session(region_name="us-west-2"), region_name="us-west-2"
+    )
+    runtime_client = pool.get_client("sagemaker-runtime", session=session, region_name="us-west-2")
+    assert len({client, other_region_client, other_session_client, runtime_client}) == 4
+
+
+def test_client_pool_applies_config_and_max_pool_connections():
+    pool = SageMakerClientPool(max_pool_connections=50)
+    session = Session(region_name="us-west-2")
+
+    client = pool.get_client("sagemaker", session=session)
+    assert client.meta.config.max_pool_connections == 50
+    assert get_user_agent_extra_suffix() in client.meta.config.user_agent_extra
+
+    config = Config(connect_timeout=5)
+    configured_client = pool.get_client(
+        "sagemaker", session=session, config=config, max_pool_connections=100
+    )
+    assert configured_client is not client
+    assert configured_client.meta.config.max_pool_connections == 100
+    assert configured_client.meta.config.connect_timeout == 5
+    assert (
+        pool.get_client(
+            "sagemaker", session=session, config=Config(connect_timeout=5), max_pool_connections=100
+        )
+        is configured_client
+    )
+
+
+def test_http_config_to_config_sets_only_given_settings():
+    config = HttpConfig(max_pool_connections=64, tcp_keepalive=True, retry_mode="adaptive")
+    assert config.to_config()._user_provided_options == {
+        "max_pool_connections": 64,
+        "tcp_keepalive": True,
+        "retries": {"mode": "adaptive"},
+    }
+    assert HttpConfig().to_config()._user_provided_options == {}
+
+
+def test_client_pool_applies_runtime_http_config_to_runtime_clients():
+    pool = SageMakerClientPool(
+        runtime_http_config=HttpConfig(
+            max_pool_connections=64, tcp_keepalive=True, connect_timeout=2, read_timeout=30
+        )
+    )
+    session = Session(region_name="us-west-2")
+
+    for service_name in ("sagemaker-runtime", "sagemaker-featurestore-runtime"):
+        config = pool.get_client(service_name, session=session).meta.config
+        assert config.max_pool_connections == 64
+        assert config.tcp_keepalive is True
+        assert (config.connect_timeout, config.read_timeout) == (2, 30)
+    assert pool.get_client("sagemaker", session=session).meta.config.max_pool_connections == 10
+
+    # The config of the caller takes precedence, and keeps its user agent
+    config = pool.get_client(
+        "sagemaker-runtime",
+        session=session,
+        config=Config(read_timeout=120, user_agent_extra="my-app/1.0"),
+    ).meta.config
+    assert config.max_pool_connections == 64
+    assert config.read_timeout == 120
+    assert config.user_agent_extra == f"my-app/1.0 {get_user_agent_extra_suffix()}"
+
+
+def test_client_pool_does_not_default_to_first_configured_region():
+    pool = SageMakerClientPool()
+    session = Session(region_name="eu-west-1")
+
+    with patch.object(SageMakerClient, "pool", pool):
+        client = SageMakerClient(session=session, region_name="eu-west-1").sagemaker_client
+
+        assert SageMakerClient().sagemaker_client is not client
+        assert SageMakerClient().sagemaker_client is pool.get_client("sagemaker")
+
+
+def test_resources_use_the_clients_of_the_region_they_were_fetched_in():
+    pool = SageMakerClientPool()
+    clients = {}
+
+    def create_client(service_name, session, region_name, config):
+        client = clients[region_name] = Mock()
+        client.describe_training_job.side_effect = lambda TrainingJobName: {
+            "TrainingJobName": TrainingJobName,
+            "TrainingJobStatus": "InProgress",
+        }
+        return client
+
+    with patch.object(SageMakerClient, "pool", pool), patch.object(
+        pool, "_create_client", side_effect=create_client
+    ):
+        TrainingJob.get("training-job-a", region="us-east-1")
+        with trusted_responses():
+            training_job = TrainingJob.get("training-job-b", region="eu-west-1")
+        training_job.refresh()
+        training_job.stop()
+
+    assert clients["us-east-1"].describe_training_job.call_count == 1
+    assert clients["eu-west-1"].describe_training_job.call_count == 2
+    clients["eu-west-1"].stop_training_job.assert_called_once_with(TrainingJobName="training-job-b")
+    clients["us-east-1"].stop_training_job.assert_not_called()
+
+
+def test_client_pool_releases_clients_of_collected_sessions():
+    pool = SageMakerClientPool()
+    pool.get_client("sagemaker", region_name="us-west-2")
+    session = Session(region_name="us-west-2")
+    pool.get_client("sagemaker", session=session)
+    session_ref = weakref.ref(session)
+    assert len(pool._clients) == 2
+
+    del session
+    gc.collect()
+
+    assert session_ref() is None
+    assert len(pool._clients) == 1
+
+
+def test_sagemaker_client_creates_clients_lazily_once_across_threads():
+    pool = SageMakerClientPool()
+    session = Session(region_name="us-west-2")
+
+    with patch.object(SageMakerClient, "pool", pool), patch.object(
+        session, "client", wraps=session.client
+    ) as mock_client:
+        sagemaker_client = SageMakerClient(session=session)
+        assert mock_client.call_count == 0
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(
+                executor.map(lambda _: sagemaker_client.get_client("sagemaker-runtime"), range(32))
+            )
+        assert sagemaker_client.sagemaker_runtime_client is clients[0]
+
+    assert len(set(clients)) == 1
+    assert mock_client.call_count == 1
+
+
 def test_configure_logging_with_default_log_level(monkeypatch):
     monkeypatch.delenv("LOG_LEVEL", raising=False)
     configure_logging()
@@ -371,3 +1333,23 @@ def test_serialize_method_nested_shape():
             "StringValue": "string",
         },
     }
+
+
+def test_snake_to_pascal_uses_member_name_table():
+    assert snake_to_pascal("auto_ml_job_name") == "AutoMLJobName"
+    assert snake_to_pascal("volume_size_in_gb") == "VolumeSizeInGB"
+    assert snake_to_pascal("volume_size_in_g_b") == "VolumeSizeInGB"
+    assert snake_to_pascal("role_arn") == "RoleArn"
+    assert snake_to_pascal("not_a_member_name") == "NotAMemberName"
+
+
+def test_pascal_to_snake_uses_member_name_table():
+    assert pascal_to_snake("AutoMLJobName") == "auto_ml_job_name"
+    assert pascal_to_snake("VolumeSizeInGB") == "volume_size_in_gb"
+    assert pascal_to_snake("NotAMemberName") == "not_a_member_name"
+
+
+def test_serialize_method_acronym_member_names():
+    resource_config = ResourceConfig(instance_count=1, volume_size_in_gb=30)
+    serialized_data = serialize(resource_config)
+    assert serialized_data == {"InstanceCount": 1, "VolumeSizeInGB": 30}
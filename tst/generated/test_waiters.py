@@ -0,0 +1,290 @@
+import asyncio
+import inspect
+import pytest
+from unittest.mock import AsyncMock, patch
+from botocore.exceptions import ClientError
+from pydantic import ValidationError
+from sagemaker_core.main.code_injection.codec import is_trusted_responses, trusted_responses
+from sagemaker_core.main.exceptions import (
+    DeleteFailedStatusError,
+    FailedStatusError,
+    TimeoutExceededError,
+)
+from sagemaker_core.main.resources import Domain, Endpoint, TrainingJob
+from sagemaker_core.main.shapes import ResourceConfig
+from sagemaker_core.main.waiters import wait_all, wait_async
+
+
+def _patch_refresh(resource_cls, status_attribute, statuses_by_name):
+    """Patch refresh to move every resource through its statuses, one per refresh."""
+
+    def refresh(self):
+        statuses = statuses_by_name[self.get_name()]
+        setattr(self, status_attribute, statuses.pop(0) if len(statuses) > 1 else statuses[0])
+        return self
+
+    return patch.object(resource_cls, "refresh", autospec=True, side_effect=refresh)
+
+
+@patch("sagemaker_core.main.waiters.time.sleep")
+def test_wait_all_until_terminal_states(mock_sleep):
+    training_jobs = [TrainingJob(training_job_name=f"training-job-{i}") for i in range(3)]
+    statuses = {
+        "training-job-0": ["InProgress", "Completed"],
+        "training-job-1": ["InProgress", "InProgress", "Stopped"],
+        "training-job-2": ["Completed"],
+    }
+
+    with _patch_refresh(TrainingJob, "training_job_status", statuses) as mock_refresh:
+        results = wait_all(training_jobs, poll=1)
+
+    assert [result.resource for result in results] == training_jobs
+    assert [result.status for result in results] == ["Completed", "Stopped", "Completed"]
+    assert all(result.error is None for result in results)
+    # Resources are not refreshed anymore once they reach a terminal state
+    assert mock_refresh.call_count == 6
+    assert mock_sleep.call_count == 2
+
+
+@patch("sagemaker_core.main.waiters.time.sleep")
+def test_wait_all_refreshes_in_context_of_caller(mock_sleep):
+    training_jobs = [TrainingJob(training_job_name=f"training-job-{i}") for i in range(2)]
+    trusted_refreshes = []
+
+    def refresh(self):
+        trusted_refreshes.append(is_trusted_responses())
+        self.training_job_status = "Completed"
+        return self
+
+    with patch.object(TrainingJob, "refresh", autospec=True, side_effect=refresh):
+        with trusted_responses():
+            wait_all(training_jobs)
+
+    assert trusted_refreshes == [True, True]
+
+
+@patch("sagemaker_core.main.waiters.time.sleep")
+def test_wait_all_raises_on_failed_state(mock_sleep):
+    training_jobs = [TrainingJob(training_job_name=f"training-job-{i}") for i in range(2)]
+    statuses = {"training-job-0": ["InProgress"], "training-job-1": ["InProgress", "Failed"]}
+
+    with _patch_refresh(TrainingJob, "training_job_status", statuses):
+        with pytest.raises(FailedStatusError):
+            wait_all(training_jobs)
+
+
+@patch("sagemaker_core.main.waiters.time.sleep")
+def test_wait_all_returns_errors_on_failure(mock_sleep):
+    training_jobs = [TrainingJob(training_job_name=f"training-job-{i}") for i in range(2)]
+    statuses = {
+        "training-job-0": ["InProgress", "InProgress", "Completed"],
+        "training-job-1": ["Failed"],
+    }
+
+    with _patch_refresh(TrainingJob, "training_job_status", statuses):
+        results = wait_all(training_jobs, on_failure="return")
+
+    assert results[0].status == "Completed"
+    assert results[0].error is None
+    assert results[1].status == "Failed"
+    assert isinstance(results[1].error, FailedStatusError)
+
+
+@patch("sagemaker_core.main.waiters.time.sleep")
+def test_wait_all_returns_refresh_errors_on_failure(mock_sleep):
+    training_jobs = [TrainingJob(training_job_name=f"training-job-{i}") for i in range(3)]
+    statuses = {
+        "training-job-0": ["InProgress", "Completed"],
+        "training-job-2": ["InProgress", "InProgress", "Completed"],
+    }
+    not_found_error = ClientError(
+        error_response={"Error": {"Code": "ResourceNotFound"}}, operation_name="DescribeTrainingJob"
+    )
+
+    def refresh(self):
+        # The second training job was deleted while waited for
+        if self.training_job_name == "training-job-1":
+            raise not_found_error
+        job_statuses = statuses[self.training_job_name]
+        self.training_job_status = job_statuses.pop(0) if len(job_statuses) > 1 else job_statuses[0]
+        return self
+
+    with patch.object(TrainingJob, "refresh", autospec=True, side_effect=refresh):
+        results = wait_all(training_jobs, on_failure="return")
+
+        assert [result.status for result in results] == ["Completed", None, "Completed"]
+        assert [result.error for result in results] == [None, not_found_error, None]
+
+        with pytest.raises(ClientError):
+            wait_all(training_jobs)
+
+
+@patch("sagemaker_core.main.waiters.time.sleep")
+def test_wait_all_with_target_status(mock_sleep):
+    endpoints = [Endpoint(endpoint_name=f"endpoint-{i}") for i in range(2)]
+    statuses = {"endpoint-0": ["Creating", "InService"], "endpoint-1": ["InService"]}
+
+    with _patch_refresh(Endpoint, "endpoint_status", statuses):
+        results = wait_all(endpoints, target_status="InService")
+
+    assert [result.status for result in results] == ["InService", "InService"]
+
+
+@patch("sagemaker_core.main.waiters.time.sleep")
+def test_wait_all_returns_timeout_errors(mock_sleep):
+    endpoints = [Endpoint(endpoint_name=f"endpoint-{i}") for i in range(2)]
+    statuses = {"endpoint-0": ["Creating"], "endpoint-1": ["InService"]}
+
+    with _patch_refresh(Endpoint, "endpoint_status", statuses):
+        results = wait_all(endpoints, target_status="InService", timeout=0, on_failure="return")
+
+    assert isinstance(results[0].error, TimeoutExceededError)
+    assert results[1].error is None
+
+
+@patch("sagemaker_core.main.waiters.Live")
+@patch("sagemaker_core.main.waiters.time.sleep")
+def test_wait_all_without_display(mock_sleep, mock_live):
+    training_jobs = [TrainingJob(training_job_name=f"training-job-{i}") for i in range(2)]
+    statuses = {"training-job-0": ["InProgress", "Completed"], "training-job-1": ["Completed"]}
+    reported_statuses = []
+
+    with _patch_refresh(TrainingJob, "training_job_status", statuses):
+        wait_all(
+            training_jobs,
+            display=False,
+            status_callback=lambda resource, status: reported_statuses.append(
+                (resource.training_job_name, status)
+            ),
+        )
+
+    mock_live.assert_not_called()
+    assert reported_statuses == [
+        ("training-job-0", "InProgress"),
+        ("training-job-1", "Completed"),
+        ("training-job-0", "Completed"),
+    ]
+
+
+@patch("sagemaker_core.main.utils.Live")
+@patch("sagemaker_core.main.utils.Poller.sleep")
+def test_wait_without_display(mock_sleep, mock_live):
+    training_job = TrainingJob(
+        training_job_name="training-job",
+        resource_config=ResourceConfig(
+            instance_type="ml.m5.xlarge", instance_count=1, volume_size_in_gb=30
+        ),
+    )
+    statuses = {"training-job": ["InProgress", "Completed"]}
+    reported_statuses = []
+
+    with _patch_refresh(TrainingJob, "training_job_status", statuses):
+        training_job.wait(display=False, status_callback=reported_statuses.append)
+
+    mock_live.assert_not_called()
+    assert reported_statuses == ["InProgress", "Completed"]
+
+
+def test_wait_all_without_target_status_for_resources_without_terminal_states():
+    with pytest.raises(ValueError):
+        wait_all([Endpoint(endpoint_name="endpoint")])
+
+
+@patch("sagemaker_core.main.waiters.asyncio.sleep", new_callable=AsyncMock)
+def test_await_completion(mock_sleep):
+    training_job = TrainingJob(training_job_name="training-job")
+    statuses = {"training-job": ["InProgress", "InProgress", "Completed"]}
+
+    with _patch_refresh(TrainingJob, "training_job_status", statuses) as mock_refresh:
+        asyncio.run(training_job.await_completion(poll=1))
+
+    assert training_job.training_job_status == "Completed"
+    assert mock_refresh.call_count == 3
+    assert mock_sleep.await_count == 2
+
+
+def test_async_methods_are_coroutine_functions_with_the_signatures_of_their_counterparts():
+    assert inspect.iscoroutinefunction(TrainingJob.await_completion)
+    assert inspect.iscoroutinefunction(Endpoint.await_status)
+    assert inspect.iscoroutinefunction(Domain.await_deletion)
+    assert inspect.iscoroutinefunction(TrainingJob(training_job_name="training-job").arefresh)
+    assert inspect.iscoroutinefunction(TrainingJob.aget)
+
+    for method_name in ("get", "refresh", "stop"):
+        method, async_method = getattr(TrainingJob, method_name), getattr(
+            TrainingJob, f"a{method_name}"
+        )
+        assert inspect.signature(async_method) == inspect.signature(method)
+        assert async_method.__doc__ == method.__doc__
+        assert async_method.__name__ == f"a{method_name}"
+    assert inspect.signature(TrainingJob.aget_all).parameters == (
+        inspect.signature(TrainingJob.get_all).parameters
+    )
+
+
+def test_await_status_validates_its_arguments():
+    endpoint = Endpoint(endpoint_name="endpoint")
+
+    with pytest.raises(ValidationError):
+        asyncio.run(endpoint.await_status("Unknown"))
+
+
+@patch("sagemaker_core.main.waiters.asyncio.sleep", new_callable=AsyncMock)
+def test_await_completion_of_many_resources_concurrently(mock_sleep):
+    training_jobs = [TrainingJob(training_job_name=f"training-job-{i}") for i in range(20)]
+    statuses = {job.training_job_name: ["InProgress", "Completed"] for job in training_jobs}
+
+    async def await_all():
+        return await asyncio.gather(*(wait_async(job) for job in training_jobs))
+
+    with _patch_refresh(TrainingJob, "training_job_status", statuses):
+        assert asyncio.run(await_all()) == ["Completed"] * 20
+
+
+@patch("sagemaker_core.main.waiters.asyncio.sleep", new_callable=AsyncMock)
+def test_await_status_raises_on_failed_state(mock_sleep):
+    endpoint = Endpoint(endpoint_name="endpoint")
+    statuses = {"endpoint": ["Creating", "Failed"]}
+
+    with _patch_refresh(Endpoint, "endpoint_status", statuses):
+        with pytest.raises(FailedStatusError):
+            asyncio.run(endpoint.await_status("InService"))
+
+
+@patch("sagemaker_core.main.waiters.asyncio.sleep", new_callable=AsyncMock)
+def test_await_status_raises_on_timeout(mock_sleep):
+    endpoint = Endpoint(endpoint_name="endpoint")
+    statuses = {"endpoint": ["Creating"]}
+
+    with _patch_refresh(Endpoint, "endpoint_status", statuses):
+        with pytest.raises(TimeoutExceededError):
+            asyncio.run(endpoint.await_status("InService", timeout=0))
+
+
+@patch("sagemaker_core.main.waiters.asyncio.sleep", new_callable=AsyncMock)
+def test_await_deletion(mock_sleep):
+    endpoint = Endpoint(endpoint_name="endpoint")
+    not_found_error = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "Could not find endpoint"}},
+        "DescribeEndpoint",
+    )
+
+    with patch.object(Endpoint, "refresh", side_effect=[endpoint, not_found_error]):
+        endpoint.endpoint_status = "Deleting"
+        asyncio.run(endpoint.await_deletion())
+
+    assert mock_sleep.await_count == 1
+
+
+@patch("sagemaker_core.main.waiters.asyncio.sleep", new_callable=AsyncMock)
+def test_await_deletion_raises_on_delete_failed_state(mock_sleep):
+    domain = Domain(domain_id="domain-id")
+    statuses = ["Deleting", "Delete_Failed"]
+
+    def refresh(self):
+        self.status = statuses.pop(0)
+        return self
+
+    with patch.object(Domain, "refresh", autospec=True, side_effect=refresh):
+        with pytest.raises(DeleteFailedStatusError):
+            asyncio.run(domain.await_deletion())
@@ -2,8 +2,23 @@ import datetime
 from dateutil.tz import tzlocal
 from pprint import pprint
 import unittest
+import pytest
+from pydantic import ValidationError
 from sagemaker_core.main.code_injection.codec import pascal_to_snake
-from sagemaker_core.main.code_injection.codec import transform
+from sagemaker_core.main.code_injection.codec import (
+    transform,
+    get_transformer,
+    trusted_responses,
+    is_trusted_responses,
+    build_from_response,
+    get_model_constructor,
+)
+from sagemaker_core.main.code_injection.shape_dag import (
+    SHAPE_DAG,
+    PASCAL_TO_SNAKE_NAMES,
+    SNAKE_TO_PASCAL_NAMES,
+    LazyShapeDag,
+)
 from sagemaker_core.main.resources import Model, TrialComponent, AutoMLJobV2
 
 
@@ -236,5 +251,126 @@ def test_deserializer_for_map_type():
     )
 
 
+def test_get_transformer_is_cached_per_shape():
+    transformer = get_transformer("DescribeModelOutput")
+    assert get_transformer("DescribeModelOutput") is transformer
+    assert transformer({"ModelName": "model-1", "Unknown": "ignored"}) == {"model_name": "model-1"}
+
+
+def test_transform_recursive_shape():
+    search_expression = {
+        "Operator": "Or",
+        "SubExpressions": [
+            {"Operator": "And", "SubExpressions": [{"Operator": "Not"}]},
+        ],
+    }
+    transformed_data = transform(search_expression, "SearchExpression")
+    assert transformed_data == {
+        "operator": "Or",
+        "sub_expressions": [
+            {"operator": "And", "sub_expressions": [{"operator": "Not"}]},
+        ],
+    }
+
+
+def test_transform_blob_type():
+    transformed_data = transform({"Body": b"payload"}, "InvokeEndpointOutput")
+    assert transformed_data["body"].read() == b"payload"
+
+
+def test_transform_sets_attributes_on_object_instance():
+    instance = DummyResourceClass()
+    transform({"ModelName": "model-1"}, "DescribeModelOutput", instance)
+    assert instance.model_name == "model-1"
+
+
+def test_trusted_responses_constructs_nested_shapes():
+    from sagemaker_core.main.shapes import (
+        MonitoringDatasetFormat,
+        MonitoringJsonDatasetFormat,
+        ResourceConfig,
+    )
+    from sagemaker_core.main.resources import TrainingJob
+
+    response = {
+        "TrainingJobName": "training-job-1",
+        "ResourceConfig": {"InstanceType": "ml.m5.xlarge", "InstanceCount": "not-an-int"},
+        "DebugRuleEvaluationStatuses": [{"RuleConfigurationName": "rule-1"}],
+    }
+    with trusted_responses():
+        transformed_data = transform(response, "DescribeTrainingJobResponse")
+        training_job = build_from_response(TrainingJob, transformed_data)
+        dataset_format = build_from_response(
+            MonitoringDatasetFormat,
+            transform({"JsonFormat": {"Line": True}}, "MonitoringDatasetFormat"),
+        )
+
+    assert isinstance(training_job.resource_config, ResourceConfig)
+    # Values are taken as is, without validation
+    assert training_job.resource_config.instance_count == "not-an-int"
+    assert training_job.debug_rule_evaluation_statuses[0].rule_configuration_name == "rule-1"
+    assert isinstance(dataset_format.json_format, MonitoringJsonDatasetFormat)
+    assert dataset_format.json_format.line is True
+
+    # Outside of the context responses are validated again
+    transformed_data = transform(response, "DescribeTrainingJobResponse")
+    assert transformed_data["resource_config"]["instance_count"] == "not-an-int"
+    with pytest.raises(ValidationError):
+        build_from_response(TrainingJob, transformed_data)
+
+
+def test_trusted_responses_updates_object_instance_without_validation():
+    from sagemaker_core.main.resources import TrainingJob
+
+    training_job = TrainingJob(training_job_name="training-job-1")
+    with trusted_responses():
+        transform(
+            {"TrainingJobName": "training-job-1", "TrainingJobStatus": 1},
+            "DescribeTrainingJobResponse",
+            training_job,
+        )
+    assert training_job.training_job_status == 1
+    assert "training_job_status" in training_job.model_fields_set
+
+
+def test_model_constructor_matches_model_construct():
+    from sagemaker_core.main.resources import TrainingJob
+
+    data = {"training_job_status": "Completed", "training_job_name": "training-job-1", "x": 1}
+    constructed = get_model_constructor(TrainingJob)(data)
+    expected = TrainingJob.model_construct(**data)
+    assert constructed == expected
+    assert repr(constructed) == repr(expected)
+    assert constructed.model_fields_set == {"training_job_status", "training_job_name"}
+
+
+def test_trusted_responses_from_environment_variable(monkeypatch):
+    monkeypatch.delenv("SAGEMAKER_CORE_TRUSTED_RESPONSES", raising=False)
+    assert not is_trusted_responses()
+    monkeypatch.setenv("SAGEMAKER_CORE_TRUSTED_RESPONSES", "true")
+    assert is_trusted_responses()
+    with trusted_responses(False):
+        assert not is_trusted_responses()
+
+
+def test_shape_dag_decodes_shapes_on_access():
+    shape_dag = LazyShapeDag()
+    assert "DescribeModelOutput" in shape_dag
+    assert "NotAShape" not in shape_dag
+    assert shape_dag._nodes == {}
+
+    node = shape_dag["DescribeModelOutput"]
+    assert node["type"] == "structure"
+    assert shape_dag["DescribeModelOutput"] is node
+    assert list(shape_dag._nodes) == ["DescribeModelOutput"]
+    assert len(shape_dag) == len(SHAPE_DAG)
+
+
+def test_name_tables_load_from_shape_dag_data():
+    assert PASCAL_TO_SNAKE_NAMES["AutoMLJobName"] == "auto_ml_job_name"
+    assert SNAKE_TO_PASCAL_NAMES.get("volume_size_in_gb") == "VolumeSizeInGB"
+    assert SNAKE_TO_PASCAL_NAMES.get("not_a_member_name") is None
+
+
 if __name__ == "__main__":
     unittest.main()
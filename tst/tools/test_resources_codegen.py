@@ -161,7 +161,7 @@ def load(
     """
 
     logger.info(f"Importing hub_content resource.")
-    client = SageMakerClient(session=session, region_name=region, service_name='sagemaker').client
+    client = Base.get_sagemaker_client(session=session, region_name=region, service_name='sagemaker')
 
     operation_input_args = {
         'HubContentName': hub_content_name,
@@ -228,7 +228,7 @@ def update(
     """
 
     logger.info("Updating endpoint resource.")
-    client = Base.get_sagemaker_client()
+    client = self._get_resource_client()
 
     operation_input_args = {
         'EndpointName': self.endpoint_name,
@@ -295,7 +295,7 @@ def update(
     """
 
     logger.info("Updating endpoint resource.")
-    client = Base.get_sagemaker_client()
+    client = self._get_resource_client()
 
     operation_input_args = {
         'EndpointName': self.endpoint_name,
@@ -386,7 +386,8 @@ def get(
 
     # deserialize the response
     transformed_response = transform(response, 'DescribeAppResponse')
-    app = cls(**transformed_response)
+    app = build_from_response(cls, transformed_response)
+    app._set_client_context(session=session, region_name=region)
     return app
 '''
         assert self.resource_generator.generate_get_method("App") == expected_output
@@ -428,7 +429,7 @@ def refresh(
     operation_input_args = serialize(operation_input_args)
     logger.debug(f"Serialized input request: {operation_input_args}")
 
-    client = Base.get_sagemaker_client()
+    client = self._get_resource_client()
     response = client.describe_app(**operation_input_args)
 
     # deserialize response and update self
@@ -473,7 +474,7 @@ def delete(
         ResourceNotFound: Resource being access is not found.
     """
 
-    client = Base.get_sagemaker_client()
+    client = self._get_resource_client()
 
     operation_input_args = {
         'CompilationJobName': self.compilation_job_name,
@@ -514,7 +515,7 @@ def stop(self) -> None:
         ResourceNotFound: Resource being access is not found.
     """
 
-    client = SageMakerClient().client
+    client = self._get_resource_client()
 
     operation_input_args = {
         'CompilationJobName': self.compilation_job_name,
@@ -534,17 +535,20 @@ def stop(self) -> None:
 @Base.add_validate_call
 def wait(
     self,
-    poll: int = 5,
+    poll: Union[int, PollStrategy] = 5,
     timeout: Optional[int] = None,
-    
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a CompilationJob resource.
     
     Parameters:
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
-        
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
+
     Raises:
         TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
         FailedStatusError:   If the resource reaches a failed state.
@@ -553,28 +557,14 @@ def wait(
     """
     terminal_states = ['COMPLETED', 'FAILED', 'STOPPED']
     start_time = time.time()
-
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{task.description}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task("Waiting for CompilationJob...")
-    status = Status("Current status:")
+    poller = Poller(poll, timeout)
     
 
-    with Live(
-        Panel(
-            Group(progress, status),
-            title="Wait Log Panel",
-            border_style=Style(color=Color.BLUE.value
-            )
-        ),
-        transient=True
-    ):
+    with WaiterDisplay("Waiting for CompilationJob...", display, status_callback) as waiter_display:
         while True:
-            self.refresh()
+            poller.call(self.refresh)
             current_status = self.compilation_job_status
-            status.update(f"Current status: [bold]{current_status}")
+            waiter_display.update(current_status)
             
             if current_status in terminal_states:
                 logger.info(f"Final Resource Status: [bold]{current_status}")
@@ -586,7 +576,7 @@ def wait(
 
             if timeout is not None and time.time() - start_time >= timeout:
                 raise TimeoutExceededError(resouce_type="CompilationJob", status=current_status)
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
         assert self.resource_generator.generate_wait_method("CompilationJob") == expected_output
 
@@ -595,17 +585,21 @@ def wait(
 @Base.add_validate_call
 def wait(
     self,
-    poll: int = 5,
+    poll: Union[int, PollStrategy] = 5,
     timeout: Optional[int] = None,
     logs: Optional[bool] = False,
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a TrainingJob resource.
     
     Parameters:
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
         logs: Whether to print logs while waiting.
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
 
     Raises:
         TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
@@ -615,13 +609,7 @@ def wait(
     """
     terminal_states = ['Completed', 'Failed', 'Stopped']
     start_time = time.time()
-
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{task.description}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task("Waiting for TrainingJob...")
-    status = Status("Current status:")
+    poller = Poller(poll, timeout)
         
     instance_count = (
                     sum(instance_group.instance_count for instance_group in self.resource_config.instance_groups)
@@ -637,22 +625,16 @@ def wait(
         )
 
 
-    with Live(
-        Panel(
-            Group(progress, status),
-            title="Wait Log Panel",
-            border_style=Style(color=Color.BLUE.value
-            )
-        ),
-        transient=True
-    ):
+    with WaiterDisplay("Waiting for TrainingJob...", display, status_callback) as waiter_display:
         while True:
-            self.refresh()
+            poller.call(self.refresh)
             current_status = self.training_job_status
-            status.update(f"Current status: [bold]{current_status}")
+            waiter_display.update(current_status)
                         
-            if logs and multi_stream_logger.ready():
-                stream_log_events = multi_stream_logger.get_latest_log_events()
+            if logs:
+                stream_log_events = multi_stream_logger.get_latest_log_events(
+                    flush=current_status in terminal_states
+                )
                 for stream_id, event in stream_log_events:
                     logger.info(f"{stream_id}:\\n{event['message']}")
 
@@ -666,26 +648,73 @@ def wait(
 
             if timeout is not None and time.time() - start_time >= timeout:
                 raise TimeoutExceededError(resouce_type="TrainingJob", status=current_status)
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
         assert self.resource_generator.generate_wait_method("TrainingJob") == expected_output
 
+    def test_generate_stream_logs_method(self):
+        expected_output = '''
+@Base.add_validate_call
+def stream_logs(
+    self,
+    follow: bool = True,
+    start_time: Optional[datetime.datetime] = None,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+    filter_pattern: Optional[str] = None,
+) -> JobLogStreamer:
+    """
+    Stream the log events of a ProcessingJob resource.
+    
+    Parameters:
+        follow: Whether to keep polling for new log events until the resource reaches a terminal state, rather than only getting the log events that exist at this moment.
+        start_time: The time of the first log events to get. Defaults to None, getting the log events from the start of the job.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to follow the logs before timing out.
+        filter_pattern: The CloudWatch Logs filter pattern the log events must match.
+    
+    Returns:
+        JobLogStreamer: The LogEvents of the ProcessingJob, fetched while iterating over them with for or async for.
+    
+    Raises:
+        TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+    """
+    instance_count = self.processing_resources.cluster_config.instance_count
+    return JobLogStreamer(
+        self,
+        log_group_name=f"/aws/sagemaker/ProcessingJobs",
+        instance_count=instance_count,
+        follow=follow,
+        start_time=start_time,
+        poll=poll,
+        timeout=timeout,
+        filter_pattern=filter_pattern,
+    )
+'''
+        assert (
+            self.resource_generator.generate_stream_logs_method("ProcessingJob") == expected_output
+        )
+
     def test_generate_wait_for_status_method(self):
         expected_output = '''
 @Base.add_validate_call
 def wait_for_status(
     self,
     target_status: Literal['InService', 'Creating', 'Updating', 'Failed', 'Deleting'],
-    poll: int = 5,
-    timeout: Optional[int] = None
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a InferenceComponent resource to reach certain status.
     
     Parameters:
         target_status: The status to wait for.
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
     
     Raises:
         TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
@@ -693,27 +722,15 @@ def wait_for_status(
         WaiterError: Raised when an error occurs while waiting.
     """
     start_time = time.time()
+    poller = Poller(poll, timeout)
 
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{task.description}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task(f"Waiting for InferenceComponent to reach [bold]{target_status} status...")
-    status = Status("Current status:")
-
-    with Live(
-        Panel(
-            Group(progress, status),
-            title="Wait Log Panel",
-            border_style=Style(color=Color.BLUE.value
-            )
-        ),
-        transient=True
-    ):
+    with WaiterDisplay(
+        f"Waiting for InferenceComponent to reach [bold]{target_status} status...", display, status_callback
+    ) as waiter_display:
         while True:
-            self.refresh()
+            poller.call(self.refresh)
             current_status = self.inference_component_status
-            status.update(f"Current status: [bold]{current_status}")
+            waiter_display.update(current_status)
 
             if target_status == current_status:
                 logger.info(f"Final Resource Status: [bold]{current_status}")
@@ -724,7 +741,7 @@ def wait_for_status(
 
             if timeout is not None and time.time() - start_time >= timeout:
                 raise TimeoutExceededError(resouce_type="InferenceComponent", status=current_status)
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
         assert (
             self.resource_generator.generate_wait_for_status_method("InferenceComponent")
@@ -737,16 +754,20 @@ def wait_for_status(
 def wait_for_status(
     self,
     target_status: Literal['Creating', 'Created', 'Updating', 'Running', 'Starting', 'Stopping', 'Completed', 'Cancelled'],
-    poll: int = 5,
-    timeout: Optional[int] = None
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a InferenceExperiment resource to reach certain status.
     
     Parameters:
         target_status: The status to wait for.
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
     
     Raises:
         TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
@@ -754,27 +775,15 @@ def wait_for_status(
         WaiterError: Raised when an error occurs while waiting.
     """
     start_time = time.time()
+    poller = Poller(poll, timeout)
 
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{task.description}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task(f"Waiting for InferenceExperiment to reach [bold]{target_status} status...")
-    status = Status("Current status:")
-
-    with Live(
-        Panel(
-            Group(progress, status),
-            title="Wait Log Panel",
-            border_style=Style(color=Color.BLUE.value
-            )
-        ),
-        transient=True
-    ):
+    with WaiterDisplay(
+        f"Waiting for InferenceExperiment to reach [bold]{target_status} status...", display, status_callback
+    ) as waiter_display:
         while True:
-            self.refresh()
+            poller.call(self.refresh)
             current_status = self.status
-            status.update(f"Current status: [bold]{current_status}")
+            waiter_display.update(current_status)
 
             if target_status == current_status:
                 logger.info(f"Final Resource Status: [bold]{current_status}")
@@ -782,13 +791,141 @@ def wait_for_status(
 
             if timeout is not None and time.time() - start_time >= timeout:
                 raise TimeoutExceededError(resouce_type="InferenceExperiment", status=current_status)
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
         assert (
             self.resource_generator.generate_wait_for_status_method("InferenceExperiment")
             == expected_output
         )
 
+    def test_generate_wait_status_attributes(self):
+        expected_output = """
+_status_attributes: ClassVar[List[str]] = ['training_job_status']
+_terminal_states: ClassVar[List[str]] = ['Completed', 'Failed', 'Stopped']
+_failure_reason_attribute: ClassVar[Optional[str]] = 'failure_reason'
+"""
+        assert (
+            self.resource_generator.generate_wait_status_attributes(
+                "TrainingJob", ["refresh", "wait", "wait_for_delete"]
+            )
+            == expected_output
+        )
+
+    def test_generate_wait_status_attributes_without_wait_method(self):
+        expected_output = """
+_status_attributes: ClassVar[List[str]] = ['workforce', 'status']
+_terminal_states: ClassVar[List[str]] = []
+_failure_reason_attribute: ClassVar[Optional[str]] = None
+"""
+        assert (
+            self.resource_generator.generate_wait_status_attributes(
+                "Workforce", ["refresh", "wait_for_status"]
+            )
+            == expected_output
+        )
+        assert self.resource_generator.generate_wait_status_attributes("Workforce", []) == ""
+
+    def test_generate_async_methods(self):
+        expected_output = '''
+# Asynchronous counterpart of get, running it on the thread pool of the async bridge, with
+# the signature and docstring of get
+@classmethod
+@functools.wraps(get.__func__, assigned=("__module__", "__doc__"))
+async def aget(cls, *args, **kwargs) -> Optional["TrainingJob"]:
+    return await run_async(cls.get, *args, **kwargs)
+
+# Asynchronous counterpart of stop, running it on the thread pool of the async bridge, with
+# the signature and docstring of stop
+@functools.wraps(stop, assigned=("__module__", "__doc__"))
+async def astop(self, *args, **kwargs) -> None:
+    return await run_async(self.stop, *args, **kwargs)
+
+@Base.add_validate_call
+async def await_completion(
+    self,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+) -> None:
+    """
+    Asynchronous counterpart of wait, waiting for a TrainingJob resource without blocking the event loop.
+
+    Parameters:
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to wait before timing out.
+
+    Raises:
+        TimeoutExceededError:  If the resource does not reach a terminal state before the timeout.
+        FailedStatusError:   If the resource reaches a failed state.
+        WaiterError: Raised when an error occurs while waiting.
+    """
+    await wait_async(self, poll=poll, timeout=timeout)
+
+# Asynchronous counterpart of get_all, listing pages on the thread pool of the async bridge, with the
+# signature and docstring of get_all
+@classmethod
+@functools.wraps(get_all.__func__, assigned=("__module__", "__doc__"))
+def aget_all(cls, *args, **kwargs) -> AsyncResourceIterator["TrainingJob"]:
+    return AsyncResourceIterator(cls.get_all(*args, **kwargs))
+'''
+        assert (
+            self.resource_generator.generate_async_methods(
+                "TrainingJob", ["get", "stop", "wait", "get_all"]
+            )
+            == expected_output
+        )
+
+    def test_generate_async_wait_for_status_and_delete_methods(self):
+        expected_output = '''
+@Base.add_validate_call
+async def await_status(
+    self,
+    target_status: Literal['Initializing', 'Updating', 'Deleting', 'Failed', 'Active'],
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+) -> None:
+    """
+    Asynchronous counterpart of wait_for_status, waiting for a Workforce resource to reach certain status without blocking the event loop.
+
+    Parameters:
+        target_status: The status to wait for.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to wait before timing out.
+
+    Raises:
+        TimeoutExceededError:  If the resource does not reach the target status before the timeout.
+        FailedStatusError:   If the resource reaches a failed state.
+        WaiterError: Raised when an error occurs while waiting.
+    """
+    await wait_async(self, target_status=target_status, poll=poll, timeout=timeout)
+
+@Base.add_validate_call
+async def await_deletion(
+    self,
+    poll: Union[int, PollStrategy] = 5,
+    timeout: Optional[int] = None,
+) -> None:
+    """
+    Asynchronous counterpart of wait_for_delete, waiting for a Workforce resource to be deleted without blocking the event loop.
+
+    Parameters:
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
+        timeout: The maximum number of seconds to wait before timing out.
+
+    Raises:
+        botocore.exceptions.ClientError: This exception is raised for AWS service related errors.
+        TimeoutExceededError:  If the resource is not deleted before the timeout.
+        DeleteFailedStatusError:   If the resource reaches a failed state.
+        WaiterError: Raised when an error occurs while waiting.
+    """
+    await wait_for_delete_async(self, poll=poll, timeout=timeout)
+'''
+        assert (
+            self.resource_generator.generate_async_methods(
+                "Workforce", ["wait_for_status", "wait_for_delete"]
+            )
+            == expected_output
+        )
+
     def test_generate_invoke_method(self):
         expected_output = '''
 
@@ -874,7 +1011,7 @@ def invoke(
     logger.debug(f"Response: {response}")
 
     transformed_response = transform(response, 'InvokeEndpointOutput')
-    return shapes.InvokeEndpointOutput(**transformed_response)
+    return build_from_response(shapes.InvokeEndpointOutput, transformed_response)
 '''
         method = Method(
             **{
@@ -965,7 +1102,7 @@ def invoke_async(
     logger.debug(f"Response: {response}")
 
     transformed_response = transform(response, 'InvokeEndpointAsyncOutput')
-    return shapes.InvokeEndpointAsyncOutput(**transformed_response)
+    return build_from_response(shapes.InvokeEndpointAsyncOutput, transformed_response)
 '''
         method = Method(
             **{
@@ -1059,7 +1196,7 @@ def invoke_with_response_stream(
     logger.debug(f"Response: {response}")
 
     transformed_response = transform(response, 'InvokeEndpointWithResponseStreamOutput')
-    return shapes.InvokeEndpointWithResponseStreamOutput(**transformed_response)
+    return build_from_response(shapes.InvokeEndpointWithResponseStreamOutput, transformed_response)
 '''
         method = Method(
             **{
@@ -1082,11 +1219,15 @@ def invoke_with_response_stream(
 @Base.add_validate_call
 def get_all(
     cls,
+    max_results: Optional[int] = Unassigned(),
     sort_order: Optional[str] = Unassigned(),
     sort_by: Optional[str] = Unassigned(),
     domain_id_equals: Optional[str] = Unassigned(),
     user_profile_name_equals: Optional[str] = Unassigned(),
     space_name_equals: Optional[str] = Unassigned(),
+    hydrate: bool = False,
+    hydrate_concurrency: Optional[int] = None,
+    prefetch_pages: int = 0,
     session: Optional[Session] = None,
     region: Optional[str] = None,
 ) -> ResourceIterator["App"]:
@@ -1101,6 +1242,9 @@ def get_all(
         domain_id_equals: A parameter to search for the domain ID.
         user_profile_name_equals: A parameter to search by user profile name. If SpaceNameEquals is set, then this value cannot be set.
         space_name_equals: A parameter to search by space name. If UserProfileNameEquals is set, then this value cannot be set.
+        hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+        hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+        prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
         session: Boto3 session.
         region: Region name.
     
@@ -1122,6 +1266,7 @@ def get_all(
     client = Base.get_sagemaker_client(session=session, region_name=region, service_name="sagemaker")
         
     operation_input_args = {
+        'MaxResults': max_results,
         'SortOrder': sort_order,
         'SortBy': sort_by,
         'DomainIdEquals': domain_id_equals,
@@ -1136,44 +1281,83 @@ def get_all(
     
     return ResourceIterator(
         client=client,
+        session=session,
+        region_name=region,
         list_method='list_apps',
         summaries_key='Apps',
         summary_name='AppDetails',
         resource_cls=App,
+        hydrate=hydrate,
+        hydrate_concurrency=hydrate_concurrency,
+        prefetch_pages=prefetch_pages,
         list_method_kwargs=operation_input_args
     )
 '''
         assert self.resource_generator.generate_get_all_method("App") == expected_output
 
-    def test_get_all_method_with_no_args(self):
+    def test_get_all_method_with_only_max_results_arg(self):
         expected_output = '''
 @classmethod
 @Base.add_validate_call
 def get_all(
     cls,
+    max_results: Optional[int] = Unassigned(),
+    hydrate: bool = False,
+    hydrate_concurrency: Optional[int] = None,
+    prefetch_pages: int = 0,
     session: Optional[Session] = None,
     region: Optional[str] = None,
 ) -> ResourceIterator["Domain"]:
     """
-    Get all Domain resources.
+    Get all Domain resources
     
     Parameters:
+        next_token: If the previous response was truncated, you will receive this token. Use it in your next request to receive the next set of results.
+        max_results: This parameter defines the maximum number of results that can be return in a single response. The MaxResults parameter is an upper bound, not a target. If there are more results available than the value specified, a NextToken is provided in the response. The NextToken indicates that the user should get the next set of results by providing this token as a part of a subsequent call. The default value for MaxResults is 10.
+        hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+        hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+        prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
         session: Boto3 session.
         region: Region name.
-
+    
     Returns:
         Iterator for listed Domain resources.
-
+    
+    Raises:
+        botocore.exceptions.ClientError: This exception is raised for AWS service related errors. 
+            The error message and error code can be parsed from the exception as follows:
+            ```
+            try:
+                # AWS service call here
+            except botocore.exceptions.ClientError as e:
+                error_message = e.response['Error']['Message']
+                error_code = e.response['Error']['Code']
+            ```
     """
+
     client = Base.get_sagemaker_client(session=session, region_name=region, service_name="sagemaker")
+        
+    operation_input_args = {
+        'MaxResults': max_results,
+    }
 
 
+    # serialize the input request
+    operation_input_args = serialize(operation_input_args)
+    logger.debug(f"Serialized input request: {operation_input_args}")
+    
     return ResourceIterator(
         client=client,
+        session=session,
+        region_name=region,
         list_method='list_domains',
         summaries_key='Domains',
         summary_name='DomainDetails',
-        resource_cls=Domain
+        resource_cls=Domain,
+        hydrate=hydrate,
+        hydrate_concurrency=hydrate_concurrency,
+        prefetch_pages=prefetch_pages,
+        list_method_kwargs=operation_input_args
     )
 '''
         assert self.resource_generator.generate_get_all_method("Domain") == expected_output
@@ -1187,9 +1371,14 @@ def get_all(
     endpoint_name: Optional[str] = Unassigned(),
     sort_by: Optional[str] = Unassigned(),
     sort_order: Optional[str] = Unassigned(),
+    max_results: Optional[int] = Unassigned(),
     name_contains: Optional[str] = Unassigned(),
     creation_time_before: Optional[datetime.datetime] = Unassigned(),
     creation_time_after: Optional[datetime.datetime] = Unassigned(),
+    parallel_shards: Optional[int] = None,
+    hydrate: bool = False,
+    hydrate_concurrency: Optional[int] = None,
+    prefetch_pages: int = 0,
     session: Optional[Session] = None,
     region: Optional[str] = None,
 ) -> ResourceIterator["DataQualityJobDefinition"]:
@@ -1205,6 +1394,10 @@ def get_all(
         name_contains: A string in the data quality monitoring job definition name. This filter returns only data quality monitoring job definitions whose name contains the specified string.
         creation_time_before: A filter that returns only data quality monitoring job definitions created before the specified time.
         creation_time_after: A filter that returns only data quality monitoring job definitions created after the specified time.
+        parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+        hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+        hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+        prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
         session: Boto3 session.
         region: Region name.
     
@@ -1229,6 +1422,7 @@ def get_all(
         'EndpointName': endpoint_name,
         'SortBy': sort_by,
         'SortOrder': sort_order,
+        'MaxResults': max_results,
         'NameContains': name_contains,
         'CreationTimeBefore': creation_time_before,
         'CreationTimeAfter': creation_time_after,
@@ -1241,10 +1435,16 @@ def get_all(
     
     return ResourceIterator(
         client=client,
+        session=session,
+        region_name=region,
         list_method='list_data_quality_job_definitions',
         summaries_key='JobDefinitionSummaries',
         summary_name='MonitoringJobDefinitionSummary',
         resource_cls=DataQualityJobDefinition,
+        hydrate=hydrate,
+        hydrate_concurrency=hydrate_concurrency,
+        prefetch_pages=prefetch_pages,
+        parallel_shards=parallel_shards,
         custom_key_mapping=custom_key_mapping,
         list_method_kwargs=operation_input_args
     )
@@ -1307,7 +1507,7 @@ def get_node(
     logger.debug(f"Response: {response}")
 
     transformed_response = transform(response, 'DescribeClusterNodeResponse')
-    return shapes.ClusterNodeDetails(**transformed_response)
+    return build_from_response(shapes.ClusterNodeDetails, transformed_response)
 '''
         method = Method(
             **{
@@ -1390,9 +1590,11 @@ def update_weights_and_capacities(
 @Base.add_validate_call
 def get_all_training_jobs(
     self,
+    max_results: Optional[int] = Unassigned(),
     status_equals: Optional[str] = Unassigned(),
     sort_by: Optional[str] = Unassigned(),
-    sort_order: Optional[str] = Unassigned(),    session: Optional[Session] = None,
+    sort_order: Optional[str] = Unassigned(),    prefetch_pages: int = 0,
+    session: Optional[Session] = None,
     region: Optional[str] = None,
 ) -> ResourceIterator[shapes.HyperParameterTrainingJobSummary]:
     """
@@ -1404,6 +1606,7 @@ def get_all_training_jobs(
         status_equals: A filter that returns only training jobs with the specified status.
         sort_by: The field to sort results by. The default is Name. If the value of this field is FinalObjectiveMetricValue, any training jobs that did not return an objective metric are not listed.
         sort_order: The sort order for results. The default is Ascending.
+        prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
         session: Boto3 session.
         region: Region name.
     
@@ -1426,6 +1629,7 @@ def get_all_training_jobs(
 
     operation_input_args = {
         'HyperParameterTuningJobName': self.hyper_parameter_tuning_job_name,
+        'MaxResults': max_results,
         'StatusEquals': status_equals,
         'SortBy': sort_by,
         'SortOrder': sort_order,
@@ -1439,10 +1643,13 @@ def get_all_training_jobs(
 
     return ResourceIterator(
         client=client,
+        session=session,
+        region_name=region,
         list_method='list_training_jobs_for_hyper_parameter_tuning_job',
         summaries_key='TrainingJobSummaries',
         summary_name='HyperParameterTrainingJobSummary',
         resource_cls=shapes.HyperParameterTrainingJobSummary,
+        prefetch_pages=prefetch_pages,
         list_method_kwargs=operation_input_args
     )
 '''
@@ -1464,6 +1671,110 @@ def get_all_training_jobs(
             == expected_output
         )
 
+    def test_get_all_code_repositories(self):
+        expected_output = '''
+@classmethod
+@Base.add_validate_call
+def get_all(
+    cls,
+    creation_time_after: Optional[datetime.datetime] = Unassigned(),
+    creation_time_before: Optional[datetime.datetime] = Unassigned(),
+    last_modified_time_after: Optional[datetime.datetime] = Unassigned(),
+    last_modified_time_before: Optional[datetime.datetime] = Unassigned(),
+    max_results: Optional[int] = Unassigned(),
+    name_contains: Optional[str] = Unassigned(),
+    sort_by: Optional[str] = Unassigned(),
+    sort_order: Optional[str] = Unassigned(),    parallel_shards: Optional[int] = None,
+    hydrate: bool = False,
+    hydrate_concurrency: Optional[int] = None,
+    prefetch_pages: int = 0,
+    session: Optional[Session] = None,
+    region: Optional[str] = None,
+) -> ResourceIterator["CodeRepository"]:
+    """
+    Gets a list of the Git repositories in your account.
+    
+    Parameters:
+        creation_time_after: A filter that returns only Git repositories that were created after the specified time.
+        creation_time_before: A filter that returns only Git repositories that were created before the specified time.
+        last_modified_time_after: A filter that returns only Git repositories that were last modified after the specified time.
+        last_modified_time_before: A filter that returns only Git repositories that were last modified before the specified time.
+        max_results: The maximum number of Git repositories to return in the response.
+        name_contains: A string in the Git repositories name. This filter returns only repositories whose name contains the specified string.
+        next_token: If the result of a ListCodeRepositoriesOutput request was truncated, the response includes a NextToken. To get the next set of Git repositories, use the token in the next request.
+        sort_by: The field to sort results by. The default is Name.
+        sort_order: The sort order for results. The default is Ascending.
+        parallel_shards: The number of creation time windows, between creation_time_after and creation_time_before, listed concurrently and merged in sort order.
+        hydrate: Whether to describe every listed resource while iterating. By default resources only hold the fields of their summary, and the other fields are fetched on first access.
+        hydrate_concurrency: The maximum number of listed resources of a page described concurrently, backing off when throttled. Implies hydrate.
+        prefetch_pages: The number of pages listed ahead on a background thread while iterating. Defaults to 0, listing every page once the previous one is consumed.
+        session: Boto3 session.
+        region: Region name.
+    
+    Returns:
+        Iterator for listed CodeRepository.
+    
+    Raises:
+        botocore.exceptions.ClientError: This exception is raised for AWS service related errors. 
+            The error message and error code can be parsed from the exception as follows:
+            ```
+            try:
+                # AWS service call here
+            except botocore.exceptions.ClientError as e:
+                error_message = e.response['Error']['Message']
+                error_code = e.response['Error']['Code']
+            ```
+    """
+
+
+    operation_input_args = {
+        'CreationTimeAfter': creation_time_after,
+        'CreationTimeBefore': creation_time_before,
+        'LastModifiedTimeAfter': last_modified_time_after,
+        'LastModifiedTimeBefore': last_modified_time_before,
+        'MaxResults': max_results,
+        'NameContains': name_contains,
+        'SortBy': sort_by,
+        'SortOrder': sort_order,
+    }
+    # serialize the input request
+    operation_input_args = serialize(operation_input_args)
+    logger.debug(f"Serialized input request: {operation_input_args}")
+
+    client = Base.get_sagemaker_client(session=session, region_name=region, service_name='sagemaker')
+
+
+    return ResourceIterator(
+        client=client,
+        session=session,
+        region_name=region,
+        list_method='list_code_repositories',
+        summaries_key='CodeRepositorySummaryList',
+        summary_name='CodeRepositorySummary',
+        resource_cls=CodeRepository,
+        hydrate=hydrate,
+        hydrate_concurrency=hydrate_concurrency,
+        prefetch_pages=prefetch_pages,
+        parallel_shards=parallel_shards,
+        list_method_kwargs=operation_input_args
+    )
+'''
+        method = Method(
+            **{
+                "operation_name": "ListCodeRepositories",
+                "resource_name": "CodeRepository",
+                "method_name": "get_all",
+                "return_type": "CodeRepository",
+                "method_type": "class",
+                "service_name": "sagemaker",
+            }
+        )
+        method.get_docstring_title(self.resource_generator.operations["ListCodeRepositories"])
+        assert (
+            self.resource_generator.generate_method(method, ["code_repository_name"])
+            == expected_output
+        )
+
     def test_generate_presigned_domain_url(self):
         expected_output = '''class PresignedDomainUrl(Base):
     """
@@ -1567,6 +1878,13 @@ def get_all_training_jobs(
     
         transformed_response = transform(response, 'CreatePresignedDomainUrlResponse')
         return cls(**operation_input_args, **transformed_response)
+    
+    # Asynchronous counterpart of create, running it on the thread pool of the async bridge, with
+    # the signature and docstring of create
+    @classmethod
+    @functools.wraps(create.__func__, assigned=("__module__", "__doc__"))
+    async def acreate(cls, *args, **kwargs) -> Optional["PresignedDomainUrl"]:
+        return await run_async(cls.create, *args, **kwargs)
 '''
         assert (
             self.resource_generator.generate_resource_class(
@@ -1700,15 +2018,19 @@ def get_all_training_jobs(
 @Base.add_validate_call
 def wait_for_delete(
     self,
-    poll: int = 5,
+    poll: Union[int, PollStrategy] = 5,
     timeout: Optional[int] = None,
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a Domain resource to be deleted.
     
     Parameters:
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
     
     Raises:
         botocore.exceptions.ClientError: This exception is raised for AWS service related errors. 
@@ -1725,20 +2047,16 @@ def wait_for_delete(
         WaiterError: Raised when an error occurs while waiting.
     """
     start_time = time.time()
+    poller = Poller(poll, timeout)
 
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{task.description}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task("Waiting for Domain to be deleted...")
-    status = Status("Current status:")
-
-    with Live(Panel(Group(progress, status), title="Wait Log Panel", border_style=Style(color=Color.BLUE.value))):
+    with WaiterDisplay(
+        "Waiting for Domain to be deleted...", display, status_callback, transient=False
+    ) as waiter_display:
         while True:
             try:
-                self.refresh()
+                poller.call(self.refresh)
                 current_status = self.status
-                status.update(f"Current status: [bold]{current_status}")
+                waiter_display.update(current_status)
                 
                 if "delete_failed" in current_status.lower() or "deletefailed" in current_status.lower():
                     raise DeleteFailedStatusError(resource_type="Domain", reason=self.failure_reason)
@@ -1754,7 +2072,7 @@ def wait_for_delete(
                     logger.info("Resource was not found. It may have been deleted.")
                     return
                 raise e
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
         assert self.resource_generator.generate_wait_for_delete_method("Domain") == expected_output
 
@@ -1763,15 +2081,19 @@ def wait_for_delete(
 @Base.add_validate_call
 def wait_for_delete(
     self,
-    poll: int = 5,
+    poll: Union[int, PollStrategy] = 5,
     timeout: Optional[int] = None,
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a Algorithm resource to be deleted.
     
     Parameters:
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
     
     Raises:
         botocore.exceptions.ClientError: This exception is raised for AWS service related errors. 
@@ -1788,20 +2110,16 @@ def wait_for_delete(
         WaiterError: Raised when an error occurs while waiting.
     """
     start_time = time.time()
+    poller = Poller(poll, timeout)
 
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{task.description}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task("Waiting for Algorithm to be deleted...")
-    status = Status("Current status:")
-
-    with Live(Panel(Group(progress, status), title="Wait Log Panel", border_style=Style(color=Color.BLUE.value))):
+    with WaiterDisplay(
+        "Waiting for Algorithm to be deleted...", display, status_callback, transient=False
+    ) as waiter_display:
         while True:
             try:
-                self.refresh()
+                poller.call(self.refresh)
                 current_status = self.algorithm_status
-                status.update(f"Current status: [bold]{current_status}")
+                waiter_display.update(current_status)
 
 
 
@@ -1814,7 +2132,7 @@ def wait_for_delete(
                     logger.info("Resource was not found. It may have been deleted.")
                     return
                 raise e
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
         assert (
             self.resource_generator.generate_wait_for_delete_method("Algorithm") == expected_output
@@ -1825,15 +2143,19 @@ def wait_for_delete(
 @Base.add_validate_call
 def wait_for_delete(
     self,
-    poll: int = 5,
+    poll: Union[int, PollStrategy] = 5,
     timeout: Optional[int] = None,
+    display: Optional[bool] = None,
+    status_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     """
     Wait for a App resource to be deleted.
     
     Parameters:
-        poll: The number of seconds to wait between each poll.
+        poll: The number of seconds to wait between each poll, or the PollStrategy choosing the delays between polls.
         timeout: The maximum number of seconds to wait before timing out.
+        display: Whether to display the status in a Rich Live panel. Defaults to None, displaying it in interactive environments unless disabled with configure_waiter_display.
+        status_callback: A function called with the status of the resource at every poll.
     
     Raises:
         botocore.exceptions.ClientError: This exception is raised for AWS service related errors. 
@@ -1850,20 +2172,16 @@ def wait_for_delete(
         WaiterError: Raised when an error occurs while waiting.
     """
     start_time = time.time()
+    poller = Poller(poll, timeout)
 
-    progress = Progress(SpinnerColumn("bouncingBar"),
-        TextColumn("{task.description}"),
-        TimeElapsedColumn(),
-    )
-    progress.add_task("Waiting for App to be deleted...")
-    status = Status("Current status:")
-
-    with Live(Panel(Group(progress, status), title="Wait Log Panel", border_style=Style(color=Color.BLUE.value))):
+    with WaiterDisplay(
+        "Waiting for App to be deleted...", display, status_callback, transient=False
+    ) as waiter_display:
         while True:
             try:
-                self.refresh()
+                poller.call(self.refresh)
                 current_status = self.status
-                status.update(f"Current status: [bold]{current_status}")
+                waiter_display.update(current_status)
 
                 
                 if current_status.lower() == "deleted":
@@ -1880,7 +2198,7 @@ def wait_for_delete(
                     logger.info("Resource was not found. It may have been deleted.")
                     return
                 raise e
-            time.sleep(poll)
+            poller.sleep(current_status)
 '''
         assert self.resource_generator.generate_wait_for_delete_method("App") == expected_output
 
@@ -1983,3 +2301,19 @@ def put_record(
             resource_states=[],
         )
         assert result == ""
+
+    def test_generate_base_module_imports_without_resource_only_imports(self):
+        base_module_imports = self.resource_generator.generate_base_module_imports()
+        resource_module_imports = self.resource_generator.generate_resource_module_imports(
+            "TrainingJob", "class TrainingJob(Base):\n    pass\n"
+        )
+
+        for resource_only_import in (
+            "from sagemaker_core.main.logs import JobLogStreamer, MultiLogStreamHandler\n",
+            "from sagemaker_core.main.waiters import wait_async, wait_for_delete_async\n",
+        ):
+            assert resource_only_import not in base_module_imports
+            assert resource_only_import in resource_module_imports
+        assert "import inspect\n" in base_module_imports
+        assert "import inspect\n" not in resource_module_imports
+        assert "import sagemaker_core.main.resources as resources\n" in base_module_imports
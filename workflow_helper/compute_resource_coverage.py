@@ -1,16 +1,25 @@
 import json
 
+RESOURCES_PACKAGE_PATH = "src/sagemaker_core/main/resources/"
+
 
 def main():
     """
     Every run of the pytest-cov command creates the report of coverages per class into a json file - i.e coverage.json
-    This file is being parsed to print the coverage for resources.py which will be used as a tracking metric
+    This file is being parsed to print the coverage for the resources package which will be used as a tracking metric
     """
     json_file = "coverage.json"
 
     with open(json_file, "r") as f:
         data = json.load(f)
-        print(data["files"]["src/sagemaker_core/main/resources.py"]["summary"]["percent_covered"])
+        summaries = [
+            file_data["summary"]
+            for file_name, file_data in data["files"].items()
+            if file_name.startswith(RESOURCES_PACKAGE_PATH)
+        ]
+        covered_lines = sum(summary["covered_lines"] for summary in summaries)
+        num_statements = sum(summary["num_statements"] for summary in summaries)
+        print(100.0 * covered_lines / num_statements)
 
 
 if __name__ == "__main__":